@@ -0,0 +1,136 @@
+"""
+Synthetic FBX scene generator for benchmarks
+
+Writes ASCII FBX 7.4 files with a configurable number of nodes, mesh faces and
+animation curves, so load and accessor costs can be measured at any scale
+without checking large assets into the repository.
+"""
+
+import math
+
+KTIME_SECOND = 46186158000
+
+_HEADER = """; FBX 7.4.0 project file
+FBXHeaderExtension:  {
+\tFBXHeaderVersion: 1003
+\tFBXVersion: 7400
+\tCreator: "ufbx-python benchmarks"
+}
+GlobalSettings:  {
+\tVersion: 1000
+\tProperties70:  {
+\t\tP: "UpAxis", "int", "Integer", "",1
+\t\tP: "UpAxisSign", "int", "Integer", "",1
+\t\tP: "FrontAxis", "int", "Integer", "",2
+\t\tP: "FrontAxisSign", "int", "Integer", "",1
+\t\tP: "CoordAxis", "int", "Integer", "",0
+\t\tP: "CoordAxisSign", "int", "Integer", "",1
+\t\tP: "UnitScaleFactor", "double", "Number", "",1
+\t}
+}
+"""
+
+
+def _array(f, indent, name, values, fmt="{:g}"):
+    f.write(f"{indent}{name}: *{len(values)} {{\n{indent}\ta: ")
+    f.write(",".join(fmt.format(v) for v in values))
+    f.write(f"\n{indent}}}\n")
+
+
+def _grid(num_faces):
+    """Vertices and FBX polygon indices of a grid with num_faces quads"""
+    width = max(int(math.ceil(math.sqrt(num_faces))), 1)
+    rows = -(-num_faces // width) if num_faces else 0
+    vertices = []
+    for y in range(rows + 1):
+        for x in range(width + 1):
+            vertices.extend((float(x), 0.0, float(y)))
+    indices = []
+    for face in range(num_faces):
+        y, x = divmod(face, width)
+        a = y * (width + 1) + x
+        b = a + width + 1
+        indices.extend((a, a + 1, b + 1, ~b))
+    return vertices, indices
+
+
+def write_scene(path, num_nodes=1, num_faces=0, num_curves=0, num_keys=30):
+    """Write a synthetic ASCII FBX file
+
+    Args:
+        path: Output path
+        num_nodes: Number of nodes, arranged as a 4-ary tree under the root
+        num_faces: Quads in a single grid mesh instanced on the first node
+        num_curves: Animation curves, three per translated node
+        num_keys: Keyframes per animation curve, one per frame at 30 fps
+
+    Returns:
+        Size of the written file in bytes
+    """
+    num_nodes = max(num_nodes, 1)
+    mesh_id = 1000
+    node_ids = [2000000 + i for i in range(num_nodes)]
+    connections = []
+
+    with open(path, "w", encoding="ascii", newline="\n") as f:
+        f.write(_HEADER)
+        f.write("Objects:  {\n")
+
+        if num_faces:
+            vertices, indices = _grid(num_faces)
+            f.write(f'\tGeometry: {mesh_id}, "Geometry::Grid", "Mesh" {{\n')
+            _array(f, "\t\t", "Vertices", vertices)
+            _array(f, "\t\t", "PolygonVertexIndex", indices, "{:d}")
+            f.write("\t\tGeometryVersion: 124\n\t}\n")
+            connections.append(("OO", mesh_id, node_ids[0], None))
+
+        for i, node_id in enumerate(node_ids):
+            kind = "Mesh" if i == 0 and num_faces else "Null"
+            f.write(f'\tModel: {node_id}, "Model::Node{i}", "{kind}" {{\n\t\tVersion: 232\n')
+            f.write("\t\tProperties70:  {\n")
+            f.write(f'\t\t\tP: "Lcl Translation", "Lcl Translation", "", "A",{i % 7:d},{i % 5:d},{i % 3:d}\n')
+            f.write(f'\t\t\tP: "Lcl Rotation", "Lcl Rotation", "", "A",0,{(i * 15) % 360:d},0\n')
+            f.write("\t\t}\n\t}\n")
+            parent = 0 if i == 0 else node_ids[(i - 1) // 4]
+            connections.append(("OO", node_id, parent, None))
+
+        if num_curves:
+            stack_id, layer_id = 3000, 3001
+            duration = max(num_keys - 1, 1) * KTIME_SECOND // 30
+            f.write(f'\tAnimationStack: {stack_id}, "AnimStack::Take 001", "" {{\n\t\tProperties70:  {{\n')
+            for prefix in ("Local", "Reference"):
+                f.write(f'\t\t\tP: "{prefix}Start", "KTime", "Time", "",0\n')
+                f.write(f'\t\t\tP: "{prefix}Stop", "KTime", "Time", "",{duration}\n')
+            f.write("\t\t}\n\t}\n")
+            f.write(f'\tAnimationLayer: {layer_id}, "AnimLayer::BaseLayer", "" {{\n\t}}\n')
+            connections.append(("OO", layer_id, stack_id, None))
+
+            times = [k * KTIME_SECOND // 30 for k in range(num_keys)]
+            for c in range(num_curves):
+                node_index, axis = divmod(c, 3)
+                curve_node_id = 4000000 + node_index
+                if axis == 0:
+                    f.write(f'\tAnimationCurveNode: {curve_node_id}, "AnimCurveNode::T", "" {{\n\t\tProperties70:  {{\n')
+                    for name in ("X", "Y", "Z"):
+                        f.write(f'\t\t\tP: "d|{name}", "Number", "", "A",0\n')
+                    f.write("\t\t}\n\t}\n")
+                    connections.append(("OO", curve_node_id, layer_id, None))
+                    connections.append(("OP", curve_node_id, node_ids[node_index % num_nodes], "Lcl Translation"))
+
+                curve_id = 5000000 + c
+                values = [math.sin(0.1 * k + c) for k in range(num_keys)]
+                f.write(f'\tAnimationCurve: {curve_id}, "AnimCurve::", "" {{\n\t\tDefault: 0\n\t\tKeyVer: 4008\n')
+                _array(f, "\t\t", "KeyTime", times, "{:d}")
+                _array(f, "\t\t", "KeyValueFloat", values, "{:.6g}")
+                _array(f, "\t\t", "KeyAttrFlags", [24836], "{:d}")
+                _array(f, "\t\t", "KeyAttrDataFloat", [0, 0, 218434821, 0], "{:d}")
+                _array(f, "\t\t", "KeyAttrRefCount", [num_keys], "{:d}")
+                f.write("\t}\n")
+                connections.append(("OP", curve_id, curve_node_id, "d|" + "XYZ"[axis]))
+
+        f.write("}\nConnections:  {\n")
+        for kind, src, dst, prop in connections:
+            suffix = f', "{prop}"' if prop else ""
+            f.write(f'\tC: "{kind}",{src},{dst}{suffix}\n')
+        f.write("}\n")
+        return f.tell()
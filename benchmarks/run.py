@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for load and accessor hot paths
+
+Measures load_file throughput and the cost of the most common accessors on
+synthetic scenes (see fbxgen.py) and optional real files, and writes the
+results as JSON that can be compared across commits.
+
+Usage:
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --file model.fbx --compare baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import ufbx
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import fbxgen
+
+SCHEMA_VERSION = 1
+
+# name: (num_nodes, num_faces, num_curves)
+SYNTHETIC_SCENES = {
+    "small": (100, 1000, 30),
+    "medium": (2000, 50000, 600),
+    "large": (20000, 500000, 6000),
+}
+QUICK_SCENES = ("small", "medium")
+
+
+def peak_rss_bytes():
+    """Peak resident set size of this process, or None if unavailable"""
+    # On Linux ru_maxrss survives exec, so a spawned worker would report the
+    # parent's peak; VmHWM belongs to the current address space only.
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def measure(fn, min_time, repeat=5):
+    """Best seconds per call of fn over repeat batches of at least min_time / repeat"""
+    batch_time = min_time / repeat
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= batch_time:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(int(batch_time / elapsed * 1.2) + 1, 100))
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best, number
+
+
+# Cases: setup(path, scene) returns (fn, ops per call, bytes per call) or None to
+# skip. scene is loaded from path by run_case and closed once the case is measured.
+
+def case_load_file(path, scene):
+    size = os.path.getsize(path)
+    return (lambda: ufbx.load_file(path).close()), 1, size
+
+
+def case_nodes_traversal(path, scene):
+    def fn():
+        for node in scene.nodes:
+            _ = node.name
+    return fn, len(scene.nodes), None
+
+
+def case_world_transform(path, scene):
+    nodes = list(scene.nodes)
+
+    def fn():
+        for node in nodes:
+            _ = node.world_transform
+    return fn, len(nodes), None
+
+
+def case_vertex_positions_view(path, scene):
+    if not len(scene.meshes):
+        return None
+    mesh = scene.meshes[0]
+    return (lambda: mesh.vertex_positions), 1, None
+
+
+def case_node_table(path, scene):
+    return scene.node_table, len(scene.nodes), None
+
+
+def case_sample_transforms(path, scene):
+    if not len(scene.anim_stacks):
+        return None
+    stack = scene.anim_stacks[0]
+    times = np.linspace(stack.time_begin, stack.time_end, 30)
+    return (lambda: stack.sample_transforms(times)), len(times) * len(scene.nodes), None
+
+
+CASES = {
+    "load_file": case_load_file,
+    "nodes_traversal": case_nodes_traversal,
+    "world_transform": case_world_transform,
+    "vertex_positions_view": case_vertex_positions_view,
+    "node_table": case_node_table,
+    "sample_transforms": case_sample_transforms,
+}
+
+
+def run_case(case, path, min_time):
+    """Run one case in this process, returning its result dict or None if skipped"""
+    rss_before = peak_rss_bytes()
+    # load_file measures its own loads, so it gets no resident scene
+    scene = None if case == "load_file" else ufbx.load_file(path)
+    try:
+        setup = CASES[case](path, scene)
+        if setup is None:
+            return None
+        fn, ops, nbytes = setup
+        seconds, number = measure(fn, min_time)
+    finally:
+        if scene is not None:
+            scene.close()
+    result = {
+        "seconds_per_call": seconds,
+        "calls_per_batch": number,
+        "ops_per_call": ops,
+        "ops_per_sec": ops / seconds if seconds > 0 else None,
+        "peak_rss_bytes": peak_rss_bytes(),
+        "baseline_rss_bytes": rss_before,
+    }
+    if nbytes is not None:
+        result["mb_per_sec"] = nbytes / seconds / 1e6 if seconds > 0 else None
+    return result
+
+
+def run_isolated(case, path, min_time):
+    """Run one case in a fresh process so peak RSS is attributable to it"""
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(1) as pool:
+        return pool.apply(run_case, (case, path, min_time))
+
+
+def metadata():
+    meta = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "ufbx_version": ufbx.__version__,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        meta["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        meta["git_commit"] = None
+    return meta
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table and return the names of regressed cases
+
+    A case regresses when its ops/s drops, or its peak RSS grows, by more than
+    threshold (a fraction) relative to the baseline.
+    """
+    regressions = []
+    print(f"\n{'case':<44} {'ops/s ratio':>12} {'rss ratio':>10}")
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None or not result.get("ops_per_sec") or not old.get("ops_per_sec"):
+            continue
+        speed = result["ops_per_sec"] / old["ops_per_sec"]
+        rss = None
+        if result.get("peak_rss_bytes") and old.get("peak_rss_bytes"):
+            rss = result["peak_rss_bytes"] / old["peak_rss_bytes"]
+        regressed = speed < 1.0 - threshold or (rss is not None and rss > 1.0 + threshold)
+        if regressed:
+            regressions.append(name)
+        rss_text = f"{rss:10.2f}" if rss is not None else f"{'-':>10}"
+        print(f"{name:<44} {speed:12.2f} {rss_text}{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--file", action="append", default=[], help="Real FBX file to benchmark (repeatable)")
+    parser.add_argument("--scenes", default=None,
+                        help=f"Comma-separated synthetic scenes from {', '.join(SYNTHETIC_SCENES)}")
+    parser.add_argument("--quick", action="store_true", help=f"Only {', '.join(QUICK_SCENES)} scenes and shorter timing")
+    parser.add_argument("--cases", default=None, help=f"Comma-separated cases from {', '.join(CASES)}")
+    parser.add_argument("--min-time", type=float, default=1.0, help="Seconds spent timing each case")
+    parser.add_argument("--no-isolate", action="store_true", help="Run cases in this process (shared peak RSS)")
+    parser.add_argument("--data-dir", default=None, help="Directory for generated scenes (default: temporary)")
+    parser.add_argument("--output", default=None, help="Write results JSON to this path")
+    parser.add_argument("--compare", default=None, help="Baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Regression threshold as a fraction")
+    args = parser.parse_args(argv)
+
+    scenes = args.scenes.split(",") if args.scenes else list(QUICK_SCENES if args.quick else SYNTHETIC_SCENES)
+    cases = args.cases.split(",") if args.cases else list(CASES)
+    for name in scenes:
+        if name not in SYNTHETIC_SCENES:
+            parser.error(f"unknown scene {name!r}")
+    for name in cases:
+        if name not in CASES:
+            parser.error(f"unknown case {name!r}")
+    min_time = min(args.min_time, 0.25) if args.quick else args.min_time
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = args.data_dir or tmp_dir
+        os.makedirs(data_dir, exist_ok=True)
+        inputs = []
+        for name in scenes:
+            num_nodes, num_faces, num_curves = SYNTHETIC_SCENES[name]
+            path = os.path.join(data_dir, f"synthetic_{name}.fbx")
+            if not os.path.exists(path):
+                fbxgen.write_scene(path, num_nodes=num_nodes, num_faces=num_faces, num_curves=num_curves)
+            inputs.append((f"synthetic_{name}", path))
+        for path in args.file:
+            inputs.append((os.path.basename(path), os.path.abspath(path)))
+
+        results = {}
+        for label, path in inputs:
+            for case in cases:
+                name = f"{case}[{label}]"
+                runner = run_case if args.no_isolate else run_isolated
+                result = runner(case, path, min_time)
+                if result is None:
+                    continue
+                result["input"] = label
+                result["input_bytes"] = os.path.getsize(path)
+                results[name] = result
+                rate = f"{result['mb_per_sec']:9.1f} MB/s" if "mb_per_sec" in result else " " * 14
+                rss = result["peak_rss_bytes"]
+                rss_text = f"{rss / 2**20:8.1f} MiB" if rss else ""
+                print(f"{name:<44} {result['ops_per_sec']:14.1f} ops/s {rate} {rss_text}", flush=True)
+
+    report = {"schema": SCHEMA_VERSION, "metadata": metadata(), "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("schema") != SCHEMA_VERSION:
+            print(f"Baseline schema {baseline.get('schema')} differs from {SCHEMA_VERSION}", file=sys.stderr)
+            return 2
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
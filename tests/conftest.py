@@ -0,0 +1,13 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def fbx_path():
+    """Path of the Maya cube test scene"""
+    return os.path.join(os.path.dirname(__file__), "fixtures", "maya_cube.fbx")
@@ -2,8 +2,7 @@
 Tests for CoordinateAxis, CoordinateAxes, and Scene.axes
 """
 
-import os
-
+import numpy as np
 import pytest
 
 import ufbx
@@ -59,17 +58,8 @@ def test_scene_has_axes_property():
     assert hasattr(ufbx.Scene, "axes")
 
 
-@pytest.fixture
-def fbx_path():
-    p = os.path.join(os.path.dirname(__file__), "fixtures", "maya_cube.fbx")
-    return p if os.path.exists(p) else None
-
-
 def test_scene_axes(fbx_path):
     """Scene.axes returns CoordinateAxes with right/up/front as CoordinateAxis."""
-    if fbx_path is None:
-        pytest.skip("maya_cube.fbx not found (see tests/fixtures/README.md)")
-
     with ufbx.load_file(fbx_path) as scene:
         ax = scene.axes
         assert ax is not None
@@ -82,10 +72,57 @@ def test_scene_axes(fbx_path):
 
 def test_scene_axes_after_close(fbx_path):
     """Accessing axes after scene.close() raises RuntimeError."""
-    if fbx_path is None:
-        pytest.skip("maya_cube.fbx not found (see tests/fixtures/README.md)")
-
     scene = ufbx.load_file(fbx_path)
     scene.close()
     with pytest.raises(RuntimeError, match="closed"):
         _ = scene.axes
+
+
+def test_coordinate_axes_presets():
+    """Preset constructors and value equality."""
+    y_up = ufbx.CoordinateAxes.right_handed_y_up()
+    assert y_up == ufbx.CoordinateAxes(0, 2, 4)
+    assert hash(y_up) == hash(ufbx.CoordinateAxes(0, 2, 4))
+    assert ufbx.CoordinateAxes.right_handed_z_up().up == ufbx.CoordinateAxis.COORDINATE_AXIS_POSITIVE_Z
+    assert ufbx.CoordinateAxes.left_handed_y_up().front == ufbx.CoordinateAxis.COORDINATE_AXIS_NEGATIVE_Z
+
+
+def test_space_conversion_options():
+    """LoadOptions carries the space conversion fields."""
+    assert ufbx.SpaceConversion.SPACE_CONVERSION_MODIFY_GEOMETRY == 2
+    opts = ufbx.LoadOptions(target_axes=ufbx.CoordinateAxes.right_handed_z_up(), target_unit_meters=1.0)
+    assert opts.target_unit_meters == 1.0
+    assert opts.space_conversion == ufbx.SpaceConversion.SPACE_CONVERSION_TRANSFORM_ROOT
+    assert "target_axes=" in repr(opts)
+
+
+def test_load_time_space_conversion(fbx_path):
+    """target_axes / target_unit_meters convert transforms and, optionally, geometry."""
+    z_up = ufbx.CoordinateAxes.right_handed_z_up()
+    with ufbx.load_file(fbx_path) as scene:
+        scale = scene.settings.unit_meters
+        translation = scene.find_node("Cube").world_transform[3, :3]
+        vertices = np.array(scene.meshes[0].vertex_positions)
+
+    with ufbx.load_file(fbx_path, target_axes=z_up, target_unit_meters=1.0) as scene:
+        assert scene.settings.unit_meters == scale  # original units are still reported
+        world = scene.find_node("Cube").world_transform
+        np.testing.assert_allclose(np.abs(world[3, :3]), np.abs(translation) * scale, atol=1e-9)
+        np.testing.assert_array_equal(scene.meshes[0].vertex_positions, vertices)
+
+    modify = ufbx.SpaceConversion.SPACE_CONVERSION_MODIFY_GEOMETRY
+    with ufbx.load_file(fbx_path, target_axes=z_up, target_unit_meters=1.0, space_conversion=modify) as scene:
+        converted = scene.meshes[0].vertex_positions
+        np.testing.assert_allclose(np.abs(converted).max(), np.abs(vertices).max() * scale)
+
+
+def test_load_options_validation(fbx_path):
+    """Invalid conversion options are rejected before loading."""
+    with pytest.raises(ValueError):
+        ufbx.load_file(fbx_path, target_axes=(0, 1, 4))
+    with pytest.raises(TypeError):
+        ufbx.load_file(fbx_path, target_axes="y-up")
+    with pytest.raises(ValueError):
+        ufbx.load_file(fbx_path, target_unit_meters=0.0)
+    with pytest.raises(ValueError):
+        ufbx.load_file(fbx_path, space_conversion=7)
@@ -0,0 +1,48 @@
+"""
+Tests for Mesh.bounds, Node.world_bounds and Scene.bounds_table
+"""
+
+import numpy as np
+
+import ufbx
+
+
+def test_bounds_properties():
+    """Bounds accessors exist."""
+    assert hasattr(ufbx.Mesh, "bounds")
+    assert hasattr(ufbx.Node, "world_bounds")
+    assert hasattr(ufbx.Scene, "bounds")
+    assert hasattr(ufbx.Scene, "bounds_table")
+
+
+def test_mesh_bounds(fbx_path):
+    """Mesh bounds match the vertex extents."""
+    with ufbx.load_file(fbx_path) as scene:
+        mesh = scene.meshes[0]
+        positions = mesh.vertex_positions
+        np.testing.assert_array_equal(mesh.bounds[0], positions.min(axis=0))
+        np.testing.assert_array_equal(mesh.bounds[1], positions.max(axis=0))
+        assert not mesh.bounds.flags.writeable
+
+
+def test_world_bounds(fbx_path):
+    """Node and scene bounds match transformed vertices; table is cached."""
+    with ufbx.load_file(fbx_path) as scene:
+        table = scene.bounds_table()
+        assert table.shape == (len(scene.nodes), 2, 3)
+        assert scene.bounds_table() is table
+
+        flat = scene.flatten_geometry()
+        for i, node in enumerate(scene.nodes):
+            if node.mesh is None:
+                assert node.world_bounds is None
+                assert np.isnan(table[i]).all()
+                continue
+            points = flat.positions[np.unique(flat.indices[flat.node_ids == i])]
+            np.testing.assert_allclose(node.world_bounds[0], points.min(axis=0))
+            np.testing.assert_allclose(node.world_bounds[1], points.max(axis=0))
+
+        np.testing.assert_allclose(scene.bounds[0], flat.positions.min(axis=0))
+        np.testing.assert_allclose(scene.bounds[1], flat.positions.max(axis=0))
+        cube = scene.find_node("Cube")
+        np.testing.assert_allclose(cube.world_bounds.mean(axis=0), cube.world_transform[3, :3])
@@ -0,0 +1,83 @@
+"""
+Tests for Scene.build_bvh and BVH queries
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_bvh_classes():
+    """BVH and its result types are exported."""
+    assert hasattr(ufbx.Scene, "build_bvh")
+    for name in ("raycast", "closest_point", "num_triangles", "num_nodes", "depth", "geometry"):
+        assert hasattr(ufbx.BVH, name)
+    assert hasattr(ufbx, "RaycastResult")
+    assert hasattr(ufbx, "ClosestPointResult")
+
+
+def _brute_force_raycast(triangles, origin, direction):
+    direction = direction / np.linalg.norm(direction)
+    best = np.inf
+    for p0, p1, p2 in triangles:
+        e1, e2 = p1 - p0, p2 - p0
+        pv = np.cross(direction, e2)
+        det = e1 @ pv
+        if det == 0.0:
+            continue
+        tv = origin - p0
+        u = (tv @ pv) / det
+        qv = np.cross(tv, e1)
+        v = (direction @ qv) / det
+        t = (e2 @ qv) / det
+        if u >= 0 and v >= 0 and u + v <= 1 and 0 < t < best:
+            best = t
+    return best
+
+
+def test_raycast(fbx_path):
+    """Raycasts hit the expected instance and agree with brute force."""
+    with ufbx.load_file(fbx_path) as scene:
+        bvh = scene.build_bvh()
+        cube = scene.nodes.index(scene.find_node("Cube"))
+    assert bvh.num_triangles == len(bvh.geometry.indices) > 0
+
+    hits = bvh.raycast([[10.0, 0.0, 10.0], [50.0, 50.0, 50.0]], [0.0, 0.0, -2.0])
+    assert hits.hit.tolist() == [True, False]
+    assert hits.node_ids.tolist() == [cube, -1]
+    np.testing.assert_allclose(hits.position[0], [10.0, 0.0, 1.0])
+    assert hits.distance[0] == pytest.approx(9.0)
+    assert np.isinf(hits.distance[1]) and hits.triangle[1] == -1
+    assert not bvh.raycast([10.0, 0.0, 10.0], [0.0, 0.0, -1.0], max_distance=5.0).hit[0]
+
+    triangles = bvh.geometry.positions[bvh.geometry.indices]
+    rng = np.random.default_rng(0)
+    origins = rng.uniform(-5.0, 15.0, (200, 3))
+    directions = rng.normal(size=(200, 3))
+    hits = bvh.raycast(origins, directions, workers=2)
+    expected = [_brute_force_raycast(triangles, o, d) for o, d in zip(origins, directions)]
+    np.testing.assert_allclose(hits.distance, expected)
+
+    rays = bvh.raycast(np.tile(origins, (10, 1)), np.tile(directions, (10, 1)), workers=4)
+    np.testing.assert_array_equal(rays.triangle[:200], hits.triangle)
+
+
+def test_closest_point(fbx_path):
+    """Closest points lie on the surface and respect max_distance."""
+    with ufbx.load_file(fbx_path) as scene:
+        bvh = scene.build_bvh(nodes=["Cube"])
+
+    near = bvh.closest_point([[10.0, 0.0, 3.0], [13.0, 0.0, 0.0], [10.0, 0.0, 0.5]])
+    np.testing.assert_allclose(near.position, [[10.0, 0.0, 1.0], [11.0, 0.0, 0.0], [10.0, 0.0, 1.0]])
+    np.testing.assert_allclose(near.distance, [2.0, 2.0, 0.5])
+    assert (near.triangle >= 0).all()
+
+    far = bvh.closest_point([[0.0, 0.0, 0.0]], max_distance=1.0)
+    assert far.triangle[0] == -1 and far.node_ids[0] == -1
+    assert np.isinf(far.distance[0]) and np.isnan(far.position[0]).all()
+
+    with pytest.raises(ValueError):
+        bvh.closest_point([[10.0, 0.0, 3.0]], max_distance=-5.0)
+    with pytest.raises(ValueError):
+        bvh.raycast([10.0, 0.0, 10.0], [0.0, 0.0, -1.0], max_distance=-1.0)
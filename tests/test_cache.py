@@ -0,0 +1,88 @@
+"""
+Tests for the ufbx.cache on-disk scene cache
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_cache_module():
+    """ufbx.cache is importable from the package."""
+    assert callable(ufbx.cache.load)
+    assert hasattr(ufbx.cache, "CachedScene")
+    assert hasattr(ufbx.AnimStack, "sample_transforms")
+
+
+@pytest.fixture
+def fbx_path(fbx_path, tmp_path):
+    # Private copy so tests can touch it
+    copy = tmp_path / "scene.fbx"
+    shutil.copyfile(fbx_path, copy)
+    return str(copy)
+
+
+def test_cache_cold_and_warm(fbx_path, tmp_path):
+    """First load parses and writes the cache, second load maps it."""
+    cache_dir = str(tmp_path / "cache")
+    cold = ufbx.cache.load(fbx_path, cache_dir)
+    assert not cold.from_cache
+    assert os.path.exists(cold.cache_path)
+
+    warm = ufbx.cache.load(fbx_path, cache_dir)
+    assert warm.from_cache
+    assert warm.cache_path == cold.cache_path
+
+    with ufbx.load_file(fbx_path) as scene:
+        flat = scene.flatten_geometry()
+        table = scene.node_table()
+        assert warm.node_names == [node.name for node in scene.nodes]
+        assert warm.material_names == [material.name for material in scene.materials]
+        assert len(warm.animations) == len(scene.anim_stacks)
+
+    np.testing.assert_array_equal(warm.geometry.positions, flat.positions)
+    np.testing.assert_array_equal(warm.geometry.indices, flat.indices)
+    np.testing.assert_array_equal(warm.geometry.material_ids, flat.material_ids)
+    np.testing.assert_array_equal(warm.node_table.world, table.world)
+    np.testing.assert_array_equal(warm.node_table.parent, table.parent)
+    assert not warm.geometry.positions.flags.writeable
+
+
+def test_cache_invalidation(fbx_path, tmp_path, monkeypatch):
+    """Touching keeps the entry; version or fps mismatch re-parses."""
+    cache_dir = str(tmp_path / "cache")
+    cache_path = ufbx.cache.load(fbx_path, cache_dir).cache_path
+
+    st = os.stat(fbx_path)
+    os.utime(fbx_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    touched = ufbx.cache.load(fbx_path, cache_dir)
+    assert touched.from_cache
+    assert len(touched.geometry.positions) > 0
+    header, buf = ufbx.cache._open(cache_path)
+    buf.close()
+    assert header["source"]["mtime_ns"] == os.stat(fbx_path).st_mtime_ns
+
+    def no_hash(path):
+        raise AssertionError("warm load re-hashed an unchanged source")
+
+    monkeypatch.setattr(ufbx.cache, "_hash_file", no_hash)
+    assert ufbx.cache.load(fbx_path, cache_dir).from_cache
+    monkeypatch.undo()
+
+    assert not ufbx.cache.load(fbx_path, cache_dir, fps=24.0).from_cache
+    assert ufbx.cache.load(fbx_path, cache_dir, fps=24.0).from_cache
+
+    with open(cache_path, "r+b") as f:
+        f.seek(8)
+        f.write((ufbx.cache.FORMAT_VERSION + 1).to_bytes(4, "little"))
+    reloaded = ufbx.cache.load(fbx_path, cache_dir, fps=24.0)
+    assert not reloaded.from_cache
+    assert len(reloaded.node_names) > 0
+
+    with open(cache_path, "wb") as f:
+        f.write(b"garbage")
+    assert not ufbx.cache.load(fbx_path, cache_dir).from_cache
@@ -0,0 +1,141 @@
+"""
+Tests for the python -m ufbx batch commands
+"""
+
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from ufbx import cli
+
+
+@pytest.fixture
+def inputs(tmp_path, fbx_path):
+    """Directory with two copies of the fixture and one broken file"""
+    root = tmp_path / "in"
+    (root / "sub").mkdir(parents=True)
+    shutil.copy(fbx_path, root / "a.fbx")
+    shutil.copy(fbx_path, root / "sub" / "b.FBX")
+    (root / "broken.fbx").write_bytes(b"not an fbx file")
+    return root
+
+
+def _manifest(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_convert_and_resume(inputs, tmp_path, capsys):
+    """convert writes .npz files and a manifest, and skips finished inputs on resume."""
+    out = tmp_path / "out"
+    assert cli.main(["convert", str(inputs), "-o", str(out), "--workers", "1"]) == 1
+    records = {os.path.basename(r["input"]): r for r in _manifest(out / "manifest.jsonl")}
+    assert records["broken.fbx"]["status"] == "error"
+    assert records["a.fbx"]["status"] == "ok"
+    assert "converted 2, skipped 0, failed 1" in capsys.readouterr().err
+
+    with np.load(out / "sub" / "b.npz") as data:
+        assert int(data["version"]) == cli.NPZ_VERSION
+        assert data["positions"].dtype == np.float32
+        assert data["indices"].shape == (24, 3)  # Cube and Cube_LOD0 instances
+        assert list(data["node_names"]) == ["", "Root_Null", "Cube", "Cube_LOD0"]
+        assert data["node_world"].shape == (4, 4, 4)
+
+    os.remove(inputs / "broken.fbx")
+    assert cli.main(["convert", str(inputs), "-o", str(out), "--workers", "1"]) == 0
+    assert "converted 0, skipped 2, failed 0" in capsys.readouterr().err
+
+    os.utime(inputs / "a.fbx", ns=(0, 0))
+    assert cli.main(["convert", str(inputs), "-o", str(out), "--workers", "1", "--double"]) == 0
+    assert "converted 1, skipped 1, failed 0" in capsys.readouterr().err
+    with np.load(out / "a.npz") as data:
+        assert data["positions"].dtype == np.float64
+
+
+def test_convert_colliding_names(inputs, tmp_path, capsys):
+    """Inputs that would share an output name get distinct, stable names."""
+    other = tmp_path / "other"
+    (other / "sub").mkdir(parents=True)
+    shutil.copy(inputs / "sub" / "b.FBX", other / "sub" / "b.fbx")
+    shutil.copy(inputs / "a.fbx", other / "a.fbx")
+    os.remove(inputs / "broken.fbx")
+
+    collected = cli._collect_inputs([str(inputs), str(other), str(inputs / "a.fbx")])
+    assert len(collected) == 4
+    stems = [stem for _, stem in collected]
+    assert len({stem.lower() for stem in stems}) == 4
+    assert all(stem.startswith(("a-", os.path.join("sub", "b-"))) for stem in stems)
+
+    out = tmp_path / "out"
+    args = ["convert", str(inputs), str(other), str(inputs / "a.fbx"), "-o", str(out), "--workers", "1"]
+    assert cli.main(args) == 0
+    assert "converted 4, skipped 0, failed 0" in capsys.readouterr().err
+    outputs = {record["output"] for record in _manifest(out / "manifest.jsonl")}
+    assert len(outputs) == 4 and all(os.path.exists(path) for path in outputs)
+    assert cli.main(args) == 0
+    assert "converted 0, skipped 4, failed 0" in capsys.readouterr().err
+
+
+def test_convert_workers(inputs, tmp_path, capsys):
+    """Multi-worker convert writes the same outputs and manifest as one worker."""
+    serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+    assert cli.main(["convert", str(inputs), "-o", str(serial), "--workers", "1"]) == 1
+    assert cli.main(["convert", str(inputs), "-o", str(parallel), "--workers", "3"]) == 1
+    assert "converted 2, skipped 0, failed 1" in capsys.readouterr().err
+
+    def statuses(out):
+        return {os.path.relpath(r["input"], inputs): r["status"] for r in _manifest(out / "manifest.jsonl")}
+
+    assert statuses(parallel) == statuses(serial)
+    for name in ("a.npz", os.path.join("sub", "b.npz")):
+        with np.load(serial / name) as expected, np.load(parallel / name) as actual:
+            np.testing.assert_array_equal(actual["positions"], expected["positions"])
+
+
+def _exit_on_crash(task):
+    """Worker task that kills its process for inputs named crash*"""
+    path, _ = task
+    if os.path.basename(path).startswith("crash"):
+        os._exit(3)
+    return {"status": "ok", "input": path}
+
+
+def test_worker_crash(tmp_path):
+    """A worker dying hard fails only its own task and the batch completes."""
+    tasks = [(str(tmp_path / f"{name}{i}.fbx"), None) for i in range(4) for name in ("model", "crash")]
+    records = {record["input"]: record for record in cli._run_tasks(_exit_on_crash, tasks, 2)}
+    assert len(records) == len(tasks)
+    for path, _ in tasks:
+        crashed = os.path.basename(path).startswith("crash")
+        assert records[path]["status"] == ("error" if crashed else "ok")
+    assert all(r["error"] == "Worker process died" for r in records.values() if r["status"] == "error")
+
+
+def test_process_pool(inputs, tmp_path, capsys):
+    """stats and extract-textures fan out over worker processes."""
+    assert cli.main(["stats", str(inputs), "--workers", "2"]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(records) == 3
+    ok = [r for r in records if r["status"] == "ok"]
+    assert len(ok) == 2
+    assert all(r["nodes"] == 4 and r["triangles"] == 12 for r in ok)
+
+    tex = tmp_path / "tex"
+    os.remove(inputs / "broken.fbx")
+    assert cli.main(["extract-textures", str(inputs), "-o", str(tex), "--workers", "2"]) == 0
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    paths = {path for r in records for path in r["textures"].values()}
+    assert len(paths) == 1  # Both inputs embed the same image
+    assert os.listdir(tex) == [os.path.basename(paths.pop())]
+
+
+def test_memory_budget(inputs, capsys):
+    """Budgets are given in MiB and must be positive."""
+    assert cli.main(["stats", str(inputs / "a.fbx"), "--workers", "1", "--max-memory", "1",
+                     "--max-temp-memory", "1"]) == 0
+    assert json.loads(capsys.readouterr().out)["result_bytes"] <= 1 << 20
+    with pytest.raises(SystemExit):
+        cli.main(["stats", str(inputs / "a.fbx"), "--max-memory", "0"])
@@ -0,0 +1,88 @@
+"""
+Tests for LoadOptions, DomNode, and Scene.dom_root
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_dom_classes_exported():
+    """DomNode, DomValueType and LoadOptions are exported."""
+    assert hasattr(ufbx, "DomNode")
+    assert hasattr(ufbx, "DomValueType")
+    assert hasattr(ufbx, "LoadOptions")
+    assert ufbx.DomValueType.DOM_VALUE_NUMBER == 0
+    assert ufbx.DomValueType.DOM_VALUE_ARRAY_F64 == 6
+
+
+def test_dom_properties():
+    """DOM accessors exist on Scene, Node, Mesh and DomNode."""
+    assert hasattr(ufbx.Scene, "dom_root")
+    assert hasattr(ufbx.Node, "dom_node")
+    assert hasattr(ufbx.Mesh, "dom_node")
+    for name in ("name", "children", "values", "is_array", "array_size", "array", "find"):
+        assert hasattr(ufbx.DomNode, name)
+
+
+def test_load_options():
+    """LoadOptions defaults and repr."""
+    opts = ufbx.LoadOptions()
+    assert opts.retain_dom is False
+    assert ufbx.LoadOptions(retain_dom=True).retain_dom is True
+    assert "retain_dom=False" in repr(opts)
+    with pytest.raises(AttributeError):
+        opts.not_an_option = 1
+
+
+def test_load_file_rejects_unknown_option(tmp_path):
+    """Unknown keyword options and wrong option types raise TypeError."""
+    path = tmp_path / "empty.fbx"
+    path.write_bytes(b"")
+    with pytest.raises(TypeError):
+        ufbx.load_file(str(path), not_an_option=True)
+    with pytest.raises(TypeError):
+        ufbx.load_file(str(path), {"retain_dom": True})
+
+
+def test_dom_root_requires_retain_dom(fbx_path):
+    """Without retain_dom the DOM is not kept."""
+    with ufbx.load_file(fbx_path) as scene:
+        assert scene.dom_root is None
+        assert scene.nodes[0].dom_node is None
+
+
+def test_dom_tree(fbx_path):
+    """DOM tree can be walked and searched."""
+    with ufbx.load_file(fbx_path, ufbx.LoadOptions(retain_dom=True)) as scene:
+        root = scene.dom_root
+        assert isinstance(root, ufbx.DomNode)
+        assert "Objects" in [child.name for child in root]
+        objects = root.find("Objects")
+        assert objects is not None
+        assert len(objects) == len(objects.children) > 0
+        assert root.find("NoSuchNode") is None
+
+        mesh_dom = scene.meshes[0].dom_node
+        assert mesh_dom is not None
+        assert mesh_dom.name == "Geometry"
+        assert isinstance(mesh_dom.values[0], int)
+
+
+def test_dom_array_zero_copy(fbx_path):
+    """Array payloads are read-only views that keep the scene alive."""
+    scene = ufbx.load_file(fbx_path, retain_dom=True)
+    vertices = scene.meshes[0].dom_node.find("Vertices")
+    assert vertices.is_array
+    arr = vertices.array
+    assert isinstance(arr, np.ndarray)
+    assert arr.dtype == np.float64
+    assert arr.size == vertices.array_size
+    assert arr.size == scene.meshes[0].num_vertices * 3
+    assert not arr.flags.writeable
+    with pytest.raises(ValueError):
+        arr[0] = 0.0
+
+    del scene, vertices
+    assert np.isfinite(arr).all()
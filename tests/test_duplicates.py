@@ -0,0 +1,93 @@
+"""
+Tests for Scene.find_duplicate_meshes() and MeshRegistry
+"""
+
+import json
+
+import pytest
+
+import ufbx
+
+QUAD = "0,0,0,1,0,0,1,1,0,0,1,0"
+SHIFTED = "0,0,0,2,0,0,2,1,0,0,1,0"
+
+
+def _write_fbx(path, geometries):
+    """ASCII FBX with one mesh node per (name, vertices) geometry"""
+    objects, connections = [], []
+    for i, (name, vertices) in enumerate(geometries):
+        geometry_id, model_id = 100 + i, 200 + i
+        objects.append(f'\tGeometry: {geometry_id}, "Geometry::{name}", "Mesh" {{\n'
+                       f'\t\tVertices: *12 {{\n\t\t\ta: {vertices}\n\t\t}}\n'
+                       f'\t\tPolygonVertexIndex: *4 {{\n\t\t\ta: 0,1,2,-4\n\t\t}}\n\t}}\n')
+        objects.append(f'\tModel: {model_id}, "Model::{name}", "Mesh" {{\n'
+                       f'\t\tProperties70:  {{\n'
+                       f'\t\t\tP: "Lcl Translation", "Lcl Translation", "", "A",{i},0,0\n\t\t}}\n\t}}\n')
+        connections.append(f'\tC: "OO",{model_id},0\n\tC: "OO",{geometry_id},{model_id}\n')
+    with open(path, "w") as f:
+        f.write("; FBX 7.4.0 project file\nFBXHeaderExtension:  {\n\tFBXVersion: 7400\n}\n")
+        f.write("Objects:  {\n" + "".join(objects) + "}\n")
+        f.write("Connections:  {\n" + "".join(connections) + "}\n")
+    return str(path)
+
+
+def test_duplicates_exported():
+    """MeshDuplicates, MeshRegistry and find_duplicate_meshes exist."""
+    assert hasattr(ufbx, "MeshDuplicates")
+    assert hasattr(ufbx, "MeshRegistry")
+    assert hasattr(ufbx.Scene, "find_duplicate_meshes")
+    assert "MeshRegistry(size=0" in repr(ufbx.MeshRegistry())
+
+
+def test_find_duplicate_meshes(tmp_path):
+    """Identical meshes under different nodes and names share a hash."""
+    path = _write_fbx(tmp_path / "a.fbx", [("A", QUAD), ("B", SHIFTED), ("C", QUAD)])
+    with ufbx.load_file(path) as scene:
+        result = scene.find_duplicate_meshes()
+        assert [mesh.name for mesh in scene.meshes] == ["A", "B", "C"]
+        again = scene.find_duplicate_meshes()
+
+    assert isinstance(result, ufbx.MeshDuplicates)
+    assert result.hashes == again.hashes
+    assert all(len(h) == 32 for h in result.hashes)
+    assert result.hashes[0] == result.hashes[2] != result.hashes[1]
+    assert result.canonical.tolist() == [0, 1, 0]
+    assert result.groups == [[0, 2]]
+    assert result.num_unique == 2
+    assert result.instances == [None, None, None]
+    assert json.loads(json.dumps(result.as_dict()))["canonical"] == [0, 1, 0]
+
+
+def test_mesh_registry_across_scenes(tmp_path):
+    """A shared registry maps meshes of later files onto their first occurrence."""
+    first = _write_fbx(tmp_path / "first.fbx", [("A", QUAD)])
+    second = _write_fbx(tmp_path / "second.fbx", [("B", SHIFTED), ("C", QUAD)])
+
+    registry = ufbx.MeshRegistry()
+    with ufbx.load_file(first) as scene:
+        assert scene.find_duplicate_meshes(registry, source="first").instances == [("first", 0)]
+    with ufbx.load_file(second) as scene:
+        result = scene.find_duplicate_meshes(registry)
+    assert result.instances == [(second, 0), ("first", 0)]
+    assert len(registry) == 2 and registry.hits == 1
+    assert registry.get(result.hashes[1]) == ("first", 0)
+
+    # Entries survive a JSON round trip
+    restored = ufbx.MeshRegistry(json.loads(json.dumps(registry.entries)))
+    assert restored.entries == registry.entries
+    assert result.hashes[0] in restored
+
+    with pytest.raises(TypeError), ufbx.load_file(first) as scene:
+        scene.find_duplicate_meshes(registry={})
+
+
+def test_find_duplicate_meshes_fixture(fbx_path):
+    """One mesh instanced by two nodes is a single unique mesh."""
+    with ufbx.load_file(fbx_path) as scene:
+        result = scene.find_duplicate_meshes()
+        geometry_only = scene.find_duplicate_meshes(attributes=False)
+    assert result.groups == [] and result.num_unique == 1
+    # Face materials only enter the hash with attributes
+    assert geometry_only.hashes != result.hashes
+    with pytest.raises(RuntimeError):
+        scene.find_duplicate_meshes()
@@ -0,0 +1,115 @@
+"""
+Tests for per-scene element wrapper caching, Element equality/hashing and ElementList views
+"""
+
+import gc
+import weakref
+
+import pytest
+
+import ufbx
+
+
+def test_element_identity_api():
+    """Element exposes element_id and defines equality and hashing."""
+    assert hasattr(ufbx.Element, "element_id")
+    assert ufbx.Element.__eq__ is not object.__eq__
+    assert ufbx.Element.__hash__ is not None
+
+
+def test_wrappers_are_cached(fbx_path):
+    """Repeated traversal returns the same wrapper objects."""
+    with ufbx.load_file(fbx_path) as scene:
+        first = scene.nodes
+        second = scene.nodes
+        assert all(a is b for a, b in zip(first, second))
+        root = scene.root_node
+        assert root is first[0]
+        for child in root.children:
+            assert child.parent is root
+        mesh_nodes = [node for node in first if node.mesh is not None]
+        assert mesh_nodes[0].mesh is scene.meshes[0]
+
+
+def test_dropped_scene_is_freed(tmp_path):
+    """Cached wrappers do not keep a dropped scene alive through a reference cycle."""
+    path = tmp_path / "quad.fbx"
+    path.write_text(
+        "; FBX 7.4.0 project file\nFBXHeaderExtension:  {\n\tFBXVersion: 7400\n}\n"
+        'Objects:  {\n\tModel: 200, "Model::Quad", "Null" {\n\t}\n}\n'
+        'Connections:  {\n\tC: "OO",200,0\n}\n'
+    )
+
+    gc.disable()
+    try:
+        scene = ufbx.load_file(str(path))
+        nodes = list(scene.nodes)
+        assert nodes[1].parent is nodes[0]
+        ref = weakref.ref(scene)
+        del scene, nodes
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_elements_as_dict_keys(fbx_path):
+    """Elements hash and compare by (scene, element)."""
+    with ufbx.load_file(fbx_path) as scene:
+        index = {node: i for i, node in enumerate(scene.nodes)}
+        assert len(index) == len(scene.nodes)
+        for i, node in enumerate(scene.nodes):
+            assert index[node] == i
+        ids = {node.element_id for node in scene.nodes}
+        assert len(ids) == len(scene.nodes)
+        assert scene.nodes[0] != scene.meshes[0]
+        assert scene.nodes[0] != "not an element"
+
+        with ufbx.load_file(fbx_path) as other:
+            assert other.nodes[0] != scene.nodes[0]
+            assert other.nodes[0].element_id == scene.nodes[0].element_id
+
+
+def test_element_id_after_close(fbx_path):
+    """element_id after close() raises RuntimeError."""
+    scene = ufbx.load_file(fbx_path)
+    node = scene.root_node
+    scene.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        _ = node.element_id
+
+
+def test_scene_collections_are_lazy_views(fbx_path):
+    """Scene collections are ElementList sequence views."""
+    from collections.abc import Sequence
+
+    with ufbx.load_file(fbx_path) as scene:
+        nodes = scene.nodes
+        assert isinstance(nodes, ufbx.ElementList)
+        assert isinstance(nodes, Sequence)
+        assert len(nodes) == len(list(nodes))
+        assert nodes[-1] is nodes[len(nodes) - 1]
+        assert nodes[0:2] == list(nodes)[0:2]
+        assert list(reversed(nodes)) == list(nodes)[::-1]
+        assert nodes == list(nodes)
+        with pytest.raises(IndexError):
+            nodes[len(nodes)]
+
+        cube = nodes[-1]
+        assert cube in nodes
+        assert nodes.index(cube) == len(nodes) - 1
+        assert nodes.count(cube) == 1
+        if len(scene.meshes):
+            assert scene.meshes[0] not in nodes
+            with pytest.raises(ValueError):
+                nodes.index(scene.meshes[0])
+
+    with pytest.raises(RuntimeError, match="closed"):
+        len(nodes)
+
+
+def test_element_type_matches_c_enum():
+    """ElementType values follow ufbx_element_type."""
+    assert ufbx.ElementType.ELEMENT_BONE == 5
+    assert ufbx.ElementType.ELEMENT_EMPTY == 6
+    assert ufbx.ElementType.ELEMENT_MATERIAL == 24
+    assert ufbx.ElementType.ELEMENT_METADATA_OBJECT == 41
@@ -0,0 +1,110 @@
+"""
+Tests for mesh attribute arrays and scene-wide geometry helpers (Scene.flatten_geometry)
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_flatten_geometry_exists():
+    """Scene exposes flatten_geometry and FlattenedGeometry is exported."""
+    assert hasattr(ufbx.Scene, "flatten_geometry")
+    assert hasattr(ufbx, "FlattenedGeometry")
+
+
+def test_vertex_positions_dtype(fbx_path):
+    """Vertex attribute views use the ufbx_real (double) layout."""
+    with ufbx.load_file(fbx_path) as scene:
+        positions = scene.meshes[0].vertex_positions
+        assert positions.dtype == np.float64
+        assert np.isfinite(positions).all()
+
+
+def test_attribute_array_exports(fbx_path):
+    """Mesh attributes are read-only views exported via buffer, array interface and DLPack."""
+    with ufbx.load_file(fbx_path) as scene:
+        positions = scene.meshes[0].vertex_positions
+        indices = scene.meshes[0].indices
+        expected = np.array(positions)
+
+    assert isinstance(positions, ufbx.AttributeArray)
+    assert not positions.flags.writeable
+    with pytest.raises(ValueError):
+        positions[0, 0] = 1.0
+
+    # Views outlive Scene.close()
+    np.testing.assert_array_equal(positions, expected)
+    assert memoryview(indices).readonly
+    assert positions.__array_interface__["data"][1] is True
+    assert type(positions * 2) is np.ndarray
+
+    assert positions.__dlpack_device__() == (1, 0)
+    if np.lib.NumpyVersion(np.__version__) >= "2.1.0":
+        # NumPy's importer speaks DLPack 1.0
+        imported = np.from_dlpack(positions)
+        assert np.shares_memory(imported, positions)
+        assert not imported.flags.writeable
+
+    # Legacy (pre-1.0) consumers cannot see read-only, so they get a copy
+    legacy = positions.__dlpack__()
+    assert legacy is not None
+    with pytest.raises(BufferError):
+        positions.__dlpack__(copy=False)
+
+
+def test_flatten_geometry_triangulated(fbx_path):
+    """Triangulated output matches per-mesh triangle and vertex counts."""
+    with ufbx.load_file(fbx_path) as scene:
+        geo = scene.flatten_geometry()
+        instances = [node for node in scene.nodes if node.mesh is not None]
+        assert geo.positions.shape == (sum(n.mesh.num_vertices for n in instances), 3)
+        assert geo.indices.shape == (sum(n.mesh.num_triangles for n in instances), 3)
+        assert geo.indices.dtype == np.uint32
+        assert geo.indices.max() < len(geo.positions)
+        assert len(geo.node_ids) == len(geo.material_ids) == len(geo.indices)
+        assert geo.face_sizes is None
+        assert set(geo.node_ids.tolist()) <= set(range(len(scene.nodes)))
+        assert geo.material_ids.max() < len(scene.materials)
+        assert "FlattenedGeometry" in repr(geo)
+
+
+def test_flatten_geometry_world_space(fbx_path):
+    """World-space positions match node.geometry_to_world applied in NumPy."""
+    with ufbx.load_file(fbx_path) as scene:
+        node = next(node for node in scene.nodes if node.mesh is not None)
+        local = scene.flatten_geometry(world_space=False, include=[node])
+        world = scene.flatten_geometry(include=[node.name])
+        np.testing.assert_allclose(local.positions, node.mesh.vertex_positions)
+
+        # world_transform is stored transposed (column-major data in a C array)
+        m = np.asarray(node.world_transform).T
+        expected = local.positions @ m[:3, :3].T + m[:3, 3]
+        np.testing.assert_allclose(world.positions, expected, atol=1e-9)
+        assert (world.node_ids == world.node_ids[0]).all()
+
+
+def test_flatten_geometry_polygons(fbx_path):
+    """Untriangulated output keeps polygon corners and face sizes."""
+    with ufbx.load_file(fbx_path) as scene:
+        node = next(node for node in scene.nodes if node.mesh is not None)
+        geo = scene.flatten_geometry(triangulate=False, include=[node])
+        assert len(geo.face_sizes) == node.mesh.num_faces
+        assert geo.face_sizes.sum() == len(geo.indices) == node.mesh.num_indices
+
+
+def test_flatten_geometry_include_errors(fbx_path):
+    """Empty and invalid selections."""
+    with ufbx.load_file(fbx_path) as scene:
+        empty = scene.flatten_geometry(include=[])
+        assert empty.positions.shape == (0, 3)
+        assert empty.indices.shape == (0, 3)
+        polygons = scene.flatten_geometry(triangulate=False, include=iter(()))
+        assert len(polygons.indices) == len(polygons.face_sizes) == 0
+        with pytest.raises(KeyError):
+            scene.flatten_geometry(include=["__no_such_node__"])
+        with pytest.raises(TypeError):
+            scene.flatten_geometry(include=[42])
+        with pytest.raises(TypeError):
+            scene.flatten_geometry(exclude=[])
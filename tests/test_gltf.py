@@ -0,0 +1,321 @@
+"""
+Tests for Scene.export_glb() and ufbx.gltf
+"""
+
+import io
+import json
+import struct
+
+import numpy as np
+import pytest
+
+import ufbx
+
+KTIME_SECOND = 46186158000
+
+# A quad skinned to one animated bone: vertices 2 and 3 are weighted to the bone
+SKINNED_FBX = f"""; FBX 7.4.0 project file
+FBXHeaderExtension:  {{
+	FBXHeaderVersion: 1003
+	FBXVersion: 7400
+}}
+Objects:  {{
+	Geometry: 100, "Geometry::Quad", "Mesh" {{
+		Vertices: *12 {{
+			a: 0,0,0,1,0,0,1,1,0,0,1,0
+		}}
+		PolygonVertexIndex: *4 {{
+			a: 0,1,2,-4
+		}}
+	}}
+	Model: 200, "Model::Quad", "Mesh" {{
+	}}
+	Model: 300, "Model::Bone", "LimbNode" {{
+		Properties70:  {{
+			P: "Lcl Translation", "Lcl Translation", "", "A",0,1,0
+		}}
+	}}
+	NodeAttribute: 301, "NodeAttribute::Bone", "LimbNode" {{
+		TypeFlags: "Skeleton"
+	}}
+	Deformer: 400, "Deformer::Skin", "Skin" {{
+		Version: 101
+	}}
+	Deformer: 500, "SubDeformer::Cluster", "Cluster" {{
+		Version: 100
+		Indexes: *2 {{
+			a: 2,3
+		}}
+		Weights: *2 {{
+			a: 1,1
+		}}
+		Transform: *16 {{
+			a: 1,0,0,0,0,1,0,0,0,0,1,0,0,-1,0,1
+		}}
+		TransformLink: *16 {{
+			a: 1,0,0,0,0,1,0,0,0,0,1,0,0,1,0,1
+		}}
+	}}
+	AnimationStack: 600, "AnimStack::Take 001", "" {{
+		Properties70:  {{
+			P: "LocalStart", "KTime", "Time", "",0
+			P: "LocalStop", "KTime", "Time", "",{KTIME_SECOND}
+		}}
+	}}
+	AnimationLayer: 601, "AnimLayer::BaseLayer", "" {{
+	}}
+	AnimationCurveNode: 602, "AnimCurveNode::T", "" {{
+		Properties70:  {{
+			P: "d|X", "Number", "", "A",0
+			P: "d|Y", "Number", "", "A",1
+			P: "d|Z", "Number", "", "A",0
+		}}
+	}}
+	AnimationCurve: 603, "AnimCurve::", "" {{
+		Default: 0
+		KeyVer: 4008
+		KeyTime: *2 {{
+			a: 0,{KTIME_SECOND}
+		}}
+		KeyValueFloat: *2 {{
+			a: 1,3
+		}}
+		KeyAttrFlags: *1 {{
+			a: 24836
+		}}
+		KeyAttrDataFloat: *4 {{
+			a: 0,0,218434821,0
+		}}
+		KeyAttrRefCount: *1 {{
+			a: 2
+		}}
+	}}
+}}
+Connections:  {{
+	C: "OO",200,0
+	C: "OO",100,200
+	C: "OO",300,0
+	C: "OO",301,300
+	C: "OO",400,100
+	C: "OO",500,400
+	C: "OO",300,500
+	C: "OO",601,600
+	C: "OO",602,601
+	C: "OP",602,300, "Lcl Translation"
+	C: "OP",603,602, "d|Y"
+}}
+"""
+
+_DTYPES = {5123: np.uint16, 5125: np.uint32, 5126: np.float32}
+_WIDTHS = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT4": 16}
+
+
+def _parse_glb(data):
+    """Split a GLB into (json, bin) and check the container layout"""
+    magic, version, length = struct.unpack_from("<III", data, 0)
+    assert magic == 0x46546C67 and version == 2 and length == len(data)
+    json_length, json_type = struct.unpack_from("<II", data, 12)
+    assert json_type == 0x4E4F534A and json_length % 4 == 0
+    gltf = json.loads(data[20:20 + json_length])
+    offset = 20 + json_length
+    if offset == len(data):
+        return gltf, b""
+    bin_length, bin_type = struct.unpack_from("<II", data, offset)
+    assert bin_type == 0x004E4942 and offset + 8 + bin_length == len(data)
+    buffer, = gltf["buffers"]
+    assert bin_length % 4 == 0 and bin_length - 3 <= buffer["byteLength"] <= bin_length
+    return gltf, data[offset + 8:offset + 8 + buffer["byteLength"]]
+
+
+def _accessor(gltf, blob, index):
+    accessor = gltf["accessors"][index]
+    view = gltf["bufferViews"][accessor["bufferView"]]
+    width = _WIDTHS[accessor["type"]]
+    dtype = np.dtype(_DTYPES[accessor["componentType"]])
+    assert view["byteOffset"] % 4 == 0
+    assert accessor["count"] * width * dtype.itemsize <= view["byteLength"]
+    assert view["byteOffset"] + view["byteLength"] <= len(blob)
+    values = np.frombuffer(blob, dtype, accessor["count"] * width, view["byteOffset"])
+    return values.reshape(accessor["count"], width)
+
+
+def _check_accessors(gltf, blob):
+    for index, accessor in enumerate(gltf["accessors"]):
+        values = _accessor(gltf, blob, index)
+        if "min" in accessor:
+            np.testing.assert_allclose(values.min(axis=0), accessor["min"], rtol=1e-6)
+            np.testing.assert_allclose(values.max(axis=0), accessor["max"], rtol=1e-6)
+
+
+def test_gltf_exported():
+    """export_glb and ufbx.gltf are available."""
+    assert hasattr(ufbx.Scene, "export_glb")
+    assert callable(ufbx.gltf.export_glb)
+    options = ufbx.gltf.ExportOptions()
+    assert options.animation and options.skins and options.fps == 30.0
+    assert "ExportOptions(" in repr(options)
+
+
+def test_export_glb_fixture(fbx_path, tmp_path):
+    """Nodes, per-material primitives, materials and the embedded texture."""
+    out = tmp_path / "cube.glb"
+    with ufbx.load_file(fbx_path) as scene:
+        size = scene.export_glb(out)
+        stream = io.BytesIO()
+        assert scene.export_glb(stream) == size
+    data = out.read_bytes()
+    assert size == len(data) and stream.getvalue() == data
+
+    gltf, blob = _parse_glb(data)
+    _check_accessors(gltf, blob)
+    assert gltf["asset"]["version"] == "2.0"
+    nodes = {node.get("name"): node for node in gltf["nodes"]}
+    assert nodes["Cube"]["translation"] == [10.0, 0.0, 0.0]
+    assert nodes["Cube_LOD0"]["scale"] == [2.0, 2.0, 2.0]
+
+    mesh = gltf["meshes"][nodes["Cube"]["mesh"]]
+    materials = [gltf["materials"][p["material"]]["name"] for p in mesh["primitives"]]
+    assert sorted(materials) == ["Blue", "Red"]
+    triangles = sum(gltf["accessors"][p["indices"]]["count"] for p in mesh["primitives"]) // 3
+    assert triangles == 12
+    for primitive in mesh["primitives"]:
+        indices = _accessor(gltf, blob, primitive["indices"])
+        assert indices.max() < gltf["accessors"][primitive["attributes"]["POSITION"]]["count"]
+
+    assert gltf["images"][0]["mimeType"] == "image/png"
+    assert "animations" not in gltf
+
+
+def test_export_glb_options(fbx_path, tmp_path):
+    """Disabled materials are left out, bad options raise."""
+    with ufbx.load_file(fbx_path) as scene:
+        stream = io.BytesIO()
+        scene.export_glb(stream, ufbx.gltf.ExportOptions(materials=False))
+        gltf, _ = _parse_glb(stream.getvalue())
+        assert "materials" not in gltf and "images" not in gltf
+
+        with pytest.raises(TypeError):
+            scene.export_glb(io.BytesIO(), bogus=True)
+        with pytest.raises(ValueError):
+            scene.export_glb(io.BytesIO(), fps=0.0)
+    with pytest.raises(RuntimeError):
+        scene.export_glb(io.BytesIO())
+
+
+def test_export_glb_skin_animation(tmp_path):
+    """Skin weights, inverse bind matrices and baked bone animation."""
+    path = tmp_path / "skinned.fbx"
+    path.write_text(SKINNED_FBX)
+
+    with ufbx.load_file(str(path)) as scene:
+        stream = io.BytesIO()
+        scene.export_glb(stream, fps=10.0)
+    gltf, blob = _parse_glb(stream.getvalue())
+    _check_accessors(gltf, blob)
+
+    nodes = [node.get("name") for node in gltf["nodes"]]
+    quad, bone = gltf["nodes"][nodes.index("Quad")], nodes.index("Bone")
+    skin = gltf["skins"][quad["skin"]]
+    assert skin["joints"] == [bone]
+    inverse_bind = _accessor(gltf, blob, skin["inverseBindMatrices"]).reshape(4, 4)
+    np.testing.assert_allclose(inverse_bind[3], [0.0, -1.0, 0.0, 1.0])
+
+    attributes = gltf["meshes"][quad["mesh"]]["primitives"][0]["attributes"]
+    positions = _accessor(gltf, blob, attributes["POSITION"])
+    weights = _accessor(gltf, blob, attributes["WEIGHTS_0"])
+    assert _accessor(gltf, blob, attributes["JOINTS_0"]).max() == 0
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0, rtol=1e-6)
+    assert len(positions) == 4
+
+    animation, = gltf["animations"]
+    assert animation["name"] == "Take 001"
+    channel, = animation["channels"]
+    assert channel["target"] == {"node": bone, "path": "translation"}
+    sampler = animation["samplers"][channel["sampler"]]
+    times = _accessor(gltf, blob, sampler["input"])[:, 0]
+    values = _accessor(gltf, blob, sampler["output"])
+    assert len(times) == 11 and times[-1] == pytest.approx(1.0)
+    np.testing.assert_allclose(values[[0, -1], 1], [1.0, 3.0], rtol=1e-5)
+
+
+def _shared_bone_fbx(tmp_path):
+    """SKINNED_FBX with two more clusters on the same bone, weighting vertices 0 and 1"""
+    extra = "".join(f"""
+	Deformer: {cluster}, "SubDeformer::Cluster", "Cluster" {{
+		Version: 100
+		Indexes: *1 {{
+			a: {vertex}
+		}}
+		Weights: *1 {{
+			a: 1
+		}}
+	}}""" for cluster, vertex in ((510, 0), (520, 1)))
+    text = SKINNED_FBX.replace("\tAnimationStack: 600", extra.lstrip("\n") + "\n\tAnimationStack: 600")
+    text = text.replace('\tC: "OO",500,400\n', '\tC: "OO",500,400\n\tC: "OO",510,400\n\tC: "OO",520,400\n'
+                        '\tC: "OO",300,510\n\tC: "OO",300,520\n')
+    path = tmp_path / "shared.fbx"
+    path.write_text(text)
+    return str(path)
+
+
+def _export_skin(path):
+    with ufbx.load_file(path) as scene:
+        assert len(scene.skin_deformers[0].clusters) == 3
+        stream = io.BytesIO()
+        scene.export_glb(stream)
+    gltf, blob = _parse_glb(stream.getvalue())
+    _check_accessors(gltf, blob)
+    nodes = [node.get("name") for node in gltf["nodes"]]
+    quad = gltf["nodes"][nodes.index("Quad")]
+    attributes = gltf["meshes"][quad["mesh"]]["primitives"][0]["attributes"]
+    joints = _accessor(gltf, blob, attributes["JOINTS_0"])
+    weights = _accessor(gltf, blob, attributes["WEIGHTS_0"])
+    return gltf, blob, gltf["skins"][quad["skin"]], joints[weights > 0], nodes.index("Bone")
+
+
+def test_export_glb_shared_joints(tmp_path):
+    """Clusters bound to the same node share one glTF joint."""
+    gltf, blob, skin, joints, bone = _export_skin(_shared_bone_fbx(tmp_path))
+    assert skin["joints"] == [bone]
+    assert (joints == 0).all()
+
+
+def test_export_glb_unbound_clusters(tmp_path, monkeypatch):
+    """Clusters without a bone share one identity joint, so joints stay unique."""
+    skin_bind = ufbx.gltf._gltf_skin_bind
+
+    def unbind(skin):
+        bones, inverse_bind = skin_bind(skin)
+        bones[1:] = -1
+        return bones, inverse_bind
+
+    monkeypatch.setattr(ufbx.gltf, "_gltf_skin_bind", unbind)
+    gltf, blob, skin, joints, bone = _export_skin(_shared_bone_fbx(tmp_path))
+    assert len(skin["joints"]) == len(set(skin["joints"])) == 2
+    assert skin["joints"][0] == bone
+    dummy = skin["joints"][1]
+    assert dummy in gltf["scenes"][0]["nodes"] and "children" not in gltf["nodes"][dummy]
+    inverse_bind = _accessor(gltf, blob, skin["inverseBindMatrices"]).reshape(2, 4, 4)
+    np.testing.assert_array_equal(inverse_bind[1], np.eye(4))
+    assert sorted(set(joints.tolist())) == [0, 1]
+
+
+def test_anim_stack_animated_nodes(tmp_path):
+    """Only animated nodes are reported, and sampling a subset matches the full sample."""
+    path = tmp_path / "skinned.fbx"
+    path.write_text(SKINNED_FBX)
+
+    with ufbx.load_file(str(path)) as scene:
+        stack, = scene.anim_stacks
+        names = [node.name for node in scene.nodes]
+        animated = stack.animated_nodes()
+        assert [names[i] for i in animated] == ["Bone"]
+
+        times = np.linspace(0.0, 1.0, 5)
+        full = stack.sample_transforms(times)
+        np.testing.assert_array_equal(stack.sample_transforms(times, animated), full[:, animated])
+        assert stack.sample_transforms(times, []).shape == (5, 0, 10)
+        with pytest.raises(IndexError):
+            stack.sample_transforms(times, [len(names)])
+        with pytest.raises(TypeError):
+            stack.sample_transforms(times, ["Bone"])
@@ -0,0 +1,101 @@
+"""
+Tests for load_file(..., stats=True) and Scene.load_stats
+"""
+
+import os
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def _binary_fbx(path, vertices, indices):
+    """Write a minimal binary FBX 7.4 file with deflate-compressed geometry arrays"""
+
+    def prop(value):
+        if isinstance(value, bytes):
+            return b"S" + struct.pack("<I", len(value)) + value
+        if isinstance(value, int):
+            return b"L" + struct.pack("<q", value)
+        code = {"float64": b"d", "int32": b"i"}[value.dtype.name]
+        data = zlib.compress(value.tobytes())
+        return code + struct.pack("<III", value.size, 1, len(data)) + data
+
+    def node(name, props=(), children=()):
+        def encode(offset):
+            prop_bytes = b"".join(prop(p) for p in props)
+            body = b""
+            start = offset + 13 + len(name) + len(prop_bytes)
+            for child in children:
+                body += child(start + len(body))
+            if children:
+                body += b"\0" * 13
+            header = struct.pack("<IIIB", start + len(body), len(props), len(prop_bytes), len(name))
+            return header + name + prop_bytes + body
+        return encode
+
+    nodes = [
+        node(b"FBXHeaderExtension", (), [node(b"FBXVersion", (7400,))]),
+        node(b"Objects", (), [
+            node(b"Geometry", (1000, b"Grid\x00\x01Geometry", b"Mesh"), [
+                node(b"Vertices", (vertices,)),
+                node(b"PolygonVertexIndex", (indices,)),
+            ]),
+            node(b"Model", (2000, b"Grid\x00\x01Model", b"Mesh")),
+        ]),
+        node(b"Connections", (), [node(b"C", (b"OO", 1000, 2000)), node(b"C", (b"OO", 2000, 0))]),
+    ]
+    data = b"Kaydara FBX Binary  \x00\x1a\x00" + struct.pack("<I", 7400)
+    for encode in nodes:
+        data += encode(len(data))
+    data += b"\0" * 13
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_load_stats_exported():
+    """LoadStats, the stats option and Scene.load_stats exist."""
+    assert hasattr(ufbx, "LoadStats")
+    assert hasattr(ufbx.Scene, "load_stats")
+    assert ufbx.LoadOptions().stats is False
+    assert "stats=False" in repr(ufbx.LoadOptions())
+
+
+def test_load_stats_binary(tmp_path):
+    """Stats of a binary file count the inflated array bytes."""
+    vertices = np.random.default_rng(0).random(600)
+    indices = np.arange(198, dtype=np.int32)
+    indices[2::3] = ~indices[2::3]
+    path = tmp_path / "grid.fbx"
+    _binary_fbx(str(path), vertices, indices)
+
+    with ufbx.load_file(str(path), stats=True) as scene:
+        assert scene.meshes[0].num_faces == len(indices) // 3
+        stats = scene.load_stats
+        assert isinstance(stats, ufbx.LoadStats)
+        assert stats.bytes_read == os.path.getsize(path)
+        assert stats.bytes_inflated == vertices.nbytes + indices.nbytes
+        assert stats.num_allocs > 0
+        assert stats.peak_heap_bytes >= stats.result_heap_bytes > 0
+        assert sum(stats.phases.values()) == pytest.approx(stats.total_seconds)
+        assert set(stats.as_dict()) == set(ufbx.LoadStats.__slots__)
+        assert ufbx.LoadStats().peak_heap_bytes is None
+
+
+def test_load_stats_ascii(fbx_path):
+    """ASCII files report reads and allocations but nothing inflated."""
+    with ufbx.load_file(fbx_path) as scene:
+        assert scene.load_stats is None
+
+    with ufbx.load_file(fbx_path, ufbx.LoadOptions(stats=True)) as scene:
+        stats = scene.load_stats
+        assert stats.bytes_read == os.path.getsize(fbx_path)
+        assert stats.bytes_inflated == 0
+        assert stats.num_frees <= stats.num_allocs
+        assert stats.total_seconds > 0.0
+        assert all(value >= 0.0 for value in stats.phases.values())
+        assert "LoadStats(" in repr(stats)
+        assert len(scene.nodes) == 4
@@ -0,0 +1,125 @@
+"""
+Tests for the scalar math helpers and the batched Vec3Array/QuatArray/MatrixArray types
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_math_arrays_exported():
+    """Batched math types are exported ndarray subclasses."""
+    for name in ("Vec3Array", "QuatArray", "MatrixArray"):
+        assert hasattr(ufbx, name)
+        assert issubclass(getattr(ufbx, name), np.ndarray)
+
+
+def test_transform_to_matrix():
+    """Transform.to_matrix() composes scale, rotation and translation."""
+    t = ufbx.Transform()
+    t.translation = ufbx.Vec3(1.0, 2.0, 3.0)
+    s = 0.5 ** 0.5
+    t.rotation = ufbx.Quat(0.0, 0.0, s, s)  # 90 degrees around Z
+    t.scale = ufbx.Vec3(2.0, 2.0, 2.0)
+    m = np.array(t.to_matrix().m)
+    assert m.shape == (3, 4)
+    np.testing.assert_allclose(m[:, :3], [[0, -2, 0], [2, 0, 0], [0, 0, 2]], atol=1e-12)
+    np.testing.assert_allclose(m[:, 3], [1, 2, 3])
+
+
+def test_quat_scalar_ops():
+    """Quat multiply and normalize."""
+    a = ufbx.Quat(0.1, 0.2, 0.3, 0.9)
+    b = ufbx.Quat(0.5, -0.2, 0.1, 0.8)
+    r = a * b
+    assert (r.x, r.y, r.z, r.w) == pytest.approx((0.61, 0.12, 0.21, 0.68))
+    n = a.normalize()
+    assert n.x ** 2 + n.y ** 2 + n.z ** 2 + n.w ** 2 == pytest.approx(1.0)
+    z = ufbx.Quat(0.0, 0.0, 0.0, 0.0).normalize()
+    assert (z.x, z.y, z.z, z.w) == (0.0, 0.0, 0.0, 1.0)
+
+
+def test_quat_array_ops():
+    """QuatArray euler round trip, rotate, mul and slerp."""
+    euler = np.array([[90.0, 0.0, 0.0], [0.0, 90.0, 0.0], [10.0, 20.0, 30.0]])
+    q = ufbx.QuatArray.from_euler(euler)
+    assert isinstance(q, ufbx.QuatArray)
+    assert q.shape == (3, 4)
+    np.testing.assert_allclose(q.to_euler(), euler, atol=1e-9)
+
+    v = q.rotate([0.0, 1.0, 0.0])
+    assert isinstance(v, ufbx.Vec3Array)
+    np.testing.assert_allclose(v[0], [0, 0, 1], atol=1e-12)
+
+    scalar = ufbx.Quat(*q[2]) * ufbx.Quat(*q[0])
+    np.testing.assert_allclose(q[2:].mul(q[0])[0], [scalar.x, scalar.y, scalar.z, scalar.w])
+
+    half = ufbx.QuatArray.identity(3).slerp(q, [0.0, 0.5, 1.0])
+    np.testing.assert_allclose(half[0], [0, 0, 0, 1])
+    np.testing.assert_allclose(half[1].to_euler(), [0, 45, 0], atol=1e-9)
+    np.testing.assert_allclose(half[2], q[2])
+
+    np.testing.assert_allclose(np.linalg.norm(ufbx.QuatArray(q * 3).normalize(), axis=-1), 1.0)
+    assert type(q * 3) is np.ndarray
+
+
+def test_matrix_array_ops():
+    """MatrixArray compose, invert, transform and decompose."""
+    rot = ufbx.QuatArray.from_euler(np.random.default_rng(1).uniform(-180, 180, (8, 3)))
+    m = ufbx.MatrixArray.from_transforms([1.0, 2.0, 3.0], rot, [2.0, 2.0, 2.0])
+    assert m.shape == (8, 4, 4)
+    np.testing.assert_allclose(m[:, 3, :3], np.tile([1.0, 2.0, 3.0], (8, 1)))
+
+    ident = m.mul(m.invert())
+    np.testing.assert_allclose(ident, np.broadcast_to(np.eye(4), (8, 4, 4)), atol=1e-12)
+
+    p = np.array([0.0, 1.0, 0.0])
+    np.testing.assert_allclose(m.transform_points(p), 2.0 * rot.rotate(p) + [1, 2, 3], atol=1e-12)
+    np.testing.assert_allclose(m.transform_directions(p), 2.0 * rot.rotate(p), atol=1e-12)
+
+    # Same convention as Node.world_transform: row vectors times the matrix
+    np.testing.assert_allclose(m[0].transform_points(p), (np.append(p, 1.0) @ m[0])[:3], atol=1e-12)
+
+    translation, rotation, scale = m.to_transforms()
+    np.testing.assert_allclose(translation, np.tile([1.0, 2.0, 3.0], (8, 1)), atol=1e-12)
+    np.testing.assert_allclose(scale, 2.0, atol=1e-12)
+    dots = np.abs(np.sum(rotation * rot, axis=-1))
+    np.testing.assert_allclose(dots, 1.0, atol=1e-12)
+
+
+def test_math_array_shapes():
+    """Shape validation, broadcasting and buffer protocol."""
+    with pytest.raises(ValueError):
+        ufbx.Vec3Array(np.zeros((4, 2)))
+    with pytest.raises(ValueError):
+        ufbx.MatrixArray.identity(2).transform_points(np.zeros((3, 3)))
+
+    points = np.zeros((5, 7, 3))
+    out = ufbx.MatrixArray.identity().transform_points(points)
+    assert out.shape == (5, 7, 3)
+    assert ufbx.QuatArray.identity((0,)).normalize().shape == (0, 4)
+
+    m = ufbx.MatrixArray.identity(3)
+    view = memoryview(m)
+    assert view.shape == (3, 4, 4)
+    assert view.format == "d"
+
+
+def test_matrix_array_node_table(fbx_path):
+    """MatrixArray wraps NodeTable.world and reproduces the node hierarchy."""
+    with ufbx.load_file(fbx_path) as scene:
+        table = scene.node_table()
+        world = ufbx.MatrixArray(table.world)
+        local = ufbx.MatrixArray(table.local)
+        assert np.shares_memory(world, table.world)
+
+        for i, parent in enumerate(table.parent):
+            if parent >= 0:
+                np.testing.assert_allclose(world[parent].mul(local[i]), world[i], atol=1e-9)
+
+        mesh = scene.meshes[0]
+        index = [node.name for node in scene.nodes].index("Cube")
+        cube = scene.nodes[index]
+        expected = np.asarray(mesh.vertex_positions) @ cube.world_transform[:3, :3] + cube.world_transform[3, :3]
+        np.testing.assert_allclose(world[index].transform_points(mesh.vertex_positions), expected)
@@ -0,0 +1,59 @@
+"""
+Tests for Scene.memory_usage() and the max_memory / max_temp_memory load budgets
+"""
+
+import pytest
+
+import ufbx
+
+
+def test_memory_usage_exported():
+    """MemoryUsage, Scene.memory_usage and the budget options exist."""
+    assert hasattr(ufbx, "MemoryUsage")
+    assert hasattr(ufbx.Scene, "memory_usage")
+    options = ufbx.LoadOptions()
+    assert options.max_memory is None
+    assert options.max_temp_memory is None
+    assert "max_memory=None" in repr(options)
+
+
+@pytest.mark.parametrize("value", [0, -1, 1.5, True, "1024"])
+def test_memory_budget_validation(value):
+    """Budgets must be positive integers."""
+    with pytest.raises(ValueError):
+        ufbx.load_file(__file__, max_memory=value)
+    with pytest.raises(ValueError):
+        ufbx.load_file(__file__, max_temp_memory=value)
+
+
+def test_memory_usage(fbx_path):
+    """Result and temporary allocations are accounted for every load."""
+    scene = ufbx.load_file(fbx_path)
+    usage = scene.memory_usage()
+    assert isinstance(usage, ufbx.MemoryUsage)
+    assert usage.result_bytes > 0 and usage.result_allocs > 0
+    assert usage.temp_peak_bytes > 0 and usage.temp_allocs > 0
+    assert usage.peak_bytes >= max(usage.result_bytes, usage.temp_peak_bytes)
+    assert set(usage.as_dict()) == set(ufbx.MemoryUsage.__slots__)
+    assert "MemoryUsage(" in repr(usage)
+    untracked = ufbx.MemoryUsage(usage.result_bytes, usage.result_allocs)
+    assert untracked.temp_peak_bytes is None and untracked.peak_bytes is None
+    scene.close()
+    with pytest.raises(RuntimeError):
+        scene.memory_usage()
+
+
+def test_memory_budgets(fbx_path):
+    """Loads over budget raise UfbxOutOfMemoryError; generous budgets load normally."""
+    with ufbx.load_file(fbx_path) as scene:
+        usage = scene.memory_usage()
+
+    with pytest.raises(ufbx.UfbxOutOfMemoryError):
+        ufbx.load_file(fbx_path, max_memory=usage.result_bytes // 2)
+    with pytest.raises(ufbx.UfbxOutOfMemoryError):
+        ufbx.load_file(fbx_path, max_temp_memory=usage.temp_peak_bytes // 2)
+
+    options = ufbx.LoadOptions(max_memory=usage.result_bytes * 4, max_temp_memory=usage.temp_peak_bytes * 4)
+    with ufbx.load_file(fbx_path, options) as scene:
+        assert len(scene.nodes) == 4
+        assert scene.memory_usage().result_bytes <= options.max_memory
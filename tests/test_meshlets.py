@@ -0,0 +1,108 @@
+"""
+Tests for Mesh.build_meshlets()
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def _grid_fbx(path, size):
+    """ASCII FBX with a size x size quad grid in the XY plane, facing +Z"""
+    vertices = [f"{x},{y},0" for y in range(size + 1) for x in range(size + 1)]
+    quads = []
+    for y in range(size):
+        for x in range(size):
+            a = y * (size + 1) + x
+            quads.append(f"{a},{a + 1},{a + size + 2},{~(a + size + 1)}")
+    with open(path, "w") as f:
+        f.write("; FBX 7.4.0 project file\nFBXHeaderExtension:  {\n\tFBXVersion: 7400\n}\nObjects:  {\n")
+        f.write(f'\tGeometry: 100, "Geometry::Grid", "Mesh" {{\n'
+                f'\t\tVertices: *{len(vertices) * 3} {{\n\t\t\ta: {",".join(vertices)}\n\t\t}}\n'
+                f'\t\tPolygonVertexIndex: *{len(quads) * 4} {{\n\t\t\ta: {",".join(quads)}\n\t\t}}\n\t}}\n')
+        f.write('\tModel: 200, "Model::Grid", "Mesh" {\n\t}\n}\n')
+        f.write('Connections:  {\n\tC: "OO",200,0\n\tC: "OO",100,200\n}\n')
+    return str(path)
+
+
+def _meshlet_triangles(result):
+    """(T, 3) mesh vertex triangles of all meshlets"""
+    triangles = []
+    for vertex_offset, triangle_offset, _, triangle_count in result.meshlets.tolist():
+        local = result.triangles[triangle_offset:triangle_offset + triangle_count].astype(np.int64)
+        triangles.append(result.vertices[vertex_offset + local])
+    return np.concatenate(triangles)
+
+
+def test_meshlets_exported():
+    """Meshlets and Mesh.build_meshlets exist."""
+    assert hasattr(ufbx, "Meshlets")
+    assert hasattr(ufbx.Mesh, "build_meshlets")
+
+
+@pytest.fixture
+def grid(tmp_path):
+    with ufbx.load_file(_grid_fbx(tmp_path / "grid.fbx", 32)) as scene:
+        yield scene.meshes[0]
+
+
+@pytest.mark.parametrize("max_vertices, max_triangles, cone_weight", [(64, 124, 0.0), (32, 40, 0.5), (3, 1, 1.0)])
+def test_build_meshlets(grid, max_vertices, max_triangles, cone_weight):
+    """Meshlets respect the limits and cover every triangle exactly once."""
+    result = grid.build_meshlets(max_vertices, max_triangles, cone_weight)
+    assert isinstance(result, ufbx.Meshlets)
+    meshlets = result.meshlets
+    assert meshlets.dtype == np.uint32 and result.triangles.dtype == np.uint8
+    assert meshlets[:, 2].max() <= max_vertices and meshlets[:, 3].max() <= max_triangles
+    assert meshlets[:, 0].tolist() == np.concatenate([[0], np.cumsum(meshlets[:-1, 2])]).tolist()
+    assert meshlets[:, 1].tolist() == np.concatenate([[0], np.cumsum(meshlets[:-1, 3])]).tolist()
+    assert len(result.vertices) == meshlets[:, 2].sum()
+    assert result.part_offsets.tolist() == [0, len(result)]
+
+    expected = np.sort(grid.triangulate().indices, axis=1)
+    actual = np.sort(_meshlet_triangles(result), axis=1)
+    assert sorted(map(tuple, actual.tolist())) == sorted(map(tuple, expected.tolist()))
+
+
+def test_meshlet_bounds(grid):
+    """Spheres contain their vertices; flat meshlets get a tight +Z cone."""
+    result = grid.build_meshlets()
+    # 64 vertices hold at most a 7x7 quad patch, so meshlets should be well filled
+    assert result.meshlets[:, 3].mean() > 80
+
+    positions = grid.vertex_positions
+    for i, (vertex_offset, _, vertex_count, _) in enumerate(result.meshlets.tolist()):
+        points = positions[result.vertices[vertex_offset:vertex_offset + vertex_count]]
+        distances = np.linalg.norm(points - result.centers[i], axis=1)
+        assert distances.max() <= result.radii[i] + 1e-9
+    np.testing.assert_allclose(result.cone_axis, np.tile([0.0, 0.0, 1.0], (len(result), 1)), atol=1e-9)
+    np.testing.assert_allclose(result.cone_cutoff, 0.0, atol=1e-6)
+
+    # A camera behind the grid sees every meshlet's back face
+    camera = np.array([16.0, 16.0, -10.0])
+    directions = result.cone_apex - camera
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    assert ((directions * result.cone_axis).sum(axis=1) >= result.cone_cutoff).all()
+
+
+def test_build_meshlets_errors(grid):
+    with pytest.raises(ValueError):
+        grid.build_meshlets(max_vertices=300)
+    with pytest.raises(ValueError):
+        grid.build_meshlets(max_triangles=0)
+    with pytest.raises(ValueError):
+        grid.build_meshlets(cone_weight=2.0)
+
+
+def test_build_meshlets_material_parts(fbx_path):
+    """Meshlets never span material parts."""
+    with ufbx.load_file(fbx_path) as scene:
+        mesh = scene.meshes[0]
+        result = mesh.build_meshlets()
+        parts = mesh.triangulate().part_offsets
+        assert len(result.part_offsets) == len(mesh.materials) + 1
+    for part in range(len(result.part_offsets) - 1):
+        meshlets = result.meshlets[result.part_offsets[part]:result.part_offsets[part + 1]]
+        assert meshlets[:, 3].sum() == parts[part + 1] - parts[part]
+    assert "Meshlets(" in repr(result)
@@ -0,0 +1,44 @@
+"""
+Tests for Scene.node_table()
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_node_table_exists():
+    """Scene exposes node_table and NodeTable is exported."""
+    assert hasattr(ufbx.Scene, "node_table")
+    assert hasattr(ufbx, "NodeTable")
+
+
+def test_node_table_matches_nodes(fbx_path):
+    """Each row matches the per-node accessors."""
+    with ufbx.load_file(fbx_path) as scene:
+        table = scene.node_table()
+        nodes = scene.nodes
+        assert len(table) == len(nodes)
+        assert table.world.shape == table.local.shape == table.geometry.shape == (len(nodes), 4, 4)
+        assert table.parent.dtype == np.int32
+
+        names = [node.name for node in nodes]
+        for i, node in enumerate(nodes):
+            np.testing.assert_allclose(table.world[i], node.world_transform)
+            np.testing.assert_allclose(table.local[i], node.local_transform)
+            assert table.attrib_type[i] == node.attrib_type
+            if node.parent is None:
+                assert table.parent[i] == -1
+                assert table.depth[i] == 0
+            else:
+                assert names[table.parent[i]] == node.parent.name
+                assert table.depth[i] == table.depth[table.parent[i]] + 1
+
+
+def test_node_table_after_close(fbx_path):
+    """node_table() after close() raises RuntimeError."""
+    scene = ufbx.load_file(fbx_path)
+    scene.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        scene.node_table()
@@ -0,0 +1,71 @@
+"""
+Tests for Element.props and Scene.gather_prop()
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import pytest
+
+import ufbx
+
+NODE = ufbx.ElementType.ELEMENT_NODE
+
+
+def test_props_api():
+    """Props mapping, Element.props and Scene.gather_prop exist."""
+    assert hasattr(ufbx, "Props")
+    assert hasattr(ufbx.Element, "props")
+    assert hasattr(ufbx.Scene, "gather_prop")
+
+
+def test_prop_enums_match_c():
+    """PropType and PropFlags follow ufbx_prop_type / ufbx_prop_flags."""
+    assert ufbx.PropType.PROP_NUMBER == 3
+    assert ufbx.PropType.PROP_FLOAT == ufbx.PropType.PROP_NUMBER
+    assert ufbx.PropType.PROP_STRING == 7
+    assert ufbx.PropType.PROP_REFERENCE == 15
+    flags = ufbx.PropFlags(0x3)
+    assert ufbx.PropFlags.PROP_FLAG_ANIMATABLE in flags
+    assert ufbx.PropFlags.PROP_FLAG_USER_DEFINED in flags
+
+
+def test_element_props_mapping(fbx_path):
+    """Props behaves like a read-only Mapping."""
+    with ufbx.load_file(fbx_path) as scene:
+        node = next(node for node in scene.nodes if len(node.props) > 0)
+        props = node.props
+        assert isinstance(props, Mapping)
+        names = list(props)
+        assert len(names) == len(props) == len(set(names))
+        for name, value in props.items():
+            assert name in props
+            assert props[name] == value or value != value
+            assert isinstance(props.prop_type(name), ufbx.PropType)
+        assert "__no_such_prop__" not in props
+        assert props.get("__no_such_prop__", 7) == 7
+        with pytest.raises(KeyError):
+            props["__no_such_prop__"]
+
+        translation = node.props.get("Lcl Translation")
+        if translation is not None:
+            assert len(translation) == 3
+
+
+def test_gather_prop(fbx_path):
+    """gather_prop matches per-element lookups."""
+    with ufbx.load_file(fbx_path) as scene:
+        missing = scene.gather_prop(NODE, "__no_such_prop__", -1.0)
+        assert missing.shape == (len(scene.nodes),)
+        assert (missing == -1.0).all()
+
+        translations = scene.gather_prop(NODE, "Lcl Translation", (0.0, 0.0, 0.0))
+        assert translations.shape == (len(scene.nodes), 3)
+        for row, node in zip(translations, scene.nodes):
+            expected = node.props.get("Lcl Translation", (0.0, 0.0, 0.0))
+            np.testing.assert_allclose(row, expected)
+
+        with pytest.raises(ValueError):
+            scene.gather_prop(NODE, "Lcl Translation", (0.0,) * 5)
+        with pytest.raises(ValueError):
+            scene.gather_prop(1000, "Lcl Translation")
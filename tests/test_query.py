@@ -0,0 +1,67 @@
+"""
+Tests for Scene.query()
+"""
+
+import fnmatch
+import re
+
+import pytest
+
+import ufbx
+
+NODE = ufbx.ElementType.ELEMENT_NODE
+
+
+def test_query_api():
+    """Scene.query and Element name/type accessors exist."""
+    assert hasattr(ufbx.Scene, "query")
+    assert hasattr(ufbx.Element, "name")
+    assert hasattr(ufbx.Element, "element_type")
+    assert hasattr(ufbx.ElementList, "element_ids")
+
+
+def test_query_by_type_and_name(fbx_path):
+    """Type and exact name filters."""
+    with ufbx.load_file(fbx_path) as scene:
+        nodes = scene.query(type=NODE)
+        assert list(nodes) == list(scene.nodes)
+        assert list(nodes.element_ids) == list(scene.nodes.element_ids)
+
+        named = next(node for node in scene.nodes if node.name)
+        result = scene.query(type=NODE, name=named.name)
+        assert list(result) == [named]
+        assert result[0].element_type == NODE
+        assert len(scene.query(name="__no_such_element__")) == 0
+        assert len(scene.query()) >= len(scene.nodes) + len(scene.meshes)
+
+
+def test_query_patterns(fbx_path):
+    """Glob and regex patterns match the same as a Python scan."""
+    with ufbx.load_file(fbx_path) as scene:
+        named = next(node for node in scene.nodes if node.name)
+        globs = [named.name[:1] + "*", "*" + named.name[-1:], "?" + named.name[1:], "*", "[!" + named.name[:1] + "]*"]
+        for glob in globs:
+            expected = [n for n in scene.nodes if fnmatch.fnmatchcase(n.name, glob)]
+            assert list(scene.query(type=NODE, pattern=glob)) == expected, glob
+
+        regex = re.compile(re.escape(named.name[1:]))
+        expected = [n for n in scene.nodes if regex.search(n.name)]
+        assert list(scene.query(type=NODE, pattern=regex)) == expected
+        with pytest.raises(TypeError):
+            scene.query(pattern=b"*")
+        with pytest.raises(TypeError):
+            scene.query(pattern=42)
+
+
+def test_query_under(fbx_path):
+    """under= selects the node's subtree, for nodes and attached elements alike."""
+    with ufbx.load_file(fbx_path) as scene:
+        root = scene.root_node
+        assert list(scene.query(type=NODE, under=root)) == list(scene.nodes)
+
+        mesh_node = next(node for node in scene.nodes if node.mesh is not None)
+        assert mesh_node in scene.query(type=NODE, under=mesh_node)
+        meshes = scene.query(type=ufbx.ElementType.ELEMENT_MESH, under=mesh_node)
+        assert mesh_node.mesh in meshes
+        with pytest.raises(TypeError):
+            scene.query(under="not a node")
@@ -0,0 +1,60 @@
+"""
+Tests for ufbx.scan() and ufbx.scan_many()
+"""
+
+import pytest
+
+import ufbx
+
+
+def test_scan_exported():
+    """scan, scan_many and ScanResult exist."""
+    assert hasattr(ufbx, "scan")
+    assert hasattr(ufbx, "scan_many")
+    assert hasattr(ufbx, "ScanResult")
+
+
+def test_scan_errors(tmp_path):
+    """Missing and invalid files raise; scan_many can collect the errors."""
+    with pytest.raises(ufbx.UfbxFileNotFoundError):
+        ufbx.scan(str(tmp_path / "missing.fbx"))
+    bad = tmp_path / "bad.fbx"
+    bad.write_bytes(b"\x00" * 64)
+    with pytest.raises(ufbx.UfbxError):
+        ufbx.scan(bad)
+    with pytest.raises(ufbx.UfbxError):
+        ufbx.scan_many([bad, bad], workers=2)
+    results = ufbx.scan_many([bad, tmp_path / "missing.fbx"], workers=2, return_exceptions=True)
+    assert isinstance(results[0], ufbx.UfbxError)
+    assert isinstance(results[1], ufbx.UfbxFileNotFoundError)
+    assert ufbx.scan_many([]) == []
+
+
+def test_scan_matches_load(fbx_path):
+    """Scanned fields match a full load."""
+    result = ufbx.scan(fbx_path)
+    assert isinstance(result, ufbx.ScanResult)
+    assert result.path == fbx_path
+    with ufbx.load_file(fbx_path) as scene:
+        assert result.version == scene.metadata.version
+        assert result.creator == scene.metadata.creator
+        assert result.file_format == scene.metadata.file_format
+        assert result.ascii == scene.metadata.ascii
+        assert result.unit_meters == pytest.approx(scene.settings.unit_meters)
+        assert result.axes == scene.settings.axes
+        assert result.frames_per_second == pytest.approx(scene.settings.frames_per_second)
+        assert result.num_nodes == len(scene.nodes)
+        assert result.num_meshes == len(scene.meshes)
+        assert result.num_materials == len(scene.materials)
+        assert result.num_textures == len(scene.textures)
+        assert result.num_anim_stacks == len(scene.anim_stacks)
+    assert set(result.as_dict()) == set(ufbx.ScanResult.__slots__)
+
+
+def test_scan_many(fbx_path):
+    """scan_many keeps the order of its input across threads."""
+    paths = [fbx_path] * 16
+    results = ufbx.scan_many(iter(paths), workers=4)
+    assert len(results) == len(paths)
+    assert all(result.num_nodes == 4 for result in results)
+    assert [r.as_dict() for r in ufbx.scan_many(paths[:2], workers=1)] == [r.as_dict() for r in results[:2]]
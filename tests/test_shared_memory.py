@@ -0,0 +1,68 @@
+"""
+Tests for Scene.to_shared_memory
+"""
+
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def test_shared_memory_classes():
+    """SharedSceneHandle and SharedScene are exported."""
+    assert hasattr(ufbx, "SharedScene")
+    assert hasattr(ufbx, "SharedSceneHandle")
+    assert hasattr(ufbx.Scene, "to_shared_memory")
+
+
+def _sum_positions(handle):
+    with handle.open() as shared:
+        return float(shared.meshes[0]["vertex_positions"].sum()), len(shared.node_table)
+
+
+def test_shared_memory_roundtrip(fbx_path):
+    """Views opened from an unpickled handle match the scene data."""
+    with ufbx.load_file(fbx_path) as scene:
+        handle = scene.to_shared_memory()
+        positions = scene.meshes[0].vertex_positions.copy()
+        indices = scene.meshes[0].indices.copy()
+        world = scene.node_table().world
+        mesh_names = [mesh.name for mesh in scene.meshes]
+
+    with handle:
+        clone = pickle.loads(pickle.dumps(handle))
+        assert clone.name == handle.name
+        with clone.open() as shared:
+            assert shared.mesh_names == mesh_names
+            mesh = shared.meshes[0]
+            np.testing.assert_array_equal(mesh["vertex_positions"], positions)
+            np.testing.assert_array_equal(mesh["indices"], indices)
+            np.testing.assert_array_equal(shared.node_table.world, world)
+            assert not mesh["vertex_positions"].flags.writeable
+            for key, arr in shared.arrays.items():
+                assert arr.ctypes.data % 64 == 0, key
+            del mesh
+        with pytest.raises(RuntimeError):
+            clone.unlink()
+
+
+def test_shared_memory_workers(fbx_path):
+    """Pool workers attach to the segment from a pickled handle."""
+    with ufbx.load_file(fbx_path) as scene:
+        expected = (float(scene.meshes[0].vertex_positions.sum()), len(scene.nodes))
+        with scene.to_shared_memory() as handle, multiprocessing.Pool(2) as pool:
+            assert pool.map(_sum_positions, [handle] * 4) == [expected] * 4
+
+
+def test_dropped_handle_unlinks(fbx_path):
+    """An owning handle dropped without unlink() frees its segment."""
+    with ufbx.load_file(fbx_path) as scene:
+        handle = scene.to_shared_memory()
+    name = handle.name
+    del handle
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
@@ -0,0 +1,184 @@
+"""
+Tests for Texture.content and Scene.extract_textures
+"""
+
+import hashlib
+import os
+
+import pytest
+
+import ufbx
+
+
+def test_extract_textures_exists():
+    """Scene.extract_textures is available."""
+    assert hasattr(ufbx.Scene, "extract_textures")
+    assert hasattr(ufbx.Texture, "content")
+
+
+def _embedded(scene):
+    textures = [t for t in scene.textures if t.content is not None]
+    if not textures:
+        pytest.skip("fixture has no embedded texture content")
+    return textures
+
+
+def test_texture_content_zero_copy(fbx_path):
+    """Embedded content is a read-only memoryview that keeps the scene alive."""
+    scene = ufbx.load_file(fbx_path)
+    content = _embedded(scene)[0].content
+    assert isinstance(content, memoryview)
+    assert content.readonly
+    data = bytes(content)
+    assert len(data) == content.nbytes > 0
+
+    del scene
+    assert bytes(content) == data
+
+
+def test_extract_textures(fbx_path, tmp_path):
+    """Textures are written once, named by content hash, aligned with Scene.textures."""
+    with ufbx.load_file(fbx_path) as scene:
+        textures = _embedded(scene)
+        paths = scene.extract_textures(str(tmp_path / "out"), workers=2)
+        assert len(paths) == len(scene.textures)
+
+        for texture, path in zip(scene.textures, paths):
+            if texture.content is None:
+                assert path is None
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            assert data == bytes(texture.content)
+            assert os.path.basename(path).startswith(hashlib.sha256(data).hexdigest())
+
+        assert len(os.listdir(tmp_path / "out")) == len({bytes(t.content) for t in textures})
+        assert scene.extract_textures(str(tmp_path / "out")) == paths
+
+
+def test_extract_textures_failed_write(fbx_path, tmp_path, monkeypatch):
+    """A failed write leaves no temporary file behind."""
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with ufbx.load_file(fbx_path) as scene, pytest.raises(OSError, match="disk full"):
+        scene.extract_textures(str(tmp_path / "out"), workers=1)
+    assert os.listdir(tmp_path / "out") == []
+
+
+def test_texture_resolver(tmp_path):
+    """TextureResolver searches roots in order and caches stat results."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b" / "maps").mkdir(parents=True)
+    (tmp_path / "b" / "maps" / "wood.png").write_bytes(b"")
+    (tmp_path / "a" / "wood.png").write_bytes(b"")
+    roots = [str(tmp_path / "b"), str(tmp_path / "a")]
+
+    resolver = ufbx.TextureResolver()
+    assert resolver.resolve(["maps\\wood.png"], roots) == os.path.join(roots[0], "maps", "wood.png")
+    assert resolver.resolve(["C:\\art\\wood.png"], roots[1:]) == os.path.join(roots[1], "wood.png")
+    assert resolver.resolve(["missing.png", ""], roots) is None
+
+    misses = resolver.misses
+    resolver.resolve(["maps\\wood.png"], roots)
+    assert resolver.misses == misses
+    assert resolver.hits > 0
+
+    resolver.clear()
+    assert len(resolver) == 0
+
+    bounded = ufbx.TextureResolver(maxsize=2)
+    bounded.resolve(["missing.png"], roots)
+    assert len(bounded) == 2
+
+
+def test_texture_resolver_misses(tmp_path, monkeypatch):
+    """Cached misses expire after miss_ttl or on invalidate()."""
+    root = [str(tmp_path)]
+    target = tmp_path / "wood.png"
+
+    resolver = ufbx.TextureResolver()
+    assert resolver.resolve(["wood.png"], root) is None
+    target.write_bytes(b"")
+    assert resolver.resolve(["wood.png"], root) is None
+    resolver.invalidate(str(tmp_path / "other.png"))
+    assert resolver.resolve(["wood.png"], root) is None
+    resolver.invalidate(str(target))
+    assert resolver.resolve(["wood.png"], root) == str(target)
+    target.unlink()
+    resolver.invalidate()
+    assert resolver.resolve(["wood.png"], root) == str(target)
+
+    clock = [1000.0]
+    monkeypatch.setattr(ufbx._ufbx.time, "monotonic", lambda: clock[0])
+    expiring = ufbx.TextureResolver(miss_ttl=5.0)
+    assert expiring.resolve(["wood.png"], root) is None
+    target.write_bytes(b"")
+    clock[0] += 1.0
+    assert expiring.resolve(["wood.png"], root) is None
+    clock[0] += 5.0
+    assert expiring.resolve(["wood.png"], root) == str(target)
+    assert "miss_ttl=5.0" in repr(expiring)
+
+
+def test_texture_resolver_ignores_cwd(tmp_path, monkeypatch):
+    """Relative names resolve only under search paths, absolute names as-is."""
+    (tmp_path / "cwd").mkdir()
+    (tmp_path / "cwd" / "wood.png").write_bytes(b"")
+    (tmp_path / "root").mkdir()
+    monkeypatch.chdir(tmp_path / "cwd")
+
+    resolver = ufbx.TextureResolver()
+    assert resolver.resolve(["wood.png"]) is None
+    assert resolver.resolve(["wood.png"], [str(tmp_path / "root")]) is None
+    absolute = str(tmp_path / "cwd" / "wood.png")
+    assert resolver.resolve([absolute]) == absolute
+    assert resolver.resolve(["wood.png"], [str(tmp_path / "root"), os.curdir]) == "wood.png"
+
+
+def test_resolve_textures(fbx_path, tmp_path):
+    """Scene.resolve_textures returns a path per texture and shares the cache."""
+    with ufbx.load_file(fbx_path) as scene:
+        with pytest.raises(TypeError):
+            scene.resolve_textures([], cache={})
+        resolver = ufbx.TextureResolver()
+        assert scene.resolve_textures([str(tmp_path)], cache=resolver) == [None] * len(scene.textures)
+
+        texture = scene.textures[0]
+        target = tmp_path / os.path.basename(texture.relative_filename.replace("\\", "/"))
+        target.write_bytes(b"")
+        resolver.clear()
+        paths = scene.resolve_textures([tmp_path], cache=resolver)
+        assert len(paths) == len(scene.textures)
+        assert paths[0] == str(target)
+
+
+def test_resolve_textures_fbx_directory(fbx_path, tmp_path):
+    """Relative texture names resolve next to the FBX file first."""
+    copy = tmp_path / "model" / "cube.fbx"
+    copy.parent.mkdir()
+    with open(fbx_path, "rb") as f:
+        copy.write_bytes(f.read())
+    with ufbx.load_file(str(copy)) as scene:
+        relative = scene.textures[0].relative_filename.replace("\\", "/")
+        target = copy.parent / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"")
+        (tmp_path / os.path.basename(relative)).write_bytes(b"")
+        assert scene.resolve_textures([tmp_path])[0] == os.path.normpath(str(target))
+
+
+def test_resolve_textures_relative_load(fbx_path, tmp_path, monkeypatch):
+    """A scene loaded by relative path resolves against its directory after chdir."""
+    model = tmp_path / "model"
+    model.mkdir()
+    with open(fbx_path, "rb") as f:
+        (model / "cube.fbx").write_bytes(f.read())
+    (tmp_path / "elsewhere").mkdir()
+    monkeypatch.chdir(tmp_path)
+    with ufbx.load_file(os.path.join("model", "cube.fbx")) as scene:
+        name = os.path.basename(scene.textures[0].relative_filename.replace("\\", "/"))
+        (model / name).write_bytes(b"")
+        monkeypatch.chdir(tmp_path / "elsewhere")
+        assert scene.resolve_textures()[0] == str(model / name)
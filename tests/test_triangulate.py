@@ -0,0 +1,113 @@
+"""
+Tests for Mesh.triangulate() and its index buffer optimizations
+"""
+
+import numpy as np
+import pytest
+
+import ufbx
+
+
+def _grid_fbx(path, size):
+    """ASCII FBX with a size x size quad grid"""
+    vertices = [f"{x},{y},0" for y in range(size + 1) for x in range(size + 1)]
+    quads = []
+    for y in range(size):
+        for x in range(size):
+            a = y * (size + 1) + x
+            quads.append(f"{a},{a + 1},{a + size + 2},{~(a + size + 1)}")
+    with open(path, "w") as f:
+        f.write("; FBX 7.4.0 project file\nFBXHeaderExtension:  {\n\tFBXVersion: 7400\n}\nObjects:  {\n")
+        f.write(f'\tGeometry: 100, "Geometry::Grid", "Mesh" {{\n'
+                f'\t\tVertices: *{len(vertices) * 3} {{\n\t\t\ta: {",".join(vertices)}\n\t\t}}\n'
+                f'\t\tPolygonVertexIndex: *{len(quads) * 4} {{\n\t\t\ta: {",".join(quads)}\n\t\t}}\n\t}}\n')
+        f.write('\tModel: 200, "Model::Grid", "Mesh" {\n\t}\n}\n')
+        f.write('Connections:  {\n\tC: "OO",200,0\n\tC: "OO",100,200\n}\n')
+    return str(path)
+
+
+def _acmr(indices, cache_size=16):
+    """Average cache misses per triangle of a FIFO vertex cache"""
+    cache, misses = [], 0
+    for v in indices.ravel().tolist():
+        if v not in cache:
+            misses += 1
+            cache.append(v)
+            if len(cache) > cache_size:
+                cache.pop(0)
+    return misses / len(indices)
+
+
+def _triangle_set(triangles):
+    return sorted(tuple(sorted(t)) for t in triangles.tolist())
+
+
+def test_triangulate_exported():
+    """Triangulation and Mesh.triangulate exist."""
+    assert hasattr(ufbx, "Triangulation")
+    assert hasattr(ufbx.Mesh, "triangulate")
+
+
+@pytest.fixture
+def grid(tmp_path):
+    with ufbx.load_file(_grid_fbx(tmp_path / "grid.fbx", 24)) as scene:
+        yield scene.meshes[0]
+
+
+def test_triangulate_plain(grid):
+    """Without optimization triangles follow face order."""
+    result = grid.triangulate()
+    assert isinstance(result, ufbx.Triangulation)
+    assert result.indices.shape == (grid.num_triangles, 3) and result.indices.dtype == np.uint32
+    assert result.part_offsets.tolist() == [0, grid.num_triangles]
+    assert result.vertex_order is None and result.optimize == ()
+    np.testing.assert_array_equal(grid.indices[result.corners], result.indices)
+    assert result.corners[0].tolist() == [0, 1, 2]
+
+
+@pytest.mark.parametrize("optimize", ["vertex_cache", "overdraw", ("overdraw", "fetch")])
+def test_triangulate_optimized(grid, optimize):
+    """Optimized buffers keep every triangle and reduce cache misses."""
+    plain = grid.triangulate()
+    result = grid.triangulate(optimize)
+    assert _triangle_set(result.corners) == _triangle_set(plain.corners)
+
+    indices = result.indices
+    if result.vertex_order is not None:
+        # Vertices renumbered in order of first use
+        order = result.vertex_order
+        assert sorted(order.tolist()) == list(range(grid.num_vertices))
+        first_use = np.unique(indices.ravel(), return_index=True)[1]
+        assert (np.diff(indices.ravel()[np.sort(first_use)]) == 1).all()
+        indices = order[indices]
+    np.testing.assert_array_equal(grid.indices[result.corners], indices)
+    assert _acmr(result.indices) < 0.8 * _acmr(plain.indices)
+
+
+def test_triangulate_errors(grid):
+    with pytest.raises(ValueError):
+        grid.triangulate("strips")
+    for cache_size in (0, 2, 1025, 2**32 - 1, 2**32):
+        with pytest.raises(ValueError):
+            grid.triangulate("vertex_cache", cache_size=cache_size)
+    for cache_size in (3, 1024):
+        assert len(grid.triangulate("vertex_cache", cache_size=cache_size).indices) == grid.num_triangles
+
+
+def test_triangulate_material_parts(fbx_path):
+    """Triangles are grouped by material part."""
+    with ufbx.load_file(fbx_path) as scene:
+        mesh = scene.meshes[0]
+        result = mesh.triangulate(("vertex_cache", "fetch"))
+        face_material = mesh.face_material
+        faces = mesh.faces
+        assert len(result.part_offsets) == len(mesh.materials) + 1
+        assert result.part_offsets[-1] == mesh.num_triangles == 12
+        for part in range(len(mesh.materials)):
+            corners = result.corners[result.part_offsets[part]:result.part_offsets[part + 1]]
+            for corner in corners[:, 0].tolist():
+                face = next(i for i, (begin, count) in enumerate(faces) if begin <= corner < begin + count)
+                assert face_material[face] == part
+            assert len(result.part_indices(part)) == len(corners)
+    with pytest.raises(RuntimeError):
+        mesh.triangulate()
@@ -2,58 +2,83 @@
 ufbx Cython bindings - High-performance Python wrapper for ufbx
 """
 
+from . import cache, gltf
 from ._ufbx import (
+    BVH,
     Anim,
     AnimCurve,
     AnimLayer,
     AnimStack,
     ApertureMode,
     AspectMode,
+    AttributeArray,
     BlendChannel,
     BlendDeformer,
     BlendMode,
     BlendShape,
     Bone,
     Camera,
+    ClosestPointResult,
     Constraint,
     ConstraintType,
     CoordinateAxes,
     CoordinateAxis,
+    DomNode,
+    DomValueType,
     Element,
+    ElementList,
     ElementType,
     Empty,
     ErrorType,
     ExtrapolationMode,
+    FlattenedGeometry,
     InheritMode,
     Interpolation,
     Light,
     LightAreaShape,
     LightDecay,
     LightType,
+    LoadOptions,
+    LoadStats,
     Material,
     MaterialFeatures,
     MaterialMap,
     MaterialTexture,
     Matrix,
+    MatrixArray,
+    MemoryUsage,
     Mesh,
+    MeshDuplicates,
+    Meshlets,
+    MeshRegistry,
     Metadata,
     MirrorAxis,
     Node,
+    NodeTable,
     ProjectionMode,
     PropFlags,
+    Props,
     PropType,
     Quat,
+    QuatArray,
+    RaycastResult,
     RotationOrder,
+    ScanResult,
     Scene,
     SceneSettings,
     ShaderType,
+    SharedScene,
+    SharedSceneHandle,
     SkinCluster,
     SkinDeformer,
+    SpaceConversion,
     SubdivisionBoundary,
     SubdivisionDisplayMode,
     Texture,
+    TextureResolver,
     TextureType,
     Transform,
+    Triangulation,
     UfbxError,
     UfbxFileNotFoundError,
     UfbxIOError,
@@ -61,10 +86,13 @@ from ._ufbx import (
     Unknown,
     Vec2,
     Vec3,
+    Vec3Array,
     Vec4,
     WrapMode,
     load_file,
     load_memory,
+    scan,
+    scan_many,
 )
 
 __version__ = "0.0.0"
@@ -76,51 +104,75 @@ __all__ = [
     "AnimStack",
     "ApertureMode",
     "AspectMode",
+    "AttributeArray",
+    "BVH",
     "BlendChannel",
     "BlendDeformer",
     "BlendMode",
     "BlendShape",
     "Bone",
     "Camera",
+    "ClosestPointResult",
     "Constraint",
     "ConstraintType",
     "CoordinateAxis",
     "CoordinateAxes",
+    "DomNode",
+    "DomValueType",
     "Element",
+    "ElementList",
     "ElementType",
     "Empty",
     "ErrorType",
     "ExtrapolationMode",
+    "FlattenedGeometry",
     "InheritMode",
     "Interpolation",
     "Light",
     "LightAreaShape",
     "LightDecay",
     "LightType",
+    "LoadOptions",
+    "LoadStats",
     "Material",
     "MaterialFeatures",
     "MaterialMap",
     "MaterialTexture",
     "Matrix",
+    "MatrixArray",
+    "MemoryUsage",
     "Mesh",
+    "MeshDuplicates",
+    "MeshRegistry",
+    "Meshlets",
     "Metadata",
     "MirrorAxis",
     "Node",
+    "NodeTable",
     "ProjectionMode",
     "PropFlags",
     "PropType",
+    "Props",
     "Quat",
+    "QuatArray",
+    "RaycastResult",
     "RotationOrder",
+    "ScanResult",
     "Scene",
     "SceneSettings",
     "ShaderType",
+    "SharedScene",
+    "SharedSceneHandle",
     "SkinCluster",
     "SkinDeformer",
+    "SpaceConversion",
     "SubdivisionBoundary",
     "SubdivisionDisplayMode",
     "Texture",
+    "TextureResolver",
     "TextureType",
     "Transform",
+    "Triangulation",
     "UfbxError",
     "UfbxFileNotFoundError",
     "UfbxIOError",
@@ -128,8 +180,11 @@ __all__ = [
     "Unknown",
     "Vec2",
     "Vec3",
+    "Vec3Array",
     "Vec4",
     "WrapMode",
     "load_file",
     "load_memory",
+    "scan",
+    "scan_many",
 ]
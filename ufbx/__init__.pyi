@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from enum import IntEnum
-from typing import Any
+import os
+import re
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from enum import IntEnum, IntFlag
+from typing import Any, BinaryIO, TypeVar, overload
 
 import numpy as np
 
+from . import cache as cache
+from . import gltf as gltf
+
 __version__: str
 
 class UfbxError(Exception): ...
@@ -28,19 +33,89 @@ class ElementType(IntEnum):
     ELEMENT_MESH: int
     ELEMENT_LIGHT: int
     ELEMENT_CAMERA: int
-    ELEMENT_MATERIAL: int
     ELEMENT_BONE: int
+    ELEMENT_EMPTY: int
+    ELEMENT_LINE_CURVE: int
+    ELEMENT_NURBS_CURVE: int
+    ELEMENT_NURBS_SURFACE: int
+    ELEMENT_NURBS_TRIM_SURFACE: int
+    ELEMENT_NURBS_TRIM_BOUNDARY: int
+    ELEMENT_PROCEDURAL_GEOMETRY: int
+    ELEMENT_STEREO_CAMERA: int
+    ELEMENT_CAMERA_SWITCHER: int
+    ELEMENT_MARKER: int
+    ELEMENT_LOD_GROUP: int
+    ELEMENT_SKIN_DEFORMER: int
+    ELEMENT_SKIN_CLUSTER: int
+    ELEMENT_BLEND_DEFORMER: int
+    ELEMENT_BLEND_CHANNEL: int
+    ELEMENT_BLEND_SHAPE: int
+    ELEMENT_CACHE_DEFORMER: int
+    ELEMENT_CACHE_FILE: int
+    ELEMENT_MATERIAL: int
+    ELEMENT_TEXTURE: int
+    ELEMENT_VIDEO: int
+    ELEMENT_SHADER: int
+    ELEMENT_SHADER_BINDING: int
+    ELEMENT_ANIM_STACK: int
+    ELEMENT_ANIM_LAYER: int
+    ELEMENT_ANIM_VALUE: int
+    ELEMENT_ANIM_CURVE: int
+    ELEMENT_DISPLAY_LAYER: int
+    ELEMENT_SELECTION_SET: int
+    ELEMENT_SELECTION_NODE: int
+    ELEMENT_CHARACTER: int
+    ELEMENT_CONSTRAINT: int
+    ELEMENT_AUDIO_LAYER: int
+    ELEMENT_AUDIO_CLIP: int
+    ELEMENT_POSE: int
+    ELEMENT_METADATA_OBJECT: int
 
 class PropType(IntEnum):
     PROP_UNKNOWN: int
     PROP_BOOLEAN: int
     PROP_INTEGER: int
+    PROP_NUMBER: int
     PROP_FLOAT: int
+    PROP_VECTOR: int
+    PROP_COLOR: int
+    PROP_COLOR_WITH_ALPHA: int
     PROP_STRING: int
-
-class PropFlags(IntEnum):
+    PROP_DATE_TIME: int
+    PROP_TRANSLATION: int
+    PROP_ROTATION: int
+    PROP_SCALING: int
+    PROP_DISTANCE: int
+    PROP_COMPOUND: int
+    PROP_BLOB: int
+    PROP_REFERENCE: int
+
+class PropFlags(IntFlag):
     PROP_FLAG_NONE: int
     PROP_FLAG_ANIMATABLE: int
+    PROP_FLAG_USER_DEFINED: int
+    PROP_FLAG_HIDDEN: int
+    PROP_FLAG_LOCK_X: int
+    PROP_FLAG_LOCK_Y: int
+    PROP_FLAG_LOCK_Z: int
+    PROP_FLAG_LOCK_W: int
+    PROP_FLAG_MUTE_X: int
+    PROP_FLAG_MUTE_Y: int
+    PROP_FLAG_MUTE_Z: int
+    PROP_FLAG_MUTE_W: int
+    PROP_FLAG_SYNTHETIC: int
+    PROP_FLAG_ANIMATED: int
+    PROP_FLAG_NOT_FOUND: int
+    PROP_FLAG_CONNECTED: int
+    PROP_FLAG_NO_VALUE: int
+    PROP_FLAG_OVERRIDDEN: int
+    PROP_FLAG_VALUE_REAL: int
+    PROP_FLAG_VALUE_VEC2: int
+    PROP_FLAG_VALUE_VEC3: int
+    PROP_FLAG_VALUE_VEC4: int
+    PROP_FLAG_VALUE_INT: int
+    PROP_FLAG_VALUE_STR: int
+    PROP_FLAG_VALUE_BLOB: int
 
 class InheritMode(IntEnum):
     INHERIT_MODE_NORMAL: int
@@ -68,6 +143,12 @@ class CoordinateAxes:
     front: CoordinateAxis
     def __init__(self, right: int, up: int, front: int) -> None: ...
     def __repr__(self) -> str: ...
+    @classmethod
+    def right_handed_y_up(cls) -> CoordinateAxes: ...
+    @classmethod
+    def right_handed_z_up(cls) -> CoordinateAxes: ...
+    @classmethod
+    def left_handed_y_up(cls) -> CoordinateAxes: ...
 
 class SubdivisionDisplayMode(IntEnum):
     SUBDIVISION_DISPLAY_MODE_OFF: int
@@ -139,6 +220,203 @@ class ErrorType(IntEnum):
     ERROR_FILE_NOT_FOUND: int
     ERROR_OUT_OF_MEMORY: int
 
+class DomValueType(IntEnum):
+    DOM_VALUE_NUMBER: int
+    DOM_VALUE_STRING: int
+    DOM_VALUE_BLOB: int
+    DOM_VALUE_ARRAY_I32: int
+    DOM_VALUE_ARRAY_I64: int
+    DOM_VALUE_ARRAY_F32: int
+    DOM_VALUE_ARRAY_F64: int
+    DOM_VALUE_ARRAY_BLOB: int
+    DOM_VALUE_ARRAY_IGNORED: int
+
+class AttributeArray(np.ndarray[Any, Any]):
+    def __dlpack__(self, *, stream: Any = None, max_version: tuple[int, int] | None = None, dl_device: Any = None, copy: bool | None = None) -> Any: ...
+
+class SpaceConversion(IntEnum):
+    SPACE_CONVERSION_TRANSFORM_ROOT: int
+    SPACE_CONVERSION_ADJUST_TRANSFORMS: int
+    SPACE_CONVERSION_MODIFY_GEOMETRY: int
+
+class LoadOptions:
+    retain_dom: bool
+    target_axes: CoordinateAxes | tuple[int, int, int] | None
+    target_unit_meters: float | None
+    space_conversion: SpaceConversion
+    stats: bool
+    max_memory: int | None
+    max_temp_memory: int | None
+    def __init__(
+        self,
+        retain_dom: bool = False,
+        target_axes: CoordinateAxes | tuple[int, int, int] | None = None,
+        target_unit_meters: float | None = None,
+        space_conversion: SpaceConversion = SpaceConversion.SPACE_CONVERSION_TRANSFORM_ROOT,
+        stats: bool = False,
+        max_memory: int | None = None,
+        max_temp_memory: int | None = None,
+    ) -> None: ...
+
+class LoadStats:
+    total_seconds: float
+    read_seconds: float
+    parse_seconds: float
+    finalize_seconds: float
+    bytes_read: int
+    bytes_inflated: int
+    num_allocs: int
+    num_frees: int
+    peak_heap_bytes: int | None
+    result_heap_bytes: int
+    @property
+    def phases(self) -> dict[str, float]: ...
+    def as_dict(self) -> dict[str, float | int | None]: ...
+
+class MemoryUsage:
+    result_bytes: int
+    result_allocs: int
+    temp_peak_bytes: int | None
+    temp_allocs: int
+    peak_bytes: int | None
+    def as_dict(self) -> dict[str, int | None]: ...
+
+class ScanResult:
+    path: str | os.PathLike[str]
+    version: int
+    creator: str
+    file_format: int
+    ascii: bool
+    unit_meters: float
+    axes: CoordinateAxes
+    frames_per_second: float
+    num_nodes: int
+    num_meshes: int
+    num_materials: int
+    num_textures: int
+    num_lights: int
+    num_cameras: int
+    num_anim_stacks: int
+    def as_dict(self) -> dict[str, Any]: ...
+
+class FlattenedGeometry:
+    positions: np.ndarray
+    indices: np.ndarray
+    node_ids: np.ndarray
+    material_ids: np.ndarray
+    face_sizes: np.ndarray | None
+    def __init__(self, positions: np.ndarray, indices: np.ndarray, node_ids: np.ndarray, material_ids: np.ndarray, face_sizes: np.ndarray | None = None) -> None: ...
+
+class Triangulation:
+    corners: np.ndarray
+    indices: np.ndarray
+    part_offsets: np.ndarray
+    vertex_order: np.ndarray | None
+    optimize: tuple[str, ...]
+    def __init__(self, corners: np.ndarray, indices: np.ndarray, part_offsets: np.ndarray, vertex_order: np.ndarray | None = None, optimize: tuple[str, ...] = ()) -> None: ...
+    def part_indices(self, part: int) -> np.ndarray: ...
+
+class Meshlets:
+    meshlets: np.ndarray
+    vertices: np.ndarray
+    triangles: np.ndarray
+    part_offsets: np.ndarray
+    centers: np.ndarray
+    radii: np.ndarray
+    cone_apex: np.ndarray
+    cone_axis: np.ndarray
+    cone_cutoff: np.ndarray
+    def __len__(self) -> int: ...
+
+class NodeTable:
+    parent: np.ndarray
+    depth: np.ndarray
+    attrib_type: np.ndarray
+    world: np.ndarray
+    local: np.ndarray
+    geometry: np.ndarray
+    def __init__(self, parent: np.ndarray, depth: np.ndarray, attrib_type: np.ndarray, world: np.ndarray, local: np.ndarray, geometry: np.ndarray) -> None: ...
+    def __len__(self) -> int: ...
+
+class SharedScene:
+    meshes: list[dict[str, np.ndarray]]
+    node_table: NodeTable
+    mesh_names: list[str]
+    node_names: list[str]
+    arrays: dict[str, np.ndarray]
+    def close(self) -> None: ...
+    def __enter__(self) -> SharedScene: ...
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool: ...
+
+class SharedSceneHandle:
+    name: str
+    size: int
+    layout: dict[str, tuple[str, tuple[int, ...], int]]
+    mesh_names: list[str]
+    node_names: list[str]
+    def open(self) -> SharedScene: ...
+    def unlink(self) -> None: ...
+    def __enter__(self) -> SharedSceneHandle: ...
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool: ...
+
+class RaycastResult:
+    hit: np.ndarray
+    distance: np.ndarray
+    position: np.ndarray
+    triangle: np.ndarray
+    node_ids: np.ndarray
+    barycentric: np.ndarray
+    def __init__(self, hit: np.ndarray, distance: np.ndarray, position: np.ndarray, triangle: np.ndarray, node_ids: np.ndarray, barycentric: np.ndarray) -> None: ...
+    def __len__(self) -> int: ...
+
+class ClosestPointResult:
+    position: np.ndarray
+    distance: np.ndarray
+    triangle: np.ndarray
+    node_ids: np.ndarray
+    def __init__(self, position: np.ndarray, distance: np.ndarray, triangle: np.ndarray, node_ids: np.ndarray) -> None: ...
+    def __len__(self) -> int: ...
+
+class BVH:
+    @property
+    def geometry(self) -> FlattenedGeometry: ...
+    @property
+    def num_triangles(self) -> int: ...
+    @property
+    def num_nodes(self) -> int: ...
+    @property
+    def depth(self) -> int: ...
+    def raycast(self, origins: np.ndarray | Sequence[float], directions: np.ndarray | Sequence[float], max_distance: float = ..., workers: int | None = None) -> RaycastResult: ...
+    def closest_point(self, points: np.ndarray | Sequence[float], max_distance: float = ..., workers: int | None = None) -> ClosestPointResult: ...
+
+class TextureResolver:
+    maxsize: int
+    hits: int
+    misses: int
+    def __init__(self, maxsize: int = 65536) -> None: ...
+    def exists(self, path: str) -> bool: ...
+    def resolve(self, filenames: Iterable[str], search_paths: Sequence[str] = ()) -> str | None: ...
+    def clear(self) -> None: ...
+    def __len__(self) -> int: ...
+
+class MeshDuplicates:
+    hashes: list[str]
+    canonical: np.ndarray
+    groups: list[list[int]]
+    instances: list[tuple[str, int] | None]
+    @property
+    def num_unique(self) -> int: ...
+    def as_dict(self) -> dict[str, Any]: ...
+
+class MeshRegistry:
+    entries: dict[str, tuple[str, int]]
+    hits: int
+    def __init__(self, entries: Mapping[str, Sequence[Any]] | None = None) -> None: ...
+    def register(self, key: str, source: str, index: int) -> tuple[str, int]: ...
+    def get(self, key: str, default: Any = None) -> tuple[str, int] | Any: ...
+    def __contains__(self, key: object) -> bool: ...
+    def __len__(self) -> int: ...
+
 class Vec2:
     x: float
     y: float
@@ -184,7 +462,56 @@ class Transform:
     def __init__(self) -> None: ...
     def to_matrix(self) -> Matrix: ...
 
-class Element: ...
+class Vec3Array(np.ndarray[Any, Any]):
+    """Batch of 3D vectors as a (..., 3) float64 ndarray"""
+    def __new__(cls, data: np.ndarray | Sequence[Any]) -> Vec3Array: ...
+    def normalize(self) -> Vec3Array: ...
+
+class QuatArray(np.ndarray[Any, Any]):
+    """Batch of (x, y, z, w) quaternions as a (..., 4) float64 ndarray"""
+    def __new__(cls, data: np.ndarray | Sequence[Any]) -> QuatArray: ...
+    @classmethod
+    def identity(cls, shape: int | tuple[int, ...] = ()) -> QuatArray: ...
+    @classmethod
+    def from_euler(cls, euler: np.ndarray | Sequence[Any], order: RotationOrder | int = ...) -> QuatArray: ...
+    def mul(self, other: np.ndarray | Sequence[Any]) -> QuatArray: ...
+    def normalize(self) -> QuatArray: ...
+    def slerp(self, other: np.ndarray | Sequence[Any], t: float | np.ndarray | Sequence[float]) -> QuatArray: ...
+    def rotate(self, vectors: np.ndarray | Sequence[Any]) -> Vec3Array: ...
+    def to_euler(self, order: RotationOrder | int = ...) -> Vec3Array: ...
+
+class MatrixArray(np.ndarray[Any, Any]):
+    """Batch of affine transforms as a (..., 4, 4) float64 ndarray (translation in m[3, :3])"""
+    def __new__(cls, data: np.ndarray | Sequence[Any]) -> MatrixArray: ...
+    @classmethod
+    def identity(cls, shape: int | tuple[int, ...] = ()) -> MatrixArray: ...
+    @classmethod
+    def from_transforms(cls, translation: np.ndarray | Sequence[Any], rotation: np.ndarray | Sequence[Any], scale: np.ndarray | Sequence[Any]) -> MatrixArray: ...
+    def mul(self, other: np.ndarray | Sequence[Any]) -> MatrixArray: ...
+    def invert(self) -> MatrixArray: ...
+    def transform_points(self, points: np.ndarray | Sequence[Any]) -> Vec3Array: ...
+    def transform_directions(self, directions: np.ndarray | Sequence[Any]) -> Vec3Array: ...
+    def to_transforms(self) -> tuple[Vec3Array, QuatArray, Vec3Array]: ...
+
+class Props(Mapping[str, Any]):
+    """Read-only mapping of element properties"""
+    def __getitem__(self, name: str) -> Any: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def __len__(self) -> int: ...
+    def prop_type(self, name: str) -> PropType: ...
+    def prop_flags(self, name: str) -> PropFlags: ...
+
+class Element:
+    @property
+    def props(self) -> Props | None: ...
+    @property
+    def name(self) -> str | None: ...
+    @property
+    def element_type(self) -> ElementType | None: ...
+    @property
+    def element_id(self) -> int | None: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __hash__(self) -> int: ...
 
 class Light(Element):
     @property
@@ -256,7 +583,7 @@ class Texture(Element):
     @property
     def relative_filename(self) -> str: ...
     @property
-    def content(self) -> bytes | None: ...
+    def content(self) -> memoryview | None: ...
     @property
     def has_file(self) -> bool: ...
     @property
@@ -275,6 +602,10 @@ class AnimStack(Element):
     def time_end(self) -> float: ...
     @property
     def layers(self) -> list[AnimLayer]: ...
+    def animated_nodes(self) -> np.ndarray: ...
+    def sample_transforms(
+        self, times: float | Sequence[float] | np.ndarray, nodes: Sequence[int] | np.ndarray | None = None
+    ) -> np.ndarray: ...
 
 class AnimLayer(Element):
     @property
@@ -473,9 +804,43 @@ class Unknown(Element):
     @property
     def name(self) -> str: ...
 
+class DomNode:
+    """Raw FBX document node"""
+    @property
+    def name(self) -> str: ...
+    @property
+    def children(self) -> list[DomNode]: ...
+    @property
+    def values(self) -> list[Any]: ...
+    @property
+    def is_array(self) -> bool: ...
+    @property
+    def array_size(self) -> int: ...
+    @property
+    def array(self) -> np.ndarray | list[bytes] | None: ...
+    def find(self, name: str) -> DomNode | None: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[DomNode]: ...
+
+_E = TypeVar("_E", bound=Element)
+
+class ElementList(Sequence[_E]):
+    """Lazy read-only view over a scene element list"""
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, index: int) -> _E: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[_E]: ...
+    def __iter__(self) -> Iterator[_E]: ...
+    def __contains__(self, value: object) -> bool: ...
+    def index(self, value: Any, start: int = 0, stop: int = ...) -> int: ...
+    def count(self, value: Any) -> int: ...
+    @property
+    def element_ids(self) -> np.ndarray: ...
+
 class Scene:
     @classmethod
-    def load_file(cls, filename: str) -> Scene: ...
+    def load_file(cls, filename: str, options: LoadOptions | None = None, **kwargs: Any) -> Scene: ...
     @classmethod
     def load_memory(cls, data: bytes) -> Scene: ...
     def close(self) -> None: ...
@@ -484,41 +849,59 @@ class Scene:
     @property
     def metadata(self) -> Metadata: ...
     @property
+    def load_stats(self) -> LoadStats | None: ...
+    def memory_usage(self) -> MemoryUsage: ...
+    @property
     def settings(self) -> SceneSettings: ...
     @property
-    def nodes(self) -> list[Node]: ...
+    def nodes(self) -> ElementList[Node]: ...
     @property
-    def meshes(self) -> list[Mesh]: ...
+    def meshes(self) -> ElementList[Mesh]: ...
     @property
-    def materials(self) -> list[Material]: ...
+    def materials(self) -> ElementList[Material]: ...
     @property
-    def lights(self) -> list[Light]: ...
+    def lights(self) -> ElementList[Light]: ...
     @property
-    def cameras(self) -> list[Camera]: ...
+    def cameras(self) -> ElementList[Camera]: ...
     @property
-    def bones(self) -> list[Bone]: ...
+    def bones(self) -> ElementList[Bone]: ...
     @property
-    def empties(self) -> list[Empty]: ...
+    def empties(self) -> ElementList[Empty]: ...
     @property
-    def unknowns(self) -> list[Unknown]: ...
+    def unknowns(self) -> ElementList[Unknown]: ...
     @property
-    def textures(self) -> list[Texture]: ...
+    def textures(self) -> ElementList[Texture]: ...
     @property
-    def anim_stacks(self) -> list[AnimStack]: ...
+    def anim_stacks(self) -> ElementList[AnimStack]: ...
     @property
-    def anim_curves(self) -> list[AnimCurve]: ...
+    def anim_curves(self) -> ElementList[AnimCurve]: ...
     @property
-    def skin_deformers(self) -> list[SkinDeformer]: ...
+    def skin_deformers(self) -> ElementList[SkinDeformer]: ...
     @property
-    def blend_deformers(self) -> list[BlendDeformer]: ...
+    def blend_deformers(self) -> ElementList[BlendDeformer]: ...
+    @property
+    def blend_shapes(self) -> ElementList[BlendShape]: ...
     @property
-    def blend_shapes(self) -> list[BlendShape]: ...
+    def constraints(self) -> ElementList[Constraint]: ...
     @property
-    def constraints(self) -> list[Constraint]: ...
+    def dom_root(self) -> DomNode | None: ...
     @property
     def root_node(self) -> Node | None: ...
     @property
     def axes(self) -> CoordinateAxes: ...
+    @property
+    def bounds(self) -> np.ndarray[Any, Any] | None: ...
+    def bounds_table(self) -> np.ndarray[Any, Any]: ...
+    def build_bvh(self, nodes: Iterable[Node | str] | None = None) -> BVH: ...
+    def flatten_geometry(self, triangulate: bool = True, world_space: bool = True, nodes: Iterable[Node | str] | None = None, *, include: Iterable[Node | str] | None = None) -> FlattenedGeometry: ...
+    def query(self, type: ElementType | int | None = None, name: str | None = None, pattern: str | re.Pattern[str] | None = None, under: Node | None = None) -> ElementList[Element]: ...
+    def gather_prop(self, type: ElementType | int, name: str, default: float | Sequence[float] = ...) -> np.ndarray: ...
+    def extract_textures(self, dest_dir: str, workers: int | None = None) -> list[str | None]: ...
+    def find_duplicate_meshes(self, registry: MeshRegistry | None = None, source: str | None = None, attributes: bool = True) -> MeshDuplicates: ...
+    def export_glb(self, file: str | os.PathLike[str] | BinaryIO, options: gltf.ExportOptions | None = None, **kwargs: Any) -> int: ...
+    def node_table(self) -> NodeTable: ...
+    def to_shared_memory(self) -> SharedSceneHandle: ...
+    def resolve_textures(self, search_paths: Iterable[str | os.PathLike[str]] = (), cache: TextureResolver | None = None) -> list[str | None]: ...
     def find_node(self, name: str) -> Node | None: ...
     def find_material(self, name: str) -> Material | None: ...
 
@@ -538,10 +921,14 @@ class Node(Element):
     @property
     def bone(self) -> Bone | None: ...
     @property
+    def dom_node(self) -> DomNode | None: ...
+    @property
     def is_root(self) -> bool: ...
     @property
     def world_transform(self) -> np.ndarray[Any, Any]: ...
     @property
+    def world_bounds(self) -> np.ndarray[Any, Any] | None: ...
+    @property
     def local_transform(self) -> np.ndarray[Any, Any]: ...
     @property
     def node_to_world(self) -> np.ndarray[Any, Any]: ...
@@ -562,6 +949,8 @@ class Mesh(Element):
     @property
     def name(self) -> str: ...
     @property
+    def dom_node(self) -> DomNode | None: ...
+    @property
     def num_vertices(self) -> int: ...
     @property
     def num_indices(self) -> int: ...
@@ -570,34 +959,38 @@ class Mesh(Element):
     @property
     def num_triangles(self) -> int: ...
     @property
-    def vertex_positions(self) -> np.ndarray[Any, Any] | None: ...
+    def bounds(self) -> np.ndarray[Any, Any] | None: ...
+    @property
+    def vertex_positions(self) -> AttributeArray | None: ...
     @property
-    def vertex_normals(self) -> np.ndarray[Any, Any] | None: ...
+    def vertex_normals(self) -> AttributeArray | None: ...
     @property
-    def vertex_uvs(self) -> np.ndarray[Any, Any] | None: ...
+    def vertex_uvs(self) -> AttributeArray | None: ...
     @property
-    def vertex_tangent(self) -> np.ndarray[Any, Any] | None: ...
+    def vertex_tangent(self) -> AttributeArray | None: ...
     @property
-    def vertex_bitangent(self) -> np.ndarray[Any, Any] | None: ...
+    def vertex_bitangent(self) -> AttributeArray | None: ...
     @property
-    def vertex_color(self) -> np.ndarray[Any, Any] | None: ...
+    def vertex_color(self) -> AttributeArray | None: ...
     @property
-    def indices(self) -> np.ndarray[Any, Any] | None: ...
+    def indices(self) -> AttributeArray | None: ...
     @property
     def materials(self) -> list[Material]: ...
     @property
     def faces(self) -> list[tuple[int, int]]: ...
     @property
-    def face_material(self) -> np.ndarray[Any, Any] | None: ...
+    def face_material(self) -> AttributeArray | None: ...
     @property
     def skin_deformers(self) -> list[SkinDeformer]: ...
     @property
     def blend_deformers(self) -> list[BlendDeformer]: ...
     @property
-    def edge_crease(self) -> np.ndarray[Any, Any] | None: ...
+    def edge_crease(self) -> AttributeArray | None: ...
     @property
-    def vertex_crease(self) -> np.ndarray[Any, Any] | None: ...
+    def vertex_crease(self) -> AttributeArray | None: ...
     def triangulate_face(self, face_index: int) -> None: ...
+    def triangulate(self, optimize: str | Iterable[str] | None = None, cache_size: int = 16) -> Triangulation: ...
+    def build_meshlets(self, max_vertices: int = 64, max_triangles: int = 124, cone_weight: float = 0.0) -> Meshlets: ...
 
 class Material(Element):
     @property
@@ -767,5 +1160,11 @@ class Material(Element):
     @property
     def fbx_vector_displacement(self) -> MaterialMap: ...
 
-def load_file(filename: str) -> Scene: ...
+def load_file(filename: str, options: LoadOptions | None = None, **kwargs: Any) -> Scene: ...
 def load_memory(data: bytes) -> Scene: ...
+def scan(path: str | os.PathLike[str]) -> ScanResult: ...
+def scan_many(
+    paths: Iterable[str | os.PathLike[str]],
+    workers: int | None = None,
+    return_exceptions: bool = False,
+) -> list[ScanResult | UfbxError]: ...
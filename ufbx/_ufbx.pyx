@@ -3,9 +3,21 @@
 Cython bindings for ufbx - thin wrapper around C API
 """
 from libc.stdlib cimport free
-from libc.stdint cimport uint32_t
-from enum import IntEnum
+from libc.stdint cimport int32_t, int64_t, uint8_t, uint16_t, uint32_t, uint64_t, UINT32_MAX
+from libc.math cimport INFINITY
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum, IntFlag
+from multiprocessing import shared_memory
+import builtins
+import hashlib
 import os
+import re
+import sys
+import threading
+import time
+import weakref
 import numpy as np
 cimport numpy as np
 
@@ -176,10 +188,35 @@ cdef extern from "ufbx-c/ufbx.h":
         void** data
         size_t count
 
+    # Properties
+    ctypedef struct ufbx_blob:
+        void* data
+        size_t size
+    ctypedef struct ufbx_prop:
+        ufbx_string name
+        unsigned int type  # ufbx_prop_type
+        unsigned int flags  # ufbx_prop_flags
+        ufbx_string value_str
+        ufbx_blob value_blob
+        int64_t value_int
+        double value_real_arr[4]
+        double value_real
+    ctypedef struct ufbx_prop_list:
+        ufbx_prop* data
+        size_t count
+    ctypedef struct ufbx_props:
+        ufbx_prop_list props
+        size_t num_animated
+        ufbx_props* defaults
+
+    ufbx_prop* ufbx_find_prop_len(const ufbx_props *props, const char *name, size_t name_len)
+    void ufbx_retain_scene(ufbx_scene *scene)
+    void ufbx_free_scene(ufbx_scene *scene)
+
     # Full ufbx_element structure matching ufbx.h layout
     ctypedef struct ufbx_element:
         ufbx_string name
-        void* props  # ufbx_props - treated as opaque
+        ufbx_props props
         unsigned int element_id
         unsigned int typed_id
         ufbx_node_list instances
@@ -294,16 +331,52 @@ cdef extern from "ufbx-c/ufbx.h":
         size_t count
 
     # Scene structure with metadata and settings
+    ctypedef struct ufbx_element_list:
+        ufbx_element** data
+        size_t count
+
     ctypedef struct ufbx_scene:
         ufbx_metadata metadata
         ufbx_scene_settings settings
         ufbx_empty_list empties
         ufbx_unknown_list unknowns
+        ufbx_element_list elements
+        ufbx_element_list* elements_by_type  # ufbx_element_list[UFBX_ELEMENT_TYPE_COUNT]
+
+    # Element types with a dedicated wrapper class
+    enum:
+        UFBX_ELEMENT_UNKNOWN
+        UFBX_ELEMENT_NODE
+        UFBX_ELEMENT_MESH
+        UFBX_ELEMENT_LIGHT
+        UFBX_ELEMENT_CAMERA
+        UFBX_ELEMENT_BONE
+        UFBX_ELEMENT_EMPTY
+        UFBX_ELEMENT_SKIN_DEFORMER
+        UFBX_ELEMENT_SKIN_CLUSTER
+        UFBX_ELEMENT_BLEND_DEFORMER
+        UFBX_ELEMENT_BLEND_CHANNEL
+        UFBX_ELEMENT_BLEND_SHAPE
+        UFBX_ELEMENT_MATERIAL
+        UFBX_ELEMENT_TEXTURE
+        UFBX_ELEMENT_ANIM_STACK
+        UFBX_ELEMENT_ANIM_LAYER
+        UFBX_ELEMENT_ANIM_CURVE
+        UFBX_ELEMENT_CONSTRAINT
+        UFBX_ELEMENT_TYPE_COUNT
+
+    # ufbx_error_type values mapped to specific exception types
+    enum:
+        UFBX_ERROR_FILE_NOT_FOUND
+        UFBX_ERROR_OUT_OF_MEMORY
+        UFBX_ERROR_MEMORY_LIMIT
+        UFBX_ERROR_ALLOCATION_LIMIT
 
     ctypedef struct ufbx_mesh:
         pass
     ctypedef struct ufbx_node:
-        pass
+        unsigned int element_id
+        unsigned int typed_id
     ctypedef struct ufbx_light:
         pass
     ctypedef struct ufbx_camera:
@@ -313,9 +386,6 @@ cdef extern from "ufbx-c/ufbx.h":
 
     # Forward declarations for texture-related types
     # (ufbx_video already declared above)
-    ctypedef struct ufbx_blob:
-        void* data
-        size_t size
     ctypedef struct ufbx_texture_layer_list:
         void** data
         size_t count
@@ -327,6 +397,22 @@ cdef extern from "ufbx-c/ufbx.h":
         ufbx_vec4 rotation  # quaternion (x, y, z, w)
         ufbx_vec3 scale
 
+    ctypedef struct ufbx_quat:
+        double x
+        double y
+        double z
+        double w
+
+    ctypedef struct ufbx_matrix:
+        double m00, m10, m20
+        double m01, m11, m21
+        double m02, m12, m22
+        double m03, m13, m23
+
+    ufbx_quat ufbx_quat_mul(ufbx_quat a, ufbx_quat b)
+    ufbx_quat ufbx_quat_normalize(ufbx_quat q)
+    ufbx_matrix ufbx_transform_to_matrix(const ufbx_transform *t)
+
     # Full ufbx_texture structure matching ufbx.h layout
     ctypedef struct ufbx_texture:
         # Element fields (union expanded as struct fields)
@@ -396,9 +482,75 @@ cdef extern from "ufbx-c/ufbx.h":
 
 cdef extern from "ufbx_wrapper.h":
 
+    ctypedef struct ufbx_wrapper_load_stats:
+        double total_seconds
+        double read_seconds
+        double parse_seconds
+        double finalize_seconds
+        uint64_t bytes_read
+        uint64_t bytes_inflated
+        size_t num_allocs
+        size_t num_frees
+        size_t peak_heap_bytes
+        size_t result_heap_bytes
+        size_t num_progress_calls
+
+    ctypedef struct ufbx_wrapper_memory_usage:
+        size_t result_bytes
+        size_t result_allocs
+        size_t temp_peak_bytes
+        size_t temp_allocs
+        size_t peak_bytes
+
+    ctypedef struct ufbx_wrapper_load_opts:
+        bint retain_dom
+        bint has_target_axes
+        int target_axes[3]
+        double target_unit_meters
+        int space_conversion
+        size_t max_memory
+        size_t max_temp_memory
+        ufbx_wrapper_load_stats *stats
+        ufbx_wrapper_memory_usage *memory_usage
+
+    ctypedef struct ufbx_wrapper_scan_result:
+        uint32_t version
+        int file_format
+        bint ascii
+        char creator[256]
+        double unit_meters
+        int axes[3]
+        double frames_per_second
+        size_t num_nodes
+        size_t num_meshes
+        size_t num_materials
+        size_t num_textures
+        size_t num_lights
+        size_t num_cameras
+        size_t num_anim_stacks
+        int error_type
+        char error[256]
+
+    ctypedef struct ufbx_wrapper_query:
+        int type
+        const char* name
+        size_t name_length
+        const char* pattern
+        size_t pattern_length
+        const ufbx_node* under
+
+    ctypedef struct ufbx_wrapper_flatten_sizes:
+        size_t num_positions
+        size_t num_indices
+        size_t num_faces
+        size_t max_face_triangles
+
     # Scene management
     ufbx_scene* ufbx_wrapper_load_file(const char *filename, char **error_msg)
+    ufbx_scene* ufbx_wrapper_load_file_opts(const char *filename, const ufbx_wrapper_load_opts *opts,
+                                            char **error_msg, int *error_type)
     void ufbx_wrapper_free_scene(ufbx_scene *scene)
+    bint ufbx_wrapper_scan_file(const char *filename, ufbx_wrapper_scan_result *result) nogil
 
     # Scene queries
     size_t ufbx_wrapper_scene_get_num_nodes(const ufbx_scene *scene)
@@ -439,12 +591,12 @@ cdef extern from "ufbx_wrapper.h":
     size_t ufbx_wrapper_mesh_get_num_triangles(const ufbx_mesh *mesh)
 
     # Mesh vertex data
-    const float* ufbx_wrapper_mesh_get_vertex_positions(const ufbx_mesh *mesh, size_t *out_count)
-    const float* ufbx_wrapper_mesh_get_vertex_normals(const ufbx_mesh *mesh, size_t *out_count)
-    const float* ufbx_wrapper_mesh_get_vertex_uvs(const ufbx_mesh *mesh, size_t *out_count)
-    const float* ufbx_wrapper_mesh_get_vertex_tangents(const ufbx_mesh *mesh, size_t *out_count)
-    const float* ufbx_wrapper_mesh_get_vertex_bitangents(const ufbx_mesh *mesh, size_t *out_count)
-    const float* ufbx_wrapper_mesh_get_vertex_colors(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_positions(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_normals(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_uvs(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_tangents(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_bitangents(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_colors(const ufbx_mesh *mesh, size_t *out_count)
     const uint32_t* ufbx_wrapper_mesh_get_indices(const ufbx_mesh *mesh, size_t *out_count)
 
     # Mesh face data
@@ -452,7 +604,7 @@ cdef extern from "ufbx_wrapper.h":
     void ufbx_wrapper_mesh_get_face(const ufbx_mesh *mesh, size_t index, uint32_t *index_begin, uint32_t *num_indices)
     const uint32_t* ufbx_wrapper_mesh_get_face_material(const ufbx_mesh *mesh, size_t *out_count)
     const double* ufbx_wrapper_mesh_get_edge_crease(const ufbx_mesh *mesh, size_t *out_count)
-    const float* ufbx_wrapper_mesh_get_vertex_crease(const ufbx_mesh *mesh, size_t *out_count)
+    const double* ufbx_wrapper_mesh_get_vertex_crease(const ufbx_mesh *mesh, size_t *out_count)
 
     # Mesh deformers
     size_t ufbx_wrapper_mesh_get_num_skin_deformers(const ufbx_mesh *mesh)
@@ -586,6 +738,130 @@ cdef extern from "ufbx_wrapper.h":
     double ufbx_wrapper_constraint_get_weight(const ufbx_constraint *constraint)
     bint ufbx_wrapper_constraint_get_active(const ufbx_constraint *constraint)
 
+    # DOM access
+    ufbx_dom_node* ufbx_wrapper_scene_get_dom_root(const ufbx_scene *scene)
+    ufbx_dom_node* ufbx_wrapper_node_get_dom_node(const ufbx_node *node)
+    ufbx_dom_node* ufbx_wrapper_mesh_get_dom_node(const ufbx_mesh *mesh)
+    const char* ufbx_wrapper_dom_node_get_name(const ufbx_dom_node *dom_node, size_t *out_length)
+    size_t ufbx_wrapper_dom_node_get_num_children(const ufbx_dom_node *dom_node)
+    ufbx_dom_node* ufbx_wrapper_dom_node_get_child(const ufbx_dom_node *dom_node, size_t index)
+    ufbx_dom_node* ufbx_wrapper_dom_node_find(const ufbx_dom_node *dom_node, const char *name, size_t name_length)
+    size_t ufbx_wrapper_dom_node_get_num_values(const ufbx_dom_node *dom_node)
+    int ufbx_wrapper_dom_node_get_value_type(const ufbx_dom_node *dom_node, size_t index)
+    int64_t ufbx_wrapper_dom_node_get_value_int(const ufbx_dom_node *dom_node, size_t index)
+    double ufbx_wrapper_dom_node_get_value_float(const ufbx_dom_node *dom_node, size_t index)
+    const char* ufbx_wrapper_dom_node_get_value_str(const ufbx_dom_node *dom_node, size_t index, size_t *out_length)
+    const void* ufbx_wrapper_dom_node_get_value_blob(const ufbx_dom_node *dom_node, size_t index, size_t *out_size)
+    bint ufbx_wrapper_dom_node_is_array(const ufbx_dom_node *dom_node)
+    size_t ufbx_wrapper_dom_node_get_array_size(const ufbx_dom_node *dom_node)
+    const void* ufbx_wrapper_dom_node_get_array(const ufbx_dom_node *dom_node, int *out_type, size_t *out_count)
+
+    # Scene-wide geometry
+    void ufbx_wrapper_flatten_count(const ufbx_scene *scene, bint all_nodes, const uint32_t *node_ids,
+                                    size_t num_node_ids, bint triangulate, ufbx_wrapper_flatten_sizes *sizes) nogil
+    bint ufbx_wrapper_flatten_fill(const ufbx_scene *scene, bint all_nodes, const uint32_t *node_ids, size_t num_node_ids,
+                                   bint triangulate, bint world_space, const ufbx_wrapper_flatten_sizes *sizes,
+                                   double *positions, uint32_t *indices, int32_t *face_nodes,
+                                   int32_t *face_materials, uint32_t *face_sizes) nogil
+
+    # Element queries
+    size_t ufbx_wrapper_scene_query(const ufbx_scene *scene, const ufbx_wrapper_query *query, uint32_t *out_element_ids) nogil
+
+    # Property gathering
+    void ufbx_wrapper_scene_gather_prop(const ufbx_scene *scene, int type, const char *name, size_t name_length,
+                                        size_t num_components, const double *default_value, double *out) nogil
+
+    # Animation sampling
+    void ufbx_wrapper_anim_stack_sample_transforms(const ufbx_scene *scene, const ufbx_anim_stack *anim_stack,
+                                                   bint all_nodes, const uint32_t *node_ids, size_t num_node_ids,
+                                                   const double *times, size_t num_times, double *out) nogil
+    void ufbx_wrapper_anim_stack_animated_nodes(const ufbx_scene *scene, const ufbx_anim_stack *anim_stack,
+                                                uint8_t *out) nogil
+
+    # Bounding boxes
+    void ufbx_wrapper_scene_compute_bounds(const ufbx_scene *scene, double *mesh_bounds, double *node_bounds) nogil
+
+    # glTF export helpers
+    ctypedef struct ufbx_wrapper_part_buffers:
+        float *positions
+        float *normals
+        float *uvs
+        float *colors
+        uint16_t *joints
+        float *weights
+        uint32_t *indices
+    int32_t ufbx_wrapper_node_material_id(const ufbx_node *node, uint32_t slot)
+    void ufbx_wrapper_scene_fill_node_trs(const ufbx_scene *scene, double *local, double *geometry) nogil
+    size_t ufbx_wrapper_mesh_get_num_parts(const ufbx_mesh *mesh)
+    enum:
+        UFBX_WRAPPER_STREAM_NORMAL
+        UFBX_WRAPPER_STREAM_UV
+        UFBX_WRAPPER_STREAM_COLOR
+    uint32_t ufbx_wrapper_mesh_get_stream_flags(const ufbx_mesh *mesh)
+    size_t ufbx_wrapper_mesh_part_get_num_triangles(const ufbx_mesh *mesh, size_t part_index)
+    size_t ufbx_wrapper_mesh_part_fill(const ufbx_mesh *mesh, size_t part_index, const ufbx_skin_deformer *skin,
+                                       const ufbx_wrapper_part_buffers *buffers) nogil
+    void ufbx_wrapper_skin_fill_bind(const ufbx_skin_deformer *skin, int32_t *joint_nodes, float *inverse_bind)
+
+    # Mesh content hashes
+    void ufbx_wrapper_scene_hash_meshes(const ufbx_scene *scene, bint attributes, uint64_t *out_hashes) nogil
+
+    # Mesh triangulation
+    enum:
+        UFBX_WRAPPER_OPTIMIZE_VERTEX_CACHE
+        UFBX_WRAPPER_OPTIMIZE_OVERDRAW
+        UFBX_WRAPPER_OPTIMIZE_FETCH
+    bint ufbx_wrapper_mesh_triangulate(const ufbx_mesh *mesh, uint32_t flags, uint32_t cache_size, uint32_t *corners,
+                                       uint32_t *indices, size_t *part_offsets, uint32_t *vertex_order) nogil
+
+    # Meshlets
+    bint ufbx_wrapper_mesh_build_meshlets(const ufbx_mesh *mesh, uint32_t max_vertices, uint32_t max_triangles,
+                                          double cone_weight, uint32_t *meshlets, uint32_t *meshlet_vertices,
+                                          uint8_t *meshlet_triangles, size_t *part_offsets, size_t *num_meshlets) nogil
+    void ufbx_wrapper_mesh_meshlet_bounds(const ufbx_mesh *mesh, const uint32_t *meshlets, size_t num_meshlets,
+                                          const uint32_t *meshlet_vertices, const uint8_t *meshlet_triangles,
+                                          double *centers, double *radii, double *cone_apex, double *cone_axis,
+                                          double *cone_cutoff) nogil
+
+    # BVH
+    ctypedef struct ufbx_wrapper_bvh
+    ufbx_wrapper_bvh* ufbx_wrapper_bvh_build(const double *positions, const uint32_t *indices, size_t num_triangles) nogil
+    void ufbx_wrapper_bvh_free(ufbx_wrapper_bvh *bvh)
+    size_t ufbx_wrapper_bvh_num_nodes(const ufbx_wrapper_bvh *bvh)
+    size_t ufbx_wrapper_bvh_max_depth(const ufbx_wrapper_bvh *bvh)
+    bint ufbx_wrapper_bvh_raycast(const ufbx_wrapper_bvh *bvh, const double *origins, const double *directions,
+                                  size_t count, double max_distance, double *out_distance, int64_t *out_triangle,
+                                  double *out_barycentric) nogil
+    bint ufbx_wrapper_bvh_closest_point(const ufbx_wrapper_bvh *bvh, const double *points, size_t count,
+                                        double max_distance, double *out_points, double *out_distance,
+                                        int64_t *out_triangle) nogil
+
+    # Batched math
+    void ufbx_wrapper_vec3_normalize_n(const double *v, double *out, size_t count) nogil
+    void ufbx_wrapper_quat_mul_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                                 double *out, size_t count) nogil
+    void ufbx_wrapper_quat_normalize_n(const double *q, double *out, size_t count) nogil
+    void ufbx_wrapper_quat_slerp_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                                   const double *t, size_t t_stride, double *out, size_t count) nogil
+    void ufbx_wrapper_quat_rotate_n(const double *q, size_t q_stride, const double *v, size_t v_stride,
+                                    double *out, size_t count) nogil
+    void ufbx_wrapper_quat_to_euler_n(const double *q, int order, double *out, size_t count) nogil
+    void ufbx_wrapper_euler_to_quat_n(const double *euler, int order, double *out, size_t count) nogil
+    void ufbx_wrapper_matrix_mul_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                                   double *out, size_t count) nogil
+    void ufbx_wrapper_matrix_invert_n(const double *m, double *out, size_t count) nogil
+    void ufbx_wrapper_matrix_transform_n(const double *m, size_t m_stride, const double *v, size_t v_stride,
+                                         bint directions, double *out, size_t count) nogil
+    void ufbx_wrapper_matrix_to_transform_n(const double *m, double *translation, double *rotation,
+                                            double *scale, size_t count) nogil
+    void ufbx_wrapper_transform_to_matrix_n(const double *translation, size_t t_stride, const double *rotation,
+                                            size_t r_stride, const double *scale, size_t s_stride,
+                                            double *out, size_t count) nogil
+
+    # Node table
+    void ufbx_wrapper_scene_fill_node_table(const ufbx_scene *scene, int32_t *parents, int32_t *depths,
+                                            int32_t *attrib_types, double *world, double *local, double *geometry) nogil
+
 
 # Python classes
 class UfbxError(Exception):
@@ -624,21 +900,91 @@ class ElementType(IntEnum):
     ELEMENT_MESH = 2
     ELEMENT_LIGHT = 3
     ELEMENT_CAMERA = 4
-    ELEMENT_MATERIAL = 5
-    ELEMENT_BONE = 6
+    ELEMENT_BONE = 5
+    ELEMENT_EMPTY = 6
+    ELEMENT_LINE_CURVE = 7
+    ELEMENT_NURBS_CURVE = 8
+    ELEMENT_NURBS_SURFACE = 9
+    ELEMENT_NURBS_TRIM_SURFACE = 10
+    ELEMENT_NURBS_TRIM_BOUNDARY = 11
+    ELEMENT_PROCEDURAL_GEOMETRY = 12
+    ELEMENT_STEREO_CAMERA = 13
+    ELEMENT_CAMERA_SWITCHER = 14
+    ELEMENT_MARKER = 15
+    ELEMENT_LOD_GROUP = 16
+    ELEMENT_SKIN_DEFORMER = 17
+    ELEMENT_SKIN_CLUSTER = 18
+    ELEMENT_BLEND_DEFORMER = 19
+    ELEMENT_BLEND_CHANNEL = 20
+    ELEMENT_BLEND_SHAPE = 21
+    ELEMENT_CACHE_DEFORMER = 22
+    ELEMENT_CACHE_FILE = 23
+    ELEMENT_MATERIAL = 24
+    ELEMENT_TEXTURE = 25
+    ELEMENT_VIDEO = 26
+    ELEMENT_SHADER = 27
+    ELEMENT_SHADER_BINDING = 28
+    ELEMENT_ANIM_STACK = 29
+    ELEMENT_ANIM_LAYER = 30
+    ELEMENT_ANIM_VALUE = 31
+    ELEMENT_ANIM_CURVE = 32
+    ELEMENT_DISPLAY_LAYER = 33
+    ELEMENT_SELECTION_SET = 34
+    ELEMENT_SELECTION_NODE = 35
+    ELEMENT_CHARACTER = 36
+    ELEMENT_CONSTRAINT = 37
+    ELEMENT_AUDIO_LAYER = 38
+    ELEMENT_AUDIO_CLIP = 39
+    ELEMENT_POSE = 40
+    ELEMENT_METADATA_OBJECT = 41
 
 
 class PropType(IntEnum):
     PROP_UNKNOWN = 0
     PROP_BOOLEAN = 1
     PROP_INTEGER = 2
-    PROP_FLOAT = 3
-    PROP_STRING = 4
-
-
-class PropFlags(IntEnum):
+    PROP_NUMBER = 3
+    PROP_FLOAT = 3  # Alias of PROP_NUMBER
+    PROP_VECTOR = 4
+    PROP_COLOR = 5
+    PROP_COLOR_WITH_ALPHA = 6
+    PROP_STRING = 7
+    PROP_DATE_TIME = 8
+    PROP_TRANSLATION = 9
+    PROP_ROTATION = 10
+    PROP_SCALING = 11
+    PROP_DISTANCE = 12
+    PROP_COMPOUND = 13
+    PROP_BLOB = 14
+    PROP_REFERENCE = 15
+
+
+class PropFlags(IntFlag):
     PROP_FLAG_NONE = 0
-    PROP_FLAG_ANIMATABLE = 1
+    PROP_FLAG_ANIMATABLE = 0x1
+    PROP_FLAG_USER_DEFINED = 0x2
+    PROP_FLAG_HIDDEN = 0x4
+    PROP_FLAG_LOCK_X = 0x10
+    PROP_FLAG_LOCK_Y = 0x20
+    PROP_FLAG_LOCK_Z = 0x40
+    PROP_FLAG_LOCK_W = 0x80
+    PROP_FLAG_MUTE_X = 0x100
+    PROP_FLAG_MUTE_Y = 0x200
+    PROP_FLAG_MUTE_Z = 0x400
+    PROP_FLAG_MUTE_W = 0x800
+    PROP_FLAG_SYNTHETIC = 0x1000
+    PROP_FLAG_ANIMATED = 0x2000
+    PROP_FLAG_NOT_FOUND = 0x4000
+    PROP_FLAG_CONNECTED = 0x8000
+    PROP_FLAG_NO_VALUE = 0x10000
+    PROP_FLAG_OVERRIDDEN = 0x20000
+    PROP_FLAG_VALUE_REAL = 0x100000
+    PROP_FLAG_VALUE_VEC2 = 0x200000
+    PROP_FLAG_VALUE_VEC3 = 0x400000
+    PROP_FLAG_VALUE_VEC4 = 0x800000
+    PROP_FLAG_VALUE_INT = 0x1000000
+    PROP_FLAG_VALUE_STR = 0x2000000
+    PROP_FLAG_VALUE_BLOB = 0x4000000
 
 
 class InheritMode(IntEnum):
@@ -676,6 +1022,32 @@ class CoordinateAxes:
     def __repr__(self) -> str:
         return f"CoordinateAxes(right={self.right!r}, up={self.up!r}, front={self.front!r})"
 
+    def __eq__(self, other):
+        if not isinstance(other, CoordinateAxes):
+            return NotImplemented
+        return (self.right, self.up, self.front) == (other.right, other.up, other.front)
+
+    def __hash__(self):
+        return hash((self.right, self.up, self.front))
+
+    @classmethod
+    def right_handed_y_up(cls):
+        """+X right, +Y up, +Z front (Maya, glTF)"""
+        return cls(CoordinateAxis.COORDINATE_AXIS_POSITIVE_X, CoordinateAxis.COORDINATE_AXIS_POSITIVE_Y,
+                   CoordinateAxis.COORDINATE_AXIS_POSITIVE_Z)
+
+    @classmethod
+    def right_handed_z_up(cls):
+        """+X right, +Z up, -Y front (3ds Max, Blender)"""
+        return cls(CoordinateAxis.COORDINATE_AXIS_POSITIVE_X, CoordinateAxis.COORDINATE_AXIS_POSITIVE_Z,
+                   CoordinateAxis.COORDINATE_AXIS_NEGATIVE_Y)
+
+    @classmethod
+    def left_handed_y_up(cls):
+        """+X right, +Y up, -Z front (Unity, Direct3D)"""
+        return cls(CoordinateAxis.COORDINATE_AXIS_POSITIVE_X, CoordinateAxis.COORDINATE_AXIS_POSITIVE_Y,
+                   CoordinateAxis.COORDINATE_AXIS_NEGATIVE_Z)
+
 
 class SubdivisionDisplayMode(IntEnum):
     SUBDIVISION_DISPLAY_MODE_OFF = 0
@@ -774,6 +1146,745 @@ class ErrorType(IntEnum):
     ERROR_OUT_OF_MEMORY = 2
 
 
+class DomValueType(IntEnum):
+    DOM_VALUE_NUMBER = 0
+    DOM_VALUE_STRING = 1
+    DOM_VALUE_BLOB = 2
+    DOM_VALUE_ARRAY_I32 = 3
+    DOM_VALUE_ARRAY_I64 = 4
+    DOM_VALUE_ARRAY_F32 = 5
+    DOM_VALUE_ARRAY_F64 = 6
+    DOM_VALUE_ARRAY_BLOB = 7
+    DOM_VALUE_ARRAY_IGNORED = 8
+
+
+class SpaceConversion(IntEnum):
+    SPACE_CONVERSION_TRANSFORM_ROOT = 0
+    SPACE_CONVERSION_ADJUST_TRANSFORMS = 1
+    SPACE_CONVERSION_MODIFY_GEOMETRY = 2
+
+
+class LoadOptions:
+    """Options for load_file(). Mirrors the matching fields of ufbx_load_opts.
+
+    target_axes: CoordinateAxes (or (right, up, front) tuple) to convert the scene to
+    target_unit_meters: Scale so one unit is this many meters (None keeps file units)
+    space_conversion: How the conversion is applied (SpaceConversion); only
+        SPACE_CONVERSION_MODIFY_GEOMETRY converts vertex data itself
+    stats: Profile the load and attach a LoadStats as Scene.load_stats
+    max_memory: Byte budget for the loaded scene (None for unlimited)
+    max_temp_memory: Byte budget for temporary load allocations (None for unlimited)
+
+    Exceeding either budget aborts the load with UfbxOutOfMemoryError.
+    """
+
+    __slots__ = ("retain_dom", "target_axes", "target_unit_meters", "space_conversion", "stats",
+                 "max_memory", "max_temp_memory")
+
+    def __init__(self, retain_dom: bool = False, target_axes=None, target_unit_meters=None,
+                 space_conversion=SpaceConversion.SPACE_CONVERSION_TRANSFORM_ROOT, stats: bool = False,
+                 max_memory=None, max_temp_memory=None):
+        self.retain_dom = retain_dom
+        self.target_axes = target_axes
+        self.target_unit_meters = target_unit_meters
+        self.space_conversion = space_conversion
+        self.stats = stats
+        self.max_memory = max_memory
+        self.max_temp_memory = max_temp_memory
+
+    def __repr__(self) -> str:
+        return (f"LoadOptions(retain_dom={self.retain_dom!r}, target_axes={self.target_axes!r}, "
+                f"target_unit_meters={self.target_unit_meters!r}, space_conversion={self.space_conversion!r}, "
+                f"stats={self.stats!r}, max_memory={self.max_memory!r}, max_temp_memory={self.max_temp_memory!r})")
+
+
+class LoadStats:
+    """Load profile attached as Scene.load_stats by load_file(..., stats=True)
+
+    total_seconds: wall time of the load
+    read_seconds: time spent reading the file
+    parse_seconds: parsing and decompression up to the last read, excluding reads
+    finalize_seconds: building the scene after the file was consumed
+    bytes_read: bytes read from the file
+    bytes_inflated: decompressed size declared by the deflate-encoded array headers
+        (binary FBX only), an estimate from the file layout rather than a measurement
+    num_allocs: allocations made during the load (ufbx_metadata counts)
+    num_frees: frees made during the load
+    peak_heap_bytes: peak bytes held by ufbx at once during the load, None if not tracked
+    result_heap_bytes: bytes owned by the loaded scene
+    """
+
+    __slots__ = ("total_seconds", "read_seconds", "parse_seconds", "finalize_seconds", "bytes_read",
+                 "bytes_inflated", "num_allocs", "num_frees", "peak_heap_bytes", "result_heap_bytes")
+
+    def __init__(self, total_seconds=0.0, read_seconds=0.0, parse_seconds=0.0, finalize_seconds=0.0,
+                 bytes_read=0, bytes_inflated=0, num_allocs=0, num_frees=0, peak_heap_bytes=None,
+                 result_heap_bytes=0):
+        self.total_seconds = total_seconds
+        self.read_seconds = read_seconds
+        self.parse_seconds = parse_seconds
+        self.finalize_seconds = finalize_seconds
+        self.bytes_read = bytes_read
+        self.bytes_inflated = bytes_inflated
+        self.num_allocs = num_allocs
+        self.num_frees = num_frees
+        self.peak_heap_bytes = peak_heap_bytes
+        self.result_heap_bytes = result_heap_bytes
+
+    @property
+    def phases(self):
+        """Wall time per phase as {"read": s, "parse": s, "finalize": s}"""
+        return {"read": self.read_seconds, "parse": self.parse_seconds, "finalize": self.finalize_seconds}
+
+    def as_dict(self):
+        """All fields as a flat dict, e.g. for exporting as metrics"""
+        return {name: getattr(self, name) for name in LoadStats.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"LoadStats(total={self.total_seconds * 1e3:.2f}ms, read={self.read_seconds * 1e3:.2f}ms, "
+                f"parse={self.parse_seconds * 1e3:.2f}ms, finalize={self.finalize_seconds * 1e3:.2f}ms, "
+                f"bytes_read={self.bytes_read}, allocs={self.num_allocs}, peak_heap={self.peak_heap_bytes})")
+
+
+class MemoryUsage:
+    """Heap usage of a loaded scene, returned by Scene.memory_usage()
+
+    result_bytes: bytes owned by the scene until it is closed
+    result_allocs: allocations made for the scene
+    temp_peak_bytes: peak temporary bytes during the load (freed once loaded), None if not tracked
+    temp_allocs: temporary allocations made during the load
+    peak_bytes: peak temporary and result bytes held at once during the load, None if not tracked
+    """
+
+    __slots__ = ("result_bytes", "result_allocs", "temp_peak_bytes", "temp_allocs", "peak_bytes")
+
+    def __init__(self, result_bytes=0, result_allocs=0, temp_peak_bytes=None, temp_allocs=0, peak_bytes=None):
+        self.result_bytes = result_bytes
+        self.result_allocs = result_allocs
+        self.temp_peak_bytes = temp_peak_bytes
+        self.temp_allocs = temp_allocs
+        self.peak_bytes = peak_bytes
+
+    def as_dict(self):
+        """All fields as a flat dict"""
+        return {name: getattr(self, name) for name in MemoryUsage.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"MemoryUsage(result_bytes={self.result_bytes}, temp_peak_bytes={self.temp_peak_bytes}, "
+                f"peak_bytes={self.peak_bytes})")
+
+
+class ScanResult:
+    """Header fields and element counts of a file, returned by scan()
+
+    path: the scanned path
+    version, creator, file_format, ascii: as in Scene.metadata
+    unit_meters, axes, frames_per_second: as in Scene.settings
+    num_nodes, num_meshes, num_materials, num_textures, num_lights, num_cameras,
+    num_anim_stacks: element counts
+    """
+
+    __slots__ = ("path", "version", "creator", "file_format", "ascii", "unit_meters", "axes",
+                 "frames_per_second", "num_nodes", "num_meshes", "num_materials", "num_textures",
+                 "num_lights", "num_cameras", "num_anim_stacks")
+
+    def __init__(self, path, version=0, creator="", file_format=0, ascii=False, unit_meters=1.0, axes=None,
+                 frames_per_second=0.0, num_nodes=0, num_meshes=0, num_materials=0, num_textures=0,
+                 num_lights=0, num_cameras=0, num_anim_stacks=0):
+        self.path = path
+        self.version = version
+        self.creator = creator
+        self.file_format = file_format
+        self.ascii = ascii
+        self.unit_meters = unit_meters
+        self.axes = axes
+        self.frames_per_second = frames_per_second
+        self.num_nodes = num_nodes
+        self.num_meshes = num_meshes
+        self.num_materials = num_materials
+        self.num_textures = num_textures
+        self.num_lights = num_lights
+        self.num_cameras = num_cameras
+        self.num_anim_stacks = num_anim_stacks
+
+    def as_dict(self):
+        """All fields as a flat dict, e.g. for an index row"""
+        return {name: getattr(self, name) for name in ScanResult.__slots__}
+
+    def __repr__(self) -> str:
+        return (f"ScanResult(path={self.path!r}, version={self.version}, creator={self.creator!r}, "
+                f"nodes={self.num_nodes}, meshes={self.num_meshes})")
+
+
+class FlattenedGeometry:
+    """Result of Scene.flatten_geometry()
+
+    positions: (P, 3) float64 vertex positions of every included mesh instance
+    indices: (T, 3) uint32 triangles, or (I,) uint32 polygon corners when not triangulated
+    node_ids: per-face index into Scene.nodes
+    material_ids: per-face index into Scene.materials (-1 if none)
+    face_sizes: per-face corner counts (None when triangulated)
+    """
+
+    __slots__ = ("positions", "indices", "node_ids", "material_ids", "face_sizes")
+
+    def __init__(self, positions, indices, node_ids, material_ids, face_sizes=None):
+        self.positions = positions
+        self.indices = indices
+        self.node_ids = node_ids
+        self.material_ids = material_ids
+        self.face_sizes = face_sizes
+
+    def __repr__(self) -> str:
+        return (f"FlattenedGeometry(positions={len(self.positions)}, "
+                f"faces={len(self.node_ids)}, triangulated={self.face_sizes is None})")
+
+
+class Triangulation:
+    """Result of Mesh.triangulate()
+
+    corners: (T, 3) uint32 mesh corners, indexing Mesh.indices and per-corner attributes
+    indices: (T, 3) uint32 vertices, indexing Mesh.vertex_positions (or vertex_order)
+    part_offsets: (P + 1,) int64 triangle offsets of each Mesh.materials part
+    vertex_order: (V,) uint32 vertex of each renumbered vertex with "fetch", else None
+    optimize: the optimizations applied, in the order given
+    """
+
+    __slots__ = ("corners", "indices", "part_offsets", "vertex_order", "optimize")
+
+    def __init__(self, corners, indices, part_offsets, vertex_order=None, optimize=()):
+        self.corners = corners
+        self.indices = indices
+        self.part_offsets = part_offsets
+        self.vertex_order = vertex_order
+        self.optimize = optimize
+
+    def part_indices(self, part):
+        """(T_part, 3) indices of one material part"""
+        return self.indices[self.part_offsets[part]:self.part_offsets[part + 1]]
+
+    def __repr__(self) -> str:
+        return (f"Triangulation(triangles={len(self.indices)}, parts={len(self.part_offsets) - 1}, "
+                f"optimize={self.optimize!r})")
+
+
+class Meshlets:
+    """Result of Mesh.build_meshlets()
+
+    meshlets: (M, 4) uint32 vertex offset, triangle offset, vertex count and
+        triangle count of each meshlet
+    vertices: (V,) uint32 mesh vertex (Mesh.vertex_positions row) of each meshlet vertex
+    triangles: (T, 3) uint8 triangle corners, indexing the meshlet's vertices
+    part_offsets: (P + 1,) int64 meshlet offsets of each Mesh.materials part
+    centers, radii: (M, 3) / (M,) float64 bounding spheres
+    cone_apex, cone_axis, cone_cutoff: (M, 3) / (M, 3) / (M,) float64 backface
+        culling cones: a meshlet faces away from a camera at c if
+        dot(normalize(cone_apex - c), cone_axis) >= cone_cutoff
+    """
+
+    __slots__ = ("meshlets", "vertices", "triangles", "part_offsets", "centers", "radii", "cone_apex",
+                 "cone_axis", "cone_cutoff")
+
+    def __init__(self, meshlets, vertices, triangles, part_offsets, centers, radii, cone_apex, cone_axis,
+                 cone_cutoff):
+        self.meshlets = meshlets
+        self.vertices = vertices
+        self.triangles = triangles
+        self.part_offsets = part_offsets
+        self.centers = centers
+        self.radii = radii
+        self.cone_apex = cone_apex
+        self.cone_axis = cone_axis
+        self.cone_cutoff = cone_cutoff
+
+    def __len__(self):
+        return len(self.meshlets)
+
+    def __repr__(self) -> str:
+        return (f"Meshlets(meshlets={len(self.meshlets)}, vertices={len(self.vertices)}, "
+                f"triangles={len(self.triangles)})")
+
+
+_TRIANGULATE_OPTIMIZE = {
+    "vertex_cache": UFBX_WRAPPER_OPTIMIZE_VERTEX_CACHE,
+    "overdraw": UFBX_WRAPPER_OPTIMIZE_OVERDRAW,
+    "fetch": UFBX_WRAPPER_OPTIMIZE_FETCH,
+}
+
+
+class NodeTable:
+    """Result of Scene.node_table(), one row per entry in Scene.nodes
+
+    parent: (N,) int32 parent index (-1 for the root)
+    depth: (N,) int32 depth in the hierarchy (root is 0)
+    attrib_type: (N,) int32 ElementType of the node attribute
+    world, local, geometry: (N, 4, 4) float64 node_to_world, node_to_parent and
+        geometry_to_node matrices, laid out like Node.world_transform
+    """
+
+    __slots__ = ("parent", "depth", "attrib_type", "world", "local", "geometry")
+
+    def __init__(self, parent, depth, attrib_type, world, local, geometry):
+        self.parent = parent
+        self.depth = depth
+        self.attrib_type = attrib_type
+        self.world = world
+        self.local = local
+        self.geometry = geometry
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __repr__(self) -> str:
+        return f"NodeTable(nodes={len(self.parent)})"
+
+
+class SharedScene:
+    """Zero-copy view of a scene exported with Scene.to_shared_memory()
+
+    meshes: one dict per Scene.meshes entry mapping attribute name (e.g.
+        "vertex_positions", "indices") to a read-only array; absent attributes
+        are omitted
+    node_table: NodeTable of all nodes
+    mesh_names, node_names: names matching meshes / node_table rows
+    arrays: every array keyed by "mesh<i>.<attribute>" or "node_table.<field>"
+
+    Views stay valid until close(); drop any arrays taken from them first.
+    """
+
+    __slots__ = ("meshes", "node_table", "mesh_names", "node_names", "arrays", "_shm")
+
+    def __init__(self, shm, layout, mesh_names, node_names):
+        self._shm = shm
+        self.arrays = {}
+        for key, (dtype, shape, offset) in layout.items():
+            arr = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            arr.flags.writeable = False
+            self.arrays[key] = arr
+        self.meshes = [{} for _ in mesh_names]
+        for key, arr in self.arrays.items():
+            if key.startswith("mesh"):
+                index, attribute = key[4:].split(".", 1)
+                self.meshes[int(index)][attribute] = arr
+        self.node_table = NodeTable(*(self.arrays["node_table." + name] for name in NodeTable.__slots__))
+        self.mesh_names = mesh_names
+        self.node_names = node_names
+
+    def close(self):
+        """Release the views and detach from the shared memory segment"""
+        if self._shm is None:
+            return
+        self.arrays = {}
+        self.meshes = []
+        self.node_table = None
+        shm, self._shm = self._shm, None
+        shm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __repr__(self) -> str:
+        return f"SharedScene(meshes={len(self.mesh_names)}, nodes={len(self.node_names)}, closed={self._shm is None})"
+
+
+def _release_shared_memory(shm):
+    """Internal: close and unlink a segment owned by a SharedSceneHandle"""
+    shm.close()
+    shm.unlink()
+
+
+class SharedSceneHandle:
+    """Picklable reference to a scene exported with Scene.to_shared_memory()
+
+    Send the handle to worker processes and call open() there to get a SharedScene
+    of zero-copy views. The exporting process owns the segment and must keep the
+    handle alive until workers are done, then call unlink() (or use it as a
+    context manager). An owning handle that is garbage collected, or still alive
+    at interpreter exit, unlinks the segment itself.
+    """
+
+    __slots__ = ("name", "size", "layout", "mesh_names", "node_names", "_shm", "_finalizer", "__weakref__")
+
+    def __init__(self, name, size, layout, mesh_names, node_names, _shm=None):
+        self.name = name
+        self.size = size
+        self.layout = layout
+        self.mesh_names = mesh_names
+        self.node_names = node_names
+        self._shm = _shm
+        self._finalizer = weakref.finalize(self, _release_shared_memory, _shm) if _shm is not None else None
+
+    def open(self):
+        """Attach to the segment and return a SharedScene"""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=self.name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=self.name)
+        return SharedScene(shm, self.layout, self.mesh_names, self.node_names)
+
+    def unlink(self):
+        """Free the segment (owner only); open SharedScenes stay valid until closed"""
+        if self._shm is None:
+            raise RuntimeError("Only the process that called Scene.to_shared_memory() can unlink it")
+        self._shm = None
+        self._finalizer()
+
+    def __reduce__(self):
+        return (SharedSceneHandle, (self.name, self.size, self.layout, self.mesh_names, self.node_names))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._shm is not None:
+            self.unlink()
+        return False
+
+    def __repr__(self) -> str:
+        return f"SharedSceneHandle({self.name!r}, size={self.size}, meshes={len(self.mesh_names)})"
+
+
+class RaycastResult:
+    """Result of BVH.raycast(), one entry per ray
+
+    hit: (R,) bool
+    distance: (R,) float64 distance along the normalized direction (inf on a miss)
+    position: (R, 3) float64 hit point (NaN on a miss)
+    triangle: (R,) int64 index into BVH.geometry.indices (-1 on a miss)
+    node_ids: (R,) int32 index into Scene.nodes (-1 on a miss)
+    barycentric: (R, 2) float64 (u, v) weights of the triangle's 2nd and 3rd corners
+    """
+
+    __slots__ = ("hit", "distance", "position", "triangle", "node_ids", "barycentric")
+
+    def __init__(self, hit, distance, position, triangle, node_ids, barycentric):
+        self.hit = hit
+        self.distance = distance
+        self.position = position
+        self.triangle = triangle
+        self.node_ids = node_ids
+        self.barycentric = barycentric
+
+    def __len__(self):
+        return len(self.hit)
+
+    def __repr__(self) -> str:
+        return f"RaycastResult(rays={len(self.hit)}, hits={int(self.hit.sum())})"
+
+
+class ClosestPointResult:
+    """Result of BVH.closest_point(), one entry per query point
+
+    position: (Q, 3) float64 closest surface point (NaN if none within max_distance)
+    distance: (Q,) float64 (inf if none)
+    triangle: (Q,) int64 index into BVH.geometry.indices (-1 if none)
+    node_ids: (Q,) int32 index into Scene.nodes (-1 if none)
+    """
+
+    __slots__ = ("position", "distance", "triangle", "node_ids")
+
+    def __init__(self, position, distance, triangle, node_ids):
+        self.position = position
+        self.distance = distance
+        self.triangle = triangle
+        self.node_ids = node_ids
+
+    def __len__(self):
+        return len(self.distance)
+
+    def __repr__(self) -> str:
+        return f"ClosestPointResult(points={len(self.distance)}, found={int((self.triangle >= 0).sum())})"
+
+
+class TextureResolver:
+    """Resolves texture filenames against search paths for Scene.resolve_textures()
+
+    Keeps a thread-safe LRU cache of os.path.isfile() results bounded to maxsize
+    entries, so one resolver can be shared by every scene of a batch job and each
+    candidate path is only stat'ed once. Missing files are re-checked once they
+    are older than miss_ttl seconds (never if None), or after invalidate().
+    """
+
+    __slots__ = ("maxsize", "miss_ttl", "hits", "misses", "_stats", "_lock")
+
+    def __init__(self, maxsize: int = 65536, miss_ttl=None):
+        self.maxsize = maxsize
+        self.miss_ttl = miss_ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats = OrderedDict()
+        self._lock = threading.Lock()
+
+    def exists(self, path: str) -> bool:
+        """Cached os.path.isfile(path)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._stats.get(path)
+            if entry is not None:
+                found, checked = entry
+                if found or self.miss_ttl is None or now - checked < self.miss_ttl:
+                    self._stats.move_to_end(path)
+                    self.hits += 1
+                    return found
+            self.misses += 1
+        found = os.path.isfile(path)
+        with self._lock:
+            self._stats[path] = (found, now)
+            self._stats.move_to_end(path)
+            if len(self._stats) > self.maxsize:
+                self._stats.popitem(last=False)
+        return found
+
+    def resolve(self, filenames, search_paths=()):
+        """First existing candidate for a texture, or None
+
+        Absolute names in filenames are tried as-is, relative ones only joined
+        with every search path (never against the working directory), then every
+        name by its basename under every search path. Windows separators in names
+        are accepted.
+        """
+        names = [name.replace("\\", "/") for name in filenames if name]
+        candidates = [name for name in names if os.path.isabs(name)]
+        for root in search_paths:
+            candidates.extend(os.path.join(root, name) for name in names if not os.path.isabs(name))
+        for root in search_paths:
+            candidates.extend(os.path.join(root, os.path.basename(name)) for name in names)
+        for path in dict.fromkeys(candidates):
+            if self.exists(path):
+                return os.path.normpath(path)
+        return None
+
+    def invalidate(self, path=None):
+        """Forget cached misses (of one path, or all) so new files are found"""
+        with self._lock:
+            if path is not None:
+                entry = self._stats.get(path)
+                if entry is not None and not entry[0]:
+                    del self._stats[path]
+                return
+            for key in [key for key, (found, _) in self._stats.items() if not found]:
+                del self._stats[key]
+
+    def clear(self):
+        """Drop all cached stat results"""
+        with self._lock:
+            self._stats.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._stats)
+
+    def __repr__(self) -> str:
+        return (f"TextureResolver(size={len(self._stats)}, maxsize={self.maxsize}, miss_ttl={self.miss_ttl}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+
+class MeshDuplicates:
+    """Identical meshes of a scene, returned by Scene.find_duplicate_meshes()
+
+    hashes: content hash per Scene.meshes entry, as 32 hex digits
+    canonical: (M,) int32 index of the first mesh with the same hash (itself if unique)
+    groups: lists of Scene.meshes indices, one per set of two or more identical meshes
+    instances: per mesh, the (source, mesh index) it was first registered as in the
+        MeshRegistry, or None without a registry
+    """
+
+    __slots__ = ("hashes", "canonical", "groups", "instances")
+
+    def __init__(self, hashes, canonical, groups, instances):
+        self.hashes = hashes
+        self.canonical = canonical
+        self.groups = groups
+        self.instances = instances
+
+    @property
+    def num_unique(self):
+        """Number of distinct meshes"""
+        return len(set(self.hashes))
+
+    def as_dict(self):
+        """All fields as a flat dict, canonical as a list"""
+        return {"hashes": list(self.hashes), "canonical": self.canonical.tolist(),
+                "groups": [list(group) for group in self.groups], "instances": list(self.instances)}
+
+    def __repr__(self) -> str:
+        return f"MeshDuplicates(meshes={len(self.hashes)}, unique={self.num_unique}, groups={len(self.groups)})"
+
+
+class MeshRegistry:
+    """Mesh content hash -> first (source, mesh index) seen, for Scene.find_duplicate_meshes()
+
+    Share one registry across every scene of a batch job to turn meshes repeated
+    between files into references to their first occurrence. Thread-safe. entries
+    is a plain dict that can be saved (e.g. as JSON) and passed back in to resume.
+    """
+
+    __slots__ = ("entries", "hits", "_lock")
+
+    def __init__(self, entries=None):
+        self.entries = {}
+        if entries:
+            for key, (source, index) in entries.items():
+                self.entries[key] = (source, int(index))
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def register(self, key, source, index):
+        """Entry for key, registering (source, index) if the hash is new"""
+        with self._lock:
+            found = self.entries.get(key)
+            if found is None:
+                found = self.entries[key] = (source, index)
+            else:
+                self.hits += 1
+            return found
+
+    def get(self, key, default=None):
+        """Entry for key without registering"""
+        return self.entries.get(key, default)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"MeshRegistry(size={len(self.entries)}, hits={self.hits})"
+
+
+cdef object _resolve_load_options(options, dict kwargs):
+    """Internal: merge an optional LoadOptions with keyword overrides"""
+    if options is None:
+        return LoadOptions(**kwargs)
+    if not isinstance(options, LoadOptions):
+        raise TypeError(f"options must be LoadOptions, not {type(options).__name__}")
+    if not kwargs:
+        return options
+    cdef object merged = LoadOptions()
+    for name in LoadOptions.__slots__:
+        setattr(merged, name, getattr(options, name))
+    for name, value in kwargs.items():
+        if name not in LoadOptions.__slots__:
+            raise TypeError(f"Unknown load option: {name}")
+        setattr(merged, name, value)
+    return merged
+
+
+cdef int _fill_load_opts(object options, ufbx_wrapper_load_opts* opts) except -1:
+    """Internal: validate LoadOptions and copy them into the C wrapper struct"""
+    opts.retain_dom = bool(options.retain_dom)
+
+    axes = options.target_axes
+    opts.has_target_axes = axes is not None
+    if axes is not None:
+        if isinstance(axes, CoordinateAxes):
+            axes = (axes.right, axes.up, axes.front)
+        try:
+            right, up, front = (int(axis) for axis in axes)
+        except (TypeError, ValueError):
+            raise TypeError("target_axes must be CoordinateAxes or a (right, up, front) tuple") from None
+        if not all(0 <= axis < CoordinateAxis.COORDINATE_AXIS_UNKNOWN for axis in (right, up, front)) \
+                or len({right // 2, up // 2, front // 2}) != 3:
+            raise ValueError(f"target_axes must use three different axes, got {options.target_axes!r}")
+        opts.target_axes[0] = right
+        opts.target_axes[1] = up
+        opts.target_axes[2] = front
+
+    opts.target_unit_meters = 0.0
+    if options.target_unit_meters is not None:
+        if not options.target_unit_meters > 0.0:
+            raise ValueError(f"target_unit_meters must be positive, got {options.target_unit_meters!r}")
+        opts.target_unit_meters = options.target_unit_meters
+
+    opts.space_conversion = SpaceConversion(options.space_conversion)
+    opts.max_memory = _memory_budget(options.max_memory, "max_memory")
+    opts.max_temp_memory = _memory_budget(options.max_temp_memory, "max_temp_memory")
+    opts.stats = NULL
+    opts.memory_usage = NULL
+    return 0
+
+
+cdef size_t _memory_budget(object value, str name) except? 0:
+    """Internal: validate a byte budget, 0 meaning unlimited"""
+    if value is None:
+        return 0
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"{name} must be a positive number of bytes, got {value!r}")
+    return value
+
+
+cdef class _SceneMemory:
+    """Internal: reference to ufbx scene memory, owner of every array view into it
+
+    Holds its own ufbx_retain_scene() reference so views stay valid after the
+    Scene is closed or collected.
+    """
+    cdef ufbx_scene* _scene
+
+    @staticmethod
+    cdef _SceneMemory _retain(ufbx_scene* scene):
+        cdef _SceneMemory obj = _SceneMemory.__new__(_SceneMemory)
+        ufbx_retain_scene(scene)
+        obj._scene = scene
+        return obj
+
+    def __dealloc__(self):
+        if self._scene != NULL:
+            ufbx_free_scene(self._scene)
+            self._scene = NULL
+
+
+cdef object _scene_array_view(Scene scene, int nd, np.npy_intp* shape, int typenum, const void* data):
+    """Internal: read-only numpy view into scene memory that keeps the memory alive"""
+    cdef np.ndarray arr = np.PyArray_SimpleNewFromData(nd, shape, typenum, <void*>data)
+    np.PyArray_CLEARFLAGS(arr, np.NPY_ARRAY_WRITEABLE)
+    np.set_array_base(arr, scene._memory_owner())
+    return arr
+
+
+class AttributeArray(np.ndarray):
+    """Read-only zero-copy view of mesh attribute data owned by the Scene
+
+    A NumPy array, so it also exposes the buffer protocol, __array_interface__ and
+    __dlpack__/__dlpack_device__ (CPU). The scene memory stays alive while any view
+    exists, even after Scene.close(). Arithmetic results are plain ndarrays.
+    """
+
+    def __array_wrap__(self, arr, context=None, return_scalar=False):
+        if return_scalar:
+            return arr[()]
+        return arr.view(np.ndarray)
+
+    def __dlpack__(self, *, stream=None, max_version=None, dl_device=None, copy=None):
+        """Export via DLPack; read-only tensors need a DLPack >= 1.0 consumer
+
+        Older consumers cannot be told the data is read-only, so they receive a
+        copy (or BufferError with copy=False) instead of writable scene memory.
+        """
+        view = self.view(np.ndarray)
+        if max_version is None or max_version[0] < 1:
+            if copy is False:
+                raise BufferError("Scene memory is read-only, which requires a DLPack >= 1.0 consumer")
+            return np.array(view, copy=True).__dlpack__(stream=stream)
+        kwargs = {"stream": stream, "max_version": max_version}
+        if dl_device is not None:
+            kwargs["dl_device"] = dl_device
+        if copy is not None:
+            kwargs["copy"] = copy
+        return view.__dlpack__(**kwargs)
+
+
+cdef object _attribute_view(Scene scene, int nd, np.npy_intp* shape, int typenum, const void* data):
+    """Internal: AttributeArray view into scene memory"""
+    return _scene_array_view(scene, nd, shape, typenum, data).view(AttributeArray)
+
+
 cdef class Vec2:
     """2D vector."""
     cdef public double x, y
@@ -875,18 +1986,29 @@ cdef class Quat:
         return f"Quat({self.x}, {self.y}, {self.z}, {self.w})"
 
     def __mul__(self, Quat other):
-        return Quat(
-            self.w * other.x + self.x * other.w + self.y * other.z - self.z * other.y,
-            self.w * other.y + self.y * other.w + self.z * other.x - self.x * other.z,
-            self.w * other.z + self.z * other.w + self.x * other.y - self.y * other.x,
-            self.w * other.w - self.x * other.x - self.y * other.y - self.z * other.z,
-        )
+        return _quat_from_c(ufbx_quat_mul(_quat_to_c(self), _quat_to_c(other)))
 
     def normalize(self):
-        cdef double length = (self.x ** 2 + self.y ** 2 + self.z ** 2 + self.w ** 2) ** 0.5
-        if length > 0.0:
-            return Quat(self.x / length, self.y / length, self.z / length, self.w / length)
-        return Quat(0.0, 0.0, 0.0, 1.0)
+        return _quat_from_c(ufbx_quat_normalize(_quat_to_c(self)))
+
+
+cdef inline ufbx_quat _quat_to_c(Quat q):
+    cdef ufbx_quat r
+    r.x = q.x
+    r.y = q.y
+    r.z = q.z
+    r.w = q.w
+    return r
+
+
+cdef Quat _quat_from_c(ufbx_quat q):
+    """Internal: Quat from a ufbx_quat without going through __init__"""
+    cdef Quat r = Quat.__new__(Quat)
+    r.x = q.x
+    r.y = q.y
+    r.z = q.z
+    r.w = q.w
+    return r
 
 
 cdef class Matrix:
@@ -919,25 +2041,498 @@ cdef class Transform:
         return f"Transform(translation={self.translation}, rotation={self.rotation}, scale={self.scale})"
 
     def to_matrix(self):
-        return Matrix()
+        cdef ufbx_transform t
+        t.translation.x = self.translation.x
+        t.translation.y = self.translation.y
+        t.translation.z = self.translation.z
+        t.rotation.x = self.rotation.x
+        t.rotation.y = self.rotation.y
+        t.rotation.z = self.rotation.z
+        t.rotation.w = self.rotation.w
+        t.scale.x = self.scale.x
+        t.scale.y = self.scale.y
+        t.scale.z = self.scale.z
+        cdef ufbx_matrix m = ufbx_transform_to_matrix(&t)
+        cdef Matrix result = Matrix.__new__(Matrix)
+        result.m = [
+            [m.m00, m.m01, m.m02, m.m03],
+            [m.m10, m.m11, m.m12, m.m13],
+            [m.m20, m.m21, m.m22, m.m23],
+        ]
+        return result
+
+
+def _math_batch(value, tuple item_shape):
+    """Internal: (leading shape, C-contiguous float64 array of shape (count, *item_shape))"""
+    arr = np.ascontiguousarray(value, dtype=np.float64)
+    cdef int k = len(item_shape)
+    if arr.ndim < k or arr.shape[arr.ndim - k:] != item_shape:
+        expected = ", ".join(["..."] + [str(n) for n in item_shape])
+        raise ValueError(f"expected an array of shape ({expected}), got {arr.shape}")
+    lead = arr.shape[:arr.ndim - k]
+    return lead, arr.reshape((-1,) + item_shape)
+
+
+def _math_broadcast(*operands):
+    """Internal: broadcast (value, item_shape) operands over their leading dimensions
+
+    Returns (shape, count, arrays, strides): operands holding a single element get
+    a stride of 0 instead of being copied out to the full count.
+    """
+    batches = [_math_batch(value, item_shape) for value, item_shape in operands]
+    shape = np.broadcast_shapes(*[lead for lead, _ in batches])
+    cdef Py_ssize_t count = 1
+    for n in shape:
+        count *= n
+    arrays = []
+    strides = []
+    for (lead, arr), (_, item_shape) in zip(batches, operands):
+        size = int(np.prod(item_shape))
+        if lead != shape and arr.shape[0] == 1:
+            strides.append(0)
+        else:
+            if lead != shape:
+                arr = np.ascontiguousarray(np.broadcast_to(arr.reshape(lead + item_shape), shape + item_shape))
+                arr = arr.reshape((-1,) + item_shape)
+            strides.append(size)
+        arrays.append(arr)
+    return shape, count, arrays, strides
+
+
+class _MathArray(np.ndarray):
+    """Internal: float64 ndarray of fixed-shape math items over any leading shape"""
+
+    _item_shape = ()
+
+    def __new__(cls, data):
+        _math_batch(data, cls._item_shape)
+        return np.ascontiguousarray(data, dtype=np.float64).view(cls)
+
+    def __array_wrap__(self, arr, context=None, return_scalar=False):
+        if return_scalar:
+            return arr[()]
+        return arr.view(np.ndarray)
+
+    @classmethod
+    def _empty(cls, shape):
+        return np.empty(tuple(shape) + cls._item_shape, dtype=np.float64).view(cls)
+
+
+class Vec3Array(_MathArray):
+    """Batch of 3D vectors as a (..., 3) float64 ndarray
+
+    Vec3Array(data) wraps any array-like of shape (..., 3) without copying when it
+    is already C-contiguous float64. Arithmetic results are plain ndarrays.
+    """
+
+    _item_shape = (3,)
+
+    def normalize(self):
+        """Unit-length copies of the vectors (zero vectors stay zero)"""
+        lead, v = _math_batch(self, (3,))
+        out = Vec3Array._empty(lead)
+        cdef const double[:, ::1] v_view = v
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t count = v.shape[0]
+        if count:
+            with nogil:
+                ufbx_wrapper_vec3_normalize_n(&v_view[0, 0], &out_view[0], count)
+        return out
+
+
+class QuatArray(_MathArray):
+    """Batch of quaternions as a (..., 4) float64 ndarray in (x, y, z, w) order
+
+    Binary operations broadcast over the leading dimensions like NumPy.
+    """
+
+    _item_shape = (4,)
+
+    @classmethod
+    def identity(cls, shape=()):
+        """Identity rotations of the given leading shape"""
+        out = cls._empty((shape,) if isinstance(shape, int) else shape)
+        out[...] = (0.0, 0.0, 0.0, 1.0)
+        return out
+
+    @classmethod
+    def from_euler(cls, euler, order=RotationOrder.ROTATION_ORDER_XYZ):
+        """Quaternions from (..., 3) Euler angles in degrees"""
+        lead, e = _math_batch(euler, (3,))
+        out = cls._empty(lead)
+        cdef const double[:, ::1] e_view = e
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t count = e.shape[0]
+        cdef int c_order = RotationOrder(order)
+        if count:
+            with nogil:
+                ufbx_wrapper_euler_to_quat_n(&e_view[0, 0], c_order, &out_view[0], count)
+        return out
+
+    def mul(self, other):
+        """Hamilton product self * other (other's rotation is applied first)"""
+        shape, count, (a, b), (sa, sb) = _math_broadcast((self, (4,)), (other, (4,)))
+        out = QuatArray._empty(shape)
+        if count == 0:
+            return out
+        cdef const double[:, ::1] a_view = a
+        cdef const double[:, ::1] b_view = b
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t c_count = count, c_sa = sa, c_sb = sb
+        with nogil:
+            ufbx_wrapper_quat_mul_n(&a_view[0, 0], c_sa, &b_view[0, 0], c_sb, &out_view[0], c_count)
+        return out
+
+    def normalize(self):
+        """Unit-length copies (zero quaternions become the identity)"""
+        lead, q = _math_batch(self, (4,))
+        out = QuatArray._empty(lead)
+        cdef const double[:, ::1] q_view = q
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t count = q.shape[0]
+        if count:
+            with nogil:
+                ufbx_wrapper_quat_normalize_n(&q_view[0, 0], &out_view[0], count)
+        return out
+
+    def slerp(self, other, t):
+        """Spherical interpolation from self (t=0) to other (t=1) along the shortest arc"""
+        shape, count, (a, b, tt), (sa, sb, st) = _math_broadcast((self, (4,)), (other, (4,)), (t, ()))
+        out = QuatArray._empty(shape)
+        if count == 0:
+            return out
+        cdef const double[:, ::1] a_view = a
+        cdef const double[:, ::1] b_view = b
+        cdef const double[::1] t_view = tt
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t c_count = count, c_sa = sa, c_sb = sb, c_st = st
+        with nogil:
+            ufbx_wrapper_quat_slerp_n(&a_view[0, 0], c_sa, &b_view[0, 0], c_sb, &t_view[0], c_st,
+                                      &out_view[0], c_count)
+        return out
+
+    def rotate(self, vectors):
+        """Rotate (..., 3) vectors, returning a Vec3Array"""
+        shape, count, (q, v), (sq, sv) = _math_broadcast((self, (4,)), (vectors, (3,)))
+        out = Vec3Array._empty(shape)
+        if count == 0:
+            return out
+        cdef const double[:, ::1] q_view = q
+        cdef const double[:, ::1] v_view = v
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t c_count = count, c_sq = sq, c_sv = sv
+        with nogil:
+            ufbx_wrapper_quat_rotate_n(&q_view[0, 0], c_sq, &v_view[0, 0], c_sv, &out_view[0], c_count)
+        return out
+
+    def to_euler(self, order=RotationOrder.ROTATION_ORDER_XYZ):
+        """Euler angles in degrees as a Vec3Array"""
+        lead, q = _math_batch(self, (4,))
+        out = Vec3Array._empty(lead)
+        cdef const double[:, ::1] q_view = q
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t count = q.shape[0]
+        cdef int c_order = RotationOrder(order)
+        if count:
+            with nogil:
+                ufbx_wrapper_quat_to_euler_n(&q_view[0, 0], c_order, &out_view[0], count)
+        return out
+
+
+class MatrixArray(_MathArray):
+    """Batch of affine transforms as a (..., 4, 4) float64 ndarray
+
+    Matrices use the layout of Node.world_transform and NodeTable.world (translation
+    in m[3, :3]), so MatrixArray(scene.node_table().world) is a zero-copy view. The
+    last column is ignored on input and written as (0, 0, 0, 1).
+    """
+
+    _item_shape = (4, 4)
+
+    @classmethod
+    def identity(cls, shape=()):
+        """Identity transforms of the given leading shape"""
+        out = cls._empty((shape,) if isinstance(shape, int) else shape)
+        out[...] = np.eye(4)
+        return out
+
+    @classmethod
+    def from_transforms(cls, translation, rotation, scale):
+        """Matrices from (..., 3) translations, (..., 4) quaternions and (..., 3) scales"""
+        shape, count, (t, r, s), (st, sr, ss) = _math_broadcast(
+            (translation, (3,)), (rotation, (4,)), (scale, (3,)))
+        out = cls._empty(shape)
+        if count == 0:
+            return out
+        cdef const double[:, ::1] t_view = t
+        cdef const double[:, ::1] r_view = r
+        cdef const double[:, ::1] s_view = s
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t c_count = count, c_st = st, c_sr = sr, c_ss = ss
+        with nogil:
+            ufbx_wrapper_transform_to_matrix_n(&t_view[0, 0], c_st, &r_view[0, 0], c_sr, &s_view[0, 0], c_ss,
+                                               &out_view[0], c_count)
+        return out
+
+    def mul(self, other):
+        """Composition self * other (other is applied first), e.g. parent_world.mul(local)"""
+        shape, count, (a, b), (sa, sb) = _math_broadcast((self, (4, 4)), (other, (4, 4)))
+        out = MatrixArray._empty(shape)
+        if count == 0:
+            return out
+        cdef const double[:, :, ::1] a_view = a
+        cdef const double[:, :, ::1] b_view = b
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t c_count = count, c_sa = sa, c_sb = sb
+        with nogil:
+            ufbx_wrapper_matrix_mul_n(&a_view[0, 0, 0], c_sa, &b_view[0, 0, 0], c_sb, &out_view[0], c_count)
+        return out
+
+    def invert(self):
+        """Inverse transforms (singular matrices give all zeros)"""
+        lead, m = _math_batch(self, (4, 4))
+        out = MatrixArray._empty(lead)
+        cdef const double[:, :, ::1] m_view = m
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t count = m.shape[0]
+        if count:
+            with nogil:
+                ufbx_wrapper_matrix_invert_n(&m_view[0, 0, 0], &out_view[0], count)
+        return out
+
+    def _transform(self, vectors, bint directions):
+        shape, count, (m, v), (sm, sv) = _math_broadcast((self, (4, 4)), (vectors, (3,)))
+        out = Vec3Array._empty(shape)
+        if count == 0:
+            return out
+        cdef const double[:, :, ::1] m_view = m
+        cdef const double[:, ::1] v_view = v
+        cdef double[::1] out_view = out.reshape(-1)
+        cdef size_t c_count = count, c_sm = sm, c_sv = sv
+        with nogil:
+            ufbx_wrapper_matrix_transform_n(&m_view[0, 0, 0], c_sm, &v_view[0, 0], c_sv, directions,
+                                            &out_view[0], c_count)
+        return out
+
+    def transform_points(self, points):
+        """Transform (..., 3) positions, returning a Vec3Array
+
+        A single matrix is applied to every point; otherwise matrices and points
+        broadcast over their leading dimensions.
+        """
+        return self._transform(points, False)
+
+    def transform_directions(self, directions):
+        """Transform (..., 3) directions (ignores translation), returning a Vec3Array"""
+        return self._transform(directions, True)
+
+    def to_transforms(self):
+        """Decompose into (translation Vec3Array, rotation QuatArray, scale Vec3Array)"""
+        lead, m = _math_batch(self, (4, 4))
+        translation = Vec3Array._empty(lead)
+        rotation = QuatArray._empty(lead)
+        scale = Vec3Array._empty(lead)
+        cdef const double[:, :, ::1] m_view = m
+        cdef double[::1] t_view = translation.reshape(-1)
+        cdef double[::1] r_view = rotation.reshape(-1)
+        cdef double[::1] s_view = scale.reshape(-1)
+        cdef size_t count = m.shape[0]
+        if count:
+            with nogil:
+                ufbx_wrapper_matrix_to_transform_n(&m_view[0, 0, 0], &t_view[0], &r_view[0], &s_view[0], count)
+        return translation, rotation, scale
+
+
+cdef object _prop_value(const ufbx_prop* prop):
+    """Internal: convert a ufbx_prop value to Python based on its type and value flags"""
+    cdef unsigned int prop_type = prop.type
+    cdef unsigned int flags = prop.flags
+    if prop_type == PropType.PROP_BOOLEAN:
+        return prop.value_int != 0
+    if prop_type == PropType.PROP_INTEGER:
+        return prop.value_int
+    if prop_type in (PropType.PROP_STRING, PropType.PROP_DATE_TIME, PropType.PROP_REFERENCE):
+        return prop.value_str.data[:prop.value_str.length].decode('utf-8', errors='replace')
+    if prop_type == PropType.PROP_BLOB:
+        if prop.value_blob.size == 0:
+            return b""
+        return (<const char*>prop.value_blob.data)[:prop.value_blob.size]
+    if flags & PropFlags.PROP_FLAG_VALUE_VEC4:
+        return tuple(prop.value_real_arr[i] for i in range(4))
+    if flags & PropFlags.PROP_FLAG_VALUE_VEC3:
+        return tuple(prop.value_real_arr[i] for i in range(3))
+    if flags & PropFlags.PROP_FLAG_VALUE_VEC2:
+        return tuple(prop.value_real_arr[i] for i in range(2))
+    if flags & PropFlags.PROP_FLAG_VALUE_REAL:
+        return prop.value_real
+    if flags & PropFlags.PROP_FLAG_VALUE_INT:
+        return prop.value_int
+    if flags & PropFlags.PROP_FLAG_VALUE_STR:
+        return prop.value_str.data[:prop.value_str.length].decode('utf-8', errors='replace')
+    return None
+
+
+cdef class Props:
+    """Read-only mapping of an element's properties (ufbx_props), including inherited defaults"""
+    cdef Scene _scene
+    cdef const ufbx_props* _props
+
+    @staticmethod
+    cdef Props _create(Scene scene, const ufbx_props* props):
+        """Internal factory method"""
+        cdef Props obj = Props.__new__(Props)
+        obj._scene = scene
+        obj._props = props
+        return obj
+
+    cdef const ufbx_prop* _find(self, name) except? NULL:
+        """Internal: look up a property by name through the defaults chain"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        if not isinstance(name, str):
+            return NULL
+        cdef bytes name_bytes = name.encode('utf-8')
+        return ufbx_find_prop_len(self._props, name_bytes, len(name_bytes))
+
+    def __getitem__(self, name):
+        cdef const ufbx_prop* prop = self._find(name)
+        if prop == NULL:
+            raise KeyError(name)
+        return _prop_value(prop)
+
+    def get(self, name, default=None):
+        """Property value, or default if the element has no such property"""
+        cdef const ufbx_prop* prop = self._find(name)
+        if prop == NULL:
+            return default
+        return _prop_value(prop)
+
+    def __contains__(self, name):
+        return self._find(name) != NULL
+
+    def prop_type(self, name):
+        """PropType of a property. Raises KeyError if missing."""
+        cdef const ufbx_prop* prop = self._find(name)
+        if prop == NULL:
+            raise KeyError(name)
+        return PropType(prop.type)
+
+    def prop_flags(self, name):
+        """PropFlags of a property. Raises KeyError if missing."""
+        cdef const ufbx_prop* prop = self._find(name)
+        if prop == NULL:
+            raise KeyError(name)
+        return PropFlags(prop.flags)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def keys(self):
+        """Property names, own properties first followed by inherited defaults"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef list names = []
+        cdef set seen = set()
+        cdef const ufbx_props* props = self._props
+        cdef const ufbx_prop* prop
+        cdef size_t i
+        while props != NULL:
+            for i in range(props.props.count):
+                prop = &props.props.data[i]
+                name = prop.name.data[:prop.name.length].decode('utf-8', errors='replace')
+                if name not in seen:
+                    seen.add(name)
+                    names.append(name)
+            props = props.defaults
+        return names
+
+    def values(self):
+        """Property values in keys() order"""
+        return [self[name] for name in self.keys()]
+
+    def items(self):
+        """(name, value) pairs in keys() order"""
+        return [(name, self[name]) for name in self.keys()]
+
+    def __repr__(self):
+        if self._scene._closed:
+            return "Props(<closed>)"
+        return f"Props({len(self)} properties)"
+
+
+Mapping.register(Props)
 
 
 cdef class Element:
     """Base element class."""
-    pass
+    cdef Scene _scene
+    cdef ufbx_element* _element
+    cdef object __weakref__
+
+    @property
+    def name(self):
+        """Element name"""
+        if self._scene is None or self._element == NULL:
+            return None
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._element.name.data[:self._element.name.length].decode('utf-8', errors='replace')
+
+    @property
+    def element_type(self):
+        """Element type (ElementType enum)"""
+        if self._scene is None or self._element == NULL:
+            return None
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return ElementType(self._element.type)
+
+    @property
+    def props(self):
+        """Element properties as a read-only mapping (Props)"""
+        if self._scene is None or self._element == NULL:
+            return None
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return Props._create(self._scene, &self._element.props)
+
+    @property
+    def element_id(self):
+        """Unique index of the element within its scene"""
+        if self._scene is None or self._element == NULL:
+            return None
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._element.element_id
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Element) or self._element == NULL:
+            return False
+        return (<Element>other)._scene is self._scene and (<Element>other)._element == self._element
+
+    def __hash__(self):
+        if self._element == NULL:
+            return id(self)
+        return hash((id(self._scene), <size_t>self._element))
 
 
 cdef class Light(Element):
     """Light source"""
-    cdef Scene _scene
     cdef ufbx_light* _light
 
     @staticmethod
     cdef Light _create(Scene scene, ufbx_light* light):
         """Internal factory method"""
-        cdef Light obj = Light.__new__(Light)
-        obj._scene = scene
-        obj._light = light
+        cdef Light obj = <Light>scene._cached_element(<ufbx_element*>light)
+        if obj is None:
+            obj = Light.__new__(Light)
+            obj._light = light
+            scene._cache_element(obj, <ufbx_element*>light)
         return obj
 
     @property
@@ -1024,15 +2619,16 @@ cdef class Light(Element):
 
 cdef class Camera(Element):
     """Camera"""
-    cdef Scene _scene
     cdef ufbx_camera* _camera
 
     @staticmethod
     cdef Camera _create(Scene scene, ufbx_camera* camera):
         """Internal factory method"""
-        cdef Camera obj = Camera.__new__(Camera)
-        obj._scene = scene
-        obj._camera = camera
+        cdef Camera obj = <Camera>scene._cached_element(<ufbx_element*>camera)
+        if obj is None:
+            obj = Camera.__new__(Camera)
+            obj._camera = camera
+            scene._cache_element(obj, <ufbx_element*>camera)
         return obj
 
     @property
@@ -1123,15 +2719,16 @@ cdef class Camera(Element):
 
 cdef class Bone(Element):
     """Bone"""
-    cdef Scene _scene
     cdef ufbx_bone* _bone
 
     @staticmethod
     cdef Bone _create(Scene scene, ufbx_bone* bone):
         """Internal factory method"""
-        cdef Bone obj = Bone.__new__(Bone)
-        obj._scene = scene
-        obj._bone = bone
+        cdef Bone obj = <Bone>scene._cached_element(<ufbx_element*>bone)
+        if obj is None:
+            obj = Bone.__new__(Bone)
+            obj._bone = bone
+            scene._cache_element(obj, <ufbx_element*>bone)
         return obj
 
     @property
@@ -1165,7 +2762,6 @@ cdef class Bone(Element):
 
 cdef class Texture(Element):
     """Texture"""
-    cdef Scene _scene
     cdef ufbx_texture* _texture
 
     @staticmethod
@@ -1173,9 +2769,11 @@ cdef class Texture(Element):
         """Internal factory method"""
         if texture == NULL:
             return None
-        cdef Texture obj = Texture.__new__(Texture)
-        obj._scene = scene
-        obj._texture = texture
+        cdef Texture obj = <Texture>scene._cached_element(<ufbx_element*>texture)
+        if obj is None:
+            obj = Texture.__new__(Texture)
+            obj._texture = texture
+            scene._cache_element(obj, <ufbx_element*>texture)
         return obj
 
     @property
@@ -1219,13 +2817,14 @@ cdef class Texture(Element):
 
     @property
     def content(self):
-        """Embedded texture content as bytes (e.g., raw PNG/JPEG data)"""
+        """Embedded texture content (e.g., raw PNG/JPEG data) as a read-only memoryview into scene memory"""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
         if self._texture.content.size == 0:
             return None
-        cdef const unsigned char[:] view = <const unsigned char[:self._texture.content.size]>self._texture.content.data
-        return bytes(view)
+        cdef np.npy_intp shape[1]
+        shape[0] = <np.npy_intp>self._texture.content.size
+        return memoryview(_scene_array_view(self._scene, 1, shape, np.NPY_UINT8, self._texture.content.data))
 
     @property
     def has_file(self):
@@ -1261,15 +2860,16 @@ cdef class Texture(Element):
 
 cdef class AnimStack(Element):
     """Animation stack (timeline)"""
-    cdef Scene _scene
     cdef ufbx_anim_stack* _anim_stack
 
     @staticmethod
     cdef AnimStack _create(Scene scene, ufbx_anim_stack* anim_stack):
         """Internal factory method"""
-        cdef AnimStack obj = AnimStack.__new__(AnimStack)
-        obj._scene = scene
-        obj._anim_stack = anim_stack
+        cdef AnimStack obj = <AnimStack>scene._cached_element(<ufbx_element*>anim_stack)
+        if obj is None:
+            obj = AnimStack.__new__(AnimStack)
+            obj._anim_stack = anim_stack
+            scene._cache_element(obj, <ufbx_element*>anim_stack)
         return obj
 
     @property
@@ -1307,18 +2907,69 @@ cdef class AnimStack(Element):
                 result.append(AnimLayer._create(self._scene, layer))
         return result
 
+    def animated_nodes(self):
+        """Indices into Scene.nodes of the nodes whose local transform this stack animates
+
+        Every other node stays at its rest transform in sample_transforms().
+        """
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef size_t num_nodes = ufbx_wrapper_scene_get_num_nodes(self._scene._scene)
+        cdef np.ndarray[np.uint8_t, ndim=1] flags = np.zeros(num_nodes, dtype=np.uint8)
+        if num_nodes > 0:
+            with nogil:
+                ufbx_wrapper_anim_stack_animated_nodes(self._scene._scene, self._anim_stack, &flags[0])
+        return np.flatnonzero(flags).astype(np.int32)
+
+    def sample_transforms(self, times, nodes=None):
+        """Evaluate the local transform of every node at the given times
+
+        Args:
+            times: Sample times in seconds (scalar or 1-D array)
+            nodes: Optional sequence of Scene.nodes indices to sample instead of all nodes
+
+        Returns:
+            (F, N, 10) float64 array over times and Scene.nodes (or nodes), each row being
+            translation (x, y, z), rotation quaternion (x, y, z, w) and scale (x, y, z)
+        """
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef np.ndarray[np.float64_t, ndim=1] sample_times = np.ascontiguousarray(np.atleast_1d(times), dtype=np.float64)
+        cdef size_t num_times = sample_times.shape[0]
+        cdef size_t num_nodes = ufbx_wrapper_scene_get_num_nodes(self._scene._scene)
+        cdef bint all_nodes = nodes is None
+        cdef np.ndarray[np.uint32_t, ndim=1] node_ids = None
+        cdef const uint32_t* node_ids_ptr = NULL
+        if not all_nodes:
+            indices = np.asarray(nodes)
+            if indices.ndim != 1 or (indices.size and indices.dtype.kind not in "iu"):
+                raise TypeError("nodes must be a 1-D sequence of node indices")
+            if indices.size and (indices.min() < 0 or indices.max() >= num_nodes):
+                raise IndexError(f"node index out of range for {num_nodes} nodes")
+            node_ids = np.ascontiguousarray(indices, dtype=np.uint32)
+            num_nodes = node_ids.shape[0]
+            if num_nodes > 0:
+                node_ids_ptr = <const uint32_t*>node_ids.data
+        cdef np.ndarray[np.float64_t, ndim=3] out = np.empty((num_times, num_nodes, 10), dtype=np.float64)
+        if num_times > 0 and num_nodes > 0:
+            with nogil:
+                ufbx_wrapper_anim_stack_sample_transforms(self._scene._scene, self._anim_stack, all_nodes, node_ids_ptr,
+                                                          num_nodes, &sample_times[0], num_times, &out[0, 0, 0])
+        return out
+
 
 cdef class AnimLayer(Element):
     """Animation layer"""
-    cdef Scene _scene
     cdef ufbx_anim_layer* _anim_layer
 
     @staticmethod
     cdef AnimLayer _create(Scene scene, ufbx_anim_layer* anim_layer):
         """Internal factory method"""
-        cdef AnimLayer obj = AnimLayer.__new__(AnimLayer)
-        obj._scene = scene
-        obj._anim_layer = anim_layer
+        cdef AnimLayer obj = <AnimLayer>scene._cached_element(<ufbx_element*>anim_layer)
+        if obj is None:
+            obj = AnimLayer.__new__(AnimLayer)
+            obj._anim_layer = anim_layer
+            scene._cache_element(obj, <ufbx_element*>anim_layer)
         return obj
 
     @property
@@ -1373,15 +3024,16 @@ cdef class AnimLayer(Element):
 
 cdef class AnimCurve(Element):
     """Animation curve"""
-    cdef Scene _scene
     cdef ufbx_anim_curve* _anim_curve
 
     @staticmethod
     cdef AnimCurve _create(Scene scene, ufbx_anim_curve* anim_curve):
         """Internal factory method"""
-        cdef AnimCurve obj = AnimCurve.__new__(AnimCurve)
-        obj._scene = scene
-        obj._anim_curve = anim_curve
+        cdef AnimCurve obj = <AnimCurve>scene._cached_element(<ufbx_element*>anim_curve)
+        if obj is None:
+            obj = AnimCurve.__new__(AnimCurve)
+            obj._anim_curve = anim_curve
+            scene._cache_element(obj, <ufbx_element*>anim_curve)
         return obj
 
     @property
@@ -1434,15 +3086,16 @@ cdef class Anim(Element):
 
 cdef class SkinDeformer(Element):
     """Skin deformer (skinning/rigging)"""
-    cdef Scene _scene
     cdef ufbx_skin_deformer* _skin_deformer
 
     @staticmethod
     cdef SkinDeformer _create(Scene scene, ufbx_skin_deformer* skin_deformer):
         """Internal factory method"""
-        cdef SkinDeformer obj = SkinDeformer.__new__(SkinDeformer)
-        obj._scene = scene
-        obj._skin_deformer = skin_deformer
+        cdef SkinDeformer obj = <SkinDeformer>scene._cached_element(<ufbx_element*>skin_deformer)
+        if obj is None:
+            obj = SkinDeformer.__new__(SkinDeformer)
+            obj._skin_deformer = skin_deformer
+            scene._cache_element(obj, <ufbx_element*>skin_deformer)
         return obj
 
     @property
@@ -1469,15 +3122,16 @@ cdef class SkinDeformer(Element):
 
 cdef class SkinCluster(Element):
     """Skin cluster (single bone binding)"""
-    cdef Scene _scene
     cdef ufbx_skin_cluster* _skin_cluster
 
     @staticmethod
     cdef SkinCluster _create(Scene scene, ufbx_skin_cluster* skin_cluster):
         """Internal factory method"""
-        cdef SkinCluster obj = SkinCluster.__new__(SkinCluster)
-        obj._scene = scene
-        obj._skin_cluster = skin_cluster
+        cdef SkinCluster obj = <SkinCluster>scene._cached_element(<ufbx_element*>skin_cluster)
+        if obj is None:
+            obj = SkinCluster.__new__(SkinCluster)
+            obj._skin_cluster = skin_cluster
+            scene._cache_element(obj, <ufbx_element*>skin_cluster)
         return obj
 
     @property
@@ -1497,15 +3151,16 @@ cdef class SkinCluster(Element):
 
 cdef class BlendDeformer(Element):
     """Blend shape deformer"""
-    cdef Scene _scene
     cdef ufbx_blend_deformer* _blend_deformer
 
     @staticmethod
     cdef BlendDeformer _create(Scene scene, ufbx_blend_deformer* blend_deformer):
         """Internal factory method"""
-        cdef BlendDeformer obj = BlendDeformer.__new__(BlendDeformer)
-        obj._scene = scene
-        obj._blend_deformer = blend_deformer
+        cdef BlendDeformer obj = <BlendDeformer>scene._cached_element(<ufbx_element*>blend_deformer)
+        if obj is None:
+            obj = BlendDeformer.__new__(BlendDeformer)
+            obj._blend_deformer = blend_deformer
+            scene._cache_element(obj, <ufbx_element*>blend_deformer)
         return obj
 
     @property
@@ -1532,15 +3187,16 @@ cdef class BlendDeformer(Element):
 
 cdef class BlendChannel(Element):
     """Blend channel (single morph target)"""
-    cdef Scene _scene
     cdef ufbx_blend_channel* _blend_channel
 
     @staticmethod
     cdef BlendChannel _create(Scene scene, ufbx_blend_channel* blend_channel):
         """Internal factory method"""
-        cdef BlendChannel obj = BlendChannel.__new__(BlendChannel)
-        obj._scene = scene
-        obj._blend_channel = blend_channel
+        cdef BlendChannel obj = <BlendChannel>scene._cached_element(<ufbx_element*>blend_channel)
+        if obj is None:
+            obj = BlendChannel.__new__(BlendChannel)
+            obj._blend_channel = blend_channel
+            scene._cache_element(obj, <ufbx_element*>blend_channel)
         return obj
 
     @property
@@ -1560,15 +3216,16 @@ cdef class BlendChannel(Element):
 
 cdef class BlendShape(Element):
     """Blend shape (vertex offsets)"""
-    cdef Scene _scene
     cdef ufbx_blend_shape* _blend_shape
 
     @staticmethod
     cdef BlendShape _create(Scene scene, ufbx_blend_shape* blend_shape):
         """Internal factory method"""
-        cdef BlendShape obj = BlendShape.__new__(BlendShape)
-        obj._scene = scene
-        obj._blend_shape = blend_shape
+        cdef BlendShape obj = <BlendShape>scene._cached_element(<ufbx_element*>blend_shape)
+        if obj is None:
+            obj = BlendShape.__new__(BlendShape)
+            obj._blend_shape = blend_shape
+            scene._cache_element(obj, <ufbx_element*>blend_shape)
         return obj
 
     @property
@@ -1588,15 +3245,16 @@ cdef class BlendShape(Element):
 
 cdef class Constraint(Element):
     """Constraint"""
-    cdef Scene _scene
     cdef ufbx_constraint* _constraint
 
     @staticmethod
     cdef Constraint _create(Scene scene, ufbx_constraint* constraint):
         """Internal factory method"""
-        cdef Constraint obj = Constraint.__new__(Constraint)
-        obj._scene = scene
-        obj._constraint = constraint
+        cdef Constraint obj = <Constraint>scene._cached_element(<ufbx_element*>constraint)
+        if obj is None:
+            obj = Constraint.__new__(Constraint)
+            obj._constraint = constraint
+            scene._cache_element(obj, <ufbx_element*>constraint)
         return obj
 
     @property
@@ -1744,101 +3402,640 @@ cdef class SceneSettings:
         )
 
     @property
-    def default_camera(self):
-        """Default camera name"""
+    def default_camera(self):
+        """Default camera name"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef bytes camera_bytes = self._settings.default_camera.data[:self._settings.default_camera.length]
+        return camera_bytes.decode('utf-8', errors='replace')
+
+    @property
+    def time_mode(self):
+        """Time mode"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._settings.time_mode
+
+    @property
+    def time_protocol(self):
+        """Time protocol"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._settings.time_protocol
+
+    @property
+    def snap_mode(self):
+        """Snap mode"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._settings.snap_mode
+
+    @property
+    def original_axis_up(self):
+        """Original up axis"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._settings.original_axis_up
+
+    @property
+    def original_unit_meters(self):
+        """Original unit in meters"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._settings.original_unit_meters
+
+
+cdef class Empty(Element):
+    """Empty node (null object)"""
+    cdef ufbx_empty* _empty
+
+    @staticmethod
+    cdef Empty _create(Scene scene, ufbx_empty* empty):
+        """Create Empty from C struct"""
+        cdef Empty obj = <Empty>scene._cached_element(<ufbx_element*>empty)
+        if obj is None:
+            obj = Empty.__new__(Empty)
+            obj._empty = empty
+            scene._cache_element(obj, <ufbx_element*>empty)
+        return obj
+
+    @property
+    def name(self):
+        """Empty name"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef bytes name_bytes = self._empty.name.data[:self._empty.name.length]
+        return name_bytes.decode('utf-8', errors='replace')
+
+
+cdef class Unknown(Element):
+    """Unknown element type"""
+    cdef ufbx_unknown* _unknown
+
+    @staticmethod
+    cdef Unknown _create(Scene scene, ufbx_unknown* unknown):
+        """Create Unknown from C struct"""
+        cdef Unknown obj = <Unknown>scene._cached_element(<ufbx_element*>unknown)
+        if obj is None:
+            obj = Unknown.__new__(Unknown)
+            obj._unknown = unknown
+            scene._cache_element(obj, <ufbx_element*>unknown)
+        return obj
+
+    @property
+    def name(self):
+        """Unknown element name"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef bytes name_bytes = self._unknown.name.data[:self._unknown.name.length]
+        return name_bytes.decode('utf-8', errors='replace')
+
+
+cdef class DomNode:
+    """Raw FBX document node (requires LoadOptions(retain_dom=True))"""
+    cdef Scene _scene
+    cdef ufbx_dom_node* _dom_node
+
+    @staticmethod
+    cdef DomNode _create(Scene scene, ufbx_dom_node* dom_node):
+        """Internal factory method"""
+        if dom_node == NULL:
+            return None
+        cdef DomNode obj = DomNode.__new__(DomNode)
+        obj._scene = scene
+        obj._dom_node = dom_node
+        return obj
+
+    @property
+    def name(self):
+        """DOM node name (e.g. 'Objects', 'Model', 'Vertices')"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef size_t length = 0
+        cdef const char* name = ufbx_wrapper_dom_node_get_name(self._dom_node, &length)
+        return name[:length].decode('utf-8', errors='replace')
+
+    @property
+    def children(self):
+        """Child DOM nodes"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef size_t count = ufbx_wrapper_dom_node_get_num_children(self._dom_node)
+        cdef list result = []
+        cdef size_t i
+        for i in range(count):
+            result.append(DomNode._create(self._scene, ufbx_wrapper_dom_node_get_child(self._dom_node, i)))
+        return result
+
+    @property
+    def values(self):
+        """Node values: int/float, str, bytes, or a numpy view for array values"""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        cdef bytes camera_bytes = self._settings.default_camera.data[:self._settings.default_camera.length]
-        return camera_bytes.decode('utf-8', errors='replace')
+        cdef size_t count = ufbx_wrapper_dom_node_get_num_values(self._dom_node)
+        cdef list result = []
+        cdef size_t i
+        for i in range(count):
+            result.append(self._get_value(i))
+        return result
 
     @property
-    def time_mode(self):
-        """Time mode"""
+    def is_array(self):
+        """True if this node holds a single array value"""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        return self._settings.time_mode
+        return ufbx_wrapper_dom_node_is_array(self._dom_node)
 
     @property
-    def time_protocol(self):
-        """Time protocol"""
+    def array_size(self):
+        """Number of elements in the array value (0 if not an array)"""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        return self._settings.time_protocol
+        return ufbx_wrapper_dom_node_get_array_size(self._dom_node)
 
     @property
-    def snap_mode(self):
-        """Snap mode"""
+    def array(self):
+        """Array payload as a zero-copy read-only numpy view (list of bytes for blob arrays)"""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        return self._settings.snap_mode
+        return self._get_array()
 
-    @property
-    def original_axis_up(self):
-        """Original up axis"""
+    def find(self, name):
+        """Find a direct child by name. Returns None if not found."""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        return self._settings.original_axis_up
+        cdef bytes name_bytes = name.encode('utf-8')
+        return DomNode._create(self._scene, ufbx_wrapper_dom_node_find(self._dom_node, name_bytes, len(name_bytes)))
 
-    @property
-    def original_unit_meters(self):
-        """Original unit in meters"""
+    def __len__(self):
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        return self._settings.original_unit_meters
+        return ufbx_wrapper_dom_node_get_num_children(self._dom_node)
 
+    def __bool__(self):
+        return True
 
-cdef class Empty(Element):
-    """Empty node (null object)"""
+    def __iter__(self):
+        return iter(self.children)
+
+    def __repr__(self):
+        if self._scene._closed:
+            return "DomNode(<closed>)"
+        return f"DomNode({self.name!r}, children={len(self)}, values={ufbx_wrapper_dom_node_get_num_values(self._dom_node)})"
+
+    cdef object _get_value(self, size_t index):
+        """Internal: convert a single DOM value to Python"""
+        cdef int value_type = ufbx_wrapper_dom_node_get_value_type(self._dom_node, index)
+        cdef size_t length = 0
+        cdef const char* data
+        cdef int64_t value_int
+        cdef double value_float
+        if value_type == DomValueType.DOM_VALUE_NUMBER:
+            value_int = ufbx_wrapper_dom_node_get_value_int(self._dom_node, index)
+            value_float = ufbx_wrapper_dom_node_get_value_float(self._dom_node, index)
+            if <double>value_int == value_float:
+                return value_int
+            return value_float
+        if value_type == DomValueType.DOM_VALUE_STRING:
+            data = ufbx_wrapper_dom_node_get_value_str(self._dom_node, index, &length)
+            return data[:length].decode('utf-8', errors='replace')
+        if value_type == DomValueType.DOM_VALUE_BLOB:
+            data = <const char*>ufbx_wrapper_dom_node_get_value_blob(self._dom_node, index, &length)
+            if data == NULL:
+                return b""
+            return data[:length]
+        if index == 0 and ufbx_wrapper_dom_node_get_num_values(self._dom_node) == 1:
+            return self._get_array()
+        return None
+
+    cdef object _get_array(self):
+        """Internal: array payload via ufbx_dom_as_*_list"""
+        cdef int array_type = -1
+        cdef size_t count = 0
+        cdef const void* data = ufbx_wrapper_dom_node_get_array(self._dom_node, &array_type, &count)
+        cdef np.npy_intp shape[1]
+        cdef const ufbx_blob* blobs
+        cdef size_t i
+        if array_type == DomValueType.DOM_VALUE_ARRAY_BLOB:
+            blobs = <const ufbx_blob*>data
+            return [(<const char*>blobs[i].data)[:blobs[i].size] for i in range(count)]
+        shape[0] = <np.npy_intp>count
+        if array_type == DomValueType.DOM_VALUE_ARRAY_I32:
+            return _scene_array_view(self._scene, 1, shape, np.NPY_INT32, data)
+        if array_type == DomValueType.DOM_VALUE_ARRAY_I64:
+            return _scene_array_view(self._scene, 1, shape, np.NPY_INT64, data)
+        if array_type == DomValueType.DOM_VALUE_ARRAY_F32:
+            return _scene_array_view(self._scene, 1, shape, np.NPY_FLOAT32, data)
+        if array_type == DomValueType.DOM_VALUE_ARRAY_F64:
+            return _scene_array_view(self._scene, 1, shape, np.NPY_FLOAT64, data)
+        return None
+
+
+cdef object _wrap_element(Scene scene, ufbx_element* element):
+    """Internal: typed wrapper for any element (plain Element if there is no dedicated class)"""
+    if element == NULL:
+        return None
+    cdef int element_type = element.type
+    if element_type == UFBX_ELEMENT_NODE:
+        return Node._create(scene, <ufbx_node*>element)
+    if element_type == UFBX_ELEMENT_MESH:
+        return Mesh._create(scene, <ufbx_mesh*>element)
+    if element_type == UFBX_ELEMENT_MATERIAL:
+        return Material._create(scene, <ufbx_material*>element)
+    if element_type == UFBX_ELEMENT_TEXTURE:
+        return Texture._create(scene, <ufbx_texture*>element)
+    if element_type == UFBX_ELEMENT_LIGHT:
+        return Light._create(scene, <ufbx_light*>element)
+    if element_type == UFBX_ELEMENT_CAMERA:
+        return Camera._create(scene, <ufbx_camera*>element)
+    if element_type == UFBX_ELEMENT_BONE:
+        return Bone._create(scene, <ufbx_bone*>element)
+    if element_type == UFBX_ELEMENT_EMPTY:
+        return Empty._create(scene, <ufbx_empty*>element)
+    if element_type == UFBX_ELEMENT_UNKNOWN:
+        return Unknown._create(scene, <ufbx_unknown*>element)
+    if element_type == UFBX_ELEMENT_ANIM_STACK:
+        return AnimStack._create(scene, <ufbx_anim_stack*>element)
+    if element_type == UFBX_ELEMENT_ANIM_LAYER:
+        return AnimLayer._create(scene, <ufbx_anim_layer*>element)
+    if element_type == UFBX_ELEMENT_ANIM_CURVE:
+        return AnimCurve._create(scene, <ufbx_anim_curve*>element)
+    if element_type == UFBX_ELEMENT_SKIN_DEFORMER:
+        return SkinDeformer._create(scene, <ufbx_skin_deformer*>element)
+    if element_type == UFBX_ELEMENT_SKIN_CLUSTER:
+        return SkinCluster._create(scene, <ufbx_skin_cluster*>element)
+    if element_type == UFBX_ELEMENT_BLEND_DEFORMER:
+        return BlendDeformer._create(scene, <ufbx_blend_deformer*>element)
+    if element_type == UFBX_ELEMENT_BLEND_CHANNEL:
+        return BlendChannel._create(scene, <ufbx_blend_channel*>element)
+    if element_type == UFBX_ELEMENT_BLEND_SHAPE:
+        return BlendShape._create(scene, <ufbx_blend_shape*>element)
+    if element_type == UFBX_ELEMENT_CONSTRAINT:
+        return Constraint._create(scene, <ufbx_constraint*>element)
+    cdef Element obj = scene._cached_element(element)
+    if obj is None:
+        obj = Element.__new__(Element)
+        scene._cache_element(obj, element)
+    return obj
+
+
+cdef class ElementList:
+    """Lazy read-only sequence view over a ufbx element list
+
+    Wrappers are only created for the items that are accessed. The view is either
+    backed directly by a ufbx list or by an array of element_ids (query results).
+    """
     cdef Scene _scene
-    cdef ufbx_empty* _empty
+    cdef ufbx_element** _data
+    cdef size_t _count
+    cdef np.ndarray _ids
+    cdef const uint32_t* _id_data
 
     @staticmethod
-    cdef Empty _create(Scene scene, ufbx_empty* empty):
-        """Create Empty from C struct"""
-        cdef Empty obj = Empty.__new__(Empty)
+    cdef ElementList _create(Scene scene, ufbx_element_list elements):
+        """Internal factory method"""
+        cdef ElementList obj = ElementList.__new__(ElementList)
+        obj._scene = scene
+        obj._data = elements.data
+        obj._count = elements.count
+        return obj
+
+    @staticmethod
+    cdef ElementList _from_ids(Scene scene, np.ndarray ids):
+        """Internal: view over a uint32 array of element_ids"""
+        cdef ElementList obj = ElementList.__new__(ElementList)
         obj._scene = scene
-        obj._empty = empty
+        obj._data = scene._scene.elements.data
+        obj._count = ids.shape[0]
+        obj._ids = ids
+        obj._id_data = <const uint32_t*>ids.data
+        np.PyArray_CLEARFLAGS(ids, np.NPY_ARRAY_WRITEABLE)
         return obj
 
+    cdef inline ufbx_element* _get(self, size_t index):
+        """Internal: element pointer at index (no bounds check)"""
+        if self._id_data != NULL:
+            return self._data[self._id_data[index]]
+        return self._data[index]
+
+    cdef object _item(self, size_t index):
+        """Internal: wrapper for the element at index (no bounds check)"""
+        return _wrap_element(self._scene, self._get(index))
+
     @property
-    def name(self):
-        """Empty name"""
+    def element_ids(self):
+        """element_id of every item as a read-only uint32 array"""
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
-        cdef bytes name_bytes = self._empty.name.data[:self._empty.name.length]
-        return name_bytes.decode('utf-8', errors='replace')
+        if self._ids is not None:
+            return self._ids
+        cdef np.ndarray[np.uint32_t, ndim=1] ids = np.empty(self._count, dtype=np.uint32)
+        cdef size_t i
+        for i in range(self._count):
+            ids[i] = self._data[i].element_id
+        np.PyArray_CLEARFLAGS(ids, np.NPY_ARRAY_WRITEABLE)
+        return ids
+
+    def __len__(self):
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return self._count
 
+    def __getitem__(self, index):
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef Py_ssize_t i
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(self._count))]
+        i = index
+        if i < 0:
+            i += self._count
+        if i < 0 or <size_t>i >= self._count:
+            raise IndexError("element index out of range")
+        return self._item(i)
 
-cdef class Unknown(Element):
-    """Unknown element type"""
-    cdef Scene _scene
-    cdef ufbx_unknown* _unknown
+    def __iter__(self):
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef size_t i
+        for i in range(self._count):
+            if self._scene._closed:
+                raise RuntimeError("Scene is closed")
+            yield self._item(i)
+
+    def __reversed__(self):
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        cdef size_t i
+        for i in range(self._count, 0, -1):
+            if self._scene._closed:
+                raise RuntimeError("Scene is closed")
+            yield self._item(i - 1)
+
+    def __contains__(self, value):
+        return self._find(value) >= 0
+
+    cdef Py_ssize_t _find(self, value) except -2:
+        """Internal: position of value in the list by pointer comparison, -1 if absent"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        if not isinstance(value, Element) or (<Element>value)._scene is not self._scene:
+            return -1
+        cdef ufbx_element* element = (<Element>value)._element
+        cdef size_t i
+        for i in range(self._count):
+            if self._get(i) == element:
+                return i
+        return -1
+
+    def index(self, value):
+        """Position of value in the list. Raises ValueError if absent."""
+        cdef Py_ssize_t i = self._find(value)
+        if i < 0:
+            raise ValueError(f"{value!r} is not in list")
+        return i
+
+    def count(self, value):
+        """Number of occurrences of value (0 or 1)"""
+        return 1 if self._find(value) >= 0 else 0
+
+    def __eq__(self, other):
+        if isinstance(other, (ElementList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        if self._scene._closed:
+            return "ElementList(<closed>)"
+        return f"ElementList(len={self._count})"
+
+
+Sequence.register(ElementList)
+
+
+cdef str _texture_extension(Scene scene, ufbx_texture* texture):
+    """Internal: file extension for embedded texture content (from its filename or magic bytes)"""
+    cdef bytes filename = texture.filename.data[:texture.filename.length]
+    ext = os.path.splitext(filename.decode('utf-8', errors='replace'))[1].lower()
+    if ext:
+        return ext
+    cdef bytes head = (<const char*>texture.content.data)[:min(texture.content.size, 12)]
+    for magic, magic_ext in _IMAGE_MAGIC:
+        if head.startswith(magic):
+            return magic_ext
+    if head[8:12] == b"WEBP":
+        return ".webp"
+    return ".bin"
+
+
+_IMAGE_MAGIC = (
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"DDS ", ".dds"),
+    (b"BM", ".bmp"),
+    (b"GIF8", ".gif"),
+    (b"II*\x00", ".tif"),
+    (b"MM\x00*", ".tif"),
+    (b"8BPS", ".psd"),
+)
+
+
+_SHARED_MESH_ATTRIBUTES = ("vertex_positions", "vertex_normals", "vertex_uvs", "vertex_tangent",
+                           "vertex_bitangent", "vertex_color", "indices", "face_material")
+
+
+def _write_file_once(path, data):
+    """Internal: write data to path unless it already exists (atomic rename)"""
+    if os.path.exists(path):
+        return
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# Queries below this many items per thread run on the calling thread
+_PARALLEL_MIN_CHUNK = 1024
+
+
+def _parallel_ranges(size_t count, workers, fn):
+    """Internal: call fn(start, stop) over chunks of range(count) on a thread pool"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), count // _PARALLEL_MIN_CHUNK))
+    if workers == 1:
+        fn(0, count)
+        return
+    bounds = [count * i // workers for i in range(workers + 1)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in [pool.submit(fn, bounds[i], bounds[i + 1]) for i in range(workers)]:
+            future.result()
+
+
+cdef class BVH:
+    """Bounding volume hierarchy over world-space triangles, built by Scene.build_bvh()
+
+    Owns a copy of the triangles, so it stays usable after the scene is closed.
+    Queries take NumPy arrays and run in C without the GIL, split across threads.
+    """
+    cdef ufbx_wrapper_bvh* _bvh
+    cdef readonly object geometry
+
+    def __cinit__(self):
+        self._bvh = NULL
+
+    def __dealloc__(self):
+        if self._bvh != NULL:
+            ufbx_wrapper_bvh_free(self._bvh)
+            self._bvh = NULL
 
     @staticmethod
-    cdef Unknown _create(Scene scene, ufbx_unknown* unknown):
-        """Create Unknown from C struct"""
-        cdef Unknown obj = Unknown.__new__(Unknown)
-        obj._scene = scene
-        obj._unknown = unknown
+    cdef BVH _build(object geometry):
+        cdef BVH obj = BVH.__new__(BVH)
+        cdef np.ndarray[np.float64_t, ndim=2] positions = np.ascontiguousarray(geometry.positions, dtype=np.float64)
+        cdef np.ndarray[np.uint32_t, ndim=2] indices = np.ascontiguousarray(geometry.indices, dtype=np.uint32)
+        cdef size_t num_triangles = indices.shape[0]
+        cdef const double* positions_ptr = <const double*>positions.data
+        cdef const uint32_t* indices_ptr = <const uint32_t*>indices.data
+        with nogil:
+            obj._bvh = ufbx_wrapper_bvh_build(positions_ptr, indices_ptr, num_triangles)
+        if obj._bvh == NULL:
+            raise UfbxOutOfMemoryError("Failed to allocate BVH")
+        obj.geometry = geometry
         return obj
 
     @property
-    def name(self):
-        """Unknown element name"""
-        if self._scene._closed:
-            raise RuntimeError("Scene is closed")
-        cdef bytes name_bytes = self._unknown.name.data[:self._unknown.name.length]
-        return name_bytes.decode('utf-8', errors='replace')
+    def num_triangles(self):
+        """Number of triangles"""
+        return len(self.geometry.indices)
+
+    @property
+    def num_nodes(self):
+        """Number of BVH nodes"""
+        return ufbx_wrapper_bvh_num_nodes(self._bvh)
+
+    @property
+    def depth(self):
+        """Depth of the deepest leaf"""
+        return ufbx_wrapper_bvh_max_depth(self._bvh)
+
+    def raycast(self, origins, directions, max_distance=np.inf, workers=None):
+        """Find the nearest triangle hit by each ray
+
+        Args:
+            origins: (R, 3) ray origins, or (3,) shared by all rays
+            directions: (R, 3) ray directions (need not be normalized), or (3,)
+            max_distance: Ignore hits farther than this (non-negative)
+            workers: Thread count (None for os.cpu_count())
+
+        Returns:
+            RaycastResult
+        """
+        if not max_distance >= 0.0:
+            raise ValueError(f"max_distance must be non-negative, got {max_distance!r}")
+        o, d = np.broadcast_arrays(np.asarray(origins, dtype=np.float64), np.asarray(directions, dtype=np.float64))
+        if o.shape[-1:] != (3,):
+            raise ValueError(f"origins and directions must have shape (..., 3), got {o.shape}")
+        cdef np.ndarray[np.float64_t, ndim=2] o_arr = np.ascontiguousarray(o.reshape(-1, 3))
+        cdef np.ndarray[np.float64_t, ndim=2] d_arr = np.ascontiguousarray(d.reshape(-1, 3))
+        cdef size_t count = o_arr.shape[0]
+        cdef np.ndarray[np.float64_t, ndim=1] distance = np.empty(count, dtype=np.float64)
+        cdef np.ndarray[np.int64_t, ndim=1] triangle = np.empty(count, dtype=np.int64)
+        cdef np.ndarray[np.float64_t, ndim=2] barycentric = np.empty((count, 2), dtype=np.float64)
+        cdef double c_max_distance = max_distance
+        cdef double* o_ptr = <double*>o_arr.data
+        cdef double* d_ptr = <double*>d_arr.data
+        cdef double* dist_ptr = <double*>distance.data
+        cdef int64_t* tri_ptr = <int64_t*>triangle.data
+        cdef double* bary_ptr = <double*>barycentric.data
+
+        def run(size_t start, size_t stop):
+            cdef bint ok
+            with nogil:
+                ok = ufbx_wrapper_bvh_raycast(self._bvh, o_ptr + start * 3, d_ptr + start * 3, stop - start,
+                                              c_max_distance, dist_ptr + start, tri_ptr + start, bary_ptr + start * 2)
+            if not ok:
+                raise UfbxOutOfMemoryError("Failed to allocate BVH traversal stack")
+
+        _parallel_ranges(count, workers, run)
+        hit = triangle >= 0
+        length = np.linalg.norm(d_arr, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            position = o_arr + d_arr * (distance / length)[:, None]
+        position[~hit] = np.nan
+        node_ids = np.where(hit, self.geometry.node_ids[np.where(hit, triangle, 0)], -1).astype(np.int32)
+        return RaycastResult(hit, distance, position, triangle, node_ids, barycentric)
+
+    def closest_point(self, points, max_distance=np.inf, workers=None):
+        """Find the closest point on any triangle to each query point
+
+        Args:
+            points: (Q, 3) query points
+            max_distance: Ignore surfaces farther than this (non-negative)
+            workers: Thread count (None for os.cpu_count())
+
+        Returns:
+            ClosestPointResult
+        """
+        if not max_distance >= 0.0:
+            raise ValueError(f"max_distance must be non-negative, got {max_distance!r}")
+        p = np.asarray(points, dtype=np.float64)
+        if p.shape[-1:] != (3,):
+            raise ValueError(f"points must have shape (..., 3), got {p.shape}")
+        cdef np.ndarray[np.float64_t, ndim=2] p_arr = np.ascontiguousarray(p.reshape(-1, 3))
+        cdef size_t count = p_arr.shape[0]
+        cdef np.ndarray[np.float64_t, ndim=2] position = np.empty((count, 3), dtype=np.float64)
+        cdef np.ndarray[np.float64_t, ndim=1] distance = np.empty(count, dtype=np.float64)
+        cdef np.ndarray[np.int64_t, ndim=1] triangle = np.empty(count, dtype=np.int64)
+        cdef double c_max_distance = max_distance
+        cdef double* p_ptr = <double*>p_arr.data
+        cdef double* pos_ptr = <double*>position.data
+        cdef double* dist_ptr = <double*>distance.data
+        cdef int64_t* tri_ptr = <int64_t*>triangle.data
+
+        def run(size_t start, size_t stop):
+            cdef bint ok
+            with nogil:
+                ok = ufbx_wrapper_bvh_closest_point(self._bvh, p_ptr + start * 3, stop - start, c_max_distance,
+                                                    pos_ptr + start * 3, dist_ptr + start, tri_ptr + start)
+            if not ok:
+                raise UfbxOutOfMemoryError("Failed to allocate BVH traversal stack")
+
+        _parallel_ranges(count, workers, run)
+        found = triangle >= 0
+        node_ids = np.where(found, self.geometry.node_ids[np.where(found, triangle, 0)], -1).astype(np.int32)
+        return ClosestPointResult(position, distance, triangle, node_ids)
+
+    def __repr__(self):
+        return f"BVH(triangles={self.num_triangles}, nodes={self.num_nodes}, depth={self.depth})"
 
 
 cdef class Scene:
     """FBX Scene - manages lifetime of all scene data"""
     cdef ufbx_scene* _scene
     cdef bint _closed
+    cdef object _elements
+    cdef _SceneMemory _memory
+    cdef tuple _bounds
+    cdef object _load_stats
+    cdef object _memory_usage
+    cdef object _source_dir
+    cdef object __weakref__
 
     def __cinit__(self):
         self._scene = NULL
         self._closed = False
+        # Weak so that Scene -> wrapper -> Element._scene does not form a cycle
+        self._elements = weakref.WeakValueDictionary()
+        self._memory = None
+        self._bounds = None
+        self._load_stats = None
+        self._memory_usage = None
+        self._source_dir = None
 
     def __dealloc__(self):
         self.close()
@@ -1849,6 +4046,46 @@ cdef class Scene:
             ufbx_wrapper_free_scene(self._scene)
             self._scene = NULL
             self._closed = True
+            self._memory = None
+            self._bounds = None
+            if self._elements is not None:
+                self._elements.clear()
+
+    cdef tuple _bounds_arrays(self):
+        """Internal: cached (mesh_bounds, node_bounds) arrays, computed on first use"""
+        if self._bounds is not None:
+            return self._bounds
+        cdef np.ndarray[np.float64_t, ndim=3] mesh_bounds = np.empty(
+            (ufbx_wrapper_scene_get_num_meshes(self._scene), 2, 3), dtype=np.float64)
+        cdef np.ndarray[np.float64_t, ndim=3] node_bounds = np.empty(
+            (ufbx_wrapper_scene_get_num_nodes(self._scene), 2, 3), dtype=np.float64)
+        cdef double* mesh_ptr = <double*>mesh_bounds.data
+        cdef double* node_ptr = <double*>node_bounds.data
+        with nogil:
+            ufbx_wrapper_scene_compute_bounds(self._scene, mesh_ptr, node_ptr)
+        mesh_bounds.flags.writeable = False
+        node_bounds.flags.writeable = False
+        self._bounds = (mesh_bounds, node_bounds)
+        return self._bounds
+
+    cdef _SceneMemory _memory_owner(self):
+        """Internal: shared owner for array views (see _scene_array_view)"""
+        if self._memory is None:
+            self._memory = _SceneMemory._retain(self._scene)
+        return self._memory
+
+    cdef Element _cached_element(self, ufbx_element* element):
+        """Internal: wrapper previously created for element, or None"""
+        if element == NULL:
+            return None
+        return self._elements.get(element.element_id)
+
+    cdef _cache_element(self, Element obj, ufbx_element* element):
+        """Internal: bind obj to element and reuse it for later lookups by element_id"""
+        obj._scene = self
+        obj._element = element
+        if element != NULL:
+            self._elements[element.element_id] = obj
 
     def __enter__(self):
         return self
@@ -1857,8 +4094,8 @@ cdef class Scene:
         self.close()
 
     @classmethod
-    def load_file(cls, filename):
-        return load_file(filename)
+    def load_file(cls, filename, options=None, **kwargs):
+        return load_file(filename, options, **kwargs)
 
     @classmethod
     def load_memory(cls, data):
@@ -1871,6 +4108,21 @@ cdef class Scene:
             raise RuntimeError("Scene is closed")
         return Metadata._create(self, &self._scene.metadata)
 
+    @property
+    def load_stats(self):
+        """LoadStats of the load, or None unless loaded with stats=True"""
+        return self._load_stats
+
+    def memory_usage(self):
+        """Heap usage of the scene as a MemoryUsage
+
+        Counted by the allocators of the load, so it covers everything ufbx
+        allocated but not Python wrappers or arrays copied out of the scene.
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        return self._memory_usage
+
     @property
     def settings(self):
         """Scene settings (axes, units, FPS, etc.)"""
@@ -1883,24 +4135,28 @@ cdef class Scene:
         """Get all nodes in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_nodes(self._scene)
-        return [self._get_node(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_NODE])
 
     @property
     def meshes(self):
         """Get all meshes in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_meshes(self._scene)
-        return [self._get_mesh(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_MESH])
 
     @property
     def materials(self):
         """Get all materials in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_materials(self._scene)
-        return [self._get_material(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_MATERIAL])
+
+    @property
+    def dom_root(self):
+        """Root of the raw FBX document (None unless loaded with retain_dom=True)"""
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        return DomNode._create(self, ufbx_wrapper_scene_get_dom_root(self._scene))
 
     @property
     def root_node(self):
@@ -1922,6 +4178,438 @@ cdef class Scene:
         cdef int f = ufbx_wrapper_scene_get_axes_front(self._scene)
         return CoordinateAxes(r, u, f)
 
+    def flatten_geometry(self, triangulate=True, world_space=True, nodes=None, **kwargs):
+        """Concatenate all mesh instances into single arrays
+
+        Args:
+            triangulate: Split polygons into triangles
+            world_space: Transform positions by each node's geometry_to_world
+            nodes: Optional iterable of Nodes or node names to restrict to
+                (also accepted as `include=`, a reserved word in Cython)
+
+        Returns:
+            FlattenedGeometry
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        selection = kwargs.pop("include", nodes)
+        if kwargs:
+            raise TypeError(f"Unexpected keyword argument: {next(iter(kwargs))}")
+
+        cdef np.ndarray[np.uint32_t, ndim=1] node_ids_arr = None
+        cdef const uint32_t* node_ids = NULL
+        cdef size_t num_node_ids = 0
+        cdef bint all_nodes = selection is None
+        if not all_nodes:
+            node_ids_arr = np.fromiter((self._resolve_node_id(n) for n in selection), dtype=np.uint32)
+            num_node_ids = node_ids_arr.shape[0]
+            if num_node_ids > 0:
+                node_ids = <const uint32_t*>node_ids_arr.data
+
+        cdef bint c_triangulate = triangulate
+        cdef bint c_world_space = world_space
+        cdef ufbx_wrapper_flatten_sizes sizes
+        with nogil:
+            ufbx_wrapper_flatten_count(self._scene, all_nodes, node_ids, num_node_ids, c_triangulate, &sizes)
+        if sizes.num_positions > UINT32_MAX:
+            raise OverflowError(f"Flattened geometry has {sizes.num_positions} vertices, "
+                                f"more than uint32 indices can address")
+
+        cdef np.ndarray[np.float64_t, ndim=2] positions = np.empty((sizes.num_positions, 3), dtype=np.float64)
+        cdef np.ndarray[np.uint32_t, ndim=1] indices = np.empty(sizes.num_indices, dtype=np.uint32)
+        cdef np.ndarray[np.int32_t, ndim=1] face_nodes = np.empty(sizes.num_faces, dtype=np.int32)
+        cdef np.ndarray[np.int32_t, ndim=1] face_materials = np.empty(sizes.num_faces, dtype=np.int32)
+        cdef np.ndarray[np.uint32_t, ndim=1] face_sizes = None
+        cdef uint32_t* face_sizes_ptr = NULL
+        if not c_triangulate:
+            face_sizes = np.empty(sizes.num_faces, dtype=np.uint32)
+            face_sizes_ptr = <uint32_t*>face_sizes.data
+
+        cdef bint ok
+        with nogil:
+            ok = ufbx_wrapper_flatten_fill(self._scene, all_nodes, node_ids, num_node_ids, c_triangulate, c_world_space, &sizes,
+                                           <double*>positions.data, <uint32_t*>indices.data,
+                                           <int32_t*>face_nodes.data, <int32_t*>face_materials.data, face_sizes_ptr)
+        if not ok:
+            raise UfbxOutOfMemoryError("Failed to allocate triangulation buffer")
+
+        if c_triangulate:
+            return FlattenedGeometry(positions, indices.reshape(-1, 3), face_nodes, face_materials)
+        return FlattenedGeometry(positions, indices, face_nodes, face_materials, face_sizes)
+
+    def build_bvh(self, nodes=None):
+        """Build a BVH over the world-space triangles of all mesh instances
+
+        Uses flatten_geometry(triangulate=True, world_space=True, nodes=nodes) and a
+        binned SAH build without the GIL.
+
+        Args:
+            nodes: Optional iterable of Nodes or node names to restrict to
+
+        Returns:
+            BVH
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        return BVH._build(self.flatten_geometry(triangulate=True, world_space=True, nodes=nodes))
+
+    def query(self, type=None, name=None, pattern=None, under=None):
+        """Find elements by type, name and/or position in the hierarchy
+
+        Args:
+            type: ElementType to match (any type if None)
+            name: Exact element name
+            pattern: Glob pattern (`*`, `?`, `[...]`) str matched against the whole
+                name, or a compiled `re.Pattern` that is searched in the name
+            under: Node whose subtree to match: the node itself, its descendants
+                and non-node elements instanced by any of them
+
+        Returns:
+            ElementList of matches in element_id order (see ElementList.element_ids)
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+
+        cdef ufbx_wrapper_query q
+        q.type = -1 if type is None else int(type)
+        q.name = NULL
+        q.name_length = 0
+        q.pattern = NULL
+        q.pattern_length = 0
+        q.under = NULL
+
+        cdef bytes name_bytes
+        cdef bytes pattern_bytes
+        regex = None
+        if name is not None:
+            name_bytes = name.encode('utf-8')
+            q.name = name_bytes
+            q.name_length = len(name_bytes)
+        if isinstance(pattern, str):
+            pattern_bytes = pattern.encode('utf-8')
+            q.pattern = pattern_bytes
+            q.pattern_length = len(pattern_bytes)
+        elif isinstance(pattern, re.Pattern):
+            regex = pattern
+        elif pattern is not None:
+            raise TypeError(f"pattern expects str or re.Pattern, not {builtins.type(pattern).__name__}")
+        if under is not None:
+            if not isinstance(under, Node):
+                raise TypeError(f"under expects Node, not {builtins.type(under).__name__}")
+            if (<Node>under)._scene is not self:
+                raise ValueError("Node belongs to a different scene")
+            q.under = (<Node>under)._node
+
+        cdef np.ndarray[np.uint32_t, ndim=1] ids = np.empty(self._scene.elements.count, dtype=np.uint32)
+        cdef size_t count
+        with nogil:
+            count = ufbx_wrapper_scene_query(self._scene, &q, <uint32_t*>ids.data)
+        ids = ids[:count].copy()
+
+        cdef ufbx_element* element
+        if regex is not None:
+            keep = np.zeros(count, dtype=bool)
+            for i in range(count):
+                element = self._scene.elements.data[ids[i]]
+                if regex.search(element.name.data[:element.name.length].decode('utf-8', errors='replace')):
+                    keep[i] = True
+            ids = ids[keep]
+        return ElementList._from_ids(self, ids)
+
+    def gather_prop(self, type, name, default=float("nan")):
+        """Read one property from every element of a type into a NumPy array
+
+        Args:
+            type: ElementType whose elements to read (rows follow that Scene collection)
+            name: Property name
+            default: Value for elements without the property. A scalar gives an (N,)
+                array, a sequence of k (1-4) values gives an (N, k) array.
+
+        Returns:
+            float64 numpy array
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        cdef int element_type = int(type)
+        if element_type < 0 or element_type >= UFBX_ELEMENT_TYPE_COUNT:
+            raise ValueError(f"Invalid element type: {type}")
+
+        cdef np.ndarray[np.float64_t, ndim=1] default_arr = np.atleast_1d(np.asarray(default, dtype=np.float64)).ravel()
+        cdef bint scalar = np.ndim(default) == 0
+        cdef size_t num_components = default_arr.shape[0]
+        if num_components < 1 or num_components > 4:
+            raise ValueError("default must be a scalar or a sequence of 1-4 values")
+
+        cdef size_t count = self._scene.elements_by_type[element_type].count
+        cdef np.ndarray[np.float64_t, ndim=2] out = np.empty((count, num_components), dtype=np.float64)
+        cdef bytes name_bytes = name.encode('utf-8')
+        cdef const char* name_ptr = name_bytes
+        cdef size_t name_length = len(name_bytes)
+        with nogil:
+            ufbx_wrapper_scene_gather_prop(self._scene, element_type, name_ptr, name_length,
+                                           num_components, <const double*>default_arr.data, <double*>out.data)
+        if scalar:
+            return out.reshape(count)
+        return out
+
+    def extract_textures(self, dest_dir, workers=None):
+        """Write embedded texture content to dest_dir, once per unique image
+
+        Files are named by the SHA-256 of their content, so identical images shared by
+        several textures (or already extracted earlier) are written once. Hashing and
+        writing run on a thread pool and release the GIL.
+
+        Args:
+            dest_dir: Output directory (created if missing)
+            workers: Thread pool size (None for the concurrent.futures default)
+
+        Returns:
+            List aligned with Scene.textures: path of the extracted file, or None for
+            textures without embedded content
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        os.makedirs(dest_dir, exist_ok=True)
+
+        # Textures often share one embedded Video: hash each distinct buffer once
+        cdef ufbx_element_list textures = self._scene.elements_by_type[UFBX_ELEMENT_TEXTURE]
+        cdef ufbx_texture* texture
+        cdef size_t i
+        cdef list buffer_index = []
+        cdef dict buffers = {}
+        for i in range(textures.count):
+            texture = <ufbx_texture*>textures.data[i]
+            if texture.content.size == 0:
+                buffer_index.append(None)
+                continue
+            key = <size_t>texture.content.data
+            if key not in buffers:
+                content = _wrap_element(self, textures.data[i]).content
+                buffers[key] = (content, _texture_extension(self, texture))
+            buffer_index.append(key)
+
+        keys = list(buffers)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            digests = list(pool.map(lambda key: hashlib.sha256(buffers[key][0]).hexdigest(), keys))
+            paths = {}
+            jobs = {}
+            for key, digest in zip(keys, digests):
+                path = os.path.join(dest_dir, digest + buffers[key][1])
+                paths[key] = path
+                if path not in jobs:
+                    jobs[path] = pool.submit(_write_file_once, path, buffers[key][0])
+            for job in jobs.values():
+                job.result()
+
+        return [None if key is None else paths[key] for key in buffer_index]
+
+    def resolve_textures(self, search_paths=(), cache=None):
+        """Resolve texture files on disk against search paths
+
+        Tries Texture.filename, absolute_filename and relative_filename as-is when
+        absolute, relative ones under the FBX file's directory and then each search
+        path, and finally by basename under the same directories (see
+        TextureResolver.resolve). Textures sharing the same filenames are resolved once.
+
+        Args:
+            search_paths: Directories to search after the FBX file's directory, in
+                priority order
+            cache: TextureResolver to share stat results across scenes (a fresh one
+                is used if None)
+
+        Returns:
+            List aligned with Scene.textures: resolved path, or None if not found
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        if cache is None:
+            cache = TextureResolver()
+        elif not isinstance(cache, TextureResolver):
+            raise TypeError(f"cache must be a TextureResolver, not {type(cache).__name__}")
+        search_paths = [os.fspath(path) for path in search_paths]
+        fbx_dir = self._source_dir
+        cdef ufbx_string source = self._scene.metadata.filename
+        if fbx_dir is None and source.length:
+            name = source.data[:source.length].decode('utf-8', errors='replace')
+            if os.path.isabs(name):
+                fbx_dir = os.path.dirname(name)
+        if fbx_dir is not None:
+            search_paths.insert(0, fbx_dir)
+
+        cdef ufbx_element_list textures = self._scene.elements_by_type[UFBX_ELEMENT_TEXTURE]
+        cdef ufbx_texture* texture
+        cdef size_t i
+        cdef dict resolved = {}
+        cdef list result = []
+        for i in range(textures.count):
+            texture = <ufbx_texture*>textures.data[i]
+            key = (texture.filename.data[:texture.filename.length],
+                   texture.absolute_filename.data[:texture.absolute_filename.length],
+                   texture.relative_filename.data[:texture.relative_filename.length])
+            if key not in resolved:
+                names = [name.decode('utf-8', errors='replace') for name in key]
+                resolved[key] = cache.resolve(names, search_paths)
+            result.append(resolved[key])
+        return result
+
+    def bounds_table(self):
+        """World-space bounding boxes of all nodes as a read-only (N, 2, 3) array
+
+        Row i is [min, max] of scene.nodes[i]'s mesh after geometry_to_world (every
+        vertex is transformed, so boxes are tight), NaN for nodes without a mesh.
+        Computed once without the GIL and cached on the scene.
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        return self._bounds_arrays()[1]
+
+    @property
+    def bounds(self):
+        """World-space [min, max] (2, 3) box of all mesh instances, or None"""
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        node_bounds = self._bounds_arrays()[1]
+        valid = node_bounds[~np.isnan(node_bounds[:, 0, 0])]
+        if len(valid) == 0:
+            return None
+        return np.stack((valid[:, 0].min(axis=0), valid[:, 1].max(axis=0)))
+
+    def node_table(self):
+        """Hierarchy and transforms of all nodes as NumPy arrays (NodeTable)"""
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        cdef size_t count = ufbx_wrapper_scene_get_num_nodes(self._scene)
+        cdef np.ndarray[np.int32_t, ndim=1] parents = np.empty(count, dtype=np.int32)
+        cdef np.ndarray[np.int32_t, ndim=1] depths = np.empty(count, dtype=np.int32)
+        cdef np.ndarray[np.int32_t, ndim=1] attrib_types = np.empty(count, dtype=np.int32)
+        cdef np.ndarray[np.float64_t, ndim=3] world = np.empty((count, 4, 4), dtype=np.float64)
+        cdef np.ndarray[np.float64_t, ndim=3] local = np.empty((count, 4, 4), dtype=np.float64)
+        cdef np.ndarray[np.float64_t, ndim=3] geometry = np.empty((count, 4, 4), dtype=np.float64)
+        with nogil:
+            ufbx_wrapper_scene_fill_node_table(self._scene, <int32_t*>parents.data, <int32_t*>depths.data,
+                                               <int32_t*>attrib_types.data, <double*>world.data,
+                                               <double*>local.data, <double*>geometry.data)
+        return NodeTable(parents, depths, attrib_types, world, local, geometry)
+
+    def find_duplicate_meshes(self, registry=None, source=None, attributes=True):
+        """Group meshes with identical content
+
+        Hashes face sizes, vertex positions and indices (and with attributes, normals,
+        UV sets, color sets and face materials) of every mesh in C with the GIL
+        released. Names and node transforms are ignored, so repeated geometry placed
+        by different nodes compares equal.
+
+        Args:
+            registry: MeshRegistry shared across scenes; the first mesh of each hash
+                in this scene is registered as (source, index)
+            source: Name of this scene in the registry (default: Metadata.filename)
+            attributes: Include vertex attributes and face materials in the hash
+
+        Returns:
+            MeshDuplicates
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        if registry is not None and not isinstance(registry, MeshRegistry):
+            raise TypeError(f"registry must be a MeshRegistry, not {type(registry).__name__}")
+        if source is None:
+            source = self._scene.metadata.filename.data[:self._scene.metadata.filename.length].decode(
+                'utf-8', errors='replace')
+
+        cdef size_t count = self._scene.elements_by_type[UFBX_ELEMENT_MESH].count
+        cdef np.ndarray words = np.zeros((count, 2), dtype=np.uint64)
+        cdef bint with_attributes = attributes
+        with nogil:
+            ufbx_wrapper_scene_hash_meshes(self._scene, with_attributes, <uint64_t*>words.data)
+
+        hashes = [f"{int(a):016x}{int(b):016x}" for a, b in words.tolist()]
+        canonical = np.empty(count, dtype=np.int32)
+        first, members = {}, {}
+        for i, key in enumerate(hashes):
+            canonical[i] = first.setdefault(key, i)
+            members.setdefault(key, []).append(i)
+        groups = [group for group in members.values() if len(group) > 1]
+        if registry is None:
+            instances = [None] * count
+        else:
+            entries = {key: registry.register(key, source, i) for key, i in first.items()}
+            instances = [entries[key] for key in hashes]
+        return MeshDuplicates(hashes, canonical, groups, instances)
+
+    def export_glb(self, file, options=None, **kwargs):
+        """Write the scene as a binary glTF 2.0 (.glb) file
+
+        See ufbx.gltf.export_glb() for what is exported.
+
+        Args:
+            file: Output path or binary file object
+            options: Optional ufbx.gltf.ExportOptions
+            **kwargs: ExportOptions fields, overriding those in `options`
+
+        Returns:
+            Size of the written GLB in bytes
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        from ufbx.gltf import export_glb
+        return export_glb(self, file, options, **kwargs)
+
+    def to_shared_memory(self):
+        """Copy mesh attributes and the node table into one shared memory segment
+
+        Packs every array attribute of every mesh (positions, normals, UVs,
+        tangents, bitangents, colors, indices, face materials) and node_table()
+        into a single multiprocessing.shared_memory block, 64-byte aligned.
+
+        Returns:
+            SharedSceneHandle: picklable; workers call handle.open() for zero-copy
+            views instead of reloading the file or receiving pickled arrays
+        """
+        if self._closed:
+            raise RuntimeError("Scene is closed")
+        cdef dict arrays = {}
+        for i, mesh in enumerate(self.meshes):
+            for attribute in _SHARED_MESH_ATTRIBUTES:
+                arr = getattr(mesh, attribute)
+                if arr is not None:
+                    arrays[f"mesh{i}.{attribute}"] = arr
+        table = self.node_table()
+        for name in NodeTable.__slots__:
+            arrays["node_table." + name] = getattr(table, name)
+
+        cdef dict layout = {}
+        cdef size_t offset = 0
+        for key, arr in arrays.items():
+            offset = (offset + 63) & ~(<size_t>63)
+            layout[key] = (arr.dtype.str, arr.shape, offset)
+            offset += arr.nbytes
+        shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for key, arr in arrays.items():
+                dtype, shape, start = layout[key]
+                np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)[...] = arr
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return SharedSceneHandle(shm.name, shm.size, layout,
+                                 [mesh.name for mesh in self.meshes],
+                                 [node.name for node in self.nodes], shm)
+
+    cdef uint32_t _resolve_node_id(self, node) except? 0xffffffff:
+        """Internal: Node or node name -> index into Scene.nodes"""
+        cdef ufbx_node* ptr
+        if isinstance(node, Node):
+            if (<Node>node)._scene is not self:
+                raise ValueError("Node belongs to a different scene")
+            return (<Node>node)._node.typed_id
+        if isinstance(node, str):
+            ptr = ufbx_find_node(self._scene, node.encode('utf-8'))
+            if ptr == NULL:
+                raise KeyError(f"Node not found: {node}")
+            return ptr.typed_id
+        raise TypeError(f"include expects Node or str, not {type(node).__name__}")
+
     def find_node(self, name):
         """Find a node by name. Returns None if not found."""
         if self._closed:
@@ -1947,208 +4635,98 @@ cdef class Scene:
         """Get all lights in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_lights(self._scene)
-        return [self._get_light(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_LIGHT])
 
     @property
     def cameras(self):
         """Get all cameras in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_cameras(self._scene)
-        return [self._get_camera(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_CAMERA])
 
     @property
     def bones(self):
         """Get all bones in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_bones(self._scene)
-        return [self._get_bone(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_BONE])
 
     @property
     def empties(self):
         """Get all empty nodes in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = self._scene.empties.count
-        cdef list result = []
-        cdef size_t i
-        for i in range(count):
-            result.append(Empty._create(self, self._scene.empties.data[i]))
-        return result
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_EMPTY])
 
     @property
     def unknowns(self):
         """Get all unknown elements in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = self._scene.unknowns.count
-        cdef list result = []
-        cdef size_t i
-        for i in range(count):
-            result.append(Unknown._create(self, self._scene.unknowns.data[i]))
-        return result
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_UNKNOWN])
 
     @property
     def textures(self):
         """Get all textures in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_textures(self._scene)
-        return [self._get_texture(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_TEXTURE])
 
     @property
     def anim_stacks(self):
         """Get all animation stacks in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_anim_stacks(self._scene)
-        return [self._get_anim_stack(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_ANIM_STACK])
 
     @property
     def anim_curves(self):
         """Get all animation curves in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_anim_curves(self._scene)
-        return [self._get_anim_curve(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_ANIM_CURVE])
 
     @property
     def skin_deformers(self):
         """Get all skin deformers in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_skin_deformers(self._scene)
-        return [self._get_skin_deformer(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_SKIN_DEFORMER])
 
     @property
     def blend_deformers(self):
         """Get all blend deformers in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_blend_deformers(self._scene)
-        return [self._get_blend_deformer(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_BLEND_DEFORMER])
 
     @property
     def blend_shapes(self):
         """Get all blend shapes in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_blend_shapes(self._scene)
-        return [self._get_blend_shape(i) for i in range(count)]
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_BLEND_SHAPE])
 
     @property
     def constraints(self):
         """Get all constraints in the scene"""
         if self._closed:
             raise RuntimeError("Scene is closed")
-        cdef size_t count = ufbx_wrapper_scene_get_num_constraints(self._scene)
-        return [self._get_constraint(i) for i in range(count)]
-
-    cdef Node _get_node(self, size_t index):
-        """Internal: get node by index"""
-        cdef ufbx_node* node = ufbx_wrapper_scene_get_node(self._scene, index)
-        if node != NULL:
-            return Node._create(self, node)
-        return None
-
-    cdef Mesh _get_mesh(self, size_t index):
-        """Internal: get mesh by index"""
-        cdef ufbx_mesh* mesh = ufbx_wrapper_scene_get_mesh(self._scene, index)
-        if mesh != NULL:
-            return Mesh._create(self, mesh)
-        return None
-
-    cdef Material _get_material(self, size_t index):
-        """Internal: get material by index"""
-        cdef ufbx_material* material = ufbx_wrapper_scene_get_material(self._scene, index)
-        if material != NULL:
-            return Material._create(self, material)
-        return None
-
-    cdef Light _get_light(self, size_t index):
-        """Internal: get light by index"""
-        cdef ufbx_light* light = ufbx_wrapper_scene_get_light(self._scene, index)
-        if light != NULL:
-            return Light._create(self, light)
-        return None
-
-    cdef Camera _get_camera(self, size_t index):
-        """Internal: get camera by index"""
-        cdef ufbx_camera* camera = ufbx_wrapper_scene_get_camera(self._scene, index)
-        if camera != NULL:
-            return Camera._create(self, camera)
-        return None
-
-    cdef Bone _get_bone(self, size_t index):
-        """Internal: get bone by index"""
-        cdef ufbx_bone* bone = ufbx_wrapper_scene_get_bone(self._scene, index)
-        if bone != NULL:
-            return Bone._create(self, bone)
-        return None
-
-    cdef Texture _get_texture(self, size_t index):
-        """Internal: get texture by index"""
-        cdef ufbx_texture* texture = ufbx_wrapper_scene_get_texture(self._scene, index)
-        if texture != NULL:
-            return Texture._create(self, texture)
-        return None
-
-    cdef AnimStack _get_anim_stack(self, size_t index):
-        """Internal: get animation stack by index"""
-        cdef ufbx_anim_stack* anim_stack = ufbx_wrapper_scene_get_anim_stack(self._scene, index)
-        if anim_stack != NULL:
-            return AnimStack._create(self, anim_stack)
-        return None
-
-    cdef AnimCurve _get_anim_curve(self, size_t index):
-        """Internal: get animation curve by index"""
-        cdef ufbx_anim_curve* anim_curve = ufbx_wrapper_scene_get_anim_curve(self._scene, index)
-        if anim_curve != NULL:
-            return AnimCurve._create(self, anim_curve)
-        return None
-
-    cdef SkinDeformer _get_skin_deformer(self, size_t index):
-        """Internal: get skin deformer by index"""
-        cdef ufbx_skin_deformer* skin_deformer = ufbx_wrapper_scene_get_skin_deformer(self._scene, index)
-        if skin_deformer != NULL:
-            return SkinDeformer._create(self, skin_deformer)
-        return None
-
-    cdef BlendDeformer _get_blend_deformer(self, size_t index):
-        """Internal: get blend deformer by index"""
-        cdef ufbx_blend_deformer* blend_deformer = ufbx_wrapper_scene_get_blend_deformer(self._scene, index)
-        if blend_deformer != NULL:
-            return BlendDeformer._create(self, blend_deformer)
-        return None
-
-    cdef BlendShape _get_blend_shape(self, size_t index):
-        """Internal: get blend shape by index"""
-        cdef ufbx_blend_shape* blend_shape = ufbx_wrapper_scene_get_blend_shape(self._scene, index)
-        if blend_shape != NULL:
-            return BlendShape._create(self, blend_shape)
-        return None
-
-    cdef Constraint _get_constraint(self, size_t index):
-        """Internal: get constraint by index"""
-        cdef ufbx_constraint* constraint = ufbx_wrapper_scene_get_constraint(self._scene, index)
-        if constraint != NULL:
-            return Constraint._create(self, constraint)
-        return None
+        return ElementList._create(self, self._scene.elements_by_type[UFBX_ELEMENT_CONSTRAINT])
 
 
 cdef class Node(Element):
     """Scene node with transform and hierarchy"""
-    cdef Scene _scene
     cdef ufbx_node* _node
 
     @staticmethod
     cdef Node _create(Scene scene, ufbx_node* node):
         """Internal factory method"""
-        cdef Node obj = Node.__new__(Node)
-        obj._scene = scene
-        obj._node = node
+        cdef Node obj = <Node>scene._cached_element(<ufbx_element*>node)
+        if obj is None:
+            obj = Node.__new__(Node)
+            obj._node = node
+            scene._cache_element(obj, <ufbx_element*>node)
         return obj
 
     @property
@@ -2222,6 +4800,13 @@ cdef class Node(Element):
             return Bone._create(self._scene, bone)
         return None
 
+    @property
+    def dom_node(self):
+        """Raw FBX document node (None unless loaded with retain_dom=True)"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return DomNode._create(self._scene, ufbx_wrapper_node_get_dom_node(self._node))
+
     @property
     def is_root(self):
         """Is this the root node"""
@@ -2238,6 +4823,14 @@ cdef class Node(Element):
         ufbx_wrapper_node_get_world_transform(self._node, <double*>matrix.data)
         return matrix
 
+    @property
+    def world_bounds(self):
+        """World-space [min, max] (2, 3) bounding box of the node's mesh, or None"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        bounds = self._scene._bounds_arrays()[1][self._element.typed_id]
+        return None if np.isnan(bounds[0, 0]) else bounds
+
     @property
     def local_transform(self):
         """Local transform matrix (4x4, column-major)"""
@@ -2317,15 +4910,16 @@ cdef class Node(Element):
 
 cdef class Mesh(Element):
     """Polygonal mesh geometry"""
-    cdef Scene _scene
     cdef ufbx_mesh* _mesh
 
     @staticmethod
     cdef Mesh _create(Scene scene, ufbx_mesh* mesh):
         """Internal factory method"""
-        cdef Mesh obj = Mesh.__new__(Mesh)
-        obj._scene = scene
-        obj._mesh = mesh
+        cdef Mesh obj = <Mesh>scene._cached_element(<ufbx_element*>mesh)
+        if obj is None:
+            obj = Mesh.__new__(Mesh)
+            obj._mesh = mesh
+            scene._cache_element(obj, <ufbx_element*>mesh)
         return obj
 
     @property
@@ -2335,6 +4929,13 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
         return ufbx_wrapper_mesh_get_name(self._mesh).decode('utf-8', errors='replace')
 
+    @property
+    def dom_node(self):
+        """Raw FBX document node (None unless loaded with retain_dom=True)"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        return DomNode._create(self._scene, ufbx_wrapper_mesh_get_dom_node(self._mesh))
+
     @property
     def num_vertices(self):
         """Number of vertices"""
@@ -2363,6 +4964,14 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
         return ufbx_wrapper_mesh_get_num_triangles(self._mesh)
 
+    @property
+    def bounds(self):
+        """Mesh-space [min, max] (2, 3) bounding box of the vertices, or None if empty"""
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        bounds = self._scene._bounds_arrays()[0][self._element.typed_id]
+        return None if np.isnan(bounds[0, 0]) else bounds
+
     @property
     def vertex_positions(self):
         """Vertex positions as numpy array (N, 3)"""
@@ -2370,16 +4979,15 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
 
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_positions(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_positions(self._mesh, &count)
 
         if data == NULL or count == 0:
             return None
 
-        # Create numpy array view (no copy) - valid while scene lives
         cdef np.npy_intp shape[2]
         shape[0] = <np.npy_intp>count
         shape[1] = 3
-        return np.PyArray_SimpleNewFromData(2, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 2, shape, np.NPY_FLOAT64, data)
 
     @property
     def vertex_normals(self):
@@ -2388,7 +4996,7 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
 
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_normals(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_normals(self._mesh, &count)
 
         if data == NULL or count == 0:
             return None
@@ -2396,7 +5004,7 @@ cdef class Mesh(Element):
         cdef np.npy_intp shape[2]
         shape[0] = <np.npy_intp>count
         shape[1] = 3
-        return np.PyArray_SimpleNewFromData(2, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 2, shape, np.NPY_FLOAT64, data)
 
     @property
     def vertex_uvs(self):
@@ -2405,7 +5013,7 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
 
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_uvs(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_uvs(self._mesh, &count)
 
         if data == NULL or count == 0:
             return None
@@ -2413,7 +5021,7 @@ cdef class Mesh(Element):
         cdef np.npy_intp shape[2]
         shape[0] = <np.npy_intp>count
         shape[1] = 2
-        return np.PyArray_SimpleNewFromData(2, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 2, shape, np.NPY_FLOAT64, data)
 
     @property
     def vertex_tangent(self):
@@ -2422,7 +5030,7 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
 
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_tangents(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_tangents(self._mesh, &count)
 
         if data == NULL or count == 0:
             return None
@@ -2430,7 +5038,7 @@ cdef class Mesh(Element):
         cdef np.npy_intp shape[2]
         shape[0] = <np.npy_intp>count
         shape[1] = 3
-        return np.PyArray_SimpleNewFromData(2, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 2, shape, np.NPY_FLOAT64, data)
 
     @property
     def vertex_bitangent(self):
@@ -2439,7 +5047,7 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
 
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_bitangents(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_bitangents(self._mesh, &count)
 
         if data == NULL or count == 0:
             return None
@@ -2447,7 +5055,7 @@ cdef class Mesh(Element):
         cdef np.npy_intp shape[2]
         shape[0] = <np.npy_intp>count
         shape[1] = 3
-        return np.PyArray_SimpleNewFromData(2, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 2, shape, np.NPY_FLOAT64, data)
 
     @property
     def vertex_color(self):
@@ -2456,7 +5064,7 @@ cdef class Mesh(Element):
             raise RuntimeError("Scene is closed")
 
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_colors(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_colors(self._mesh, &count)
 
         if data == NULL or count == 0:
             return None
@@ -2464,7 +5072,7 @@ cdef class Mesh(Element):
         cdef np.npy_intp shape[2]
         shape[0] = <np.npy_intp>count
         shape[1] = 4
-        return np.PyArray_SimpleNewFromData(2, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 2, shape, np.NPY_FLOAT64, data)
 
     @property
     def indices(self):
@@ -2480,7 +5088,7 @@ cdef class Mesh(Element):
 
         cdef np.npy_intp shape[1]
         shape[0] = <np.npy_intp>count
-        return np.PyArray_SimpleNewFromData(1, shape, np.NPY_UINT32, <void*>data)
+        return _attribute_view(self._scene, 1, shape, np.NPY_UINT32, data)
 
     @property
     def materials(self):
@@ -2520,7 +5128,7 @@ cdef class Mesh(Element):
             return None
         cdef np.npy_intp shape[1]
         shape[0] = <np.npy_intp>count
-        return np.PyArray_SimpleNewFromData(1, shape, np.NPY_UINT32, <void*>data)
+        return _attribute_view(self._scene, 1, shape, np.NPY_UINT32, data)
 
     @property
     def skin_deformers(self):
@@ -2561,7 +5169,7 @@ cdef class Mesh(Element):
             return None
         cdef np.npy_intp shape[1]
         shape[0] = <np.npy_intp>count
-        return np.PyArray_SimpleNewFromData(1, shape, np.NPY_FLOAT64, <void*>data)
+        return _attribute_view(self._scene, 1, shape, np.NPY_FLOAT64, data)
 
     @property
     def vertex_crease(self):
@@ -2569,12 +5177,127 @@ cdef class Mesh(Element):
         if self._scene._closed:
             raise RuntimeError("Scene is closed")
         cdef size_t count = 0
-        cdef const float* data = ufbx_wrapper_mesh_get_vertex_crease(self._mesh, &count)
+        cdef const double* data = ufbx_wrapper_mesh_get_vertex_crease(self._mesh, &count)
         if data == NULL or count == 0:
             return None
         cdef np.npy_intp shape[1]
         shape[0] = <np.npy_intp>count
-        return np.PyArray_SimpleNewFromData(1, shape, np.NPY_FLOAT32, <void*>data)
+        return _attribute_view(self._scene, 1, shape, np.NPY_FLOAT64, data)
+
+    def triangulate(self, optimize=None, cache_size=16):
+        """Triangulate faces into per-material index buffers, optionally GPU-optimized
+
+        Triangles are grouped by material part in Mesh.materials order. Optimizations,
+        all run in C with the GIL released:
+
+        - "vertex_cache": reorder triangles within each part for a post-transform
+          vertex cache of cache_size entries (Tipsify)
+        - "overdraw": vertex cache order split into clusters, sorted so outward-facing
+          clusters draw first (Tipsify's view-independent overdraw ordering)
+        - "fetch": renumber vertices in order of first use; gather vertex data with
+          Triangulation.vertex_order
+
+        Args:
+            optimize: None, one of the names above or an iterable of them
+            cache_size: Vertex cache size the reordering targets, 3 to 1024
+
+        Returns:
+            Triangulation
+        """
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        if optimize is None:
+            names = ()
+        elif isinstance(optimize, str):
+            names = (optimize,)
+        else:
+            names = tuple(optimize)
+        cdef uint32_t flags = 0
+        for name in names:
+            if name not in _TRIANGULATE_OPTIMIZE:
+                raise ValueError(f"Unknown optimization: {name!r} (expected one of {', '.join(_TRIANGULATE_OPTIMIZE)})")
+            flags |= _TRIANGULATE_OPTIMIZE[name]
+        # Bounded so the Tipsify timestamps (uint32) cannot wrap
+        if not 3 <= cache_size <= 1024:
+            raise ValueError(f"cache_size must be between 3 and 1024, got {cache_size!r}")
+
+        cdef size_t num_triangles = ufbx_wrapper_mesh_get_num_triangles(self._mesh)
+        cdef size_t num_vertices = ufbx_wrapper_mesh_get_num_vertices(self._mesh)
+        cdef np.ndarray corners = np.empty((num_triangles, 3), dtype=np.uint32)
+        cdef np.ndarray indices = np.empty((num_triangles, 3), dtype=np.uint32)
+        cdef np.ndarray part_offsets = np.zeros(ufbx_wrapper_mesh_get_num_parts(self._mesh) + 1, dtype=np.uintp)
+        cdef np.ndarray vertex_order = None
+        cdef uint32_t* order_data = NULL
+        if flags & UFBX_WRAPPER_OPTIMIZE_FETCH:
+            vertex_order = np.empty(num_vertices, dtype=np.uint32)
+            order_data = <uint32_t*>vertex_order.data
+        cdef uint32_t c_cache_size = cache_size
+        cdef bint ok
+        with nogil:
+            ok = ufbx_wrapper_mesh_triangulate(self._mesh, flags, c_cache_size, <uint32_t*>corners.data,
+                                               <uint32_t*>indices.data, <size_t*>part_offsets.data, order_data)
+        if not ok:
+            raise UfbxOutOfMemoryError("Failed to allocate triangulation buffers")
+        return Triangulation(corners, indices, part_offsets.astype(np.int64), vertex_order, names)
+
+    def build_meshlets(self, max_vertices=64, max_triangles=124, cone_weight=0.0):
+        """Split the triangulated mesh into meshlets for mesh shader style renderers
+
+        Meshlets are grown greedily in C with the GIL released, adding the adjacent
+        triangle that needs the fewest new vertices and stays closest to the meshlet
+        (and, by cone_weight, faces the same way). They never span material parts.
+
+        Args:
+            max_vertices: Vertex limit per meshlet (3 to 256)
+            max_triangles: Triangle limit per meshlet
+            cone_weight: 0 to 1, trading spatial compactness for tighter culling cones
+
+        Returns:
+            Meshlets
+        """
+        if self._scene._closed:
+            raise RuntimeError("Scene is closed")
+        if not 3 <= max_vertices <= 256:
+            raise ValueError(f"max_vertices must be between 3 and 256, got {max_vertices!r}")
+        if max_triangles < 1:
+            raise ValueError(f"max_triangles must be positive, got {max_triangles!r}")
+        if not 0.0 <= cone_weight <= 1.0:
+            raise ValueError(f"cone_weight must be between 0 and 1, got {cone_weight!r}")
+
+        cdef size_t num_triangles = ufbx_wrapper_mesh_get_num_triangles(self._mesh)
+        cdef np.ndarray meshlets = np.empty((num_triangles, 4), dtype=np.uint32)
+        cdef np.ndarray vertices = np.empty(num_triangles * 3, dtype=np.uint32)
+        cdef np.ndarray triangles = np.empty((num_triangles, 3), dtype=np.uint8)
+        cdef np.ndarray part_offsets = np.zeros(ufbx_wrapper_mesh_get_num_parts(self._mesh) + 1, dtype=np.uintp)
+        cdef uint32_t c_max_vertices = max_vertices
+        cdef uint32_t c_max_triangles = max_triangles
+        cdef double c_cone_weight = cone_weight
+        cdef size_t count = 0
+        cdef bint ok
+        with nogil:
+            ok = ufbx_wrapper_mesh_build_meshlets(self._mesh, c_max_vertices, c_max_triangles, c_cone_weight,
+                                                  <uint32_t*>meshlets.data, <uint32_t*>vertices.data,
+                                                  <uint8_t*>triangles.data, <size_t*>part_offsets.data, &count)
+        if not ok:
+            raise UfbxOutOfMemoryError("Failed to allocate meshlet buffers")
+
+        # Trim the worst-case buffers
+        meshlets = meshlets[:count].copy()
+        num_vertices = int(meshlets[-1, 0] + meshlets[-1, 2]) if count else 0
+        vertices = vertices[:num_vertices].copy()
+
+        cdef np.ndarray centers = np.empty((count, 3), dtype=np.float64)
+        cdef np.ndarray radii = np.empty(count, dtype=np.float64)
+        cdef np.ndarray cone_apex = np.empty((count, 3), dtype=np.float64)
+        cdef np.ndarray cone_axis = np.empty((count, 3), dtype=np.float64)
+        cdef np.ndarray cone_cutoff = np.empty(count, dtype=np.float64)
+        with nogil:
+            ufbx_wrapper_mesh_meshlet_bounds(self._mesh, <uint32_t*>meshlets.data, count, <uint32_t*>vertices.data,
+                                             <uint8_t*>triangles.data, <double*>centers.data, <double*>radii.data,
+                                             <double*>cone_apex.data, <double*>cone_axis.data,
+                                             <double*>cone_cutoff.data)
+        return Meshlets(meshlets, vertices, triangles, part_offsets.astype(np.int64), centers, radii, cone_apex,
+                        cone_axis, cone_cutoff)
 
 
 cdef class MaterialMap:
@@ -2859,15 +5582,16 @@ cdef class MaterialTexture:
 
 cdef class Material(Element):
     """Material definition (Rust API style - direct struct access)"""
-    cdef Scene _scene
     cdef ufbx_material* _material
 
     @staticmethod
     cdef Material _create(Scene scene, ufbx_material* material):
         """Internal factory method"""
-        cdef Material obj = Material.__new__(Material)
-        obj._scene = scene
-        obj._material = material
+        cdef Material obj = <Material>scene._cached_element(<ufbx_element*>material)
+        if obj is None:
+            obj = Material.__new__(Material)
+            obj._material = material
+            scene._cache_element(obj, <ufbx_element*>material)
         return obj
 
     @property
@@ -3447,12 +6171,89 @@ cdef class Material(Element):
         return MaterialMap._create(self._scene, &self._material.fbx.vector_displacement)
 
 
+# glTF export helpers, used by ufbx/gltf.py
+def _gltf_node_trs(Scene scene):
+    """Internal: (N, 10) local and geometry transforms of Scene.nodes, as in sample_transforms()"""
+    cdef size_t count = ufbx_wrapper_scene_get_num_nodes(scene._scene)
+    cdef np.ndarray[np.float64_t, ndim=2] local = np.empty((count, 10), dtype=np.float64)
+    cdef np.ndarray[np.float64_t, ndim=2] geometry = np.empty((count, 10), dtype=np.float64)
+    with nogil:
+        ufbx_wrapper_scene_fill_node_trs(scene._scene, <double*>local.data, <double*>geometry.data)
+    return local, geometry
+
+
+def _gltf_node_material_ids(Node node):
+    """Internal: index into Scene.materials (or -1) of each material slot of node.mesh"""
+    cdef ufbx_mesh* mesh = ufbx_wrapper_node_get_mesh(node._node)
+    if mesh == NULL:
+        return []
+    return [ufbx_wrapper_node_material_id(node._node, slot)
+            for slot in range(ufbx_wrapper_mesh_get_num_parts(mesh))]
+
+
+def _gltf_mesh_parts(Mesh mesh, SkinDeformer skin=None):
+    """Internal: yield (part index, streams) for each non-empty material part
+
+    streams maps POSITION, NORMAL, TEXCOORD_0, COLOR_0, JOINTS_0, WEIGHTS_0
+    (those present) and indices to float32 / uint16 / uint32 arrays of the
+    deduplicated vertices, allocated per part so only one part is alive at a time.
+    """
+    cdef ufbx_mesh* c_mesh = mesh._mesh
+    cdef const ufbx_skin_deformer* c_skin = skin._skin_deformer if skin is not None else NULL
+    cdef ufbx_wrapper_part_buffers buffers
+    cdef size_t part, corners, num_vertices
+    cdef uint32_t flags = ufbx_wrapper_mesh_get_stream_flags(c_mesh)
+    for part in range(ufbx_wrapper_mesh_get_num_parts(c_mesh)):
+        corners = ufbx_wrapper_mesh_part_get_num_triangles(c_mesh, part) * 3
+        if corners == 0:
+            continue
+        streams = {"POSITION": np.empty((corners, 3), dtype=np.float32)}
+        if flags & UFBX_WRAPPER_STREAM_NORMAL:
+            streams["NORMAL"] = np.empty((corners, 3), dtype=np.float32)
+        if flags & UFBX_WRAPPER_STREAM_UV:
+            streams["TEXCOORD_0"] = np.empty((corners, 2), dtype=np.float32)
+        if flags & UFBX_WRAPPER_STREAM_COLOR:
+            streams["COLOR_0"] = np.empty((corners, 4), dtype=np.float32)
+        if c_skin != NULL:
+            streams["JOINTS_0"] = np.empty((corners, 4), dtype=np.uint16)
+            streams["WEIGHTS_0"] = np.empty((corners, 4), dtype=np.float32)
+        indices = np.empty(corners, dtype=np.uint32)
+
+        buffers.positions = <float*>np.PyArray_DATA(streams["POSITION"])
+        buffers.normals = <float*>np.PyArray_DATA(streams["NORMAL"]) if "NORMAL" in streams else NULL
+        buffers.uvs = <float*>np.PyArray_DATA(streams["TEXCOORD_0"]) if "TEXCOORD_0" in streams else NULL
+        buffers.colors = <float*>np.PyArray_DATA(streams["COLOR_0"]) if "COLOR_0" in streams else NULL
+        buffers.joints = <uint16_t*>np.PyArray_DATA(streams["JOINTS_0"]) if c_skin != NULL else NULL
+        buffers.weights = <float*>np.PyArray_DATA(streams["WEIGHTS_0"]) if c_skin != NULL else NULL
+        buffers.indices = <uint32_t*>np.PyArray_DATA(indices)
+        with nogil:
+            num_vertices = ufbx_wrapper_mesh_part_fill(c_mesh, part, c_skin, &buffers)
+        if num_vertices == 0:
+            raise UfbxOutOfMemoryError("Failed to build mesh part vertex streams")
+
+        streams = {name: arr[:num_vertices] for name, arr in streams.items()}
+        streams["indices"] = indices
+        yield part, streams
+
+
+def _gltf_skin_bind(SkinDeformer skin):
+    """Internal: joint node indices (-1 without a bone) and (C, 16) float32 inverse bind matrices"""
+    cdef size_t count = ufbx_wrapper_skin_deformer_get_num_clusters(skin._skin_deformer)
+    cdef np.ndarray[np.int32_t, ndim=1] joints = np.empty(count, dtype=np.int32)
+    cdef np.ndarray[np.float32_t, ndim=2] inverse_bind = np.empty((count, 16), dtype=np.float32)
+    if count > 0:
+        ufbx_wrapper_skin_fill_bind(skin._skin_deformer, <int32_t*>joints.data, <float*>inverse_bind.data)
+    return joints, inverse_bind
+
+
 # Module-level functions
-def load_file(filename):
+def load_file(filename, options=None, **kwargs):
     """Load FBX file and return Scene object
 
     Args:
         filename: Path to FBX file
+        options: Optional LoadOptions
+        **kwargs: LoadOptions fields, overriding those in `options`
 
     Returns:
         Scene object
@@ -3463,22 +6264,113 @@ def load_file(filename):
     if not os.path.exists(filename):
         raise UfbxFileNotFoundError(f"File not found: {filename}")
 
+    options = _resolve_load_options(options, kwargs)
+    cdef ufbx_wrapper_load_opts opts
+    cdef ufbx_wrapper_load_stats stats
+    cdef ufbx_wrapper_memory_usage usage
+    _fill_load_opts(options, &opts)
+    if options.stats:
+        opts.stats = &stats
+    opts.memory_usage = &usage
+
     cdef char* error_msg = NULL
+    cdef int error_type = 0
     cdef bytes filename_bytes = filename.encode('utf-8')
-    cdef ufbx_scene* scene = ufbx_wrapper_load_file(filename_bytes, &error_msg)
+    cdef ufbx_scene* scene = ufbx_wrapper_load_file_opts(filename_bytes, &opts, &error_msg, &error_type)
 
     if scene == NULL:
         err = error_msg.decode('utf-8') if error_msg != NULL else "Unknown error"
         if error_msg != NULL:
             free(error_msg)
+        if error_type in (UFBX_ERROR_OUT_OF_MEMORY, UFBX_ERROR_MEMORY_LIMIT, UFBX_ERROR_ALLOCATION_LIMIT):
+            raise UfbxOutOfMemoryError(f"Failed to load FBX file: {err}")
         raise UfbxError(f"Failed to load FBX file: {err}")
 
     cdef Scene py_scene = Scene.__new__(Scene)
     py_scene._scene = scene
     py_scene._closed = False
+    # Absolute, so resolve_textures() does not depend on the working directory at call time
+    py_scene._source_dir = os.path.dirname(os.path.abspath(filename))
+    # Peaks are 0 when the allocators could not be tracked
+    py_scene._memory_usage = MemoryUsage(usage.result_bytes, usage.result_allocs, usage.temp_peak_bytes or None,
+                                         usage.temp_allocs, usage.peak_bytes or None)
+    if opts.stats != NULL:
+        py_scene._load_stats = LoadStats(
+            stats.total_seconds, stats.read_seconds, stats.parse_seconds, stats.finalize_seconds,
+            stats.bytes_read, stats.bytes_inflated, stats.num_allocs, stats.num_frees,
+            stats.peak_heap_bytes or None, stats.result_heap_bytes)
     return py_scene
 
 
+def scan(path):
+    """Read the metadata, settings and element counts of a file without loading its data
+
+    Geometry, animation and embedded content are skipped, so this is much
+    cheaper than load_file(). The GIL is released while the file is read.
+
+    Args:
+        path: Path to FBX file (str or os.PathLike)
+
+    Returns:
+        ScanResult
+
+    Raises:
+        UfbxFileNotFoundError: If the file does not exist
+        UfbxError: If the file cannot be parsed
+    """
+    cdef bytes filename_bytes = os.fspath(path).encode('utf-8')
+    cdef const char* filename = filename_bytes
+    cdef ufbx_wrapper_scan_result result
+    cdef bint ok
+    with nogil:
+        ok = ufbx_wrapper_scan_file(filename, &result)
+
+    if not ok:
+        err = result.error.decode('utf-8', errors='replace') or "Unknown error"
+        if result.error_type == UFBX_ERROR_FILE_NOT_FOUND:
+            raise UfbxFileNotFoundError(f"File not found: {os.fspath(path)}")
+        if result.error_type in (UFBX_ERROR_OUT_OF_MEMORY, UFBX_ERROR_MEMORY_LIMIT, UFBX_ERROR_ALLOCATION_LIMIT):
+            raise UfbxOutOfMemoryError(f"Failed to scan FBX file: {err}")
+        raise UfbxError(f"Failed to scan FBX file: {err}")
+
+    return ScanResult(
+        path, result.version, result.creator.decode('utf-8', errors='replace'), result.file_format,
+        result.ascii, result.unit_meters, CoordinateAxes(result.axes[0], result.axes[1], result.axes[2]),
+        result.frames_per_second, result.num_nodes, result.num_meshes, result.num_materials,
+        result.num_textures, result.num_lights, result.num_cameras, result.num_anim_stacks)
+
+
+def scan_many(paths, workers=None, return_exceptions=False):
+    """scan() many files on a thread pool
+
+    Args:
+        paths: Iterable of paths
+        workers: Number of threads (default: CPU count)
+        return_exceptions: Put the UfbxError of a failed file in its slot
+            instead of raising it
+
+    Returns:
+        List of ScanResult (or UfbxError) in the order of paths
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(int(workers), len(paths)))
+
+    def scan_one(path):
+        try:
+            return scan(path)
+        except UfbxError as e:
+            if not return_exceptions:
+                raise
+            return e
+
+    if workers == 1:
+        return [scan_one(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan_one, paths))
+
+
 def load_memory(data):
     """Load FBX from memory buffer."""
     if data is None or len(data) == 0:
@@ -0,0 +1,274 @@
+"""
+On-disk scene cache for fast reloads of previously parsed FBX files
+
+ufbx.cache.load() parses an FBX once and stores the flattened triangle mesh,
+node table, material names and baked animation in a versioned binary file.
+Later loads (from any process) mmap that file and return read-only NumPy views,
+falling back to a full parse when the source changed or the format version
+differs.
+
+File layout: MAGIC, uint32 format version, uint32 header size, UTF-8 JSON
+header, then every array at a 64-byte aligned offset listed in the header.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+import numpy as np
+
+from ._ufbx import FlattenedGeometry, LoadOptions, NodeTable, load_file
+
+FORMAT_VERSION = 2
+MAGIC = b"UFBXCACH"
+_PREFIX = struct.Struct("<8sII")
+_ALIGN = 64
+
+
+class BakedAnimation:
+    """Animation stack sampled at a fixed rate
+
+    times: (F,) float64 sample times in seconds
+    transforms: (F, N, 10) float64 local transforms per Scene.nodes entry, see
+        AnimStack.sample_transforms()
+    """
+
+    __slots__ = ("name", "times", "transforms")
+
+    def __init__(self, name, times, transforms):
+        self.name = name
+        self.times = times
+        self.transforms = transforms
+
+    def __repr__(self) -> str:
+        return f"BakedAnimation({self.name!r}, frames={len(self.times)})"
+
+
+class CachedScene:
+    """Scene data returned by ufbx.cache.load()
+
+    geometry: FlattenedGeometry in world space, triangulated
+    node_table: NodeTable of all nodes
+    node_names, material_names: names for node_ids / material_ids
+    animations: list of BakedAnimation, one per animation stack
+    cache_path: path of the backing cache file
+    from_cache: True if the source was not parsed
+    """
+
+    __slots__ = ("geometry", "node_table", "node_names", "material_names", "animations",
+                 "cache_path", "from_cache", "_mmap")
+
+    def __init__(self, geometry, node_table, node_names, material_names, animations,
+                 cache_path=None, from_cache=False, _mmap=None):
+        self.geometry = geometry
+        self.node_table = node_table
+        self.node_names = node_names
+        self.material_names = material_names
+        self.animations = animations
+        self.cache_path = cache_path
+        self.from_cache = from_cache
+        self._mmap = _mmap
+
+    def __repr__(self) -> str:
+        return (f"CachedScene(nodes={len(self.node_names)}, triangles={len(self.geometry.indices)}, "
+                f"animations={len(self.animations)}, from_cache={self.from_cache})")
+
+
+def cache_path_for(path, cache_dir):
+    """Cache file used for the FBX file at path"""
+    key = hashlib.sha256(os.path.realpath(path).encode("utf-8", "surrogateescape")).hexdigest()
+    return os.path.join(cache_dir, key[:32] + ".ufbxc")
+
+
+def load(path, cache_dir, fps=30.0, **kwargs):
+    """Load an FBX file through the on-disk cache
+
+    The cache entry is valid while the source size and mtime match; if only the
+    mtime changed the source is re-hashed and, when the content is identical, the
+    entry is kept and rewritten with the new mtime. Otherwise (or on a format version, fps or load option mismatch, or
+    a damaged cache file) the FBX is parsed with load_file(path, **kwargs) and the entry is
+    rewritten atomically.
+
+    Args:
+        path: FBX file
+        cache_dir: Directory for cache files (created if missing)
+        fps: Sampling rate for baked animation
+        **kwargs: Options passed to load_file() on a cache miss
+
+    Returns:
+        CachedScene with read-only arrays backed by the mmap'd cache file
+    """
+    path = os.fspath(path)
+    options = repr(LoadOptions(**kwargs))
+    cache_path = cache_path_for(path, cache_dir)
+    st = os.stat(path)
+
+    cached = _open(cache_path)
+    if cached is not None:
+        header, buf = cached
+        source = header["source"]
+        valid = (header["fps"] == fps and header["load_options"] == options
+                 and source["size"] == st.st_size)
+        if valid and source["mtime_ns"] != st.st_mtime_ns:
+            valid = source["sha256"] == _hash_file(path)
+            if valid:
+                # Same content: record the new mtime so later loads skip the hash
+                header, buf = _refresh(cache_path, header, buf, st.st_mtime_ns)
+        if valid:
+            return _from_header(header, buf, cache_path, True)
+        buf.close()
+
+    with load_file(path, **kwargs) as scene:
+        arrays, header = extract(scene, fps)
+    header["load_options"] = options
+    header["source"] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _hash_file(path)}
+    os.makedirs(cache_dir, exist_ok=True)
+    _write(cache_path, header, arrays)
+
+    header, buf = _open(cache_path)
+    return _from_header(header, buf, cache_path, False)
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract(scene, fps=30.0):
+    """Arrays and header fields stored for a parsed scene
+
+    Shared by the cache files and `python -m ufbx convert`. Returns (arrays,
+    header): arrays maps names to NumPy arrays (the world-space triangle mesh of
+    Scene.flatten_geometry(triangulate=True), node_* NodeTable fields and
+    anim{i}_times / anim{i}_transforms baked at fps), header holds fps,
+    node_names, material_names and animations.
+    """
+    geometry = scene.flatten_geometry(triangulate=True, world_space=True)
+    table = scene.node_table()
+    arrays = {
+        "positions": geometry.positions,
+        "indices": geometry.indices,
+        "node_ids": geometry.node_ids,
+        "material_ids": geometry.material_ids,
+    }
+    for name in NodeTable.__slots__:
+        arrays["node_" + name] = getattr(table, name)
+
+    animations = []
+    for i, stack in enumerate(scene.anim_stacks):
+        count = max(int(round((stack.time_end - stack.time_begin) * fps)), 0) + 1
+        times = stack.time_begin + np.arange(count, dtype=np.float64) / fps
+        arrays[f"anim{i}_times"] = times
+        arrays[f"anim{i}_transforms"] = stack.sample_transforms(times)
+        animations.append(stack.name)
+
+    header = {
+        "fps": fps,
+        "node_names": [node.name for node in scene.nodes],
+        "material_names": [material.name for material in scene.materials],
+        "animations": animations,
+    }
+    return arrays, header
+
+
+def _write(cache_path, header, arrays):
+    """Internal: write a cache file atomically"""
+    layout = {}
+    offset = 0
+    for name, arr in arrays.items():
+        offset = -(-offset // _ALIGN) * _ALIGN
+        layout[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+        offset += arr.nbytes
+    header = dict(header, arrays=layout)
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    data_start = -(-(_PREFIX.size + len(header_bytes)) // _ALIGN) * _ALIGN
+
+    tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+            f.write(header_bytes)
+            for name, arr in arrays.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(arr).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _open(cache_path):
+    """Internal: (header, mmap) of a cache file, or None if missing or unusable"""
+    try:
+        with open(cache_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        magic, version, header_size = _PREFIX.unpack_from(buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError("cache format mismatch")
+        header = json.loads(buf[_PREFIX.size:_PREFIX.size + header_size])
+        header["data_start"] = -(-(_PREFIX.size + header_size) // _ALIGN) * _ALIGN
+        end = max((spec["offset"] + np.dtype(spec["dtype"]).itemsize * int(np.prod(spec["shape"]))
+                   for spec in header["arrays"].values()), default=0)
+        if header["data_start"] + end > len(buf):
+            raise ValueError("truncated cache file")
+    except (struct.error, ValueError, KeyError):
+        buf.close()
+        return None
+    return header, buf
+
+
+def _refresh(cache_path, header, buf, mtime_ns):
+    """Internal: rewrite an entry with a new source mtime, (header, mmap) to serve from"""
+    arrays = _views(header, buf)
+    updated = {key: value for key, value in header.items() if key not in ("arrays", "data_start")}
+    updated["source"] = dict(header["source"], mtime_ns=mtime_ns)
+    try:
+        _write(cache_path, updated, arrays)
+    except OSError:
+        # Unwritable cache dir: keep serving the existing entry
+        return header, buf
+    del arrays
+    reopened = _open(cache_path)
+    if reopened is None:
+        return header, buf
+    buf.close()
+    return reopened
+
+
+def _views(header, buf):
+    """Internal: read-only array views into buf, keyed by name"""
+    start = header["data_start"]
+    arrays = {}
+    for name, spec in header["arrays"].items():
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        if count == 0:
+            arr = np.empty(spec["shape"], dtype=dtype)
+            arr.flags.writeable = False
+        else:
+            arr = np.frombuffer(buf, dtype=dtype, count=count,
+                                offset=start + spec["offset"]).reshape(spec["shape"])
+        arrays[name] = arr
+    return arrays
+
+
+def _from_header(header, buf, cache_path, from_cache):
+    """Internal: CachedScene of read-only views into buf"""
+    arrays = _views(header, buf)
+    geometry = FlattenedGeometry(arrays["positions"], arrays["indices"],
+                                 arrays["node_ids"], arrays["material_ids"])
+    node_table = NodeTable(*(arrays["node_" + name] for name in NodeTable.__slots__))
+    animations = [BakedAnimation(name, arrays[f"anim{i}_times"], arrays[f"anim{i}_transforms"])
+                  for i, name in enumerate(header["animations"])]
+    return CachedScene(geometry, node_table, header["node_names"], header["material_names"],
+                       animations, cache_path, from_cache, buf)
@@ -0,0 +1,336 @@
+"""
+Batch command line tools, run as `python -m ufbx`
+
+    python -m ufbx convert assets/ -o out/ --workers 16 --max-memory 2048
+    python -m ufbx stats model.fbx other.fbx
+    python -m ufbx extract-textures assets/ -o textures/
+
+Every command accepts files and directories (searched recursively for *.fbx)
+and processes them on a pool of spawned worker processes. A file that fails
+is reported and skipped; the exit code is 1 if any file failed.
+
+convert writes one .npz per input (see NPZ_VERSION for the layout) and
+appends a line per finished file to a JSON lines manifest, so an interrupted
+run resumes where it stopped.
+"""
+
+import argparse
+import collections
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from . import cache
+from ._ufbx import LoadOptions, load_file
+
+# Layout of converted .npz files:
+#   version: scalar, NPZ_VERSION
+#   positions (P, 3), indices (T, 3) uint32, node_ids, material_ids: world-space
+#       triangles as in Scene.flatten_geometry(triangulate=True)
+#   node_parent, node_depth, node_attrib_type, node_world, node_local,
+#       node_geometry: NodeTable fields
+#   node_names, material_names, anim_names: str arrays
+#   anim{i}_times (F,), anim{i}_transforms (F, N, 10): AnimStack i baked at --fps
+# Floating point arrays are stored as float32 unless --double is given.
+NPZ_VERSION = 1
+
+
+def _collect_inputs(paths):
+    """Internal: (path, output stem) of every FBX file in paths, directories searched recursively
+
+    Files map to their basename and directory contents to their path relative to
+    the directory. Distinct inputs that would share a stem (a/model.fbx and
+    b/model.fbx, or the same relative path under two directories) get a short
+    hash of their absolute path appended, so no output is written twice.
+    """
+    inputs = {}
+    for path in paths:
+        if not os.path.isdir(path):
+            inputs.setdefault(os.path.abspath(path), (path, os.path.splitext(os.path.basename(path))[0]))
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                if name.lower().endswith(".fbx"):
+                    full = os.path.join(root, name)
+                    inputs.setdefault(os.path.abspath(full), (full, os.path.splitext(os.path.relpath(full, path))[0]))
+
+    # Compare case-insensitively, output directories may be on a case-insensitive file system
+    counts = {}
+    for _, stem in inputs.values():
+        counts[stem.lower()] = counts.get(stem.lower(), 0) + 1
+    result = []
+    for key, (path, stem) in inputs.items():
+        if counts[stem.lower()] > 1:
+            stem = f"{stem}-{hashlib.sha256(key.encode('utf-8', 'surrogateescape')).hexdigest()[:8]}"
+        result.append((path, stem))
+    return result
+
+
+def _load_options(args):
+    """Internal: load_file keyword arguments for the memory budget options (MiB)"""
+    kwargs = {}
+    if args.max_memory:
+        kwargs["max_memory"] = args.max_memory << 20
+    if args.max_temp_memory:
+        kwargs["max_temp_memory"] = args.max_temp_memory << 20
+    LoadOptions(**kwargs)  # Validate in the parent, before any worker starts
+    return kwargs
+
+
+def _run_tasks(fn, tasks, workers):
+    """Internal: yield fn(task) for every task, in completion order
+
+    Workers are spawned rather than forked so they do not inherit the parent's
+    threads or heap; with one worker the tasks run in this process. A worker
+    that dies (a crash in native code, or killed for memory) breaks the pool:
+    the tasks that were in flight are rerun one per fresh process, a task whose
+    process dies again is reported as a failed record for its input (task[0]),
+    and the remaining tasks continue on a new pool.
+    """
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield fn(task)
+        return
+    context = multiprocessing.get_context("spawn")
+    pending = collections.deque(tasks)
+    while pending:
+        suspects = []
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            running = {}
+            while (pending or running) and not suspects:
+                # Keep a bounded number of tasks in flight, so a broken pool loses few
+                while pending and len(running) < workers * 2:
+                    task = pending.popleft()
+                    running[pool.submit(fn, task)] = task
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                    done, _ = wait(running)
+                for future in done:
+                    task = running.pop(future)
+                    if isinstance(future.exception(), BrokenProcessPool):
+                        suspects.append(task)
+                    else:
+                        yield future.result()
+        for task in suspects:
+            yield _run_alone(fn, task, context)
+
+
+def _run_alone(fn, task, context):
+    """Internal: fn(task) in a fresh worker process, or a failed record if it dies"""
+    start = time.perf_counter()
+    with ProcessPoolExecutor(1, mp_context=context) as pool:
+        try:
+            return pool.submit(fn, task).result()
+        except BrokenProcessPool:
+            return {"status": "error", "error": "Worker process died", "input": task[0],
+                    "seconds": round(time.perf_counter() - start, 6)}
+
+
+def _guard(fn, path, *args):
+    """Internal: fn(path, *args) as a result record, catching any per-file failure"""
+    start = time.perf_counter()
+    try:
+        record = fn(path, *args)
+        record["status"] = "ok"
+    except Exception as e:  # Reported per file, a batch never stops on one input
+        record = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    record["input"] = path
+    record["seconds"] = round(time.perf_counter() - start, 6)
+    return record
+
+
+# convert
+
+def _convert_file(path, output, fps, double, kwargs):
+    with load_file(path, **kwargs) as scene:
+        arrays, header = cache.extract(scene, fps)
+    if not double:
+        for name, arr in arrays.items():
+            if arr.dtype == np.float64:
+                arrays[name] = arr.astype(np.float32)
+    arrays["version"] = np.array(NPZ_VERSION, dtype=np.uint32)
+    arrays["node_names"] = np.array(header["node_names"], dtype=str)
+    arrays["material_names"] = np.array(header["material_names"], dtype=str)
+    arrays["anim_names"] = np.array(header["animations"], dtype=str)
+
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    tmp_path = f"{output}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp_path, output)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return {"output": output, "triangles": len(arrays["indices"]), "bytes": os.path.getsize(output)}
+
+
+def _convert_task(task):
+    return _guard(_convert_file, *task)
+
+
+def _source_key(path):
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _read_manifest(path):
+    """Internal: latest manifest record per input path"""
+    done = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:  # Line cut short by an interrupted run
+                    continue
+                done[record["input"]] = record
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def cmd_convert(args):
+    kwargs = _load_options(args)
+    manifest_path = args.manifest or os.path.join(args.output, "manifest.jsonl")
+    done = {} if args.force else _read_manifest(manifest_path)
+
+    tasks, sources = [], {}
+    skipped = 0
+    for path, stem in _collect_inputs(args.inputs):
+        # Absolute paths keep the manifest valid when resuming from another directory
+        path = os.path.abspath(path)
+        output = os.path.abspath(os.path.join(args.output, stem + ".npz"))
+        try:
+            source = _source_key(path)
+        except OSError:
+            source = None
+        previous = done.get(path)
+        if (source is not None and previous is not None and previous["status"] == "ok"
+                and previous.get("source") == source and previous["output"] == output
+                and os.path.exists(output)):
+            skipped += 1
+            continue
+        sources[path] = source
+        tasks.append((path, output, args.fps, args.double, kwargs))
+
+    failed = 0
+    os.makedirs(os.path.dirname(manifest_path) or ".", exist_ok=True)
+    with open(manifest_path, "a", encoding="utf-8") as manifest:
+        for record in _run_tasks(_convert_task, tasks, args.workers):
+            record["source"] = sources[record["input"]]
+            manifest.write(json.dumps(record, sort_keys=True) + "\n")
+            manifest.flush()
+            if record["status"] != "ok":
+                failed += 1
+                print(f"{record['input']}: {record['error']}", file=sys.stderr)
+
+    print(f"converted {len(tasks) - failed}, skipped {skipped}, failed {failed}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+# stats
+
+def _stats_file(path, kwargs):
+    with load_file(path, **kwargs) as scene:
+        return {
+            "version": scene.metadata.version,
+            "creator": scene.metadata.creator,
+            "nodes": len(scene.nodes),
+            "meshes": len(scene.meshes),
+            "materials": len(scene.materials),
+            "textures": len(scene.textures),
+            "anim_stacks": len(scene.anim_stacks),
+            "vertices": sum(mesh.num_vertices for mesh in scene.meshes),
+            "faces": sum(mesh.num_faces for mesh in scene.meshes),
+            "triangles": sum(mesh.num_triangles for mesh in scene.meshes),
+            "result_bytes": scene.memory_usage().result_bytes,
+        }
+
+
+def _stats_task(task):
+    return _guard(_stats_file, *task)
+
+
+def cmd_stats(args):
+    kwargs = _load_options(args)
+    tasks = [(path, kwargs) for path, _ in _collect_inputs(args.inputs)]
+    failed = 0
+    for record in _run_tasks(_stats_task, tasks, args.workers):
+        failed += record["status"] != "ok"
+        print(json.dumps(record, sort_keys=True), flush=True)
+    return 1 if failed else 0
+
+
+# extract-textures
+
+def _extract_textures_file(path, dest_dir, kwargs):
+    with load_file(path, **kwargs) as scene:
+        names = [texture.name for texture in scene.textures]
+        written = scene.extract_textures(dest_dir, workers=1)
+    return {"textures": {name: out for name, out in zip(names, written) if out is not None}}
+
+
+def _extract_textures_task(task):
+    return _guard(_extract_textures_file, *task)
+
+
+def cmd_extract_textures(args):
+    kwargs = _load_options(args)
+    # Files are content-addressed, so one shared directory deduplicates across inputs
+    tasks = [(path, args.output, kwargs) for path, _ in _collect_inputs(args.inputs)]
+    failed = 0
+    for record in _run_tasks(_extract_textures_task, tasks, args.workers):
+        failed += record["status"] != "ok"
+        print(json.dumps(record, sort_keys=True), flush=True)
+    return 1 if failed else 0
+
+
+def _positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ufbx", description="Batch FBX processing with ufbx")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("inputs", nargs="+", help="FBX files or directories (searched recursively)")
+    common.add_argument("--workers", type=_positive_int, default=os.cpu_count() or 1,
+                        help="Worker processes (default: CPU count)")
+    common.add_argument("--max-memory", type=_positive_int, default=None, metavar="MIB",
+                        help="Per-file budget for scene memory, in MiB")
+    common.add_argument("--max-temp-memory", type=_positive_int, default=None, metavar="MIB",
+                        help="Per-file budget for temporary load memory, in MiB")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", parents=[common],
+                                  help="Write triangulated geometry and baked animation as .npz")
+    convert.add_argument("-o", "--output", required=True, help="Output directory")
+    convert.add_argument("--fps", type=float, default=30.0, help="Animation sampling rate")
+    convert.add_argument("--double", action="store_true", help="Keep float64 instead of float32")
+    convert.add_argument("--manifest", default=None, help="Manifest path (default: OUTPUT/manifest.jsonl)")
+    convert.add_argument("--force", action="store_true", help="Convert inputs already in the manifest")
+    convert.set_defaults(fn=cmd_convert)
+
+    stats = commands.add_parser("stats", parents=[common], help="Print scene statistics as JSON lines")
+    stats.set_defaults(fn=cmd_stats)
+
+    extract = commands.add_parser("extract-textures", parents=[common],
+                                  help="Write embedded textures, named by content hash")
+    extract.add_argument("-o", "--output", required=True, help="Output directory")
+    extract.set_defaults(fn=cmd_extract_textures)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "fps", 1.0) <= 0.0:
+        parser.error("--fps must be positive")
+    return args.fn(args)
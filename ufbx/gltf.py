@@ -0,0 +1,432 @@
+"""
+Binary glTF 2.0 (.glb) export
+
+Scene.export_glb() writes the node hierarchy, meshes split per material, PBR
+materials with their textures, skins and animation baked at a fixed rate.
+
+Vertex streams are built in C per mesh material part (triangulated, identical
+vertices merged with ufbx_generate_indices) and written from those arrays
+straight into the binary chunk. The chunk is spooled to a temporary file, so
+only one mesh part is held in memory at a time however large the scene is.
+
+glTF is Y-up and in meters; load with target_axes=CoordinateAxes.right_handed_y_up()
+and target_unit_meters=1.0 to convert FBX files that are not.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import struct
+import tempfile
+
+import numpy as np
+
+from ._ufbx import WrapMode, _gltf_mesh_parts, _gltf_node_material_ids, _gltf_node_trs, _gltf_skin_bind
+
+# Binary chunk bytes kept in memory before spilling to a temporary file
+SPOOL_MAX_SIZE = 64 << 20
+
+_COMPONENT_TYPES = {np.dtype(np.uint16): 5123, np.dtype(np.uint32): 5125, np.dtype(np.float32): 5126}
+_ACCESSOR_TYPES = {1: "SCALAR", 2: "VEC2", 3: "VEC3", 4: "VEC4", 16: "MAT4"}
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+_WRAP_MODES = {WrapMode.WRAP_MODE_REPEAT: 10497, WrapMode.WRAP_MODE_CLAMP: 33071}
+_IDENTITY_TRS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+_IDENTITY_MATRIX = np.eye(4, dtype=np.float32).reshape(16)
+# Animation samples (float64) held in memory at a time while baking
+_ANIM_CHUNK_SIZE = 64 << 20
+_EPSILON = 1e-6
+
+
+class ExportOptions:
+    """Options for Scene.export_glb()
+
+    animation: Bake every animation stack at fps
+    fps: Sampling rate for baked animation
+    skins: Export skin deformers as glTF skins (JOINTS_0 / WEIGHTS_0, four influences)
+    materials: Export materials, otherwise primitives use the glTF default material
+    textures: Embed textures referenced by materials (PNG and JPEG only), from the
+        FBX file or read from disk
+    """
+
+    __slots__ = ("animation", "fps", "skins", "materials", "textures")
+
+    def __init__(self, animation: bool = True, fps: float = 30.0, skins: bool = True, materials: bool = True,
+                 textures: bool = True):
+        self.animation = animation
+        self.fps = fps
+        self.skins = skins
+        self.materials = materials
+        self.textures = textures
+
+    def __repr__(self) -> str:
+        return (f"ExportOptions(animation={self.animation!r}, fps={self.fps!r}, skins={self.skins!r}, "
+                f"materials={self.materials!r}, textures={self.textures!r})")
+
+
+def _resolve_options(options, kwargs):
+    """Internal: merge an optional ExportOptions with keyword overrides"""
+    if options is None:
+        options = ExportOptions()
+    elif not isinstance(options, ExportOptions):
+        raise TypeError(f"options must be ExportOptions, not {type(options).__name__}")
+    if not kwargs:
+        return options
+    merged = ExportOptions(**{name: getattr(options, name) for name in ExportOptions.__slots__})
+    for name, value in kwargs.items():
+        if name not in ExportOptions.__slots__:
+            raise TypeError(f"Unknown export option: {name}")
+        setattr(merged, name, value)
+    return merged
+
+
+class _Writer:
+    """Internal: glTF JSON document and its binary chunk, written to a spool file owned by the caller"""
+
+    def __init__(self, spool):
+        self.gltf = {"asset": {"version": "2.0", "generator": "ufbx-python"}}
+        self.bin = spool
+        self.size = 0
+
+    def add(self, key, item):
+        """Append item to the top-level list key, returning its index"""
+        items = self.gltf.setdefault(key, [])
+        items.append(item)
+        return len(items) - 1
+
+    def view(self, data, target=None):
+        """Write a contiguous buffer as a new bufferView, 4-byte aligned"""
+        data = memoryview(data).cast("B")
+        pad = -self.size % 4
+        if pad:
+            self.bin.write(b"\0" * pad)
+            self.size += pad
+        view = {"buffer": 0, "byteOffset": self.size, "byteLength": data.nbytes}
+        if target is not None:
+            view["target"] = target
+        self.bin.write(data)
+        self.size += data.nbytes
+        return self.add("bufferViews", view)
+
+    def accessor(self, arr, target=None, bounds=False):
+        """Write an (N,) or (N, K) array as an accessor"""
+        components = arr.shape[1] if arr.ndim > 1 else 1
+        accessor = {
+            "bufferView": self.view(arr, target),
+            "componentType": _COMPONENT_TYPES[arr.dtype],
+            "count": arr.shape[0],
+            "type": _ACCESSOR_TYPES[components],
+        }
+        if bounds:
+            accessor["min"] = np.atleast_1d(arr.min(axis=0)).tolist()
+            accessor["max"] = np.atleast_1d(arr.max(axis=0)).tolist()
+        return self.add("accessors", accessor)
+
+    def write_glb(self, out):
+        """Write the GLB container, returning its size in bytes"""
+        if self.size:
+            self.gltf["buffers"] = [{"byteLength": self.size}]
+        json_bytes = json.dumps(self.gltf, separators=(",", ":")).encode("utf-8")
+        json_bytes += b" " * (-len(json_bytes) % 4)
+        bin_size = self.size + (-self.size % 4)
+        total = 12 + 8 + len(json_bytes) + (8 + bin_size if self.size else 0)
+
+        out.write(struct.pack("<4sII", b"glTF", 2, total))
+        out.write(struct.pack("<I4s", len(json_bytes), b"JSON"))
+        out.write(json_bytes)
+        if self.size:
+            out.write(struct.pack("<I4s", bin_size, b"BIN\0"))
+            self.bin.seek(0)
+            shutil.copyfileobj(self.bin, out, 1 << 20)
+            out.write(b"\0" * (bin_size - self.size))
+        return total
+
+
+def export_glb(scene, file, options=None, **kwargs):
+    """Write scene as a binary glTF 2.0 file
+
+    Nodes map one-to-one onto Scene.nodes (plus a child node per mesh with a
+    geometry transform), each mesh becomes one primitive per material slot and
+    every animation stack becomes an animation of translation, rotation and
+    scale channels for the nodes it moves.
+
+    Args:
+        scene: Scene to export
+        file: Output path or binary file object
+        options: Optional ExportOptions
+        **kwargs: ExportOptions fields, overriding those in `options`
+
+    Returns:
+        Size of the written GLB in bytes
+    """
+    options = _resolve_options(options, kwargs)
+    if not options.fps > 0.0:
+        raise ValueError(f"fps must be positive, got {options.fps!r}")
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as spool:
+        writer = _Writer(spool)
+        _export(scene, writer, options)
+        if hasattr(file, "write"):
+            return writer.write_glb(file)
+        with open(os.fspath(file), "wb") as f:
+            return writer.write_glb(f)
+
+
+def _trs(node, trs):
+    """Internal: set the non-default translation/rotation/scale of a glTF node"""
+    if np.abs(trs[0:3]).max() > _EPSILON:
+        node["translation"] = trs[0:3].tolist()
+    if np.abs(trs[3:7] - _IDENTITY_TRS[3:7]).max() > _EPSILON:
+        node["rotation"] = trs[3:7].tolist()
+    if np.abs(trs[7:10] - 1.0).max() > _EPSILON:
+        node["scale"] = trs[7:10].tolist()
+
+
+def _export(scene, writer, options):
+    table = scene.node_table()
+    local, geometry = _gltf_node_trs(scene)
+    nodes = list(scene.nodes)
+
+    gltf_nodes = []
+    for i, node in enumerate(nodes):
+        gltf_node = {"name": node.name} if node.name else {}
+        _trs(gltf_node, local[i])
+        gltf_nodes.append(gltf_node)
+    for i, parent in enumerate(table.parent):
+        if parent >= 0:
+            gltf_nodes[parent].setdefault("children", []).append(i)
+    writer.gltf["nodes"] = gltf_nodes
+    roots = [i for i, parent in enumerate(table.parent) if parent < 0]
+    writer.gltf["scenes"] = [{"nodes": roots}]
+    writer.gltf["scene"] = 0
+
+    materials = _Materials(scene, writer, options) if options.materials else None
+    skin_ids = {skin: i for i, skin in enumerate(scene.skin_deformers)} if options.skins else {}
+    skins = {}
+    parts = {}
+    meshes = {}
+    for i, node in enumerate(nodes):
+        mesh = node.mesh
+        if mesh is None:
+            continue
+        skin = None
+        if skin_ids and mesh.skin_deformers:
+            skin = mesh.skin_deformers[0]
+
+        if skin is not None and skin not in skins:
+            skins[skin] = _write_skin(writer, skin, gltf_nodes, roots)
+
+        # Vertex data is written once per mesh and shared by all of its instances
+        key = (mesh, skin)
+        if key not in parts:
+            remap = skins[skin][1] if skin is not None else None
+            parts[key] = [(part, _write_part(writer, streams, remap)) for part, streams in _gltf_mesh_parts(mesh, skin)]
+        if not parts[key]:
+            continue
+
+        material_ids = _gltf_node_material_ids(node) if materials is not None else []
+        mesh_key = (mesh, skin, tuple(material_ids))
+        if mesh_key not in meshes:
+            primitives = []
+            for part, (attributes, indices) in parts[key]:
+                primitive = {"attributes": attributes, "indices": indices}
+                material = materials.get(material_ids[part]) if part < len(material_ids) else None
+                if material is not None:
+                    primitive["material"] = material
+                primitives.append(primitive)
+            gltf_mesh = {"primitives": primitives}
+            if mesh.name:
+                gltf_mesh["name"] = mesh.name
+            meshes[mesh_key] = writer.add("meshes", gltf_mesh)
+
+        target = gltf_nodes[i]
+        if np.abs(geometry[i] - _IDENTITY_TRS).max() > _EPSILON:
+            # glTF has no geometry transform: attach the mesh to a child node instead
+            target = {"name": f"{node.name}_geometry"}
+            _trs(target, geometry[i])
+            gltf_nodes[i].setdefault("children", []).append(len(gltf_nodes))
+            gltf_nodes.append(target)
+        target["mesh"] = meshes[mesh_key]
+        if skin is not None:
+            target["skin"] = skins[skin][0]
+
+    if options.animation:
+        for stack in scene.anim_stacks:
+            _write_animation(writer, stack, local, options.fps)
+
+
+def _write_part(writer, streams, joint_remap=None):
+    """Internal: (attributes, indices accessor) of one mesh part"""
+    indices = streams.pop("indices")
+    if joint_remap is not None:
+        streams["JOINTS_0"] = joint_remap[streams["JOINTS_0"]]
+    attributes = {}
+    for name, arr in streams.items():
+        attributes[name] = writer.accessor(arr, _ARRAY_BUFFER, bounds=name == "POSITION")
+    return attributes, writer.accessor(indices, _ELEMENT_ARRAY_BUFFER)
+
+
+def _write_skin(writer, skin, gltf_nodes, roots):
+    """Internal: (skin index, cluster -> joint uint16 remap for JOINTS_0)
+
+    glTF joints must be unique, so clusters bound to the same node share a joint
+    and clusters without a bone share one identity joint added as a scene root.
+    """
+    bones, cluster_bind = _gltf_skin_bind(skin)
+    slots = {}
+    joints, inverse_bind = [], []
+    remap = np.empty(len(bones), dtype=np.uint16)
+    for cluster, bone in enumerate(bones.tolist()):
+        if bone not in slots:
+            slots[bone] = len(joints)
+            if bone < 0:
+                bone = len(gltf_nodes)
+                gltf_nodes.append({"name": f"{skin.name or 'skin'}_unbound"})
+                roots.append(bone)
+                inverse_bind.append(_IDENTITY_MATRIX)
+            else:
+                inverse_bind.append(cluster_bind[cluster])
+            joints.append(bone)
+        remap[cluster] = slots[bones[cluster]]
+    gltf_skin = {"joints": joints, "inverseBindMatrices": writer.accessor(np.array(inverse_bind, dtype=np.float32))}
+    if skin.name:
+        gltf_skin["name"] = skin.name
+    return writer.add("skins", gltf_skin), remap
+
+
+def _write_animation(writer, stack, rest, fps):
+    count = max(int(round((stack.time_end - stack.time_begin) * fps)), 0) + 1
+    times = stack.time_begin + np.arange(count, dtype=np.float64) / fps
+
+    # Only animated nodes are sampled, as many at a time as fit in _ANIM_CHUNK_SIZE
+    animated = stack.animated_nodes()
+    chunk = max(_ANIM_CHUNK_SIZE // (count * 10 * 8), 1)
+    channels, samplers = [], []
+    input_accessor = None
+    for start in range(0, len(animated), chunk):
+        nodes = animated[start:start + chunk]
+        samples = stack.sample_transforms(times, nodes)
+        for column, node in enumerate(nodes.tolist()):
+            for path, begin, end in (("translation", 0, 3), ("rotation", 3, 7), ("scale", 7, 10)):
+                values = samples[:, column, begin:end]
+                base = rest[node, begin:end]
+                if path == "rotation":
+                    # Keep consecutive quaternions in one hemisphere so interpolation takes the short way
+                    signs = np.sign(np.sum(values[1:] * values[:-1], axis=1))
+                    signs[signs == 0] = 1.0
+                    values = values * np.concatenate(([1.0], np.cumprod(signs)))[:, None]
+                    diff = np.minimum(np.abs(values - base).max(axis=1), np.abs(values + base).max(axis=1))
+                else:
+                    diff = np.abs(values - base).max(axis=1)
+                if diff.max() <= _EPSILON:
+                    continue
+                if input_accessor is None:
+                    input_accessor = writer.accessor((times - stack.time_begin).astype(np.float32), bounds=True)
+                output = writer.accessor(np.ascontiguousarray(values, dtype=np.float32))
+                samplers.append({"input": input_accessor, "output": output, "interpolation": "LINEAR"})
+                channels.append({"sampler": len(samplers) - 1, "target": {"node": node, "path": path}})
+
+    if channels:
+        animation = {"channels": channels, "samplers": samplers}
+        if stack.name:
+            animation["name"] = stack.name
+        writer.add("animations", animation)
+
+
+class _Materials:
+    """Internal: glTF materials, textures and images, created on first use"""
+
+    def __init__(self, scene, writer, options):
+        self.materials = list(scene.materials)
+        self.writer = writer
+        self.textures = options.textures
+        self.indices = {}
+        self.texture_indices = {}
+        self.images = {}
+        self.samplers = {}
+
+    def get(self, material_id):
+        if material_id < 0:
+            return None
+        if material_id not in self.indices:
+            self.indices[material_id] = self.writer.add("materials", self._material(self.materials[material_id]))
+        return self.indices[material_id]
+
+    def _material(self, material):
+        def scalar(material_map, default):
+            return material_map.value_vec4[0] if material_map.has_value else default
+
+        factor = scalar(material.pbr_base_factor, 1.0)
+        color = material.pbr_base_color.value_vec4 if material.pbr_base_color.has_value else (1.0, 1.0, 1.0, 1.0)
+        opacity = min(max(scalar(material.pbr_opacity, 1.0), 0.0), 1.0)
+        pbr = {
+            "baseColorFactor": [min(max(c * factor, 0.0), 1.0) for c in color[:3]] + [opacity],
+            "metallicFactor": min(max(scalar(material.pbr_metalness, 0.0), 0.0), 1.0),
+            "roughnessFactor": min(max(scalar(material.pbr_roughness, 1.0), 0.0), 1.0),
+        }
+        gltf_material = {"pbrMetallicRoughness": pbr}
+        if material.name:
+            gltf_material["name"] = material.name
+        if opacity < 1.0:
+            gltf_material["alphaMode"] = "BLEND"
+
+        emission = material.pbr_emission_color
+        if emission.has_value:
+            strength = scalar(material.pbr_emission_factor, 1.0)
+            emissive = [min(max(c * strength, 0.0), 1.0) for c in emission.value_vec4[:3]]
+            if max(emissive) > 0.0:
+                gltf_material["emissiveFactor"] = emissive
+
+        if self.textures:
+            for target, key, material_map in (
+                (pbr, "baseColorTexture", material.pbr_base_color),
+                (gltf_material, "normalTexture", material.pbr_normal_map),
+                (gltf_material, "occlusionTexture", material.pbr_ambient_occlusion),
+                (gltf_material, "emissiveTexture", material.pbr_emission_color),
+            ):
+                texture = self._texture(material_map.texture)
+                if texture is not None:
+                    target[key] = {"index": texture}
+            if "emissiveTexture" in gltf_material:
+                gltf_material.setdefault("emissiveFactor", [1.0, 1.0, 1.0])
+        return gltf_material
+
+    def _texture(self, texture):
+        if texture is None:
+            return None
+        key = texture.element_id
+        if key not in self.texture_indices:
+            image = self._image(texture)
+            index = None
+            if image is not None:
+                wrap = (_WRAP_MODES.get(texture.wrap_u, 10497), _WRAP_MODES.get(texture.wrap_v, 10497))
+                if wrap not in self.samplers:
+                    self.samplers[wrap] = self.writer.add("samplers", {"wrapS": wrap[0], "wrapT": wrap[1]})
+                index = self.writer.add("textures", {"source": image, "sampler": self.samplers[wrap]})
+            self.texture_indices[key] = index
+        return self.texture_indices[key]
+
+    def _image(self, texture):
+        data = texture.content
+        if data is None:
+            path = texture.absolute_filename or texture.filename
+            if not path or not os.path.isfile(path):
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+        head = bytes(data[:4])
+        if head.startswith(b"\x89PNG"):
+            mime_type = "image/png"
+        elif head.startswith(b"\xff\xd8"):
+            mime_type = "image/jpeg"
+        else:
+            return None  # Not a core glTF image format
+
+        digest = hashlib.sha256(data).digest()
+        if digest not in self.images:
+            image = {"bufferView": self.writer.view(data), "mimeType": mime_type}
+            if texture.name:
+                image["name"] = texture.name
+            self.images[digest] = self.writer.add("images", image)
+        return self.images[digest]
@@ -1,14 +1,348 @@
+#if !defined(_WIN32) && !defined(_FILE_OFFSET_BITS)
+#define _FILE_OFFSET_BITS 64  // 64-bit off_t for fseeko/ftello on 32-bit systems
+#endif
+
 #include "ufbx_wrapper.h"
 #include "ufbx-c/ufbx.h"
 #include <string.h>
 #include <stdlib.h>
+#include <math.h>
+#include <stdio.h>
+
+#if defined(_WIN32)
+#include <windows.h>
+#else
+#include <time.h>
+#include <sys/types.h>
+#endif
+
+// 64-bit file offsets (plain fseek/ftell use a 32-bit long on LLP64 platforms)
+#if defined(_WIN32)
+#define ufbx_wrapper_fseek(f, offset, origin) _fseeki64((f), (__int64)(offset), (origin))
+#define ufbx_wrapper_ftell(f) ((int64_t)_ftelli64(f))
+#else
+#define ufbx_wrapper_fseek(f, offset, origin) fseeko((f), (off_t)(offset), (origin))
+#define ufbx_wrapper_ftell(f) ((int64_t)ftello(f))
+#endif
+
+// Load statistics
+
+static double ufbx_wrapper_now(void) {
+#if defined(_WIN32)
+    LARGE_INTEGER freq, count;
+    QueryPerformanceFrequency(&freq);
+    QueryPerformanceCounter(&count);
+    return (double)count.QuadPart / (double)freq.QuadPart;
+#else
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (double)ts.tv_sec + (double)ts.tv_nsec * 1e-9;
+#endif
+}
+
+// Live and peak bytes of one load, shared by its temp and result allocators.
+// Allocation counts and final sizes come from ufbx_metadata; this only tracks
+// what ufbx does not record (peaks and frees). The result allocator outlives the
+// load, so the counter is freed by whichever allocator goes last.
+typedef struct ufbx_wrapper_heap_counter ufbx_wrapper_heap_counter;
+
+typedef struct {
+    ufbx_wrapper_heap_counter *owner;
+    size_t current;
+    size_t peak;
+    size_t num_frees;
+} ufbx_wrapper_heap_pool;
+
+struct ufbx_wrapper_heap_counter {
+    ufbx_wrapper_heap_pool temp;
+    ufbx_wrapper_heap_pool result;
+    size_t current;
+    size_t peak;
+    int refs;
+};
+
+static void ufbx_wrapper_heap_grow(ufbx_wrapper_heap_pool *pool, size_t old_size, size_t new_size) {
+    ufbx_wrapper_heap_counter *counter = pool->owner;
+    pool->current = pool->current - old_size + new_size;
+    if (pool->current > pool->peak) pool->peak = pool->current;
+    counter->current = counter->current - old_size + new_size;
+    if (counter->current > counter->peak) counter->peak = counter->current;
+}
+
+static void *ufbx_wrapper_counting_alloc(void *user, size_t size) {
+    void *ptr = malloc(size);
+    if (ptr) ufbx_wrapper_heap_grow((ufbx_wrapper_heap_pool*)user, 0, size);
+    return ptr;
+}
+
+static void *ufbx_wrapper_counting_realloc(void *user, void *old_ptr, size_t old_size, size_t new_size) {
+    void *ptr = realloc(old_ptr, new_size);
+    if (ptr) ufbx_wrapper_heap_grow((ufbx_wrapper_heap_pool*)user, old_size, new_size);
+    return ptr;
+}
+
+static void ufbx_wrapper_counting_free(void *user, void *ptr, size_t size) {
+    ufbx_wrapper_heap_pool *pool = (ufbx_wrapper_heap_pool*)user;
+    free(ptr);
+    pool->num_frees++;
+    pool->current -= size;
+    pool->owner->current -= size;
+}
+
+static void ufbx_wrapper_counter_release(ufbx_wrapper_heap_counter *counter) {
+    if (--counter->refs == 0) free(counter);
+}
+
+static void ufbx_wrapper_counting_free_allocator(void *user) {
+    ufbx_wrapper_counter_release(((ufbx_wrapper_heap_pool*)user)->owner);
+}
+
+static void ufbx_wrapper_counting_allocator(ufbx_allocator_opts *opts, ufbx_wrapper_heap_pool *pool,
+                                            ufbx_wrapper_heap_counter *counter) {
+    pool->owner = counter;
+    opts->allocator.alloc_fn = &ufbx_wrapper_counting_alloc;
+    opts->allocator.realloc_fn = &ufbx_wrapper_counting_realloc;
+    opts->allocator.free_fn = &ufbx_wrapper_counting_free;
+    opts->allocator.free_allocator_fn = &ufbx_wrapper_counting_free_allocator;
+    opts->allocator.user = pool;
+    counter->refs++;
+}
+
+typedef struct {
+    ufbx_wrapper_load_stats *stats;
+    double last_checkpoint;
+} ufbx_wrapper_load_profile;
+
+typedef struct {
+    ufbx_stream inner;
+    ufbx_wrapper_load_profile *profile;
+} ufbx_wrapper_timed_stream;
+
+static size_t ufbx_wrapper_timed_read(void *user, void *data, size_t size) {
+    ufbx_wrapper_timed_stream *ts = (ufbx_wrapper_timed_stream*)user;
+    double begin = ufbx_wrapper_now();
+    size_t num_read = ts->inner.read_fn(ts->inner.user, data, size);
+    double end = ufbx_wrapper_now();
+    ts->profile->stats->read_seconds += end - begin;
+    if (num_read != SIZE_MAX) ts->profile->stats->bytes_read += num_read;
+    ts->profile->last_checkpoint = end;
+    return num_read;
+}
+
+static bool ufbx_wrapper_timed_skip(void *user, size_t size) {
+    ufbx_wrapper_timed_stream *ts = (ufbx_wrapper_timed_stream*)user;
+    double begin = ufbx_wrapper_now();
+    bool ok = ts->inner.skip_fn(ts->inner.user, size);
+    double end = ufbx_wrapper_now();
+    ts->profile->stats->read_seconds += end - begin;
+    ts->profile->last_checkpoint = end;
+    return ok;
+}
+
+static uint64_t ufbx_wrapper_timed_size(void *user) {
+    ufbx_wrapper_timed_stream *ts = (ufbx_wrapper_timed_stream*)user;
+    return ts->inner.size_fn(ts->inner.user);
+}
+
+static void ufbx_wrapper_timed_close(void *user) {
+    ufbx_wrapper_timed_stream *ts = (ufbx_wrapper_timed_stream*)user;
+    if (ts->inner.close_fn) ts->inner.close_fn(ts->inner.user);
+    free(ts);
+}
+
+static bool ufbx_wrapper_timed_open_file(void *user, ufbx_stream *stream, const char *path, size_t path_len,
+                                         const ufbx_open_file_info *info) {
+    ufbx_wrapper_timed_stream *ts = (ufbx_wrapper_timed_stream*)calloc(1, sizeof(ufbx_wrapper_timed_stream));
+    if (!ts) return false;
+    if (!ufbx_open_file_ctx(&ts->inner, info->context, path, path_len, NULL, NULL)) {
+        free(ts);
+        return false;
+    }
+    ts->profile = (ufbx_wrapper_load_profile*)user;
+    memset(stream, 0, sizeof(ufbx_stream));
+    stream->read_fn = &ufbx_wrapper_timed_read;
+    stream->skip_fn = ts->inner.skip_fn ? &ufbx_wrapper_timed_skip : NULL;
+    stream->size_fn = ts->inner.size_fn ? &ufbx_wrapper_timed_size : NULL;
+    stream->close_fn = &ufbx_wrapper_timed_close;
+    stream->user = ts;
+    return true;
+}
+
+static ufbx_progress_result ufbx_wrapper_profile_progress(void *user, const ufbx_progress *progress) {
+    ufbx_wrapper_load_profile *profile = (ufbx_wrapper_load_profile*)user;
+    (void)progress;
+    profile->stats->num_progress_calls++;
+    profile->last_checkpoint = ufbx_wrapper_now();
+    return UFBX_PROGRESS_CONTINUE;
+}
+
+static bool ufbx_wrapper_read_exact(FILE *f, void *dst, size_t size) {
+    return fread(dst, 1, size, f) == size;
+}
+
+static uint64_t ufbx_wrapper_read_uint(const unsigned char *p, size_t size) {
+    uint64_t value = 0;
+    for (size_t i = size; i > 0; i--) value = (value << 8) | p[i - 1];
+    return value;
+}
+
+// Sum of the decompressed sizes declared by the deflate-encoded array headers in
+// the node records [begin, end), reading only record and property headers. This
+// is an estimate from the file layout, not a measurement of the load's inflate.
+static bool ufbx_wrapper_scan_inflated(FILE *f, uint64_t begin, uint64_t end, bool wide, int depth, uint64_t *total) {
+    size_t field = wide ? 8 : 4;
+    uint64_t pos = begin;
+    while (pos + 3 * field + 1 <= end) {
+        unsigned char header[25];
+        if (ufbx_wrapper_fseek(f, pos, SEEK_SET) != 0 || !ufbx_wrapper_read_exact(f, header, 3 * field + 1)) return false;
+        uint64_t node_end = ufbx_wrapper_read_uint(header, field);
+        uint64_t num_props = ufbx_wrapper_read_uint(header + field, field);
+        if (node_end == 0) return true;  // NULL record terminates the list
+        if (node_end <= pos || node_end > end) return false;
+        uint64_t prop_pos = pos + 3 * field + 1 + header[3 * field];
+        if (ufbx_wrapper_fseek(f, prop_pos, SEEK_SET) != 0) return false;
+
+        for (uint64_t i = 0; i < num_props; i++) {
+            int type = fgetc(f);
+            unsigned char buf[12];
+            size_t skip = 0;
+            switch (type) {
+            case 'C': skip = 1; break;
+            case 'Y': skip = 2; break;
+            case 'I': case 'F': skip = 4; break;
+            case 'L': case 'D': skip = 8; break;
+            case 'S': case 'R':
+                if (!ufbx_wrapper_read_exact(f, buf, 4)) return false;
+                skip = (size_t)ufbx_wrapper_read_uint(buf, 4);
+                break;
+            case 'b': case 'c': case 'i': case 'f': case 'l': case 'd': {
+                if (!ufbx_wrapper_read_exact(f, buf, 12)) return false;
+                uint64_t count = ufbx_wrapper_read_uint(buf, 4);
+                uint64_t encoding = ufbx_wrapper_read_uint(buf + 4, 4);
+                skip = (size_t)ufbx_wrapper_read_uint(buf + 8, 4);
+                if (encoding == 1) {
+                    uint64_t elem = (type == 'l' || type == 'd') ? 8 : (type == 'i' || type == 'f') ? 4 : 1;
+                    *total += count * elem;
+                }
+                break;
+            }
+            default:
+                return false;
+            }
+            if (skip > 0 && ufbx_wrapper_fseek(f, skip, SEEK_CUR) != 0) return false;
+        }
+
+        int64_t children = ufbx_wrapper_ftell(f);
+        if (children < 0) return false;
+        if ((uint64_t)children < node_end && depth < 64) {
+            if (!ufbx_wrapper_scan_inflated(f, (uint64_t)children, node_end, wide, depth + 1, total)) return false;
+        }
+        pos = node_end;
+    }
+    return true;
+}
+
+static uint64_t ufbx_wrapper_fbx_inflated_bytes(const char *filename) {
+    static const char magic[] = "Kaydara FBX Binary  ";
+    unsigned char header[27];
+    uint64_t total = 0;
+    FILE *f = fopen(filename, "rb");
+    if (!f) return 0;
+    if (ufbx_wrapper_read_exact(f, header, sizeof(header)) && memcmp(header, magic, sizeof(magic) - 1) == 0
+            && ufbx_wrapper_fseek(f, 0, SEEK_END) == 0) {
+        int64_t size = ufbx_wrapper_ftell(f);
+        uint32_t version = (uint32_t)ufbx_wrapper_read_uint(header + 23, 4);
+        if (size > 0) ufbx_wrapper_scan_inflated(f, sizeof(header), (uint64_t)size, version >= 7500, 0, &total);
+    }
+    fclose(f);
+    return total;
+}
 
 // Scene management
 ufbx_scene* ufbx_wrapper_load_file(const char *filename, char **error_msg) {
+    return ufbx_wrapper_load_file_opts(filename, NULL, error_msg, NULL);
+}
+
+ufbx_scene* ufbx_wrapper_load_file_opts(const char *filename, const ufbx_wrapper_load_opts *wrapper_opts,
+                                        char **error_msg, int *error_type) {
     ufbx_load_opts opts = {0};
+    if (wrapper_opts) {
+        opts.retain_dom = wrapper_opts->retain_dom;
+        if (wrapper_opts->has_target_axes) {
+            opts.target_axes.right = (ufbx_coordinate_axis)wrapper_opts->target_axes[0];
+            opts.target_axes.up = (ufbx_coordinate_axis)wrapper_opts->target_axes[1];
+            opts.target_axes.front = (ufbx_coordinate_axis)wrapper_opts->target_axes[2];
+        }
+        opts.target_unit_meters = (ufbx_real)wrapper_opts->target_unit_meters;
+        opts.space_conversion = (ufbx_space_conversion)wrapper_opts->space_conversion;
+    }
+
+    // Budgets apply even if the counting allocators below cannot be set up
+    opts.temp_allocator.memory_limit = wrapper_opts ? wrapper_opts->max_temp_memory : 0;
+    opts.result_allocator.memory_limit = wrapper_opts ? wrapper_opts->max_memory : 0;
+
+    // Always track peak usage: it is cheap (ufbx allocates in large blocks) and
+    // backs Scene.memory_usage() as well as the load stats
+    ufbx_wrapper_heap_counter *counter = (ufbx_wrapper_heap_counter*)calloc(1, sizeof(ufbx_wrapper_heap_counter));
+    if (counter) {
+        ufbx_wrapper_counting_allocator(&opts.temp_allocator, &counter->temp, counter);
+        ufbx_wrapper_counting_allocator(&opts.result_allocator, &counter->result, counter);
+        counter->refs++;  // Held until the counts are copied below
+    }
+
+    ufbx_wrapper_load_stats *stats = wrapper_opts ? wrapper_opts->stats : NULL;
+    ufbx_wrapper_load_profile profile = { stats, 0.0 };
+    if (stats) {
+        memset(stats, 0, sizeof(ufbx_wrapper_load_stats));
+        opts.open_file_cb.fn = &ufbx_wrapper_timed_open_file;
+        opts.open_file_cb.user = &profile;
+        opts.progress_cb.fn = &ufbx_wrapper_profile_progress;
+        opts.progress_cb.user = &profile;
+    }
+
     ufbx_error error;
+    double begin = stats ? ufbx_wrapper_now() : 0.0;
     ufbx_scene *scene = ufbx_load_file(filename, &opts, &error);
 
+    if (stats) {
+        double end = ufbx_wrapper_now();
+        double parse_end = profile.last_checkpoint > begin ? profile.last_checkpoint : end;
+        stats->total_seconds = end - begin;
+        stats->finalize_seconds = end - parse_end;
+        stats->parse_seconds = parse_end - begin - stats->read_seconds;
+        if (stats->parse_seconds < 0.0) stats->parse_seconds = 0.0;
+        if (scene) {
+            stats->num_allocs = scene->metadata.temp_allocs + scene->metadata.result_allocs;
+            stats->result_heap_bytes = scene->metadata.result_memory_used;
+        }
+        // Peaks only come from the counter, they stay 0 (unknown) without it
+        if (counter) {
+            stats->num_frees = counter->temp.num_frees + counter->result.num_frees;
+            stats->peak_heap_bytes = counter->peak;
+        }
+        if (scene && scene->metadata.file_format == UFBX_FILE_FORMAT_FBX && !scene->metadata.ascii) {
+            stats->bytes_inflated = ufbx_wrapper_fbx_inflated_bytes(filename);
+        }
+    }
+
+    ufbx_wrapper_memory_usage *usage = wrapper_opts ? wrapper_opts->memory_usage : NULL;
+    if (usage) {
+        memset(usage, 0, sizeof(ufbx_wrapper_memory_usage));
+        if (scene) {
+            usage->result_bytes = scene->metadata.result_memory_used;
+            usage->result_allocs = scene->metadata.result_allocs;
+            usage->temp_allocs = scene->metadata.temp_allocs;
+        }
+        if (scene && counter) {
+            usage->temp_peak_bytes = counter->temp.peak;
+            usage->peak_bytes = counter->peak;
+        }
+    }
+    if (counter) ufbx_wrapper_counter_release(counter);
+
+    if (!scene && error_type) {
+        *error_type = (int)error.type;
+    }
     if (!scene && error_msg) {
         size_t len = error.description.length;
         *error_msg = (char*)malloc(len + 1);
@@ -27,6 +361,52 @@ void ufbx_wrapper_free_scene(ufbx_scene *scene) {
     }
 }
 
+static void ufbx_wrapper_copy_text(char *dst, ufbx_string src) {
+    size_t len = src.length < UFBX_WRAPPER_SCAN_TEXT_SIZE - 1 ? src.length : UFBX_WRAPPER_SCAN_TEXT_SIZE - 1;
+    memcpy(dst, src.data, len);
+    dst[len] = '\0';
+}
+
+bool ufbx_wrapper_scan_file(const char *filename, ufbx_wrapper_scan_result *result) {
+    memset(result, 0, sizeof(ufbx_wrapper_scan_result));
+
+    // Vertex, key and embedded arrays are skipped unparsed (binary files seek
+    // past them), so the cost is dominated by the object headers
+    ufbx_load_opts opts = {0};
+    opts.ignore_geometry = true;
+    opts.ignore_animation = true;
+    opts.ignore_embedded = true;
+    opts.skip_skin_vertices = true;
+
+    ufbx_error error;
+    ufbx_scene *scene = ufbx_load_file(filename, &opts, &error);
+    if (!scene) {
+        result->error_type = (int)error.type;
+        ufbx_wrapper_copy_text(result->error, error.description);
+        return false;
+    }
+
+    result->version = scene->metadata.version;
+    result->file_format = (int)scene->metadata.file_format;
+    result->ascii = scene->metadata.ascii;
+    ufbx_wrapper_copy_text(result->creator, scene->metadata.creator);
+    result->unit_meters = scene->settings.unit_meters;
+    result->axes[0] = (int)scene->settings.axes.right;
+    result->axes[1] = (int)scene->settings.axes.up;
+    result->axes[2] = (int)scene->settings.axes.front;
+    result->frames_per_second = scene->settings.frames_per_second;
+    result->num_nodes = scene->nodes.count;
+    result->num_meshes = scene->meshes.count;
+    result->num_materials = scene->materials.count;
+    result->num_textures = scene->textures.count;
+    result->num_lights = scene->lights.count;
+    result->num_cameras = scene->cameras.count;
+    result->num_anim_stacks = scene->anim_stacks.count;
+
+    ufbx_free_scene(scene);
+    return true;
+}
+
 // Scene queries
 size_t ufbx_wrapper_scene_get_num_nodes(const ufbx_scene *scene) {
     return scene ? scene->nodes.count : 0;
@@ -210,64 +590,64 @@ size_t ufbx_wrapper_mesh_get_num_triangles(const ufbx_mesh *mesh) {
 }
 
 // Mesh vertex data
-const float* ufbx_wrapper_mesh_get_vertex_positions(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_positions(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_position.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
 
     *out_count = mesh->vertex_position.values.count;
-    return (const float*)mesh->vertex_position.values.data;
+    return (const double*)mesh->vertex_position.values.data;
 }
 
-const float* ufbx_wrapper_mesh_get_vertex_normals(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_normals(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_normal.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
 
     *out_count = mesh->vertex_normal.values.count;
-    return (const float*)mesh->vertex_normal.values.data;
+    return (const double*)mesh->vertex_normal.values.data;
 }
 
-const float* ufbx_wrapper_mesh_get_vertex_uvs(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_uvs(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_uv.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
 
     *out_count = mesh->vertex_uv.values.count;
-    return (const float*)mesh->vertex_uv.values.data;
+    return (const double*)mesh->vertex_uv.values.data;
 }
 
-const float* ufbx_wrapper_mesh_get_vertex_tangents(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_tangents(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_tangent.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
 
     *out_count = mesh->vertex_tangent.values.count;
-    return (const float*)mesh->vertex_tangent.values.data;
+    return (const double*)mesh->vertex_tangent.values.data;
 }
 
-const float* ufbx_wrapper_mesh_get_vertex_bitangents(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_bitangents(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_bitangent.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
 
     *out_count = mesh->vertex_bitangent.values.count;
-    return (const float*)mesh->vertex_bitangent.values.data;
+    return (const double*)mesh->vertex_bitangent.values.data;
 }
 
-const float* ufbx_wrapper_mesh_get_vertex_colors(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_colors(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_color.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
 
     *out_count = mesh->vertex_color.values.count;
-    return (const float*)mesh->vertex_color.values.data;
+    return (const double*)mesh->vertex_color.values.data;
 }
 
 const uint32_t* ufbx_wrapper_mesh_get_indices(const ufbx_mesh *mesh, size_t *out_count) {
@@ -313,13 +693,13 @@ const double* ufbx_wrapper_mesh_get_edge_crease(const ufbx_mesh *mesh, size_t *o
     return mesh->edge_crease.data;
 }
 
-const float* ufbx_wrapper_mesh_get_vertex_crease(const ufbx_mesh *mesh, size_t *out_count) {
+const double* ufbx_wrapper_mesh_get_vertex_crease(const ufbx_mesh *mesh, size_t *out_count) {
     if (!mesh || !mesh->vertex_crease.exists || !out_count) {
         if (out_count) *out_count = 0;
         return NULL;
     }
     *out_count = mesh->vertex_crease.values.count;
-    return (const float*)mesh->vertex_crease.values.data;
+    return (const double*)mesh->vertex_crease.values.data;
 }
 
 // Mesh deformers
@@ -1094,3 +1474,1888 @@ double ufbx_wrapper_constraint_get_weight(const ufbx_constraint *constraint) {
 bool ufbx_wrapper_constraint_get_active(const ufbx_constraint *constraint) {
     return constraint ? constraint->active : false;
 }
+
+// DOM access
+ufbx_dom_node* ufbx_wrapper_scene_get_dom_root(const ufbx_scene *scene) {
+    return scene ? scene->dom_root : NULL;
+}
+
+ufbx_dom_node* ufbx_wrapper_node_get_dom_node(const ufbx_node *node) {
+    return node ? node->element.dom_node : NULL;
+}
+
+ufbx_dom_node* ufbx_wrapper_mesh_get_dom_node(const ufbx_mesh *mesh) {
+    return mesh ? mesh->element.dom_node : NULL;
+}
+
+const char* ufbx_wrapper_dom_node_get_name(const ufbx_dom_node *dom_node, size_t *out_length) {
+    if (!dom_node || !dom_node->name.data) {
+        if (out_length) *out_length = 0;
+        return "";
+    }
+    if (out_length) *out_length = dom_node->name.length;
+    return dom_node->name.data;
+}
+
+size_t ufbx_wrapper_dom_node_get_num_children(const ufbx_dom_node *dom_node) {
+    return dom_node ? dom_node->children.count : 0;
+}
+
+ufbx_dom_node* ufbx_wrapper_dom_node_get_child(const ufbx_dom_node *dom_node, size_t index) {
+    if (!dom_node || index >= dom_node->children.count) return NULL;
+    return dom_node->children.data[index];
+}
+
+ufbx_dom_node* ufbx_wrapper_dom_node_find(const ufbx_dom_node *dom_node, const char *name, size_t name_length) {
+    if (!dom_node || !name) return NULL;
+    return ufbx_dom_find_len(dom_node, name, name_length);
+}
+
+size_t ufbx_wrapper_dom_node_get_num_values(const ufbx_dom_node *dom_node) {
+    return dom_node ? dom_node->values.count : 0;
+}
+
+int ufbx_wrapper_dom_node_get_value_type(const ufbx_dom_node *dom_node, size_t index) {
+    if (!dom_node || index >= dom_node->values.count) return UFBX_WRAPPER_DOM_VALUE_NONE;
+    return (int)dom_node->values.data[index].type;
+}
+
+int64_t ufbx_wrapper_dom_node_get_value_int(const ufbx_dom_node *dom_node, size_t index) {
+    if (!dom_node || index >= dom_node->values.count) return 0;
+    return dom_node->values.data[index].value_int;
+}
+
+double ufbx_wrapper_dom_node_get_value_float(const ufbx_dom_node *dom_node, size_t index) {
+    if (!dom_node || index >= dom_node->values.count) return 0.0;
+    return dom_node->values.data[index].value_float;
+}
+
+const char* ufbx_wrapper_dom_node_get_value_str(const ufbx_dom_node *dom_node, size_t index, size_t *out_length) {
+    if (!dom_node || index >= dom_node->values.count || !dom_node->values.data[index].value_str.data) {
+        if (out_length) *out_length = 0;
+        return "";
+    }
+    if (out_length) *out_length = dom_node->values.data[index].value_str.length;
+    return dom_node->values.data[index].value_str.data;
+}
+
+const void* ufbx_wrapper_dom_node_get_value_blob(const ufbx_dom_node *dom_node, size_t index, size_t *out_size) {
+    if (!dom_node || index >= dom_node->values.count) {
+        if (out_size) *out_size = 0;
+        return NULL;
+    }
+    if (out_size) *out_size = dom_node->values.data[index].value_blob.size;
+    return dom_node->values.data[index].value_blob.data;
+}
+
+bool ufbx_wrapper_dom_node_is_array(const ufbx_dom_node *dom_node) {
+    return dom_node ? ufbx_dom_is_array(dom_node) : false;
+}
+
+size_t ufbx_wrapper_dom_node_get_array_size(const ufbx_dom_node *dom_node) {
+    return dom_node ? ufbx_dom_array_size(dom_node) : 0;
+}
+
+const void* ufbx_wrapper_dom_node_get_array(const ufbx_dom_node *dom_node, int *out_type, size_t *out_count) {
+    if (out_type) *out_type = UFBX_WRAPPER_DOM_VALUE_NONE;
+    if (out_count) *out_count = 0;
+    if (!dom_node || !ufbx_dom_is_array(dom_node)) return NULL;
+
+    ufbx_dom_value_type type = dom_node->values.data[0].type;
+    if (out_type) *out_type = (int)type;
+
+    switch (type) {
+    case UFBX_DOM_VALUE_ARRAY_I32: {
+        ufbx_int32_list list = ufbx_dom_as_int32_list(dom_node);
+        if (out_count) *out_count = list.count;
+        return list.data;
+    }
+    case UFBX_DOM_VALUE_ARRAY_I64: {
+        ufbx_int64_list list = ufbx_dom_as_int64_list(dom_node);
+        if (out_count) *out_count = list.count;
+        return list.data;
+    }
+    case UFBX_DOM_VALUE_ARRAY_F32: {
+        ufbx_float_list list = ufbx_dom_as_float_list(dom_node);
+        if (out_count) *out_count = list.count;
+        return list.data;
+    }
+    case UFBX_DOM_VALUE_ARRAY_F64: {
+        ufbx_double_list list = ufbx_dom_as_double_list(dom_node);
+        if (out_count) *out_count = list.count;
+        return list.data;
+    }
+    case UFBX_DOM_VALUE_ARRAY_BLOB: {
+        ufbx_blob_list list = ufbx_dom_as_blob_list(dom_node);
+        if (out_count) *out_count = list.count;
+        return list.data;
+    }
+    default:
+        return NULL;
+    }
+}
+
+// Scene-wide geometry
+int32_t ufbx_wrapper_node_material_id(const ufbx_node *node, uint32_t slot) {
+    // Per-instance materials take precedence over the mesh materials
+    const ufbx_material *material = NULL;
+    if (slot < node->materials.count) material = node->materials.data[slot];
+    else if (node->mesh && slot < node->mesh->materials.count) material = node->mesh->materials.data[slot];
+    return material ? (int32_t)material->typed_id : -1;
+}
+
+static const ufbx_node* ufbx_wrapper_flatten_get_node(const ufbx_scene *scene, bool all_nodes,
+                                                      const uint32_t *node_ids, size_t index) {
+    uint32_t node_id = all_nodes ? (uint32_t)index : node_ids[index];
+    if (node_id >= scene->nodes.count) return NULL;
+    return scene->nodes.data[node_id];
+}
+
+void ufbx_wrapper_flatten_count(const ufbx_scene *scene, bool all_nodes, const uint32_t *node_ids,
+                                size_t num_node_ids, bool triangulate, ufbx_wrapper_flatten_sizes *sizes) {
+    memset(sizes, 0, sizeof(*sizes));
+    if (!scene) return;
+    size_t count = all_nodes ? scene->nodes.count : num_node_ids;
+
+    for (size_t i = 0; i < count; i++) {
+        const ufbx_node *node = ufbx_wrapper_flatten_get_node(scene, all_nodes, node_ids, i);
+        if (!node || !node->mesh) continue;
+        const ufbx_mesh *mesh = node->mesh;
+        sizes->num_positions += mesh->num_vertices;
+        if (triangulate) {
+            sizes->num_indices += mesh->num_triangles * 3;
+            sizes->num_faces += mesh->num_triangles;
+        } else {
+            sizes->num_indices += mesh->num_indices;
+            sizes->num_faces += mesh->num_faces;
+        }
+        if (mesh->max_face_triangles > sizes->max_face_triangles) {
+            sizes->max_face_triangles = mesh->max_face_triangles;
+        }
+    }
+}
+
+bool ufbx_wrapper_flatten_fill(const ufbx_scene *scene, bool all_nodes, const uint32_t *node_ids, size_t num_node_ids,
+                               bool triangulate, bool world_space, const ufbx_wrapper_flatten_sizes *sizes,
+                               double *positions, uint32_t *indices, int32_t *face_nodes,
+                               int32_t *face_materials, uint32_t *face_sizes) {
+    if (!scene) return false;
+    size_t count = all_nodes ? scene->nodes.count : num_node_ids;
+
+    uint32_t *tri_indices = NULL;
+    size_t tri_capacity = sizes->max_face_triangles * 3;
+    if (triangulate && tri_capacity > 0) {
+        tri_indices = (uint32_t*)malloc(tri_capacity * sizeof(uint32_t));
+        if (!tri_indices) return false;
+    }
+
+    size_t position_offset = 0, index_offset = 0, face_offset = 0;
+    for (size_t i = 0; i < count; i++) {
+        const ufbx_node *node = ufbx_wrapper_flatten_get_node(scene, all_nodes, node_ids, i);
+        if (!node || !node->mesh) continue;
+        const ufbx_mesh *mesh = node->mesh;
+
+        // Positions, optionally baked into world space
+        for (size_t v = 0; v < mesh->num_vertices; v++) {
+            ufbx_vec3 p = mesh->vertices.data[v];
+            if (world_space) p = ufbx_transform_position(&node->geometry_to_world, p);
+            double *dst = positions + (position_offset + v) * 3;
+            dst[0] = p.x; dst[1] = p.y; dst[2] = p.z;
+        }
+
+        for (size_t f = 0; f < mesh->num_faces; f++) {
+            ufbx_face face = mesh->faces.data[f];
+
+            int32_t material_id = -1;
+            if (mesh->face_material.count > f) {
+                material_id = ufbx_wrapper_node_material_id(node, mesh->face_material.data[f]);
+            }
+
+            if (triangulate) {
+                uint32_t num_tris = ufbx_triangulate_face(tri_indices, tri_capacity, mesh, face);
+                for (uint32_t t = 0; t < num_tris * 3; t++) {
+                    indices[index_offset++] = (uint32_t)position_offset + mesh->vertex_indices.data[tri_indices[t]];
+                }
+                for (uint32_t t = 0; t < num_tris; t++) {
+                    face_nodes[face_offset] = (int32_t)node->typed_id;
+                    face_materials[face_offset] = material_id;
+                    face_offset++;
+                }
+            } else {
+                for (uint32_t c = 0; c < face.num_indices; c++) {
+                    indices[index_offset++] = (uint32_t)position_offset + mesh->vertex_indices.data[face.index_begin + c];
+                }
+                face_nodes[face_offset] = (int32_t)node->typed_id;
+                face_materials[face_offset] = material_id;
+                if (face_sizes) face_sizes[face_offset] = face.num_indices;
+                face_offset++;
+            }
+        }
+
+        position_offset += mesh->num_vertices;
+    }
+
+    free(tri_indices);
+    return true;
+}
+
+// Node table (struct-of-arrays)
+static void ufbx_wrapper_store_matrix(const ufbx_matrix *m, double *matrix16) {
+    // Same column-major layout as ufbx_wrapper_node_get_world_transform()
+    matrix16[0] = m->m00; matrix16[4] = m->m01; matrix16[8]  = m->m02; matrix16[12] = m->m03;
+    matrix16[1] = m->m10; matrix16[5] = m->m11; matrix16[9]  = m->m12; matrix16[13] = m->m13;
+    matrix16[2] = m->m20; matrix16[6] = m->m21; matrix16[10] = m->m22; matrix16[14] = m->m23;
+    matrix16[3] = 0.0;    matrix16[7] = 0.0;    matrix16[11] = 0.0;    matrix16[15] = 1.0;
+}
+
+void ufbx_wrapper_scene_fill_node_table(const ufbx_scene *scene, int32_t *parents, int32_t *depths,
+                                        int32_t *attrib_types, double *world, double *local, double *geometry) {
+    if (!scene) return;
+
+    for (size_t i = 0; i < scene->nodes.count; i++) {
+        const ufbx_node *node = scene->nodes.data[i];
+        parents[i] = node->parent ? (int32_t)node->parent->typed_id : -1;
+        depths[i] = (int32_t)node->node_depth;
+        attrib_types[i] = (int32_t)node->attrib_type;
+        ufbx_wrapper_store_matrix(&node->node_to_world, world + i * 16);
+        ufbx_wrapper_store_matrix(&node->node_to_parent, local + i * 16);
+        ufbx_wrapper_store_matrix(&node->geometry_to_node, geometry + i * 16);
+    }
+}
+
+// Element queries
+static bool ufbx_wrapper_glob_match(const char *pattern, size_t pattern_len, const char *str, size_t str_len) {
+    // Supports '*', '?' and '[...]' character classes ('[!...]' negates)
+    size_t p = 0, s = 0;
+    size_t star_p = SIZE_MAX, star_s = 0;
+    while (s < str_len) {
+        if (p < pattern_len) {
+            char c = pattern[p];
+            if (c == '*') {
+                star_p = ++p;
+                star_s = s;
+                continue;
+            }
+            if (c == '?') {
+                p++; s++;
+                continue;
+            }
+            if (c == '[') {
+                size_t q = p + 1;
+                bool negate = q < pattern_len && pattern[q] == '!';
+                if (negate) q++;
+                bool matched = false;
+                size_t first = q;
+                while (q < pattern_len && (pattern[q] != ']' || q == first)) {
+                    unsigned char lo = (unsigned char)pattern[q], hi = lo;
+                    if (q + 2 < pattern_len && pattern[q + 1] == '-' && pattern[q + 2] != ']') {
+                        hi = (unsigned char)pattern[q + 2];
+                        q += 2;
+                    }
+                    unsigned char ch = (unsigned char)str[s];
+                    if (ch >= lo && ch <= hi) matched = true;
+                    q++;
+                }
+                if (q < pattern_len) {
+                    if (matched != negate) {
+                        p = q + 1; s++;
+                        continue;
+                    }
+                } else if (str[s] == '[') {
+                    // Unterminated class, treat '[' literally
+                    p++; s++;
+                    continue;
+                }
+            } else if (c == str[s]) {
+                p++; s++;
+                continue;
+            }
+        }
+        if (star_p == SIZE_MAX) return false;
+        p = star_p;
+        s = ++star_s;
+    }
+    while (p < pattern_len && pattern[p] == '*') p++;
+    return p == pattern_len;
+}
+
+// `under` selects the subtree rooted at `ancestor`: the node itself, its descendants
+// and elements instanced by any of them
+static bool ufbx_wrapper_node_in_subtree(const ufbx_node *node, const ufbx_node *ancestor) {
+    for (const ufbx_node *p = node; p && p->node_depth >= ancestor->node_depth; p = p->parent) {
+        if (p == ancestor) return true;
+    }
+    return false;
+}
+
+static bool ufbx_wrapper_element_is_under(const ufbx_element *element, const ufbx_node *ancestor) {
+    if (element->type == UFBX_ELEMENT_NODE) {
+        return ufbx_wrapper_node_in_subtree((const ufbx_node*)element, ancestor);
+    }
+    for (size_t i = 0; i < element->instances.count; i++) {
+        if (ufbx_wrapper_node_in_subtree(element->instances.data[i], ancestor)) return true;
+    }
+    return false;
+}
+
+static bool ufbx_wrapper_query_accepts(const ufbx_wrapper_query *query, const ufbx_element *element) {
+    if (query->type >= 0 && (int)element->type != query->type) return false;
+    if (query->name) {
+        if (element->name.length != query->name_length) return false;
+        if (memcmp(element->name.data, query->name, query->name_length) != 0) return false;
+    }
+    if (query->pattern) {
+        if (!ufbx_wrapper_glob_match(query->pattern, query->pattern_length, element->name.data, element->name.length)) return false;
+    }
+    if (query->under && !ufbx_wrapper_element_is_under(element, query->under)) return false;
+    return true;
+}
+
+static int ufbx_wrapper_cmp_u32(const void *a, const void *b) {
+    uint32_t va = *(const uint32_t*)a, vb = *(const uint32_t*)b;
+    return va < vb ? -1 : va > vb ? 1 : 0;
+}
+
+size_t ufbx_wrapper_scene_query(const ufbx_scene *scene, const ufbx_wrapper_query *query, uint32_t *out_element_ids) {
+    if (!scene || !query || !out_element_ids) return 0;
+    size_t num_results = 0;
+
+    // Literal prefix that every match must start with
+    const char *prefix = NULL;
+    size_t prefix_len = 0;
+    if (query->name) {
+        prefix = query->name;
+        prefix_len = query->name_length;
+    } else if (query->pattern) {
+        prefix = query->pattern;
+        while (prefix_len < query->pattern_length && !strchr("*?[", query->pattern[prefix_len])) prefix_len++;
+    }
+
+    if (prefix_len > 0) {
+        // `elements_by_name` is sorted by name bytes: binary search the first candidate
+        const ufbx_name_element_list *names = &scene->elements_by_name;
+        size_t lo = 0, hi = names->count;
+        while (lo < hi) {
+            size_t mid = lo + (hi - lo) / 2;
+            const ufbx_string *name = &names->data[mid].name;
+            size_t n = name->length < prefix_len ? name->length : prefix_len;
+            int cmp = memcmp(name->data, prefix, n);
+            if (cmp < 0 || (cmp == 0 && name->length < prefix_len)) lo = mid + 1;
+            else hi = mid;
+        }
+        for (size_t i = lo; i < names->count; i++) {
+            const ufbx_string *name = &names->data[i].name;
+            if (name->length < prefix_len || memcmp(name->data, prefix, prefix_len) != 0) break;
+            const ufbx_element *element = names->data[i].element;
+            if (ufbx_wrapper_query_accepts(query, element)) {
+                out_element_ids[num_results++] = element->element_id;
+            }
+        }
+        qsort(out_element_ids, num_results, sizeof(uint32_t), ufbx_wrapper_cmp_u32);
+    } else {
+        const ufbx_element_list *elements = &scene->elements;
+        if (query->type >= 0 && query->type < (int)UFBX_ELEMENT_TYPE_COUNT) {
+            elements = &scene->elements_by_type[query->type];
+        }
+        for (size_t i = 0; i < elements->count; i++) {
+            const ufbx_element *element = elements->data[i];
+            if (ufbx_wrapper_query_accepts(query, element)) {
+                out_element_ids[num_results++] = element->element_id;
+            }
+        }
+    }
+
+    return num_results;
+}
+
+// Property gathering
+void ufbx_wrapper_scene_gather_prop(const ufbx_scene *scene, int type, const char *name, size_t name_length,
+                                    size_t num_components, const double *default_value, double *out) {
+    if (!scene || type < 0 || type >= (int)UFBX_ELEMENT_TYPE_COUNT) return;
+    const ufbx_element_list *elements = &scene->elements_by_type[type];
+
+    for (size_t i = 0; i < elements->count; i++) {
+        double *dst = out + i * num_components;
+        const ufbx_prop *prop = ufbx_find_prop_len(&elements->data[i]->props, name, name_length);
+        if (!prop || (prop->flags & UFBX_PROP_FLAG_NO_VALUE) != 0) {
+            memcpy(dst, default_value, num_components * sizeof(double));
+            continue;
+        }
+        for (size_t c = 0; c < num_components; c++) {
+            dst[c] = c < 4 ? (double)prop->value_real_arr[c] : default_value[c];
+        }
+        if (prop->type == UFBX_PROP_BOOLEAN || prop->type == UFBX_PROP_INTEGER) {
+            dst[0] = (double)prop->value_int;
+        }
+    }
+}
+
+// Animation sampling
+void ufbx_wrapper_anim_stack_sample_transforms(const ufbx_scene *scene, const ufbx_anim_stack *anim_stack,
+                                               bool all_nodes, const uint32_t *node_ids, size_t num_node_ids,
+                                               const double *times, size_t num_times, double *out) {
+    if (!scene || !anim_stack) return;
+
+    size_t num_nodes = all_nodes ? scene->nodes.count : num_node_ids;
+    for (size_t f = 0; f < num_times; f++) {
+        for (size_t i = 0; i < num_nodes; i++) {
+            const ufbx_node *node = scene->nodes.data[all_nodes ? i : node_ids[i]];
+            ufbx_transform t = ufbx_evaluate_transform(anim_stack->anim, node, times[f]);
+            double *dst = out + (f * num_nodes + i) * 10;
+            dst[0] = t.translation.x; dst[1] = t.translation.y; dst[2] = t.translation.z;
+            dst[3] = t.rotation.x; dst[4] = t.rotation.y; dst[5] = t.rotation.z; dst[6] = t.rotation.w;
+            dst[7] = t.scale.x; dst[8] = t.scale.y; dst[9] = t.scale.z;
+        }
+    }
+}
+
+// Bit 0: node properties animated by a layer, bit 1: local transform animated
+#define UFBX_WRAPPER_ANIM_DIRECT 1u
+#define UFBX_WRAPPER_ANIM_LOCAL 2u
+
+static bool ufbx_wrapper_anim_direct(const uint8_t *flags, const ufbx_node *node) {
+    return node && (flags[node->typed_id] & UFBX_WRAPPER_ANIM_DIRECT) != 0;
+}
+
+void ufbx_wrapper_anim_stack_animated_nodes(const ufbx_scene *scene, const ufbx_anim_stack *anim_stack, uint8_t *out) {
+    if (!scene) return;
+    memset(out, 0, scene->nodes.count);
+    if (!anim_stack) return;
+
+    for (size_t i = 0; i < anim_stack->layers.count; i++) {
+        const ufbx_anim_layer *layer = anim_stack->layers.data[i];
+        for (size_t j = 0; j < layer->anim_props.count; j++) {
+            const ufbx_element *element = layer->anim_props.data[j].element;
+            if (element && element->type == UFBX_ELEMENT_NODE) out[element->typed_id] |= UFBX_WRAPPER_ANIM_DIRECT;
+        }
+    }
+
+    // ufbx_evaluate_transform() also reads the scale of the parent's scale helper
+    // and of the helpers along its inherit_scale_node chain
+    for (size_t i = 0; i < scene->nodes.count; i++) {
+        const ufbx_node *node = scene->nodes.data[i];
+        if (node->is_root) continue;
+        bool animated = ufbx_wrapper_anim_direct(out, node);
+        const ufbx_node *parent = node->parent;
+        if (!animated && parent) {
+            animated = ufbx_wrapper_anim_direct(out, parent->scale_helper);
+            for (const ufbx_node *p = parent->inherit_scale_node; p && !animated; p = p->inherit_scale_node) {
+                animated = ufbx_wrapper_anim_direct(out, p->scale_helper);
+                if (!p->scale_helper) break;
+            }
+        }
+        if (animated) out[i] |= UFBX_WRAPPER_ANIM_LOCAL;
+    }
+    for (size_t i = 0; i < scene->nodes.count; i++) {
+        out[i] = (out[i] & UFBX_WRAPPER_ANIM_LOCAL) ? 1 : 0;
+    }
+}
+
+// Bounding boxes
+static void ufbx_wrapper_bounds_reset(double *bounds) {
+    for (int k = 0; k < 6; k++) bounds[k] = NAN;
+}
+
+static void ufbx_wrapper_bounds_add(double *bounds, bool *empty, ufbx_vec3 p) {
+    if (*empty) {
+        bounds[0] = bounds[3] = p.x;
+        bounds[1] = bounds[4] = p.y;
+        bounds[2] = bounds[5] = p.z;
+        *empty = false;
+        return;
+    }
+    if (p.x < bounds[0]) bounds[0] = p.x;
+    if (p.y < bounds[1]) bounds[1] = p.y;
+    if (p.z < bounds[2]) bounds[2] = p.z;
+    if (p.x > bounds[3]) bounds[3] = p.x;
+    if (p.y > bounds[4]) bounds[4] = p.y;
+    if (p.z > bounds[5]) bounds[5] = p.z;
+}
+
+void ufbx_wrapper_scene_compute_bounds(const ufbx_scene *scene, double *mesh_bounds, double *node_bounds) {
+    if (!scene) return;
+
+    for (size_t i = 0; i < scene->meshes.count; i++) {
+        const ufbx_mesh *mesh = scene->meshes.data[i];
+        double *dst = mesh_bounds + i * 6;
+        bool empty = true;
+        ufbx_wrapper_bounds_reset(dst);
+        for (size_t v = 0; v < mesh->vertices.count; v++) {
+            ufbx_wrapper_bounds_add(dst, &empty, mesh->vertices.data[v]);
+        }
+    }
+
+    // Exact world-space boxes: transform every vertex, not just the local box corners
+    for (size_t i = 0; i < scene->nodes.count; i++) {
+        const ufbx_node *node = scene->nodes.data[i];
+        double *dst = node_bounds + i * 6;
+        bool empty = true;
+        ufbx_wrapper_bounds_reset(dst);
+        if (!node->mesh) continue;
+        const ufbx_mesh *mesh = node->mesh;
+        for (size_t v = 0; v < mesh->vertices.count; v++) {
+            ufbx_vec3 p = ufbx_transform_position(&node->geometry_to_world, mesh->vertices.data[v]);
+            ufbx_wrapper_bounds_add(dst, &empty, p);
+        }
+    }
+}
+
+// BVH over world-space triangles (binned SAH build, leaf-ordered triangle copy)
+#define UFBX_WRAPPER_BVH_BINS 16
+#define UFBX_WRAPPER_BVH_LEAF_SIZE 4
+
+typedef struct {
+    double bmin[3], bmax[3];
+    uint32_t first;  // leaf: first triangle, interior: left child (right is first + 1)
+    uint32_t count;  // 0 for interior nodes
+} ufbx_wrapper_bvh_node;
+
+struct ufbx_wrapper_bvh {
+    ufbx_wrapper_bvh_node *nodes;
+    size_t num_nodes;
+    double *triangles;    // 9 doubles per triangle in leaf order
+    uint32_t *triangle_ids;
+    size_t num_triangles;
+    size_t max_depth;
+};
+
+typedef struct {
+    uint32_t node, first, count, depth;
+} ufbx_wrapper_bvh_task;
+
+static double ufbx_wrapper_box_area(const double *bmin, const double *bmax) {
+    double dx = bmax[0] - bmin[0], dy = bmax[1] - bmin[1], dz = bmax[2] - bmin[2];
+    return dx * dy + dy * dz + dz * dx;
+}
+
+static void ufbx_wrapper_box_empty(double *bmin, double *bmax) {
+    for (int k = 0; k < 3; k++) { bmin[k] = INFINITY; bmax[k] = -INFINITY; }
+}
+
+static void ufbx_wrapper_box_grow(double *bmin, double *bmax, const double *tmin, const double *tmax) {
+    for (int k = 0; k < 3; k++) {
+        if (tmin[k] < bmin[k]) bmin[k] = tmin[k];
+        if (tmax[k] > bmax[k]) bmax[k] = tmax[k];
+    }
+}
+
+ufbx_wrapper_bvh* ufbx_wrapper_bvh_build(const double *positions, const uint32_t *indices, size_t num_triangles) {
+    ufbx_wrapper_bvh *bvh = (ufbx_wrapper_bvh*)calloc(1, sizeof(ufbx_wrapper_bvh));
+    if (!bvh) return NULL;
+    if (num_triangles > UINT32_MAX / 2) { free(bvh); return NULL; }
+
+    size_t max_nodes = num_triangles > 0 ? 2 * num_triangles - 1 : 1;
+    bvh->nodes = (ufbx_wrapper_bvh_node*)malloc(max_nodes * sizeof(ufbx_wrapper_bvh_node));
+    bvh->triangles = (double*)malloc((num_triangles ? num_triangles : 1) * 9 * sizeof(double));
+    bvh->triangle_ids = (uint32_t*)malloc((num_triangles ? num_triangles : 1) * sizeof(uint32_t));
+    double *tri_bounds = (double*)malloc((num_triangles ? num_triangles : 1) * 6 * sizeof(double));
+    double *centroids = (double*)malloc((num_triangles ? num_triangles : 1) * 3 * sizeof(double));
+    ufbx_wrapper_bvh_task *tasks = (ufbx_wrapper_bvh_task*)malloc(max_nodes * sizeof(ufbx_wrapper_bvh_task));
+    uint32_t *perm = bvh->triangle_ids;
+    if (!bvh->nodes || !bvh->triangles || !perm || !tri_bounds || !centroids || !tasks) {
+        free(tri_bounds); free(centroids); free(tasks);
+        ufbx_wrapper_bvh_free(bvh);
+        return NULL;
+    }
+
+    for (size_t t = 0; t < num_triangles; t++) {
+        double *bmin = tri_bounds + t * 6, *bmax = bmin + 3;
+        ufbx_wrapper_box_empty(bmin, bmax);
+        for (int c = 0; c < 3; c++) {
+            const double *p = positions + (size_t)indices[t * 3 + c] * 3;
+            ufbx_wrapper_box_grow(bmin, bmax, p, p);
+        }
+        for (int k = 0; k < 3; k++) centroids[t * 3 + k] = 0.5 * (bmin[k] + bmax[k]);
+        perm[t] = (uint32_t)t;
+    }
+
+    bvh->num_triangles = num_triangles;
+    bvh->num_nodes = 1;
+    size_t num_tasks = 0;
+    tasks[num_tasks++] = (ufbx_wrapper_bvh_task){ 0, 0, (uint32_t)num_triangles, 1 };
+    ufbx_wrapper_box_empty(bvh->nodes[0].bmin, bvh->nodes[0].bmax);
+    bvh->nodes[0].first = 0;
+    bvh->nodes[0].count = 0;
+
+    while (num_tasks > 0) {
+        ufbx_wrapper_bvh_task task = tasks[--num_tasks];
+        ufbx_wrapper_bvh_node *node = &bvh->nodes[task.node];
+        if (task.depth > bvh->max_depth) bvh->max_depth = task.depth;
+
+        double cmin[3], cmax[3];
+        ufbx_wrapper_box_empty(node->bmin, node->bmax);
+        ufbx_wrapper_box_empty(cmin, cmax);
+        for (uint32_t i = task.first; i < task.first + task.count; i++) {
+            const double *tb = tri_bounds + (size_t)perm[i] * 6;
+            const double *c = centroids + (size_t)perm[i] * 3;
+            ufbx_wrapper_box_grow(node->bmin, node->bmax, tb, tb + 3);
+            ufbx_wrapper_box_grow(cmin, cmax, c, c);
+        }
+        node->first = task.first;
+        node->count = task.count;
+        if (task.count <= 1) continue;
+
+        // Binned SAH over all three axes
+        int best_axis = -1, best_split = 0;
+        double best_cost = INFINITY;
+        for (int axis = 0; axis < 3; axis++) {
+            double extent = cmax[axis] - cmin[axis];
+            if (!(extent > 0.0)) continue;
+            double scale = UFBX_WRAPPER_BVH_BINS / extent;
+            uint32_t bin_count[UFBX_WRAPPER_BVH_BINS] = { 0 };
+            double bin_min[UFBX_WRAPPER_BVH_BINS][3], bin_max[UFBX_WRAPPER_BVH_BINS][3];
+            for (int b = 0; b < UFBX_WRAPPER_BVH_BINS; b++) ufbx_wrapper_box_empty(bin_min[b], bin_max[b]);
+            for (uint32_t i = task.first; i < task.first + task.count; i++) {
+                int b = (int)((centroids[(size_t)perm[i] * 3 + axis] - cmin[axis]) * scale);
+                if (b >= UFBX_WRAPPER_BVH_BINS) b = UFBX_WRAPPER_BVH_BINS - 1;
+                const double *tb = tri_bounds + (size_t)perm[i] * 6;
+                bin_count[b]++;
+                ufbx_wrapper_box_grow(bin_min[b], bin_max[b], tb, tb + 3);
+            }
+            // Sweep from the right to get suffix areas, then from the left
+            double right_area[UFBX_WRAPPER_BVH_BINS];
+            uint32_t right_count[UFBX_WRAPPER_BVH_BINS];
+            double rmin[3], rmax[3];
+            uint32_t rc = 0;
+            ufbx_wrapper_box_empty(rmin, rmax);
+            for (int b = UFBX_WRAPPER_BVH_BINS - 1; b > 0; b--) {
+                rc += bin_count[b];
+                if (bin_count[b]) ufbx_wrapper_box_grow(rmin, rmax, bin_min[b], bin_max[b]);
+                right_count[b] = rc;
+                right_area[b] = rc ? ufbx_wrapper_box_area(rmin, rmax) : 0.0;
+            }
+            double lmin[3], lmax[3];
+            uint32_t lc = 0;
+            ufbx_wrapper_box_empty(lmin, lmax);
+            for (int b = 0; b < UFBX_WRAPPER_BVH_BINS - 1; b++) {
+                lc += bin_count[b];
+                if (bin_count[b]) ufbx_wrapper_box_grow(lmin, lmax, bin_min[b], bin_max[b]);
+                if (lc == 0 || right_count[b + 1] == 0) continue;
+                double cost = lc * ufbx_wrapper_box_area(lmin, lmax) + right_count[b + 1] * right_area[b + 1];
+                if (cost < best_cost) {
+                    best_cost = cost;
+                    best_axis = axis;
+                    best_split = b + 1;
+                }
+            }
+        }
+
+        double parent_area = ufbx_wrapper_box_area(node->bmin, node->bmax);
+        double leaf_cost = (double)task.count;
+        uint32_t mid;
+        if (best_axis >= 0) {
+            double split_cost = 1.0 + (parent_area > 0.0 ? best_cost / parent_area : (double)task.count);
+            if (task.count <= UFBX_WRAPPER_BVH_LEAF_SIZE && split_cost >= leaf_cost) continue;
+            double scale = UFBX_WRAPPER_BVH_BINS / (cmax[best_axis] - cmin[best_axis]);
+            uint32_t i = task.first, j = task.first + task.count;
+            while (i < j) {
+                int b = (int)((centroids[(size_t)perm[i] * 3 + best_axis] - cmin[best_axis]) * scale);
+                if (b >= UFBX_WRAPPER_BVH_BINS) b = UFBX_WRAPPER_BVH_BINS - 1;
+                if (b < best_split) {
+                    i++;
+                } else {
+                    uint32_t t = perm[i]; perm[i] = perm[--j]; perm[j] = t;
+                }
+            }
+            mid = i;
+        } else {
+            // All centroids coincide: keep small sets as leaves, halve large ones
+            if (task.count <= UFBX_WRAPPER_BVH_LEAF_SIZE) continue;
+            mid = task.first + task.count / 2;
+        }
+
+        uint32_t left = (uint32_t)bvh->num_nodes;
+        bvh->num_nodes += 2;
+        node->first = left;
+        node->count = 0;
+        tasks[num_tasks++] = (ufbx_wrapper_bvh_task){ left + 1, mid, task.first + task.count - mid, task.depth + 1 };
+        tasks[num_tasks++] = (ufbx_wrapper_bvh_task){ left, task.first, mid - task.first, task.depth + 1 };
+    }
+
+    for (size_t t = 0; t < num_triangles; t++) {
+        for (int c = 0; c < 3; c++) {
+            const double *p = positions + (size_t)indices[(size_t)perm[t] * 3 + c] * 3;
+            memcpy(bvh->triangles + t * 9 + c * 3, p, 3 * sizeof(double));
+        }
+    }
+
+    free(tri_bounds);
+    free(centroids);
+    free(tasks);
+    return bvh;
+}
+
+void ufbx_wrapper_bvh_free(ufbx_wrapper_bvh *bvh) {
+    if (!bvh) return;
+    free(bvh->nodes);
+    free(bvh->triangles);
+    free(bvh->triangle_ids);
+    free(bvh);
+}
+
+size_t ufbx_wrapper_bvh_num_nodes(const ufbx_wrapper_bvh *bvh) {
+    return bvh ? bvh->num_nodes : 0;
+}
+
+size_t ufbx_wrapper_bvh_max_depth(const ufbx_wrapper_bvh *bvh) {
+    return bvh ? bvh->max_depth : 0;
+}
+
+static double ufbx_wrapper_ray_box(const double *o, const double *inv_d, const double *bmin, const double *bmax, double t_max) {
+    // Slab test, returns entry distance or INFINITY on a miss
+    double t0 = 0.0, t1 = t_max;
+    for (int k = 0; k < 3; k++) {
+        double a = (bmin[k] - o[k]) * inv_d[k];
+        double b = (bmax[k] - o[k]) * inv_d[k];
+        t0 = fmax(t0, fmin(a, b));
+        t1 = fmin(t1, fmax(a, b));
+    }
+    return t0 <= t1 ? t0 : INFINITY;
+}
+
+bool ufbx_wrapper_bvh_raycast(const ufbx_wrapper_bvh *bvh, const double *origins, const double *directions,
+                              size_t count, double max_distance, double *out_distance, int64_t *out_triangle,
+                              double *out_barycentric) {
+    uint32_t *stack = (uint32_t*)malloc((bvh->max_depth + 2) * sizeof(uint32_t));
+    if (!stack) return false;
+
+    for (size_t r = 0; r < count; r++) {
+        const double *o = origins + r * 3;
+        double d[3] = { directions[r * 3 + 0], directions[r * 3 + 1], directions[r * 3 + 2] };
+        double len = sqrt(d[0] * d[0] + d[1] * d[1] + d[2] * d[2]);
+        double best_t = max_distance;
+        int64_t best_tri = -1;
+        double best_u = 0.0, best_v = 0.0;
+
+        if (len > 0.0 && bvh->num_triangles > 0) {
+            double inv_d[3];
+            for (int k = 0; k < 3; k++) { d[k] /= len; inv_d[k] = 1.0 / d[k]; }
+
+            size_t top = 0;
+            stack[top++] = 0;
+            while (top > 0) {
+                const ufbx_wrapper_bvh_node *node = &bvh->nodes[stack[--top]];
+                if (ufbx_wrapper_ray_box(o, inv_d, node->bmin, node->bmax, best_t) == INFINITY) continue;
+                if (node->count > 0) {
+                    for (uint32_t i = node->first; i < node->first + node->count; i++) {
+                        // Moller-Trumbore, two-sided
+                        const double *p0 = bvh->triangles + (size_t)i * 9, *p1 = p0 + 3, *p2 = p0 + 6;
+                        double e1[3] = { p1[0] - p0[0], p1[1] - p0[1], p1[2] - p0[2] };
+                        double e2[3] = { p2[0] - p0[0], p2[1] - p0[1], p2[2] - p0[2] };
+                        double pv[3] = { d[1] * e2[2] - d[2] * e2[1], d[2] * e2[0] - d[0] * e2[2], d[0] * e2[1] - d[1] * e2[0] };
+                        double det = e1[0] * pv[0] + e1[1] * pv[1] + e1[2] * pv[2];
+                        if (det == 0.0) continue;
+                        double inv_det = 1.0 / det;
+                        double tv[3] = { o[0] - p0[0], o[1] - p0[1], o[2] - p0[2] };
+                        double u = (tv[0] * pv[0] + tv[1] * pv[1] + tv[2] * pv[2]) * inv_det;
+                        if (u < 0.0 || u > 1.0) continue;
+                        double qv[3] = { tv[1] * e1[2] - tv[2] * e1[1], tv[2] * e1[0] - tv[0] * e1[2], tv[0] * e1[1] - tv[1] * e1[0] };
+                        double v = (d[0] * qv[0] + d[1] * qv[1] + d[2] * qv[2]) * inv_det;
+                        if (v < 0.0 || u + v > 1.0) continue;
+                        double t = (e2[0] * qv[0] + e2[1] * qv[1] + e2[2] * qv[2]) * inv_det;
+                        if (t > 0.0 && t < best_t) {
+                            best_t = t;
+                            best_tri = bvh->triangle_ids[i];
+                            best_u = u;
+                            best_v = v;
+                        }
+                    }
+                } else {
+                    // Visit the nearer child first
+                    uint32_t near = node->first, far = node->first + 1;
+                    double t_near = ufbx_wrapper_ray_box(o, inv_d, bvh->nodes[near].bmin, bvh->nodes[near].bmax, best_t);
+                    double t_far = ufbx_wrapper_ray_box(o, inv_d, bvh->nodes[far].bmin, bvh->nodes[far].bmax, best_t);
+                    if (t_far < t_near) {
+                        uint32_t tmp = near; near = far; far = tmp;
+                        double tt = t_near; t_near = t_far; t_far = tt;
+                    }
+                    if (t_far != INFINITY) stack[top++] = far;
+                    if (t_near != INFINITY) stack[top++] = near;
+                }
+            }
+        }
+
+        out_triangle[r] = best_tri;
+        out_distance[r] = best_tri >= 0 ? best_t : INFINITY;
+        out_barycentric[r * 2 + 0] = best_tri >= 0 ? best_u : NAN;
+        out_barycentric[r * 2 + 1] = best_tri >= 0 ? best_v : NAN;
+    }
+
+    free(stack);
+    return true;
+}
+
+static double ufbx_wrapper_point_box_dist2(const double *p, const double *bmin, const double *bmax) {
+    double d2 = 0.0;
+    for (int k = 0; k < 3; k++) {
+        double v = p[k] < bmin[k] ? bmin[k] - p[k] : (p[k] > bmax[k] ? p[k] - bmax[k] : 0.0);
+        d2 += v * v;
+    }
+    return d2;
+}
+
+static void ufbx_wrapper_closest_on_triangle(const double *p, const double *a, const double *b, const double *c, double *out) {
+    // Ericson, Real-Time Collision Detection 5.1.5
+    double ab[3], ac[3], ap[3], bp[3], cp[3];
+    for (int k = 0; k < 3; k++) {
+        ab[k] = b[k] - a[k]; ac[k] = c[k] - a[k];
+        ap[k] = p[k] - a[k]; bp[k] = p[k] - b[k]; cp[k] = p[k] - c[k];
+    }
+    #define UFBX_WRAPPER_DOT(x, y) ((x)[0] * (y)[0] + (x)[1] * (y)[1] + (x)[2] * (y)[2])
+    double d1 = UFBX_WRAPPER_DOT(ab, ap), d2 = UFBX_WRAPPER_DOT(ac, ap);
+    double d3 = UFBX_WRAPPER_DOT(ab, bp), d4 = UFBX_WRAPPER_DOT(ac, bp);
+    double d5 = UFBX_WRAPPER_DOT(ab, cp), d6 = UFBX_WRAPPER_DOT(ac, cp);
+    #undef UFBX_WRAPPER_DOT
+    double v, w;
+    if (d1 <= 0.0 && d2 <= 0.0) { v = 0.0; w = 0.0; }
+    else if (d3 >= 0.0 && d4 <= d3) { v = 1.0; w = 0.0; }
+    else if (d6 >= 0.0 && d5 <= d6) { v = 0.0; w = 1.0; }
+    else {
+        double vc = d1 * d4 - d3 * d2, vb = d5 * d2 - d1 * d6, va = d3 * d6 - d5 * d4;
+        if (vc <= 0.0 && d1 >= 0.0 && d3 <= 0.0) { v = d1 / (d1 - d3); w = 0.0; }
+        else if (vb <= 0.0 && d2 >= 0.0 && d6 <= 0.0) { v = 0.0; w = d2 / (d2 - d6); }
+        else if (va <= 0.0 && (d4 - d3) >= 0.0 && (d5 - d6) >= 0.0) {
+            w = (d4 - d3) / ((d4 - d3) + (d5 - d6));
+            v = 1.0 - w;
+        } else {
+            double denom = 1.0 / (va + vb + vc);
+            v = vb * denom;
+            w = vc * denom;
+        }
+    }
+    for (int k = 0; k < 3; k++) out[k] = a[k] + ab[k] * v + ac[k] * w;
+}
+
+bool ufbx_wrapper_bvh_closest_point(const ufbx_wrapper_bvh *bvh, const double *points, size_t count,
+                                    double max_distance, double *out_points, double *out_distance,
+                                    int64_t *out_triangle) {
+    uint32_t *stack = (uint32_t*)malloc((bvh->max_depth + 2) * sizeof(uint32_t));
+    if (!stack) return false;
+
+    for (size_t q = 0; q < count; q++) {
+        const double *p = points + q * 3;
+        double best_d2 = max_distance * max_distance;
+        int64_t best_tri = -1;
+        double best_p[3] = { NAN, NAN, NAN };
+
+        size_t top = 0;
+        if (bvh->num_triangles > 0) stack[top++] = 0;
+        while (top > 0) {
+            const ufbx_wrapper_bvh_node *node = &bvh->nodes[stack[--top]];
+            if (ufbx_wrapper_point_box_dist2(p, node->bmin, node->bmax) > best_d2) continue;
+            if (node->count > 0) {
+                for (uint32_t i = node->first; i < node->first + node->count; i++) {
+                    const double *t = bvh->triangles + (size_t)i * 9;
+                    double c[3];
+                    ufbx_wrapper_closest_on_triangle(p, t, t + 3, t + 6, c);
+                    double dx = c[0] - p[0], dy = c[1] - p[1], dz = c[2] - p[2];
+                    double d2 = dx * dx + dy * dy + dz * dz;
+                    if (d2 <= best_d2) {
+                        best_d2 = d2;
+                        best_tri = bvh->triangle_ids[i];
+                        memcpy(best_p, c, sizeof(best_p));
+                    }
+                }
+            } else {
+                uint32_t near = node->first, far = node->first + 1;
+                double d_near = ufbx_wrapper_point_box_dist2(p, bvh->nodes[near].bmin, bvh->nodes[near].bmax);
+                double d_far = ufbx_wrapper_point_box_dist2(p, bvh->nodes[far].bmin, bvh->nodes[far].bmax);
+                if (d_far < d_near) {
+                    uint32_t tmp = near; near = far; far = tmp;
+                    double dd = d_near; d_near = d_far; d_far = dd;
+                }
+                if (d_far <= best_d2) stack[top++] = far;
+                if (d_near <= best_d2) stack[top++] = near;
+            }
+        }
+
+        out_triangle[q] = best_tri;
+        out_distance[q] = best_tri >= 0 ? sqrt(best_d2) : INFINITY;
+        memcpy(out_points + q * 3, best_p, sizeof(best_p));
+    }
+
+    free(stack);
+    return true;
+}
+
+// Batched math
+
+static ufbx_matrix ufbx_wrapper_load_matrix(const double *matrix16) {
+    // Inverse of ufbx_wrapper_store_matrix(), the fourth row is ignored
+    ufbx_matrix m;
+    m.m00 = matrix16[0]; m.m01 = matrix16[4]; m.m02 = matrix16[8];  m.m03 = matrix16[12];
+    m.m10 = matrix16[1]; m.m11 = matrix16[5]; m.m12 = matrix16[9];  m.m13 = matrix16[13];
+    m.m20 = matrix16[2]; m.m21 = matrix16[6]; m.m22 = matrix16[10]; m.m23 = matrix16[14];
+    return m;
+}
+
+static ufbx_vec3 ufbx_wrapper_load_vec3(const double *v) {
+    ufbx_vec3 r;
+    r.x = v[0]; r.y = v[1]; r.z = v[2];
+    return r;
+}
+
+static void ufbx_wrapper_store_vec3(ufbx_vec3 v, double *out) {
+    out[0] = v.x; out[1] = v.y; out[2] = v.z;
+}
+
+static ufbx_quat ufbx_wrapper_load_quat(const double *q) {
+    ufbx_quat r;
+    r.x = q[0]; r.y = q[1]; r.z = q[2]; r.w = q[3];
+    return r;
+}
+
+static void ufbx_wrapper_store_quat(ufbx_quat q, double *out) {
+    out[0] = q.x; out[1] = q.y; out[2] = q.z; out[3] = q.w;
+}
+
+void ufbx_wrapper_vec3_normalize_n(const double *v, double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_wrapper_store_vec3(ufbx_vec3_normalize(ufbx_wrapper_load_vec3(v + i * 3)), out + i * 3);
+    }
+}
+
+void ufbx_wrapper_quat_mul_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                             double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_quat r = ufbx_quat_mul(ufbx_wrapper_load_quat(a + i * a_stride), ufbx_wrapper_load_quat(b + i * b_stride));
+        ufbx_wrapper_store_quat(r, out + i * 4);
+    }
+}
+
+void ufbx_wrapper_quat_normalize_n(const double *q, double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_wrapper_store_quat(ufbx_quat_normalize(ufbx_wrapper_load_quat(q + i * 4)), out + i * 4);
+    }
+}
+
+void ufbx_wrapper_quat_slerp_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                               const double *t, size_t t_stride, double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_quat r = ufbx_quat_slerp(ufbx_wrapper_load_quat(a + i * a_stride),
+                                      ufbx_wrapper_load_quat(b + i * b_stride), t[i * t_stride]);
+        ufbx_wrapper_store_quat(r, out + i * 4);
+    }
+}
+
+void ufbx_wrapper_quat_rotate_n(const double *q, size_t q_stride, const double *v, size_t v_stride,
+                                double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_vec3 r = ufbx_quat_rotate_vec3(ufbx_wrapper_load_quat(q + i * q_stride),
+                                            ufbx_wrapper_load_vec3(v + i * v_stride));
+        ufbx_wrapper_store_vec3(r, out + i * 3);
+    }
+}
+
+void ufbx_wrapper_quat_to_euler_n(const double *q, int order, double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_vec3 r = ufbx_quat_to_euler(ufbx_wrapper_load_quat(q + i * 4), (ufbx_rotation_order)order);
+        ufbx_wrapper_store_vec3(r, out + i * 3);
+    }
+}
+
+void ufbx_wrapper_euler_to_quat_n(const double *euler, int order, double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_quat r = ufbx_euler_to_quat(ufbx_wrapper_load_vec3(euler + i * 3), (ufbx_rotation_order)order);
+        ufbx_wrapper_store_quat(r, out + i * 4);
+    }
+}
+
+void ufbx_wrapper_matrix_mul_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                               double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_matrix ma = ufbx_wrapper_load_matrix(a + i * a_stride);
+        ufbx_matrix mb = ufbx_wrapper_load_matrix(b + i * b_stride);
+        ufbx_matrix r = ufbx_matrix_mul(&ma, &mb);
+        ufbx_wrapper_store_matrix(&r, out + i * 16);
+    }
+}
+
+void ufbx_wrapper_matrix_invert_n(const double *m, double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_matrix mm = ufbx_wrapper_load_matrix(m + i * 16);
+        ufbx_matrix r = ufbx_matrix_invert(&mm);
+        ufbx_wrapper_store_matrix(&r, out + i * 16);
+    }
+}
+
+void ufbx_wrapper_matrix_transform_n(const double *m, size_t m_stride, const double *v, size_t v_stride,
+                                     bool directions, double *out, size_t count) {
+    ufbx_matrix mm = ufbx_wrapper_load_matrix(m);
+    for (size_t i = 0; i < count; i++) {
+        if (m_stride != 0 && i > 0) mm = ufbx_wrapper_load_matrix(m + i * m_stride);
+        ufbx_vec3 p = ufbx_wrapper_load_vec3(v + i * v_stride);
+        ufbx_vec3 r = directions ? ufbx_transform_direction(&mm, p) : ufbx_transform_position(&mm, p);
+        ufbx_wrapper_store_vec3(r, out + i * 3);
+    }
+}
+
+void ufbx_wrapper_matrix_to_transform_n(const double *m, double *translation, double *rotation,
+                                        double *scale, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_matrix mm = ufbx_wrapper_load_matrix(m + i * 16);
+        ufbx_transform t = ufbx_matrix_to_transform(&mm);
+        ufbx_wrapper_store_vec3(t.translation, translation + i * 3);
+        ufbx_wrapper_store_quat(t.rotation, rotation + i * 4);
+        ufbx_wrapper_store_vec3(t.scale, scale + i * 3);
+    }
+}
+
+void ufbx_wrapper_transform_to_matrix_n(const double *translation, size_t t_stride, const double *rotation,
+                                        size_t r_stride, const double *scale, size_t s_stride,
+                                        double *out, size_t count) {
+    for (size_t i = 0; i < count; i++) {
+        ufbx_transform t;
+        t.translation = ufbx_wrapper_load_vec3(translation + i * t_stride);
+        t.rotation = ufbx_wrapper_load_quat(rotation + i * r_stride);
+        t.scale = ufbx_wrapper_load_vec3(scale + i * s_stride);
+        ufbx_matrix r = ufbx_transform_to_matrix(&t);
+        ufbx_wrapper_store_matrix(&r, out + i * 16);
+    }
+}
+
+// glTF export helpers
+static void ufbx_wrapper_store_transform(const ufbx_transform *t, double *dst) {
+    dst[0] = t->translation.x; dst[1] = t->translation.y; dst[2] = t->translation.z;
+    dst[3] = t->rotation.x; dst[4] = t->rotation.y; dst[5] = t->rotation.z; dst[6] = t->rotation.w;
+    dst[7] = t->scale.x; dst[8] = t->scale.y; dst[9] = t->scale.z;
+}
+
+void ufbx_wrapper_scene_fill_node_trs(const ufbx_scene *scene, double *local, double *geometry) {
+    if (!scene) return;
+    for (size_t i = 0; i < scene->nodes.count; i++) {
+        const ufbx_node *node = scene->nodes.data[i];
+        ufbx_wrapper_store_transform(&node->local_transform, local + i * 10);
+        ufbx_wrapper_store_transform(&node->geometry_transform, geometry + i * 10);
+    }
+}
+
+size_t ufbx_wrapper_mesh_get_num_parts(const ufbx_mesh *mesh) {
+    return mesh ? mesh->material_parts.count : 0;
+}
+
+uint32_t ufbx_wrapper_mesh_get_stream_flags(const ufbx_mesh *mesh) {
+    uint32_t flags = 0;
+    if (!mesh) return flags;
+    if (mesh->vertex_normal.exists) flags |= UFBX_WRAPPER_STREAM_NORMAL;
+    if (mesh->vertex_uv.exists) flags |= UFBX_WRAPPER_STREAM_UV;
+    if (mesh->vertex_color.exists) flags |= UFBX_WRAPPER_STREAM_COLOR;
+    return flags;
+}
+
+size_t ufbx_wrapper_mesh_part_get_num_triangles(const ufbx_mesh *mesh, size_t part_index) {
+    if (!mesh || part_index >= mesh->material_parts.count) return 0;
+    return mesh->material_parts.data[part_index].num_triangles;
+}
+
+static void ufbx_wrapper_fill_skin_vertex(const ufbx_skin_deformer *skin, uint32_t vertex,
+                                          uint16_t *joints, float *weights) {
+    // Weights are sorted by decreasing weight, so the first four are the strongest
+    uint32_t count = 0;
+    float total = 0.0f;
+    if (vertex < skin->vertices.count) {
+        ufbx_skin_vertex sv = skin->vertices.data[vertex];
+        for (uint32_t k = 0; k < sv.num_weights && count < 4; k++) {
+            ufbx_skin_weight w = skin->weights.data[sv.weight_begin + k];
+            if (w.weight <= 0.0) continue;
+            joints[count] = (uint16_t)w.cluster_index;
+            weights[count] = (float)w.weight;
+            total += weights[count];
+            count++;
+        }
+    }
+    for (uint32_t k = 0; k < count; k++) weights[k] /= total;
+    if (count == 0) {
+        // glTF requires weights summing to one, bind unweighted vertices to the first joint
+        joints[0] = 0;
+        weights[0] = 1.0f;
+        count = 1;
+    }
+    for (uint32_t k = count; k < 4; k++) {
+        joints[k] = 0;
+        weights[k] = 0.0f;
+    }
+}
+
+size_t ufbx_wrapper_mesh_part_fill(const ufbx_mesh *mesh, size_t part_index, const ufbx_skin_deformer *skin,
+                                   const ufbx_wrapper_part_buffers *buffers) {
+    if (!mesh || part_index >= mesh->material_parts.count) return 0;
+    const ufbx_mesh_part *part = &mesh->material_parts.data[part_index];
+    size_t num_corners = part->num_triangles * 3;
+    if (num_corners == 0) return 0;
+
+    size_t tri_capacity = mesh->max_face_triangles * 3;
+    uint32_t *tri_indices = (uint32_t*)malloc(tri_capacity * sizeof(uint32_t));
+    if (!tri_indices) return 0;
+
+    bool normals = buffers->normals && mesh->vertex_normal.exists;
+    bool uvs = buffers->uvs && mesh->vertex_uv.exists;
+    bool colors = buffers->colors && mesh->vertex_color.exists;
+    bool skinned = skin && buffers->joints && buffers->weights;
+
+    size_t corner = 0;
+    for (size_t i = 0; i < part->face_indices.count; i++) {
+        ufbx_face face = mesh->faces.data[part->face_indices.data[i]];
+        uint32_t num_tris = ufbx_triangulate_face(tri_indices, tri_capacity, mesh, face);
+        for (uint32_t t = 0; t < num_tris * 3; t++, corner++) {
+            uint32_t index = tri_indices[t];
+            ufbx_vec3 p = ufbx_get_vertex_vec3(&mesh->vertex_position, index);
+            float *dst = buffers->positions + corner * 3;
+            dst[0] = (float)p.x; dst[1] = (float)p.y; dst[2] = (float)p.z;
+            if (normals) {
+                ufbx_vec3 n = ufbx_get_vertex_vec3(&mesh->vertex_normal, index);
+                dst = buffers->normals + corner * 3;
+                dst[0] = (float)n.x; dst[1] = (float)n.y; dst[2] = (float)n.z;
+            }
+            if (uvs) {
+                ufbx_vec2 uv = ufbx_get_vertex_vec2(&mesh->vertex_uv, index);
+                dst = buffers->uvs + corner * 2;
+                dst[0] = (float)uv.x; dst[1] = (float)(1.0 - uv.y);
+            }
+            if (colors) {
+                ufbx_vec4 c = ufbx_get_vertex_vec4(&mesh->vertex_color, index);
+                dst = buffers->colors + corner * 4;
+                dst[0] = (float)c.x; dst[1] = (float)c.y; dst[2] = (float)c.z; dst[3] = (float)c.w;
+            }
+            if (skinned) {
+                ufbx_wrapper_fill_skin_vertex(skin, mesh->vertex_indices.data[index],
+                                              buffers->joints + corner * 4, buffers->weights + corner * 4);
+            }
+        }
+    }
+    free(tri_indices);
+
+    // Zero unused streams so they cannot split vertices, then merge in place
+    ufbx_vertex_stream streams[6];
+    size_t num_streams = 0;
+    streams[num_streams].data = buffers->positions;
+    streams[num_streams].vertex_count = corner;
+    streams[num_streams++].vertex_size = 3 * sizeof(float);
+    if (buffers->normals) {
+        if (!normals) memset(buffers->normals, 0, corner * 3 * sizeof(float));
+        streams[num_streams].data = buffers->normals;
+        streams[num_streams].vertex_count = corner;
+        streams[num_streams++].vertex_size = 3 * sizeof(float);
+    }
+    if (buffers->uvs) {
+        if (!uvs) memset(buffers->uvs, 0, corner * 2 * sizeof(float));
+        streams[num_streams].data = buffers->uvs;
+        streams[num_streams].vertex_count = corner;
+        streams[num_streams++].vertex_size = 2 * sizeof(float);
+    }
+    if (buffers->colors) {
+        if (!colors) memset(buffers->colors, 0, corner * 4 * sizeof(float));
+        streams[num_streams].data = buffers->colors;
+        streams[num_streams].vertex_count = corner;
+        streams[num_streams++].vertex_size = 4 * sizeof(float);
+    }
+    if (skinned) {
+        streams[num_streams].data = buffers->joints;
+        streams[num_streams].vertex_count = corner;
+        streams[num_streams++].vertex_size = 4 * sizeof(uint16_t);
+        streams[num_streams].data = buffers->weights;
+        streams[num_streams].vertex_count = corner;
+        streams[num_streams++].vertex_size = 4 * sizeof(float);
+    }
+
+    ufbx_error error;
+    size_t num_vertices = ufbx_generate_indices(streams, num_streams, buffers->indices, corner, NULL, &error);
+    if (error.type != UFBX_ERROR_NONE) return 0;
+    return num_vertices;
+}
+
+void ufbx_wrapper_skin_fill_bind(const ufbx_skin_deformer *skin, int32_t *joint_nodes, float *inverse_bind) {
+    if (!skin) return;
+    for (size_t i = 0; i < skin->clusters.count; i++) {
+        const ufbx_skin_cluster *cluster = skin->clusters.data[i];
+        joint_nodes[i] = cluster->bone_node ? (int32_t)cluster->bone_node->typed_id : -1;
+        const ufbx_matrix *m = &cluster->geometry_to_bone;
+        float *dst = inverse_bind + i * 16;
+        dst[0] = (float)m->m00; dst[4] = (float)m->m01; dst[8]  = (float)m->m02; dst[12] = (float)m->m03;
+        dst[1] = (float)m->m10; dst[5] = (float)m->m11; dst[9]  = (float)m->m12; dst[13] = (float)m->m13;
+        dst[2] = (float)m->m20; dst[6] = (float)m->m21; dst[10] = (float)m->m22; dst[14] = (float)m->m23;
+        dst[3] = 0.0f;          dst[7] = 0.0f;          dst[11] = 0.0f;          dst[15] = 1.0f;
+    }
+}
+
+// Mesh content hashes
+typedef struct {
+    uint64_t a, b;
+} ufbx_wrapper_hash_state;
+
+static inline uint64_t ufbx_wrapper_rotl64(uint64_t x, int r) {
+    return (x << r) | (x >> (64 - r));
+}
+
+static inline uint64_t ufbx_wrapper_mix64(uint64_t x) {
+    x ^= x >> 30; x *= UINT64_C(0xbf58476d1ce4e5b9);
+    x ^= x >> 27; x *= UINT64_C(0x94d049bb133111eb);
+    return x ^ (x >> 31);
+}
+
+// Two lanes fed the same bijectively mixed word but accumulated differently
+static inline void ufbx_wrapper_hash_word(ufbx_wrapper_hash_state *h, uint64_t word) {
+    uint64_t m = ufbx_wrapper_mix64(word);
+    h->a = ufbx_wrapper_rotl64(h->a ^ m, 27) * UINT64_C(0x9e3779b97f4a7c15) + UINT64_C(0x52dce729);
+    h->b = ufbx_wrapper_rotl64(h->b + ufbx_wrapper_rotl64(m, 32), 31) * UINT64_C(0xff51afd7ed558ccd) ^ h->a;
+}
+
+static void ufbx_wrapper_hash_reals(ufbx_wrapper_hash_state *h, const ufbx_real *values, size_t count) {
+    ufbx_wrapper_hash_word(h, count);
+    for (size_t i = 0; i < count; i++) {
+        double v = (double)values[i];
+        if (v == 0.0) v = 0.0;  // -0.0 hashes as 0.0
+        uint64_t bits;
+        memcpy(&bits, &v, sizeof(bits));
+        ufbx_wrapper_hash_word(h, bits);
+    }
+}
+
+static void ufbx_wrapper_hash_u32(ufbx_wrapper_hash_state *h, const uint32_t *values, size_t count) {
+    ufbx_wrapper_hash_word(h, count);
+    size_t i = 0;
+    for (; i + 2 <= count; i += 2) {
+        ufbx_wrapper_hash_word(h, (uint64_t)values[i] | (uint64_t)values[i + 1] << 32);
+    }
+    if (i < count) ufbx_wrapper_hash_word(h, values[i]);
+}
+
+static void ufbx_wrapper_hash_attrib(ufbx_wrapper_hash_state *h, bool exists, const ufbx_real *values,
+                                     size_t num_reals, const uint32_t *indices, size_t num_indices) {
+    ufbx_wrapper_hash_word(h, exists);
+    if (!exists) return;
+    ufbx_wrapper_hash_reals(h, values, num_reals);
+    ufbx_wrapper_hash_u32(h, indices, num_indices);
+}
+
+void ufbx_wrapper_scene_hash_meshes(const ufbx_scene *scene, bool attributes, uint64_t *out_hashes) {
+    if (!scene) return;
+    for (size_t i = 0; i < scene->meshes.count; i++) {
+        const ufbx_mesh *mesh = scene->meshes.data[i];
+        ufbx_wrapper_hash_state h = { UINT64_C(0x243f6a8885a308d3), UINT64_C(0x13198a2e03707344) };
+
+        ufbx_wrapper_hash_word(&h, mesh->faces.count);
+        for (size_t f = 0; f < mesh->faces.count; f++) {
+            ufbx_wrapper_hash_word(&h, mesh->faces.data[f].num_indices);
+        }
+        const ufbx_vertex_vec3 *pos = &mesh->vertex_position;
+        ufbx_wrapper_hash_attrib(&h, pos->exists, (const ufbx_real*)pos->values.data, pos->values.count * 3,
+                                 pos->indices.data, pos->indices.count);
+
+        if (attributes) {
+            const ufbx_vertex_vec3 *normal = &mesh->vertex_normal;
+            ufbx_wrapper_hash_attrib(&h, normal->exists, (const ufbx_real*)normal->values.data,
+                                     normal->values.count * 3, normal->indices.data, normal->indices.count);
+            ufbx_wrapper_hash_word(&h, mesh->uv_sets.count);
+            for (size_t s = 0; s < mesh->uv_sets.count; s++) {
+                const ufbx_vertex_vec2 *uv = &mesh->uv_sets.data[s].vertex_uv;
+                ufbx_wrapper_hash_attrib(&h, uv->exists, (const ufbx_real*)uv->values.data, uv->values.count * 2,
+                                         uv->indices.data, uv->indices.count);
+            }
+            ufbx_wrapper_hash_word(&h, mesh->color_sets.count);
+            for (size_t s = 0; s < mesh->color_sets.count; s++) {
+                const ufbx_vertex_vec4 *color = &mesh->color_sets.data[s].vertex_color;
+                ufbx_wrapper_hash_attrib(&h, color->exists, (const ufbx_real*)color->values.data,
+                                         color->values.count * 4, color->indices.data, color->indices.count);
+            }
+            ufbx_wrapper_hash_u32(&h, mesh->face_material.data, mesh->face_material.count);
+        }
+
+        out_hashes[i * 2 + 0] = ufbx_wrapper_mix64(h.a ^ h.b);
+        out_hashes[i * 2 + 1] = ufbx_wrapper_mix64(h.b + ufbx_wrapper_rotl64(h.a, 17));
+    }
+}
+
+// Mesh triangulation with index buffer optimization
+typedef struct {
+    double key;
+    uint32_t index;
+} ufbx_wrapper_cluster_key;
+
+typedef struct {
+    uint32_t *local_id;      // [num_vertices] mesh vertex -> part-local vertex, UINT32_MAX if unused
+    uint32_t *part_vertices; // [num_vertices] part-local vertex -> mesh vertex
+    uint32_t *tris;          // [3 * num_triangles] part triangles in part-local vertices
+    uint32_t *adj_offsets;   // [num_vertices + 1]
+    uint32_t *adj;           // [3 * num_triangles] triangles around each vertex
+    uint32_t *live;          // [num_vertices] triangles not yet emitted around each vertex
+    uint32_t *cache_time;    // [num_vertices]
+    uint32_t *stack;         // [3 * num_triangles] dead-end stack
+    uint32_t *candidates;    // [3 * num_triangles]
+    uint8_t *emitted;        // [num_triangles]
+    uint32_t *order;         // [num_triangles] output triangle order
+    uint32_t *clusters;      // [num_triangles + 1] cluster start offsets into order
+    uint32_t *sorted;        // [num_triangles + 1] triangle order sorted by cluster
+    ufbx_wrapper_cluster_key *keys;  // [num_triangles] overdraw sort key per cluster
+    double *cluster_geometry;        // [6 * num_triangles] centroid and normal per cluster
+    uint32_t *corners;       // [3 * num_triangles] part corners before reordering
+} ufbx_wrapper_tri_scratch;
+
+// Returns whether the triangle vertices missed a FIFO cache of cache_size entries
+static uint32_t ufbx_wrapper_cache_misses(const uint32_t *tri, uint32_t *cache_time, uint32_t *time,
+                                          uint32_t cache_size) {
+    uint32_t misses = 0;
+    for (int c = 0; c < 3; c++) {
+        uint32_t v = tri[c];
+        if (*time - cache_time[v] > cache_size) {
+            cache_time[v] = (*time)++;
+            misses++;
+        }
+    }
+    return misses;
+}
+
+// Tipsify (Sander, Nehab and Barczak 2007): emits triangle fans around a vertex
+// chosen to stay in a FIFO cache of cache_size entries. Writes the triangle order
+// and the cluster starts where the fan walk had to jump (hard boundaries); returns
+// the number of clusters.
+static size_t ufbx_wrapper_tipsify(ufbx_wrapper_tri_scratch *s, size_t num_tris, size_t num_verts,
+                                   uint32_t cache_size) {
+    memset(s->adj_offsets, 0, (num_verts + 1) * sizeof(uint32_t));
+    for (size_t i = 0; i < num_tris * 3; i++) s->adj_offsets[s->tris[i] + 1]++;
+    for (size_t v = 0; v < num_verts; v++) {
+        s->live[v] = s->adj_offsets[v + 1];
+        s->adj_offsets[v + 1] += s->adj_offsets[v];
+    }
+    for (size_t i = 0; i < num_tris * 3; i++) {
+        uint32_t v = s->tris[i];
+        s->adj[s->adj_offsets[v + 1] - s->live[v]] = (uint32_t)(i / 3);
+        s->live[v]--;
+    }
+    for (size_t v = 0; v < num_verts; v++) {
+        s->live[v] = s->adj_offsets[v + 1] - s->adj_offsets[v];
+        s->cache_time[v] = 0;
+    }
+    memset(s->emitted, 0, num_tris);
+
+    uint32_t time = cache_size + 1;
+    size_t num_out = 0, num_stack = 0, num_clusters = 0, cursor = 0;
+    int64_t fan = 0;
+    bool jumped = true;
+    while (fan >= 0) {
+        if (jumped) s->clusters[num_clusters++] = (uint32_t)num_out;
+        size_t num_candidates = 0;
+        for (uint32_t a = s->adj_offsets[fan]; a < s->adj_offsets[fan + 1]; a++) {
+            uint32_t t = s->adj[a];
+            if (s->emitted[t]) continue;
+            s->emitted[t] = 1;
+            s->order[num_out++] = t;
+            for (int c = 0; c < 3; c++) {
+                uint32_t v = s->tris[t * 3 + c];
+                s->stack[num_stack++] = v;
+                s->candidates[num_candidates++] = v;
+                s->live[v]--;
+                if (time - s->cache_time[v] > cache_size) s->cache_time[v] = time++;
+            }
+        }
+
+        // Prefer the live candidate that entered the cache earliest but stays cached
+        // while its remaining triangles are emitted
+        int64_t best = -1, best_priority = -1;
+        for (size_t i = 0; i < num_candidates; i++) {
+            uint32_t v = s->candidates[i];
+            if (s->live[v] == 0) continue;
+            int64_t priority = 0;
+            if ((int64_t)time - s->cache_time[v] + 2 * (int64_t)s->live[v] <= (int64_t)cache_size) {
+                priority = (int64_t)time - s->cache_time[v];
+            }
+            if (priority > best_priority) {
+                best_priority = priority;
+                best = v;
+            }
+        }
+        jumped = best < 0;
+        if (jumped) {
+            while (num_stack > 0 && best < 0) {
+                uint32_t v = s->stack[--num_stack];
+                if (s->live[v] > 0) best = v;
+            }
+            while (cursor < num_verts && best < 0) {
+                if (s->live[cursor] > 0) best = (int64_t)cursor;
+                else cursor++;
+            }
+        }
+        fan = best;
+    }
+    s->clusters[num_clusters] = (uint32_t)num_out;
+    return num_clusters;
+}
+
+// Splits hard clusters where the cache miss rate so far is within threshold of the
+// whole cluster's, as in meshoptimizer's overdraw optimizer, so sorting has
+// finer clusters to work with at a bounded vertex cache cost
+static size_t ufbx_wrapper_soft_clusters(ufbx_wrapper_tri_scratch *s, size_t num_clusters, uint32_t cache_size,
+                                         double threshold) {
+    size_t num_hard = num_clusters;
+    uint32_t *hard = s->sorted;  // Free until the clusters are sorted
+    memcpy(hard, s->clusters, (num_hard + 1) * sizeof(uint32_t));
+    num_clusters = 0;
+    for (size_t c = 0; c < num_hard; c++) {
+        uint32_t begin = hard[c], end = hard[c + 1];
+        uint32_t time = cache_size + 1, misses = 0;
+        for (uint32_t i = begin * 3; i < end * 3; i++) s->cache_time[s->tris[s->order[i / 3] * 3 + i % 3]] = 0;
+        for (uint32_t i = begin; i < end; i++) {
+            misses += ufbx_wrapper_cache_misses(s->tris + s->order[i] * 3, s->cache_time, &time, cache_size);
+        }
+        double limit = threshold * (double)misses / (double)(end - begin);
+
+        s->clusters[num_clusters++] = begin;
+        time += cache_size + 1;
+        misses = 0;
+        uint32_t start = begin;
+        for (uint32_t i = begin; i < end; i++) {
+            misses += ufbx_wrapper_cache_misses(s->tris + s->order[i] * 3, s->cache_time, &time, cache_size);
+            if (i + 1 < end && (double)misses / (double)(i + 1 - start) <= limit) {
+                s->clusters[num_clusters++] = start = i + 1;
+                time += cache_size + 1;  // Start the next cluster with a cold cache
+                misses = 0;
+            }
+        }
+    }
+    s->clusters[num_clusters] = hard[num_hard];
+    return num_clusters;
+}
+
+static int ufbx_wrapper_cmp_cluster(const void *a, const void *b) {
+    const ufbx_wrapper_cluster_key *ka = (const ufbx_wrapper_cluster_key*)a;
+    const ufbx_wrapper_cluster_key *kb = (const ufbx_wrapper_cluster_key*)b;
+    if (ka->key != kb->key) return ka->key > kb->key ? -1 : 1;
+    return ka->index < kb->index ? -1 : (ka->index > kb->index ? 1 : 0);
+}
+
+// Sorts clusters by the view-independent overdraw measure of Tipsify, how far the
+// cluster faces away from the part's centroid, so outer surfaces are drawn first
+static void ufbx_wrapper_sort_clusters(ufbx_wrapper_tri_scratch *s, size_t num_clusters, const ufbx_mesh *mesh) {
+    double center[3] = { 0.0, 0.0, 0.0 }, total_area = 0.0;
+    for (size_t c = 0; c < num_clusters; c++) {
+        double *centroid = s->cluster_geometry + c * 6, *normal = centroid + 3;
+        double area = 0.0;
+        memset(centroid, 0, 6 * sizeof(double));
+        for (uint32_t i = s->clusters[c]; i < s->clusters[c + 1]; i++) {
+            const uint32_t *tri = s->tris + s->order[i] * 3;
+            ufbx_vec3 p0 = mesh->vertices.data[s->part_vertices[tri[0]]];
+            ufbx_vec3 p1 = mesh->vertices.data[s->part_vertices[tri[1]]];
+            ufbx_vec3 p2 = mesh->vertices.data[s->part_vertices[tri[2]]];
+            double e1[3] = { p1.x - p0.x, p1.y - p0.y, p1.z - p0.z };
+            double e2[3] = { p2.x - p0.x, p2.y - p0.y, p2.z - p0.z };
+            double n[3] = { e1[1] * e2[2] - e1[2] * e2[1], e1[2] * e2[0] - e1[0] * e2[2],
+                            e1[0] * e2[1] - e1[1] * e2[0] };
+            double a = sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2]);
+            centroid[0] += a * (p0.x + p1.x + p2.x) / 3.0;
+            centroid[1] += a * (p0.y + p1.y + p2.y) / 3.0;
+            centroid[2] += a * (p0.z + p1.z + p2.z) / 3.0;
+            for (int k = 0; k < 3; k++) normal[k] += n[k];
+            area += a;
+        }
+        for (int k = 0; k < 3; k++) center[k] += centroid[k];
+        total_area += area;
+        if (area > 0.0) {
+            for (int k = 0; k < 3; k++) centroid[k] /= area;
+        }
+    }
+    if (total_area > 0.0) {
+        for (int k = 0; k < 3; k++) center[k] /= total_area;
+    }
+
+    for (size_t c = 0; c < num_clusters; c++) {
+        const double *centroid = s->cluster_geometry + c * 6, *normal = centroid + 3;
+        double len = sqrt(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]);
+        double key = 0.0;
+        if (len > 0.0) {
+            for (int k = 0; k < 3; k++) key += (centroid[k] - center[k]) * normal[k] / len;
+        }
+        s->keys[c].key = key;
+        s->keys[c].index = (uint32_t)c;
+    }
+    qsort(s->keys, num_clusters, sizeof(ufbx_wrapper_cluster_key), ufbx_wrapper_cmp_cluster);
+
+    size_t dst = 0;
+    for (size_t c = 0; c < num_clusters; c++) {
+        uint32_t index = s->keys[c].index;
+        for (uint32_t i = s->clusters[index]; i < s->clusters[index + 1]; i++) s->sorted[dst++] = s->order[i];
+    }
+    memcpy(s->order, s->sorted, dst * sizeof(uint32_t));
+}
+
+bool ufbx_wrapper_mesh_triangulate(const ufbx_mesh *mesh, uint32_t flags, uint32_t cache_size, uint32_t *corners,
+                                   uint32_t *indices, size_t *part_offsets, uint32_t *vertex_order) {
+    if (!mesh) return false;
+    size_t num_tris = mesh->num_triangles, num_verts = mesh->num_vertices;
+    size_t tri_capacity = mesh->max_face_triangles * 3;
+    bool optimize = (flags & (UFBX_WRAPPER_OPTIMIZE_VERTEX_CACHE | UFBX_WRAPPER_OPTIMIZE_OVERDRAW)) != 0;
+    if (cache_size == 0) cache_size = 1;
+
+    ufbx_wrapper_tri_scratch s;
+    memset(&s, 0, sizeof(s));
+    uint32_t *tri_indices = (uint32_t*)malloc((tri_capacity + 1) * sizeof(uint32_t));
+    bool ok = tri_indices != NULL;
+    if (ok && optimize) {
+        s.local_id = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+        s.part_vertices = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+        s.tris = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+        s.adj_offsets = (uint32_t*)malloc((num_verts + 2) * sizeof(uint32_t));
+        s.adj = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+        s.live = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+        s.cache_time = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+        s.stack = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+        s.candidates = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+        s.emitted = (uint8_t*)malloc(num_tris + 1);
+        s.order = (uint32_t*)malloc((num_tris + 1) * sizeof(uint32_t));
+        s.clusters = (uint32_t*)malloc((num_tris + 2) * sizeof(uint32_t));
+        s.sorted = (uint32_t*)malloc((num_tris + 2) * sizeof(uint32_t));
+        s.keys = (ufbx_wrapper_cluster_key*)malloc((num_tris + 1) * sizeof(ufbx_wrapper_cluster_key));
+        s.cluster_geometry = (double*)malloc((num_tris * 6 + 1) * sizeof(double));
+        s.corners = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+        ok = s.local_id && s.part_vertices && s.tris && s.adj_offsets && s.adj && s.live && s.cache_time
+            && s.stack && s.candidates && s.emitted && s.order && s.clusters && s.sorted && s.keys
+            && s.cluster_geometry && s.corners;
+        if (ok) memset(s.local_id, 0xff, num_verts * sizeof(uint32_t));
+    }
+
+    size_t num_out = 0;
+    for (size_t p = 0; ok && p < mesh->material_parts.count; p++) {
+        const ufbx_mesh_part *part = &mesh->material_parts.data[p];
+        part_offsets[p] = num_out;
+        size_t begin = num_out;
+        for (size_t i = 0; i < part->face_indices.count; i++) {
+            ufbx_face face = mesh->faces.data[part->face_indices.data[i]];
+            uint32_t n = ufbx_triangulate_face(tri_indices, tri_capacity, mesh, face);
+            memcpy(corners + num_out * 3, tri_indices, n * 3 * sizeof(uint32_t));
+            num_out += n;
+        }
+        size_t part_tris = num_out - begin;
+        if (!optimize || part_tris == 0) continue;
+
+        // Triangles in part-local vertices, so scratch only scales with the part
+        uint32_t *part_corners = corners + begin * 3;
+        size_t part_verts = 0;
+        for (size_t i = 0; i < part_tris * 3; i++) {
+            uint32_t v = mesh->vertex_indices.data[part_corners[i]];
+            if (s.local_id[v] == UINT32_MAX) {
+                s.local_id[v] = (uint32_t)part_verts;
+                s.part_vertices[part_verts++] = v;
+            }
+            s.tris[i] = s.local_id[v];
+        }
+
+        size_t num_clusters = ufbx_wrapper_tipsify(&s, part_tris, part_verts, cache_size);
+        if (flags & UFBX_WRAPPER_OPTIMIZE_OVERDRAW) {
+            num_clusters = ufbx_wrapper_soft_clusters(&s, num_clusters, cache_size, 1.05);
+            ufbx_wrapper_sort_clusters(&s, num_clusters, mesh);
+        }
+
+        memcpy(s.corners, part_corners, part_tris * 3 * sizeof(uint32_t));
+        for (size_t i = 0; i < part_tris; i++) {
+            memcpy(part_corners + i * 3, s.corners + s.order[i] * 3, 3 * sizeof(uint32_t));
+        }
+        for (size_t i = 0; i < part_verts; i++) s.local_id[s.part_vertices[i]] = UINT32_MAX;
+    }
+    if (ok) part_offsets[mesh->material_parts.count] = num_out;
+
+    if (ok) {
+        for (size_t i = 0; i < num_out * 3; i++) indices[i] = mesh->vertex_indices.data[corners[i]];
+    }
+    if (ok && (flags & UFBX_WRAPPER_OPTIMIZE_FETCH)) {
+        // Renumber vertices in order of first use; unused vertices go last
+        uint32_t *remap = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+        ok = remap != NULL;
+        if (ok) {
+            memset(remap, 0xff, num_verts * sizeof(uint32_t));
+            uint32_t next = 0;
+            for (size_t i = 0; i < num_out * 3; i++) {
+                uint32_t v = indices[i];
+                if (remap[v] == UINT32_MAX) {
+                    vertex_order[next] = v;
+                    remap[v] = next++;
+                }
+                indices[i] = remap[v];
+            }
+            for (size_t v = 0; v < num_verts; v++) {
+                if (remap[v] == UINT32_MAX) vertex_order[next++] = (uint32_t)v;
+            }
+            free(remap);
+        }
+    }
+
+    free(tri_indices);
+    free(s.local_id); free(s.part_vertices); free(s.tris); free(s.adj_offsets); free(s.adj);
+    free(s.live); free(s.cache_time); free(s.stack); free(s.candidates); free(s.emitted);
+    free(s.order); free(s.clusters); free(s.sorted); free(s.keys); free(s.cluster_geometry);
+    free(s.corners);
+    return ok;
+}
+
+// Meshlets
+static inline double ufbx_wrapper_dot3(const double *a, const double *b) {
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2];
+}
+
+// Unit normal and centroid of a triangle of mesh vertices; returns twice its area
+static double ufbx_wrapper_triangle_frame(const ufbx_mesh *mesh, const uint32_t *tri, double *normal,
+                                          double *centroid) {
+    ufbx_vec3 p0 = mesh->vertices.data[tri[0]], p1 = mesh->vertices.data[tri[1]], p2 = mesh->vertices.data[tri[2]];
+    double e1[3] = { p1.x - p0.x, p1.y - p0.y, p1.z - p0.z };
+    double e2[3] = { p2.x - p0.x, p2.y - p0.y, p2.z - p0.z };
+    normal[0] = e1[1] * e2[2] - e1[2] * e2[1];
+    normal[1] = e1[2] * e2[0] - e1[0] * e2[2];
+    normal[2] = e1[0] * e2[1] - e1[1] * e2[0];
+    double len = sqrt(ufbx_wrapper_dot3(normal, normal));
+    for (int k = 0; k < 3; k++) normal[k] = len > 0.0 ? normal[k] / len : 0.0;
+    if (centroid) {
+        centroid[0] = (p0.x + p1.x + p2.x) / 3.0;
+        centroid[1] = (p0.y + p1.y + p2.y) / 3.0;
+        centroid[2] = (p0.z + p1.z + p2.z) / 3.0;
+    }
+    return len;
+}
+
+// Greedy meshlet growth: each step adds the triangle adjacent to the meshlet that
+// needs the fewest new vertices, preferring (as meshoptimizer does) triangles that
+// would be left dangling, then ones close to the meshlet's centroid and, by
+// cone_weight, facing along its average normal.
+// Meshlets never span material parts.
+bool ufbx_wrapper_mesh_build_meshlets(const ufbx_mesh *mesh, uint32_t max_vertices, uint32_t max_triangles,
+                                      double cone_weight, uint32_t *meshlets, uint32_t *meshlet_vertices,
+                                      uint8_t *meshlet_triangles, size_t *part_offsets, size_t *num_meshlets_out) {
+    *num_meshlets_out = 0;
+    if (!mesh) return false;
+    size_t num_tris = mesh->num_triangles, num_verts = mesh->num_vertices;
+    size_t num_parts = mesh->material_parts.count;
+
+    uint32_t *corners = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+    uint32_t *tris = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+    size_t *tri_parts = (size_t*)malloc((num_parts + 1) * sizeof(size_t));
+    uint32_t *adj_offsets = (uint32_t*)calloc(num_verts + 2, sizeof(uint32_t));
+    uint32_t *adj = (uint32_t*)malloc((num_tris * 3 + 1) * sizeof(uint32_t));
+    uint32_t *live = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+    uint32_t *local = (uint32_t*)malloc((num_verts + 1) * sizeof(uint32_t));
+    uint8_t *emitted = (uint8_t*)calloc(num_tris + 1, 1);
+    uint32_t *queued = (uint32_t*)calloc(num_tris + 1, sizeof(uint32_t));
+    double *frames = (double*)malloc((num_tris * 6 + 1) * sizeof(double));
+    size_t num_meshlets = 0;
+    bool ok = false;
+    if (!corners || !tris || !tri_parts || !adj_offsets || !adj || !live || !local || !emitted || !queued
+        || !frames) goto done;
+    if (!ufbx_wrapper_mesh_triangulate(mesh, 0, 16, corners, tris, tri_parts, NULL)) goto done;
+    // Triangles sharing a vertex with the current meshlet, queued once per meshlet
+    // (marked with its stamp in queued); reuses the corner buffer
+    uint32_t *candidates = corners;
+
+    double total_area = 0.0;
+    for (size_t t = 0; t < num_tris; t++) {
+        total_area += 0.5 * ufbx_wrapper_triangle_frame(mesh, tris + t * 3, frames + t * 6, frames + t * 6 + 3);
+        for (int c = 0; c < 3; c++) adj_offsets[tris[t * 3 + c] + 1]++;
+    }
+    for (size_t v = 0; v < num_verts; v++) {
+        live[v] = adj_offsets[v + 1];
+        adj_offsets[v + 1] += adj_offsets[v];
+    }
+    for (size_t i = 0; i < num_tris * 3; i++) {
+        uint32_t v = tris[i];
+        adj[adj_offsets[v + 1] - live[v]] = (uint32_t)(i / 3);
+        live[v]--;
+    }
+    for (size_t v = 0; v < num_verts; v++) live[v] = adj_offsets[v + 1] - adj_offsets[v];
+    memset(local, 0xff, num_verts * sizeof(uint32_t));
+    double expected_radius = num_tris > 0 ? 0.5 * sqrt(total_area / (double)num_tris * max_triangles) : 1.0;
+    if (!(expected_radius > 0.0)) expected_radius = 1.0;
+
+    size_t vertex_offset = 0, triangle_offset = 0;
+    for (size_t p = 0; p < num_parts; p++) {
+        part_offsets[p] = num_meshlets;
+        size_t begin = tri_parts[p], end = tri_parts[p + 1], cursor = begin;
+        while (true) {
+            while (cursor < end && emitted[cursor]) cursor++;
+            if (cursor >= end) break;
+
+            uint32_t *mv = meshlet_vertices + vertex_offset;
+            uint8_t *mt = meshlet_triangles + triangle_offset * 3;
+            uint32_t vcount = 0, tcount = 0;
+            size_t num_candidates = 0;
+            uint32_t stamp = (uint32_t)num_meshlets + 1;
+            queued[cursor] = stamp;
+            double centroid[3] = { 0.0, 0.0, 0.0 }, axis[3] = { 0.0, 0.0, 0.0 };
+            int64_t next = (int64_t)cursor;
+            while (next >= 0) {
+                // Add the triangle
+                const uint32_t *tri = tris + next * 3;
+                const double *frame = frames + next * 6;
+                for (int c = 0; c < 3; c++) {
+                    uint32_t v = tri[c];
+                    if (local[v] == UINT32_MAX) {
+                        local[v] = vcount;
+                        mv[vcount++] = v;
+                        for (uint32_t a = adj_offsets[v]; a < adj_offsets[v + 1]; a++) {
+                            uint32_t t = adj[a];
+                            if (t >= begin && t < end && !emitted[t] && queued[t] != stamp) {
+                                queued[t] = stamp;
+                                candidates[num_candidates++] = t;
+                            }
+                        }
+                    }
+                    mt[tcount * 3 + c] = (uint8_t)local[v];
+                    live[v]--;
+                }
+                emitted[next] = 1;
+                tcount++;
+                for (int k = 0; k < 3; k++) {
+                    centroid[k] += (frame[3 + k] - centroid[k]) / (double)tcount;
+                    axis[k] += frame[k];
+                }
+                if (tcount >= max_triangles) break;
+
+                double axis_len = sqrt(ufbx_wrapper_dot3(axis, axis));
+                double unit_axis[3] = { 0.0, 0.0, 0.0 };
+                if (axis_len > 0.0) {
+                    for (int k = 0; k < 3; k++) unit_axis[k] = axis[k] / axis_len;
+                }
+
+                // Pick the next triangle among those sharing a vertex with the meshlet
+                next = -1;
+                uint32_t best_priority = UINT32_MAX;
+                double best_score = INFINITY;
+                size_t num_kept = 0;
+                for (size_t i = 0; i < num_candidates; i++) {
+                    uint32_t t = candidates[i];
+                    if (emitted[t]) continue;
+                    candidates[num_kept++] = t;
+                    const uint32_t *ct = tris + t * 3;
+                    uint32_t extra = (local[ct[0]] == UINT32_MAX)
+                        + (local[ct[1]] == UINT32_MAX && ct[1] != ct[0])
+                        + (local[ct[2]] == UINT32_MAX && ct[2] != ct[0] && ct[2] != ct[1]);
+                    if (vcount + extra > max_vertices) continue;
+                    // Triangles adding no vertices come first, then ones that would
+                    // otherwise be left dangling, then by how many vertices they add
+                    uint32_t priority = extra;
+                    if (extra > 0) {
+                        bool dangling = live[ct[0]] == 1 || live[ct[1]] == 1 || live[ct[2]] == 1;
+                        priority = dangling ? 1 : extra + 1;
+                    }
+                    if (priority > best_priority) continue;
+                    const double *cf = frames + t * 6;
+                    double d[3] = { cf[3] - centroid[0], cf[4] - centroid[1], cf[5] - centroid[2] };
+                    double score = ufbx_wrapper_dot3(d, d);  // Same order as distance without the cone term
+                    if (cone_weight > 0.0) {
+                        double cone = 1.0 - ufbx_wrapper_dot3(cf, unit_axis) * cone_weight;
+                        score = (1.0 + sqrt(score) / expected_radius * (1.0 - cone_weight)) * (cone > 1e-3 ? cone : 1e-3);
+                    }
+                    if (priority < best_priority || score < best_score) {
+                        best_priority = priority;
+                        best_score = score;
+                        next = t;
+                    }
+                }
+                num_candidates = num_kept;
+
+                // Nothing adjacent fits: continue with the next triangle in face order if
+                // it is close enough not to inflate the meshlet's bounds
+                if (next < 0) {
+                    while (cursor < end && emitted[cursor]) cursor++;
+                    if (cursor < end) {
+                        const uint32_t *ct = tris + cursor * 3;
+                        const double *cf = frames + cursor * 6;
+                        uint32_t extra = (local[ct[0]] == UINT32_MAX)
+                            + (local[ct[1]] == UINT32_MAX && ct[1] != ct[0])
+                            + (local[ct[2]] == UINT32_MAX && ct[2] != ct[0] && ct[2] != ct[1]);
+                        double d[3] = { cf[3] - centroid[0], cf[4] - centroid[1], cf[5] - centroid[2] };
+                        if (vcount + extra <= max_vertices && ufbx_wrapper_dot3(d, d) <= 4.0 * expected_radius * expected_radius) {
+                            next = (int64_t)cursor;
+                        }
+                    }
+                }
+            }
+
+            for (uint32_t i = 0; i < vcount; i++) local[mv[i]] = UINT32_MAX;
+            uint32_t *dst = meshlets + num_meshlets * 4;
+            dst[0] = (uint32_t)vertex_offset;
+            dst[1] = (uint32_t)triangle_offset;
+            dst[2] = vcount;
+            dst[3] = tcount;
+            vertex_offset += vcount;
+            triangle_offset += tcount;
+            num_meshlets++;
+        }
+    }
+    part_offsets[num_parts] = num_meshlets;
+    *num_meshlets_out = num_meshlets;
+    ok = true;
+
+done:
+    free(corners); free(tris); free(tri_parts); free(adj_offsets); free(adj);
+    free(live); free(local); free(emitted); free(queued); free(frames);
+    return ok;
+}
+
+// Bounding sphere around the vertex bounds' center and a backface culling cone:
+// a meshlet faces away from a camera at c if dot(normalize(apex - c), axis) >= cutoff.
+// Meshlets whose normals spread too far get axis 0 and cutoff 1 (never culled).
+void ufbx_wrapper_mesh_meshlet_bounds(const ufbx_mesh *mesh, const uint32_t *meshlets, size_t num_meshlets,
+                                      const uint32_t *meshlet_vertices, const uint8_t *meshlet_triangles,
+                                      double *centers, double *radii, double *cone_apex, double *cone_axis,
+                                      double *cone_cutoff) {
+    for (size_t m = 0; m < num_meshlets; m++) {
+        const uint32_t *desc = meshlets + m * 4;
+        const uint32_t *mv = meshlet_vertices + desc[0];
+        const uint8_t *mt = meshlet_triangles + (size_t)desc[1] * 3;
+        double lo[3] = { INFINITY, INFINITY, INFINITY }, hi[3] = { -INFINITY, -INFINITY, -INFINITY };
+        for (uint32_t i = 0; i < desc[2]; i++) {
+            ufbx_vec3 p = mesh->vertices.data[mv[i]];
+            double q[3] = { p.x, p.y, p.z };
+            for (int k = 0; k < 3; k++) {
+                if (q[k] < lo[k]) lo[k] = q[k];
+                if (q[k] > hi[k]) hi[k] = q[k];
+            }
+        }
+        double *center = centers + m * 3, radius = 0.0;
+        for (int k = 0; k < 3; k++) center[k] = 0.5 * (lo[k] + hi[k]);
+        for (uint32_t i = 0; i < desc[2]; i++) {
+            ufbx_vec3 p = mesh->vertices.data[mv[i]];
+            double d[3] = { p.x - center[0], p.y - center[1], p.z - center[2] };
+            double dist = sqrt(ufbx_wrapper_dot3(d, d));
+            if (dist > radius) radius = dist;
+        }
+        radii[m] = radius;
+
+        double axis[3] = { 0.0, 0.0, 0.0 }, normal[3];
+        uint32_t tri[3];
+        for (uint32_t t = 0; t < desc[3]; t++) {
+            for (int c = 0; c < 3; c++) tri[c] = mv[mt[t * 3 + c]];
+            if (ufbx_wrapper_triangle_frame(mesh, tri, normal, NULL) > 0.0) {
+                for (int k = 0; k < 3; k++) axis[k] += normal[k];
+            }
+        }
+        double len = sqrt(ufbx_wrapper_dot3(axis, axis));
+        double min_dot = len > 0.0 ? 1.0 : -1.0;
+        if (len > 0.0) {
+            for (int k = 0; k < 3; k++) axis[k] /= len;
+        }
+        double max_t = 0.0;
+        for (uint32_t t = 0; t < desc[3] && min_dot > 0.1; t++) {
+            for (int c = 0; c < 3; c++) tri[c] = mv[mt[t * 3 + c]];
+            if (ufbx_wrapper_triangle_frame(mesh, tri, normal, NULL) <= 0.0) continue;
+            double dn = ufbx_wrapper_dot3(axis, normal);
+            if (dn < min_dot) min_dot = dn;
+            if (dn <= 0.1) break;
+            // Push the apex back until every triangle's plane is in front of it
+            ufbx_vec3 p0 = mesh->vertices.data[tri[0]];
+            double d[3] = { center[0] - p0.x, center[1] - p0.y, center[2] - p0.z };
+            double dist = ufbx_wrapper_dot3(d, normal) / dn;
+            if (dist > max_t) max_t = dist;
+        }
+
+        double *apex = cone_apex + m * 3, *out_axis = cone_axis + m * 3;
+        if (min_dot <= 0.1) {
+            for (int k = 0; k < 3; k++) {
+                apex[k] = 0.0;
+                out_axis[k] = 0.0;
+            }
+            cone_cutoff[m] = 1.0;
+        } else {
+            for (int k = 0; k < 3; k++) {
+                apex[k] = center[k] - axis[k] * max_t;
+                out_axis[k] = axis[k];
+            }
+            cone_cutoff[m] = sqrt(1.0 - min_dot * min_dot);
+        }
+    }
+}
@@ -27,10 +27,112 @@ typedef struct ufbx_blend_deformer ufbx_blend_deformer;
 typedef struct ufbx_blend_channel ufbx_blend_channel;
 typedef struct ufbx_blend_shape ufbx_blend_shape;
 typedef struct ufbx_constraint ufbx_constraint;
+typedef struct ufbx_dom_node ufbx_dom_node;
+
+// Load profile filled by ufbx_wrapper_load_file_opts() when requested.
+// Phases: read is time spent inside stream reads, parse runs until the last
+// read or progress checkpoint (excluding reads), finalize is the remainder.
+typedef struct ufbx_wrapper_load_stats {
+    double total_seconds;
+    double read_seconds;
+    double parse_seconds;
+    double finalize_seconds;
+    uint64_t bytes_read;
+    uint64_t bytes_inflated;     // Decompressed size declared by deflate-encoded binary FBX array headers (estimate)
+    size_t num_allocs;           // Temp and result allocations (ufbx_metadata counts)
+    size_t num_frees;
+    size_t peak_heap_bytes;      // Peak temp + result bytes live at once, 0 if not tracked
+    size_t result_heap_bytes;    // Bytes owned by the returned scene
+    size_t num_progress_calls;
+} ufbx_wrapper_load_stats;
+
+// Heap usage of a loaded scene: sizes and counts from ufbx_metadata, peaks from
+// the allocators of the load
+typedef struct ufbx_wrapper_memory_usage {
+    size_t result_bytes;         // Bytes owned by the scene
+    size_t result_allocs;
+    size_t temp_peak_bytes;      // Peak temporary bytes during the load, 0 if not tracked
+    size_t temp_allocs;
+    size_t peak_bytes;           // Peak temp + result bytes live at once, 0 if not tracked
+} ufbx_wrapper_memory_usage;
+
+// Load options (subset of ufbx_load_opts exposed to Python)
+typedef struct ufbx_wrapper_load_opts {
+    bool retain_dom;
+    bool has_target_axes;
+    int target_axes[3];         // right, up, front (ufbx_coordinate_axis)
+    double target_unit_meters;  // 0 keeps the file's units
+    int space_conversion;       // ufbx_space_conversion
+    size_t max_memory;          // Result allocator memory_limit, 0 for none
+    size_t max_temp_memory;     // Temp allocator memory_limit, 0 for none
+    ufbx_wrapper_load_stats *stats;  // Optional, collects a load profile
+    ufbx_wrapper_memory_usage *memory_usage;  // Optional, receives heap usage
+} ufbx_wrapper_load_opts;
+
+// Header fields and element counts read by ufbx_wrapper_scan_file()
+#define UFBX_WRAPPER_SCAN_TEXT_SIZE 256
+
+typedef struct ufbx_wrapper_scan_result {
+    uint32_t version;
+    int file_format;            // ufbx_file_format
+    bool ascii;
+    char creator[UFBX_WRAPPER_SCAN_TEXT_SIZE];  // Truncated, NUL-terminated
+    double unit_meters;
+    int axes[3];                // right, up, front (ufbx_coordinate_axis)
+    double frames_per_second;
+    size_t num_nodes;
+    size_t num_meshes;
+    size_t num_materials;
+    size_t num_textures;
+    size_t num_lights;
+    size_t num_cameras;
+    size_t num_anim_stacks;
+    int error_type;             // ufbx_error_type, UFBX_ERROR_NONE on success
+    char error[UFBX_WRAPPER_SCAN_TEXT_SIZE];
+} ufbx_wrapper_scan_result;
+
+// Vertex streams of one mesh part written by ufbx_wrapper_mesh_part_fill().
+// Every non-NULL stream holds num_triangles * 3 vertices before deduplication.
+typedef struct ufbx_wrapper_part_buffers {
+    float *positions;           // xyz
+    float *normals;             // xyz, or NULL
+    float *uvs;                 // uv with v flipped (top-left origin), or NULL
+    float *colors;              // rgba, or NULL
+    uint16_t *joints;           // 4 cluster indices per vertex, or NULL
+    float *weights;             // 4 normalized weights per vertex, or NULL
+    uint32_t *indices;          // num_triangles * 3
+} ufbx_wrapper_part_buffers;
+
+// Output sizes for ufbx_wrapper_flatten_fill()
+typedef struct ufbx_wrapper_flatten_sizes {
+    size_t num_positions;
+    size_t num_indices;
+    size_t num_faces;
+    size_t max_face_triangles;
+} ufbx_wrapper_flatten_sizes;
+
+// Element query filters; unset fields (NULL / -1) match everything
+typedef struct ufbx_wrapper_query {
+    int type;                   // ufbx_element_type, -1 for any
+    const char *name;           // Exact name
+    size_t name_length;
+    const char *pattern;        // Glob pattern ('*', '?', '[...]')
+    size_t pattern_length;
+    const ufbx_node *under;     // Only elements below this node
+} ufbx_wrapper_query;
+
+// Returned in place of a ufbx_dom_value_type when there is no such value
+#define UFBX_WRAPPER_DOM_VALUE_NONE -1
 
 // Scene management
 ufbx_scene* ufbx_wrapper_load_file(const char *filename, char **error_msg);
+// On failure *error_type (if given) receives the ufbx_error_type
+ufbx_scene* ufbx_wrapper_load_file_opts(const char *filename, const ufbx_wrapper_load_opts *opts,
+                                        char **error_msg, int *error_type);
 void ufbx_wrapper_free_scene(ufbx_scene *scene);
+// Load without geometry, animation or embedded data and keep only the header
+// fields; returns false and fills result->error on failure. Thread-safe.
+bool ufbx_wrapper_scan_file(const char *filename, ufbx_wrapper_scan_result *result);
 
 // Scene queries
 size_t ufbx_wrapper_scene_get_num_nodes(const ufbx_scene *scene);
@@ -75,12 +177,12 @@ size_t ufbx_wrapper_mesh_get_num_faces(const ufbx_mesh *mesh);
 size_t ufbx_wrapper_mesh_get_num_triangles(const ufbx_mesh *mesh);
 
 // Mesh vertex data (returns pointers to internal data - valid while scene lives)
-const float* ufbx_wrapper_mesh_get_vertex_positions(const ufbx_mesh *mesh, size_t *out_count);
-const float* ufbx_wrapper_mesh_get_vertex_normals(const ufbx_mesh *mesh, size_t *out_count);
-const float* ufbx_wrapper_mesh_get_vertex_uvs(const ufbx_mesh *mesh, size_t *out_count);
-const float* ufbx_wrapper_mesh_get_vertex_tangents(const ufbx_mesh *mesh, size_t *out_count);
-const float* ufbx_wrapper_mesh_get_vertex_bitangents(const ufbx_mesh *mesh, size_t *out_count);
-const float* ufbx_wrapper_mesh_get_vertex_colors(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_positions(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_normals(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_uvs(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_tangents(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_bitangents(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_colors(const ufbx_mesh *mesh, size_t *out_count);
 const uint32_t* ufbx_wrapper_mesh_get_indices(const ufbx_mesh *mesh, size_t *out_count);
 
 // Mesh face data
@@ -88,7 +190,7 @@ size_t ufbx_wrapper_mesh_get_face_count(const ufbx_mesh *mesh);
 void ufbx_wrapper_mesh_get_face(const ufbx_mesh *mesh, size_t index, uint32_t *index_begin, uint32_t *num_indices);
 const uint32_t* ufbx_wrapper_mesh_get_face_material(const ufbx_mesh *mesh, size_t *out_count);
 const double* ufbx_wrapper_mesh_get_edge_crease(const ufbx_mesh *mesh, size_t *out_count);
-const float* ufbx_wrapper_mesh_get_vertex_crease(const ufbx_mesh *mesh, size_t *out_count);
+const double* ufbx_wrapper_mesh_get_vertex_crease(const ufbx_mesh *mesh, size_t *out_count);
 
 // Mesh deformers
 size_t ufbx_wrapper_mesh_get_num_skin_deformers(const ufbx_mesh *mesh);
@@ -287,6 +389,152 @@ int ufbx_wrapper_constraint_get_type(const ufbx_constraint *constraint);
 double ufbx_wrapper_constraint_get_weight(const ufbx_constraint *constraint);
 bool ufbx_wrapper_constraint_get_active(const ufbx_constraint *constraint);
 
+// DOM access (requires retain_dom load option)
+ufbx_dom_node* ufbx_wrapper_scene_get_dom_root(const ufbx_scene *scene);
+ufbx_dom_node* ufbx_wrapper_node_get_dom_node(const ufbx_node *node);
+ufbx_dom_node* ufbx_wrapper_mesh_get_dom_node(const ufbx_mesh *mesh);
+const char* ufbx_wrapper_dom_node_get_name(const ufbx_dom_node *dom_node, size_t *out_length);
+size_t ufbx_wrapper_dom_node_get_num_children(const ufbx_dom_node *dom_node);
+ufbx_dom_node* ufbx_wrapper_dom_node_get_child(const ufbx_dom_node *dom_node, size_t index);
+ufbx_dom_node* ufbx_wrapper_dom_node_find(const ufbx_dom_node *dom_node, const char *name, size_t name_length);
+size_t ufbx_wrapper_dom_node_get_num_values(const ufbx_dom_node *dom_node);
+int ufbx_wrapper_dom_node_get_value_type(const ufbx_dom_node *dom_node, size_t index);
+int64_t ufbx_wrapper_dom_node_get_value_int(const ufbx_dom_node *dom_node, size_t index);
+double ufbx_wrapper_dom_node_get_value_float(const ufbx_dom_node *dom_node, size_t index);
+const char* ufbx_wrapper_dom_node_get_value_str(const ufbx_dom_node *dom_node, size_t index, size_t *out_length);
+const void* ufbx_wrapper_dom_node_get_value_blob(const ufbx_dom_node *dom_node, size_t index, size_t *out_size);
+bool ufbx_wrapper_dom_node_is_array(const ufbx_dom_node *dom_node);
+size_t ufbx_wrapper_dom_node_get_array_size(const ufbx_dom_node *dom_node);
+const void* ufbx_wrapper_dom_node_get_array(const ufbx_dom_node *dom_node, int *out_type, size_t *out_count);
+
+// Scene-wide geometry of every node (all_nodes) or of the num_node_ids nodes in
+// node_ids (NULL when num_node_ids is 0). Indices are uint32 offsets into the merged
+// positions, so callers must reject sizes->num_positions above UINT32_MAX.
+void ufbx_wrapper_flatten_count(const ufbx_scene *scene, bool all_nodes, const uint32_t *node_ids,
+                                size_t num_node_ids, bool triangulate, ufbx_wrapper_flatten_sizes *sizes);
+bool ufbx_wrapper_flatten_fill(const ufbx_scene *scene, bool all_nodes, const uint32_t *node_ids, size_t num_node_ids,
+                               bool triangulate, bool world_space, const ufbx_wrapper_flatten_sizes *sizes,
+                               double *positions, uint32_t *indices, int32_t *face_nodes,
+                               int32_t *face_materials, uint32_t *face_sizes);
+
+// Node table: arrays sized scene->nodes.count, matrices 16 doubles per node
+void ufbx_wrapper_scene_fill_node_table(const ufbx_scene *scene, int32_t *parents, int32_t *depths,
+                                        int32_t *attrib_types, double *world, double *local, double *geometry);
+
+// Element queries: out_element_ids must hold scene->elements.count entries,
+// returns the number of matches written in element_id order
+size_t ufbx_wrapper_scene_query(const ufbx_scene *scene, const ufbx_wrapper_query *query, uint32_t *out_element_ids);
+
+// Property gathering: out holds num_components doubles per element of `type`,
+// missing properties are filled from default_value
+void ufbx_wrapper_scene_gather_prop(const ufbx_scene *scene, int type, const char *name, size_t name_length,
+                                    size_t num_components, const double *default_value, double *out);
+
+// Animation sampling: out holds 10 doubles (translation xyz, rotation xyzw, scale xyz)
+// per node of scene->nodes (all_nodes) or of node_ids for each of num_times times
+void ufbx_wrapper_anim_stack_sample_transforms(const ufbx_scene *scene, const ufbx_anim_stack *anim_stack,
+                                               bool all_nodes, const uint32_t *node_ids, size_t num_node_ids,
+                                               const double *times, size_t num_times, double *out);
+// out[i] = 1 if the local transform of scene->nodes[i] depends on properties animated by anim_stack
+void ufbx_wrapper_anim_stack_animated_nodes(const ufbx_scene *scene, const ufbx_anim_stack *anim_stack, uint8_t *out);
+
+// Bounding boxes as (min xyz, max xyz): mesh_bounds per scene->meshes in mesh space,
+// node_bounds per scene->nodes in world space; NaN where there is no geometry
+void ufbx_wrapper_scene_compute_bounds(const ufbx_scene *scene, double *mesh_bounds, double *node_bounds);
+
+// glTF export helpers
+// Material of a mesh slot on a node: per-instance materials first, then the mesh's;
+// returns the material typed_id or -1
+int32_t ufbx_wrapper_node_material_id(const ufbx_node *node, uint32_t slot);
+// local and geometry hold 10 doubles per node (as in anim_stack_sample_transforms)
+void ufbx_wrapper_scene_fill_node_trs(const ufbx_scene *scene, double *local, double *geometry);
+size_t ufbx_wrapper_mesh_get_num_parts(const ufbx_mesh *mesh);
+// Optional vertex attributes of a mesh as UFBX_WRAPPER_STREAM_* flags
+#define UFBX_WRAPPER_STREAM_NORMAL 0x1
+#define UFBX_WRAPPER_STREAM_UV 0x2
+#define UFBX_WRAPPER_STREAM_COLOR 0x4
+uint32_t ufbx_wrapper_mesh_get_stream_flags(const ufbx_mesh *mesh);
+size_t ufbx_wrapper_mesh_part_get_num_triangles(const ufbx_mesh *mesh, size_t part_index);
+// Triangulate one material part into per-corner streams (skin may be NULL) and merge
+// identical vertices; returns the vertex count, 0 if the part is empty or on failure
+size_t ufbx_wrapper_mesh_part_fill(const ufbx_mesh *mesh, size_t part_index, const ufbx_skin_deformer *skin,
+                                   const ufbx_wrapper_part_buffers *buffers);
+// Joint node typed_ids (-1 without a bone) and inverse bind matrices (16 floats,
+// column-major) per cluster
+void ufbx_wrapper_skin_fill_bind(const ufbx_skin_deformer *skin, int32_t *joint_nodes, float *inverse_bind);
+
+// Mesh content hashes: two 64-bit words per scene->meshes entry over face sizes, vertex
+// positions and indices, plus normals, UV sets, color sets and face materials if
+// attributes is set. Names and transforms are not hashed; values are hashed as numbers,
+// so hashes are stable across runs and platforms.
+void ufbx_wrapper_scene_hash_meshes(const ufbx_scene *scene, bool attributes, uint64_t *out_hashes);
+
+// Mesh triangulation: corners and indices hold 3 * mesh->num_triangles entries (mesh
+// corners and the vertices they refer to), grouped by material part with triangle
+// offsets in part_offsets (material_parts.count + 1 entries). With FETCH, indices
+// refer to vertex_order (mesh->num_vertices entries, vertices in order of first use).
+// Returns false if out of memory.
+#define UFBX_WRAPPER_OPTIMIZE_VERTEX_CACHE 0x1
+#define UFBX_WRAPPER_OPTIMIZE_OVERDRAW 0x2
+#define UFBX_WRAPPER_OPTIMIZE_FETCH 0x4
+bool ufbx_wrapper_mesh_triangulate(const ufbx_mesh *mesh, uint32_t flags, uint32_t cache_size, uint32_t *corners,
+                                   uint32_t *indices, size_t *part_offsets, uint32_t *vertex_order);
+
+// Meshlets: meshlets holds 4 uint32 (vertex offset, triangle offset, vertex count,
+// triangle count) per meshlet, meshlet_vertices mesh vertices and meshlet_triangles
+// 3 indices into the meshlet's vertices per triangle. Sized for the worst case
+// (num_triangles meshlets, 3 * num_triangles vertices); part_offsets holds
+// material_parts.count + 1 meshlet offsets. Stores the number of meshlets in
+// *num_meshlets, returns false if out of memory.
+bool ufbx_wrapper_mesh_build_meshlets(const ufbx_mesh *mesh, uint32_t max_vertices, uint32_t max_triangles,
+                                      double cone_weight, uint32_t *meshlets, uint32_t *meshlet_vertices,
+                                      uint8_t *meshlet_triangles, size_t *part_offsets, size_t *num_meshlets);
+// Per meshlet: center (3), radius, cone apex (3), cone axis (3) and cone cutoff
+void ufbx_wrapper_mesh_meshlet_bounds(const ufbx_mesh *mesh, const uint32_t *meshlets, size_t num_meshlets,
+                                      const uint32_t *meshlet_vertices, const uint8_t *meshlet_triangles,
+                                      double *centers, double *radii, double *cone_apex, double *cone_axis,
+                                      double *cone_cutoff);
+
+// BVH over triangles: positions are (P, 3) doubles, indices (T, 3) corners into them.
+// Queries write one result per input; misses get triangle -1, distance INFINITY, NaN points.
+// They return false if out of memory.
+typedef struct ufbx_wrapper_bvh ufbx_wrapper_bvh;
+ufbx_wrapper_bvh* ufbx_wrapper_bvh_build(const double *positions, const uint32_t *indices, size_t num_triangles);
+void ufbx_wrapper_bvh_free(ufbx_wrapper_bvh *bvh);
+size_t ufbx_wrapper_bvh_num_nodes(const ufbx_wrapper_bvh *bvh);
+size_t ufbx_wrapper_bvh_max_depth(const ufbx_wrapper_bvh *bvh);
+bool ufbx_wrapper_bvh_raycast(const ufbx_wrapper_bvh *bvh, const double *origins, const double *directions,
+                              size_t count, double max_distance, double *out_distance, int64_t *out_triangle,
+                              double *out_barycentric);
+bool ufbx_wrapper_bvh_closest_point(const ufbx_wrapper_bvh *bvh, const double *points, size_t count,
+                                    double max_distance, double *out_points, double *out_distance,
+                                    int64_t *out_triangle);
+
+// Batched math over count elements. Vectors are 3 doubles, quaternions 4 (x, y, z, w),
+// matrices 16 in the column-major layout of ufbx_wrapper_node_get_world_transform().
+// Inputs with a *_stride argument advance by that many doubles per element, so a
+// stride of 0 broadcasts a single value.
+void ufbx_wrapper_vec3_normalize_n(const double *v, double *out, size_t count);
+void ufbx_wrapper_quat_mul_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                             double *out, size_t count);
+void ufbx_wrapper_quat_normalize_n(const double *q, double *out, size_t count);
+void ufbx_wrapper_quat_slerp_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                               const double *t, size_t t_stride, double *out, size_t count);
+void ufbx_wrapper_quat_rotate_n(const double *q, size_t q_stride, const double *v, size_t v_stride,
+                                double *out, size_t count);
+void ufbx_wrapper_quat_to_euler_n(const double *q, int order, double *out, size_t count);
+void ufbx_wrapper_euler_to_quat_n(const double *euler, int order, double *out, size_t count);
+void ufbx_wrapper_matrix_mul_n(const double *a, size_t a_stride, const double *b, size_t b_stride,
+                               double *out, size_t count);
+void ufbx_wrapper_matrix_invert_n(const double *m, double *out, size_t count);
+void ufbx_wrapper_matrix_transform_n(const double *m, size_t m_stride, const double *v, size_t v_stride,
+                                     bool directions, double *out, size_t count);
+void ufbx_wrapper_matrix_to_transform_n(const double *m, double *translation, double *rotation,
+                                        double *scale, size_t count);
+void ufbx_wrapper_transform_to_matrix_n(const double *translation, size_t t_stride, const double *rotation,
+                                        size_t r_stride, const double *scale, size_t s_stride,
+                                        double *out, size_t count);
+
 #ifdef __cplusplus
 }
 #endif